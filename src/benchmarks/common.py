@@ -0,0 +1,137 @@
+import random
+from io import BytesIO
+from pathlib import Path
+from typing import Sequence
+
+from PIL import Image
+
+
+def make_images(
+        count: int,
+        size: tuple[int, int] = (640, 480),
+        fmt: str = 'JPEG',
+        seed: int = 0
+) -> list[bytes]:
+    """
+    Генерация набора синтетических изображений.
+
+    :param count: Количество изображений.
+    :type count: int
+
+    :param size: Размер изображений (ширина, высота).
+    :type size: tuple[int, int]
+
+    :param fmt: Формат изображений (формат PIL).
+    :type fmt: str
+
+    :param seed: Зерно генератора случайных чисел.
+    :type seed: int
+
+    :return: Изображения в байтах.
+    :rtype: list[bytes]
+    """
+
+    rnd = random.Random(seed)
+    images = []
+    for _ in range(count):
+        img = Image.new('RGB', size, tuple(rnd.randrange(256) for _ in range(3)))
+        for _ in range(8):
+            x0, y0 = rnd.randrange(size[0]), rnd.randrange(size[1])
+            x1, y1 = rnd.randrange(x0, size[0] + 1), rnd.randrange(y0, size[1] + 1)
+            img.paste(tuple(rnd.randrange(256) for _ in range(3)),
+                      (x0, y0, x1, y1))
+        with BytesIO() as buff:
+            img.save(buff, format=fmt)
+            images.append(buff.getvalue())
+
+    return images
+
+
+def load_images(path: str | Path, count: int | None = None) -> list[bytes]:
+    """
+    Загрузка изображений из папки.
+
+    :param path: Путь к папке с изображениями.
+    :type path: str | Path
+
+    :param count: Максимальное количество изображений.
+    :type count: int | None
+
+    :return: Изображения в байтах.
+    :rtype: list[bytes]
+    """
+
+    files = sorted(p for p in Path(path).iterdir() if p.is_file())[:count]
+
+    return [p.read_bytes() for p in files]
+
+
+def rss_mb() -> float:
+    """
+    Получение резидентной памяти текущего процесса.
+
+    :return: Резидентная память в МБ (0, если недоступна).
+    :rtype: float
+    """
+
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    return 0.0
+
+
+def process_memory_mb(pid: int) -> tuple[float, float]:
+    """
+    Получение памяти процесса.
+
+    Собственная память не включает страницы, разделяемые с другими
+    процессами (веса в разделяемой памяти, страничный кеш файлов).
+
+    :param pid: Идентификатор процесса.
+    :type pid: int
+
+    :return: Резидентная и собственная память в МБ (0, если
+             недоступны).
+    :rtype: tuple[float, float]
+    """
+
+    rss, private = 0, 0
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                name, _, value = line.partition(':')
+                if name == 'Rss':
+                    rss = int(value.split()[0])
+                elif name in ('Private_Clean', 'Private_Dirty'):
+                    private += int(value.split()[0])
+    except (OSError, ValueError):
+        pass
+
+    return rss / 1024, private / 1024
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence]) -> None:
+    """
+    Вывод таблицы результатов бенчмарка.
+
+    :param headers: Заголовки столбцов.
+    :type headers: Sequence[str]
+
+    :param rows: Строки таблицы.
+    :type rows: Sequence[Sequence]
+    """
+
+    cells = [[str(h) for h in headers]] + [
+        [f"{c:.3f}" if isinstance(c, float) else str(c) for c in row]
+        for row in rows
+    ]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for i, row in enumerate(cells):
+        print("  ".join(c.rjust(w) for c, w in zip(row, widths)))
+        if i == 0:
+            print("  ".join("-" * w for w in widths))
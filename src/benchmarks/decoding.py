@@ -0,0 +1,80 @@
+"""
+Бенчмарк декодирования изображений с учетом размера модели.
+
+Для каждого формата и разрешения сравниваются полное декодирование,
+уменьшенное декодирование PIL (draft/reduce) и TurboJPEG (если
+доступен): время декодирования, размер результата и отклонение после
+приведения к размеру модели (как в BlipProcessor, бикубически).
+
+Запуск из корня приложения:
+python3 -m benchmarks.decoding --formats JPEG,PNG,WEBP --megapixels 1,12,48
+"""
+import time
+
+import click
+from PIL import Image, ImageChops, ImageStat
+
+from benchmarks.common import make_images, print_table
+from entities.cap_models import ImageDecoder
+
+
+def _measure(decoder: ImageDecoder, img: bytes, size: tuple[int, int],
+             repeats: int) -> tuple[float, Image.Image]:
+    """
+    Измерение среднего времени декодирования изображения.
+
+    :return: Среднее время в секундах и декодированное изображение.
+    :rtype: tuple[float, Image.Image]
+    """
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        image = decoder.decode(img, size)
+
+    return (time.perf_counter() - start) / repeats, image
+
+
+@click.command()
+@click.option('--formats', default='JPEG,PNG,WEBP',
+              help="Форматы изображений через запятую")
+@click.option('--megapixels', default='1,12,48',
+              help="Разрешения в мегапикселях через запятую")
+@click.option('--target', default=384, help="Размер входа модели")
+@click.option('--repeats', default=5, help="Количество повторов")
+def main(formats: str, megapixels: str, target: int, repeats: int) -> None:
+    size = (target, target)
+    decoders = {
+        'full': ImageDecoder(draft=False),
+        'draft': ImageDecoder(draft=True),
+        'turbojpeg': ImageDecoder(draft=True, turbojpeg=True)
+    }
+
+    rows = []
+    for fmt in formats.split(','):
+        for mp in map(float, megapixels.split(',')):
+            # Соотношение сторон 4:3, как у фотографий телефонов.
+            height = int((mp * 1e6 * 3 / 4) ** 0.5)
+            img = make_images(1, size=(height * 4 // 3, height), fmt=fmt)[0]
+
+            full_time, full = _measure(decoders['full'], img, size, repeats)
+            reference = full.resize(size, Image.Resampling.BICUBIC)
+            for name, decoder in decoders.items():
+                if name == 'turbojpeg' and fmt != 'JPEG':
+                    continue
+                if name == 'full':
+                    dec_time, image = full_time, full
+                else:
+                    dec_time, image = _measure(decoder, img, size, repeats)
+                diff = ImageStat.Stat(ImageChops.difference(
+                    reference, image.resize(size, Image.Resampling.BICUBIC)
+                )).mean
+                rows.append((fmt, mp, name, f"{image.width}x{image.height}",
+                             dec_time * 1000, full_time / dec_time,
+                             sum(diff) / len(diff)))
+
+    print_table(('формат', 'Мп', 'декодер', 'размер', 'время, мс',
+                 'ускорение', 'отклонение'), rows)
+
+
+if __name__ == '__main__':
+    main()
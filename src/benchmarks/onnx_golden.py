@@ -0,0 +1,74 @@
+"""
+Сверка жадных описаний ONNX Runtime с torch на эталонном наборе.
+
+Для каждого изображения сравниваются последовательности токенов,
+сгенерированные torch-моделью и ONNX-графами. Завершается с кодом 1,
+если хотя бы одна последовательность отличается.
+
+Запуск из корня приложения (рядом с config.yml, после build.py):
+python3 -m benchmarks.onnx_golden --images-dir ./golden
+"""
+import sys
+import time
+from io import BytesIO
+
+import click
+import torch
+from PIL import Image
+from transformers import BlipForConditionalGeneration, BlipProcessor
+
+from benchmarks.common import make_images, load_images, print_table
+from entities.cap_models import CapModelRegistry, ONNXBLIPCapModelBuilder
+from infrastructure.config import ONNX_BLIP_MODEL_NAME, CAP_MODEL_SETTINGS
+
+
+@click.command()
+@click.option('--images', 'count', default=16, help="Количество изображений")
+@click.option('--images-dir', default=None, help="Папка с изображениями")
+@click.option('--max-length', default=50,
+              help="Максимальная длина описания")
+def main(count: int, images_dir: str | None, max_length: int) -> None:
+    images = (load_images(images_dir, count) if images_dir
+              else make_images(count))
+    settings = CAP_MODEL_SETTINGS[ONNX_BLIP_MODEL_NAME]
+
+    torch_model = BlipForConditionalGeneration.from_pretrained(
+        settings['download_path']
+    ).eval()
+    processor = BlipProcessor.from_pretrained(settings['download_path'])
+    onnx_model = ONNXBLIPCapModelBuilder(
+        processor=BlipProcessor,
+        onnx_dir=settings['save_dir'],
+        registry=CapModelRegistry(),
+        threads=settings['threads']
+    ).get_model()
+
+    rows, mismatches = [], 0
+    for i, img in enumerate(images):
+        pixel_values = processor(
+            Image.open(BytesIO(img)).convert('RGB'), return_tensors='pt'
+        )['pixel_values']
+
+        start = time.perf_counter()
+        with torch.no_grad():
+            torch_ids = torch_model.generate(
+                pixel_values=pixel_values, max_length=max_length
+            )[0].tolist()
+        torch_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        onnx_ids = onnx_model.generate_ids([img], max_length)[0]
+        onnx_time = time.perf_counter() - start
+
+        identical = torch_ids == onnx_ids
+        mismatches += not identical
+        rows.append((i, torch_time, onnx_time, identical,
+                     processor.decode(onnx_ids, skip_special_tokens=True)))
+
+    print_table(('№', 'torch, с', 'onnx, с', 'совпадает', 'описание'), rows)
+    print(f"Несовпадений: {mismatches} из {len(images)}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
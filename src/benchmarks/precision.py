@@ -0,0 +1,129 @@
+"""
+Бенчмарк режимов точности вычислений BLIP captioning-модели.
+
+Каждый режим измеряется в отдельном процессе (чтобы резидентная память
+не смешивалась), после чего описания сравниваются с описаниями fp32.
+
+Запуск из корня приложения (рядом с config.yml):
+python3 -m benchmarks.precision --images-dir ./golden
+"""
+import json
+import subprocess
+import sys
+import time
+
+import click
+
+from benchmarks.common import make_images, load_images, rss_mb, print_table
+
+
+def _measure(precision: str, images: list[bytes], max_length: int) -> dict:
+    """
+    Измерение задержки, памяти и описаний в одном режиме точности.
+
+    :return: Результаты измерения.
+    :rtype: dict
+    """
+
+    from transformers import BlipForConditionalGeneration, BlipProcessor
+
+    from entities.cap_models import BLIPCapModelBuilder, CapModelRegistry
+    from infrastructure.config import BLIP_MODEL_NAME, CAP_MODEL_SETTINGS
+
+    builder = BLIPCapModelBuilder(
+        model=BlipForConditionalGeneration,
+        processor=BlipProcessor,
+        download_path=CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['save_dir'],
+        cache_dir=CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['cache_dir'],
+        registry=CapModelRegistry(),
+        precision=precision
+    )
+    builder.set_max_length(max_length)
+
+    start = time.perf_counter()
+    model = builder.get_model()
+    load_time = time.perf_counter() - start
+
+    model.descript(images[0])  # Прогрев.
+    latencies, captions = [], []
+    for img in images:
+        start = time.perf_counter()
+        captions.append(model.descript(img))
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    return {
+        'precision': precision,
+        'load_time': load_time,
+        'latency_p50': latencies[len(latencies) // 2],
+        'latency_p95': latencies[int(len(latencies) * 0.95) - 1],
+        'rss_mb': rss_mb(),
+        'captions': captions
+    }
+
+
+def _agreement(captions: list[str], reference: list[str]) -> tuple[float, float]:
+    """
+    Согласованность описаний с эталонными.
+
+    :return: Доля точных совпадений и средний коэффициент Жаккара слов.
+    :rtype: tuple[float, float]
+    """
+
+    exact = sum(c == r for c, r in zip(captions, reference)) / len(reference)
+    jaccard = sum(
+        len(set(c.split()) & set(r.split())) /
+        max(len(set(c.split()) | set(r.split())), 1)
+        for c, r in zip(captions, reference)
+    ) / len(reference)
+
+    return exact, jaccard
+
+
+@click.command()
+@click.option('--precision', '-p', multiple=True,
+              default=('fp32', 'bf16', 'int8-dynamic'),
+              help="Режимы точности")
+@click.option('--images', 'count', default=20, help="Количество изображений")
+@click.option('--images-dir', default=None, help="Папка с изображениями")
+@click.option('--max-length', default=30,
+              help="Максимальная длина описания")
+@click.option('--single', default=None, hidden=True)
+def main(
+        precision: tuple[str, ...],
+        count: int,
+        images_dir: str | None,
+        max_length: int,
+        single: str | None
+) -> None:
+    images = (load_images(images_dir, count) if images_dir
+              else make_images(count))
+
+    if single is not None:
+        print(json.dumps(_measure(single, images, max_length)))
+        return
+
+    results = {}
+    for mode in dict.fromkeys(('fp32',) + precision):
+        args = [sys.executable, '-m', 'benchmarks.precision',
+                '--single', mode, '--images', str(count),
+                '--max-length', str(max_length)]
+        if images_dir:
+            args += ['--images-dir', images_dir]
+        output = subprocess.run(args, capture_output=True, text=True,
+                                check=True).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    reference = results['fp32']['captions']
+    rows = []
+    for mode, result in results.items():
+        exact, jaccard = _agreement(result['captions'], reference)
+        rows.append((mode, result['load_time'], result['latency_p50'],
+                     result['latency_p95'], result['rss_mb'], exact, jaccard))
+
+    print_table(('режим', 'загрузка, с', 'p50, с', 'p95, с', 'RSS, МБ',
+                 'совпадение', 'Жаккар'), rows)
+
+
+if __name__ == '__main__':
+    main()
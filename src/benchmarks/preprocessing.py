@@ -0,0 +1,81 @@
+"""
+Бенчмарк векторизованной обработки батча изображений.
+
+Для каждого размера батча сравнивается время обработки одного
+изображения обработчиком BlipProcessor и ImagePreprocessor, а также
+максимальное отклонение их результатов.
+
+Запуск из корня приложения (рядом с config.yml):
+python3 -m benchmarks.preprocessing --batch-sizes 1,2,4,8,16,32,64
+"""
+import time
+from io import BytesIO
+
+import click
+import numpy as np
+from PIL import Image
+
+from benchmarks.common import make_images, print_table
+
+
+def _measure(func, images: list, repeats: int) -> tuple[float, np.ndarray]:
+    """
+    Измерение среднего времени обработки батча изображений.
+
+    :return: Среднее время на изображение в секундах и результат.
+    :rtype: tuple[float, np.ndarray]
+    """
+
+    func(images)  # Прогрев.
+    start = time.perf_counter()
+    for _ in range(repeats):
+        pixel_values = func(images)
+
+    return (time.perf_counter() - start) / repeats / len(images), pixel_values
+
+
+@click.command()
+@click.option('--batch-sizes', default='1,2,4,8,16,32,64',
+              help="Размеры батча через запятую")
+@click.option('--repeats', default=5, help="Количество повторов")
+@click.option('--model-dir', default=None,
+              help="Папка обработчика BLIP (по умолчанию из config.yml)")
+def main(batch_sizes: str, repeats: int, model_dir: str | None) -> None:
+    from transformers import BlipProcessor
+
+    from entities.cap_models import ImagePreprocessor
+    from infrastructure.config import BLIP_MODEL_NAME, CAP_MODEL_SETTINGS
+
+    processor = BlipProcessor.from_pretrained(
+        model_dir or CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['save_dir']
+    )
+    preprocessor = ImagePreprocessor.from_image_processor(
+        processor.image_processor
+    )
+
+    sizes = [int(size) for size in batch_sizes.split(',')]
+    pil_images = [
+        Image.open(BytesIO(img)).convert('RGB')
+        for img in make_images(max(sizes))
+    ]
+
+    rows = []
+    for size in sizes:
+        images = pil_images[:size]
+        proc_time, expected = _measure(
+            lambda batch: processor(images=batch,
+                                    return_tensors='np')['pixel_values'],
+            images, repeats
+        )
+        vec_time, actual = _measure(preprocessor, images, repeats)
+        rows.append((size, proc_time * 1000, vec_time * 1000,
+                     proc_time / vec_time,
+                     f"{np.abs(expected - actual).max():.2e}"))
+
+    print_table(('батч', 'BlipProcessor, мс/изобр.',
+                 'ImagePreprocessor, мс/изобр.', 'ускорение',
+                 'макс. отклонение'), rows)
+
+
+if __name__ == '__main__':
+    main()
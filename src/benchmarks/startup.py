@@ -0,0 +1,108 @@
+"""
+Профиль времени импорта модулей приложения.
+
+Каждый модуль импортируется в отдельном чистом процессе интерпретатора
+с -X importtime: выводится общее время импорта и самые дорогие
+(по накопленному времени) импорты верхнего уровня. Отдельно замеряется
+время запуска main.py с неизвестным приложением (без загрузки
+реализаций FastAPI и Gradio).
+
+Для сравнения до и после изменений профиль запускается на обеих
+версиях кода.
+
+Запуск из корня приложения:
+python3 -m benchmarks.startup --modules main,use_cases,infrastructure.db --top 10
+"""
+import subprocess
+import sys
+import time
+
+import click
+
+from benchmarks.common import print_table
+
+
+def _import_profile(module: str) -> tuple[float, list[tuple[str, float]]]:
+    """
+    Импорт модуля в чистом процессе с -X importtime.
+
+    :return: Время процесса в секундах и накопленное время импорта (в
+             секундах) по модулям.
+    :rtype: tuple[float, list[tuple[str, float]]]
+
+    :raises RuntimeError: Если модуль не импортируется.
+    """
+
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    # Строки вида: "import time: self [us] | cumulative | imported package".
+    imports = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # После разделителя один пробел, далее отступ по вложенности.
+        imports.append((name[1:].rstrip(), int(cumulative) / 1e6))
+
+    return elapsed, imports
+
+
+def _run_main(app: str) -> float:
+    """
+    Запуск main.py в чистом процессе.
+
+    :return: Время процесса в секундах.
+    :rtype: float
+    """
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, 'main.py', f'--app={app}'],
+                   capture_output=True)
+
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option('--modules', default='main,use_cases,infrastructure.db,'
+                                   'infrastructure.ui.api.app',
+              help="Модули через запятую")
+@click.option('--top', default=10, help="Количество самых дорогих импортов")
+@click.option('--repeats', default=3, help="Количество запусков на модуль")
+def main(modules: str, top: int, repeats: int) -> None:
+    rows = []
+    for module in modules.split(','):
+        try:
+            runs = [_import_profile(module) for _ in range(repeats)]
+        except RuntimeError as e:
+            print(f"{module}: не импортируется ({e})")
+            continue
+        elapsed = min(run[0] for run in runs)
+        imports = min(runs, key=lambda run: run[0])[1]
+        total = sum(seconds for name, seconds in imports
+                    if not name.startswith(' '))
+        rows.append([module, elapsed, total])
+
+        print(f"\n{module}: самые дорогие импорты верхнего уровня")
+        heaviest = sorted(
+            ((name, seconds) for name, seconds in imports
+             if not name.startswith(' ')),
+            key=lambda item: item[1], reverse=True
+        )[:top]
+        print_table(['модуль', 'накоплено, с'], heaviest)
+
+    unknown = min(_run_main('unknown') for _ in range(repeats))
+    rows.append(['main.py --app=unknown', unknown, float('nan')])
+
+    print()
+    print_table(['модуль', 'процесс, с', 'импорт, с'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Бенчмарк HTTP-клиента App Translator (MyMemory) на локальной замене
+переводчика.
+
+Локальный HTTP-сервер отвечает в формате API MyMemory (с задержкой
+--delay-ms) и считает открытые к нему соединения. Сравниваются запрос
+с новым соединением на каждый перевод (как в translate.Translator) и
+MyMemoryClient с пулом keep-alive соединений: время, p95 задержки и
+количество соединений.
+
+Запуск из корня приложения:
+python3 -m benchmarks.translator_pool --requests 200 --concurrency 8 --pool-size 8
+"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from urllib.parse import parse_qs, urlparse
+
+import click
+import requests
+
+from benchmarks.common import print_table
+from entities.translators import MyMemoryClient
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """ Замена API MyMemory: переводом считается текст в верхнем регистре."""
+
+    protocol_version = 'HTTP/1.1'
+    delay = 0.0
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self) -> None:
+        super().setup()
+        with _StandInHandler.lock:
+            _StandInHandler.connections += 1
+
+    def do_GET(self) -> None:
+        time.sleep(self.delay)
+        text = parse_qs(urlparse(self.path).query).get('q', [''])[0]
+        body = json.dumps({
+            'responseData': {'translatedText': text.upper(), 'match': 1},
+            'responseStatus': 200,
+            'responseDetails': ''
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def _run(
+        translate: Callable[[str], str],
+        count: int,
+        concurrency: int
+) -> tuple[float, float, int]:
+    """
+    Выполнение переводов и подсчет соединений к серверу.
+
+    :return: Время в секундах, p95 задержки в миллисекундах и
+             количество открытых соединений.
+    :rtype: tuple[float, float, int]
+    """
+
+    def timed(i: int) -> float:
+        start = time.perf_counter()
+        translate(f"a photo number {i}")
+        return time.perf_counter() - start
+
+    _StandInHandler.connections = 0
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = sorted(executor.map(timed, range(count)))
+    elapsed = time.perf_counter() - start
+    p95 = latencies[max(int(len(latencies) * 0.95) - 1, 0)] * 1000
+
+    return elapsed, p95, _StandInHandler.connections
+
+
+@click.command()
+@click.option('--requests', 'count', default=200, help="Количество переводов")
+@click.option('--concurrency', default=8, help="Параллельных переводов")
+@click.option('--pool-size', default=8, help="Размер пула соединений")
+@click.option('--delay-ms', default=5.0, help="Задержка ответа сервера")
+def main(count: int, concurrency: int, pool_size: int, delay_ms: float) -> None:
+    _StandInHandler.delay = delay_ms / 1000
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/get"
+
+    def fresh(text: str) -> str:
+        response = requests.get(
+            url, params={'q': text, 'langpair': 'en|ru'}, timeout=5
+        )
+        return response.json()['responseData']['translatedText']
+
+    client = MyMemoryClient(to_lang='ru', url=url, pool_size=pool_size)
+
+    rows = []
+    for name, translate in (('новое соединение', fresh),
+                            ('пул keep-alive', client.translate)):
+        elapsed, p95, connections = _run(translate, count, concurrency)
+        rows.append([name, elapsed, count / elapsed, p95, connections])
+
+    print_table(
+        ['клиент', 'время, с', 'переводов/с', 'p95, мс', 'соединений'], rows
+    )
+    print(client.stats())
+
+    client.close()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
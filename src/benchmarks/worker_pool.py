@@ -0,0 +1,124 @@
+"""
+Бенчмарк пропускной способности и памяти пула процессов инференса.
+
+Для каждого обработчика выводится резидентная и собственная память:
+веса в разделяемой памяти в собственную память не входят.
+
+Запуск из корня приложения (рядом с config.yml):
+python3 -m benchmarks.worker_pool --workers 1 --workers 2 --workers 4
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+from transformers import BlipForConditionalGeneration, BlipProcessor
+
+from benchmarks.common import (
+    make_images,
+    load_images,
+    print_table,
+    process_memory_mb
+)
+from entities.cap_models import (
+    BLIPCapModelBuilder,
+    CapModelRegistry,
+    CapModelWorkerPool,
+    PooledCapModelBuilder
+)
+from infrastructure.config import (
+    BLIP_MODEL_NAME,
+    CAP_MODEL_SETTINGS,
+    DEFAULT_LENGTH_DESCRIPTION
+)
+
+
+def _make_builder() -> BLIPCapModelBuilder:
+    return BLIPCapModelBuilder(
+        model=BlipForConditionalGeneration,
+        processor=BlipProcessor,
+        download_path=CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['save_dir'],
+        cache_dir=CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['cache_dir'],
+        registry=CapModelRegistry()
+    )
+
+
+def _build_model(weights):
+    builder = _make_builder()
+    builder.set_weights(weights)
+
+    return builder.get_model()
+
+
+def _throughput(model, images: list[bytes], concurrency: int) -> float:
+    """
+    Измерение пропускной способности модели.
+
+    :return: Количество изображений в секунду.
+    :rtype: float
+    """
+
+    model.descript(images[0])  # Прогрев.
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(model.descript, images))
+
+    return len(images) / (time.perf_counter() - start)
+
+
+@click.command()
+@click.option('--workers', '-w', multiple=True, type=int,
+              default=(1, 2, 4), help="Количество процессов пула")
+@click.option('--images', 'count', default=32, help="Количество изображений")
+@click.option('--images-dir', default=None, help="Папка с изображениями")
+@click.option('--concurrency', default=8, help="Количество клиентов")
+@click.option('--torch-threads', default=1,
+              help="Количество потоков torch в процессе пула")
+def main(
+        workers: tuple[int, ...],
+        count: int,
+        images_dir: str | None,
+        concurrency: int,
+        torch_threads: int
+) -> None:
+    images = (load_images(images_dir, count) if images_dir
+              else make_images(count))
+
+    # Веса загружаются один раз и переносятся в разделяемую память.
+    builder = _make_builder()
+    builder.get_model().share_memory()
+    weights = builder.get_weights()
+
+    rows = []
+    for workers_count in workers:
+        pool = CapModelWorkerPool(
+            _build_model,
+            workers=workers_count,
+            weights=weights,
+            torch_threads=torch_threads
+        )
+        model = PooledCapModelBuilder(
+            pool, max_length=DEFAULT_LENGTH_DESCRIPTION
+        ).get_model()
+        try:
+            throughput = _throughput(model, images, concurrency)
+            memory = [process_memory_mb(pid) for pid in pool.pids()]
+            rows.append((
+                workers_count,
+                throughput,
+                sum(rss for rss, _ in memory) / len(memory),
+                sum(own for _, own in memory) / len(memory)
+            ))
+        finally:
+            pool.close()
+
+    # Базовая линия без пула (потоки в одном процессе).
+    rows.append(('без пула',
+                 _throughput(builder.get_model(), images, concurrency),
+                 '-', '-'))
+
+    print_table(('процессы', 'изобр./с', 'RSS обработчика, МБ',
+                 'собственная память обработчика, МБ'), rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,35 +1,272 @@
-import time
+"""
+Подготовка артефактов captioning-моделей и локальных моделей перевода.
+
+Артефакты всех моделей из CAP_MODEL_SETTINGS и локальной модели
+перевода готовятся параллельно (модель ждет только модели, из весов
+которой она строится). Модель пропускается, если ее артефакты
+совпадают с манифестом. Артефакты собираются в промежуточной папке и
+заменяют старые только целиком, с манифестом. Загрузки с Hugging Face
+Hub после обрыва продолжаются из кеша, копирование из локального
+набора - с места остановки.
+
+Для работы без сети модели устанавливаются из локального набора: папки
+с подпапками по названиям моделей (копии папок артефактов с
+манифестами).
+
+Запуск из корня приложения:
+python3 build.py [--bundle ./bundle] [--verify sha256] [--force]
+"""
+import json
 import logging.config
+import os
+import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
 
-from transformers import (
-    BlipForConditionalGeneration,
-    BlipProcessor,
-    # Blip2ForConditionalGeneration,
-    # Blip2Processor
-)
+import click
 
+from entities.cap_models.artifacts import (
+    VERIFY_MODES,
+    file_sha256,
+    read_manifest,
+    verify_artifacts,
+    write_manifest
+)
+from entities.cap_models.onnx_blip import (
+    ENCODER_FILE,
+    DECODER_FILE,
+    DECODER_WITH_PAST_FILE,
+    CONFIG_FILE
+)
 from infrastructure.config import (
     BLIP_MODEL_NAME,
     # BLIP2_MODEL_NAME,
-    CAP_MODEL_SETTINGS
+    ONNX_BLIP_MODEL_NAME,
+    CAP_MODEL_SETTINGS,
+    MARIAN_TRANS_NAME,
+    TRANS_MODEL_SETTINGS
 )
-from infrastructure.config import LOGGING_CONFIG
+from infrastructure.config import LOGGING_CONFIG, ensure_dirs
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+# Параметры моделей, артефакты которых готовятся (папки save_dir).
+_model_settings = {
+    **CAP_MODEL_SETTINGS,
+    MARIAN_TRANS_NAME: TRANS_MODEL_SETTINGS[MARIAN_TRANS_NAME]
+}
+
+
+def download_blip(name: str, target_dir: Path) -> None:
+    """
+    Загрузка BLIP captioning-модели и обработчика изображений.
+
+    Модель и обработчик загружаются параллельно, веса сохраняются в
+    safetensors.
+
+    :param name: Название captioning-модели.
+    :type name: str
+
+    :param target_dir: Папка для артефактов.
+    :type target_dir: Path
+    """
+
+    from transformers import BlipForConditionalGeneration, BlipProcessor
+
+    settings = CAP_MODEL_SETTINGS[name]
+
+    def download_processor() -> None:
+        processor = BlipProcessor.from_pretrained(
+            settings['download_path'],
+            cache_dir=settings['cache_dir']
+        )
+        processor.save_pretrained(target_dir)
+
+    def download_model() -> None:
+        model = BlipForConditionalGeneration.from_pretrained(
+            settings['download_path'],
+            cache_dir=settings['cache_dir']
+        )
+        model.save_pretrained(target_dir, safe_serialization=True)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(download_processor),
+                   pool.submit(download_model)]
+    for future in futures:
+        future.result()
+
+
+def export_blip_onnx(name: str, onnx_dir: Path) -> None:
+    """
+    Экспорт BLIP captioning-модели в ONNX-графы.
+
+    Создаются граф визуального энкодера и два графа текстового
+    декодера: для первого шага генерации и для последующих шагов с
+    KV-кешем, а также конфигурация токенов и обработчик изображений.
+    Экспортируются веса, подготовленные для BLIP captioning-модели.
+
+    :param name: Название captioning-модели.
+    :type name: str
 
+    :param onnx_dir: Папка для ONNX-артефактов.
+    :type onnx_dir: Path
+    """
 
-def download_blip_processor():
-    processor = BlipProcessor.from_pretrained(
-        CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['download_path'],
-        cache_dir=CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['cache_dir']
+    import torch
+    from transformers import BlipForConditionalGeneration, BlipProcessor
+
+    src_dir = CAP_MODEL_SETTINGS[name]['download_path']
+
+    model = BlipForConditionalGeneration.from_pretrained(src_dir).eval()
+    BlipProcessor.from_pretrained(src_dir).save_pretrained(onnx_dir)
+
+    text_config = model.config.text_config
+    num_layers = text_config.num_hidden_layers
+    num_heads = text_config.num_attention_heads
+    head_dim = text_config.hidden_size // num_heads
+    image_size = model.config.vision_config.image_size
+
+    class VisionEncoder(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.vision_model = model.vision_model
+
+        def forward(self, pixel_values):
+            return self.vision_model(pixel_values=pixel_values)[0]
+
+    class TextDecoder(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.text_decoder = model.text_decoder
+
+        def forward(self, input_ids, attention_mask, encoder_hidden_states,
+                    *past):
+            past_key_values = tuple(
+                (past[2 * i], past[2 * i + 1]) for i in range(num_layers)
+            ) if past else None
+            outputs = self.text_decoder(
+                input_ids=input_ids,
+                attention_mask=attention_mask,
+                encoder_hidden_states=encoder_hidden_states,
+                past_key_values=past_key_values,
+                use_cache=True,
+                return_dict=True
+            )
+            presents = outputs.past_key_values
+            if hasattr(presents, 'to_legacy_cache'):
+                presents = presents.to_legacy_cache()
+            return (outputs.logits,
+                    *(t for layer in presents for t in layer[:2]))
+
+    pixel_values = torch.randn(1, 3, image_size, image_size)
+    with torch.no_grad():
+        image_embeds = model.vision_model(pixel_values=pixel_values)[0]
+
+    torch.onnx.export(
+        VisionEncoder(),
+        (pixel_values,),
+        str(onnx_dir.joinpath(ENCODER_FILE)),
+        input_names=['pixel_values'],
+        output_names=['image_embeds'],
+        dynamic_axes={
+            'pixel_values': {0: 'batch'},
+            'image_embeds': {0: 'batch'}
+        },
+        opset_version=17
     )
-    processor.save_pretrained(CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['save_dir'])
 
+    present_names = [f'present.{i}.{kv}'
+                     for i in range(num_layers) for kv in ('key', 'value')]
+    past_names = [f'past_key_values.{i}.{kv}'
+                  for i in range(num_layers) for kv in ('key', 'value')]
+    dynamic_axes = {
+        'input_ids': {0: 'batch', 1: 'seq'},
+        'attention_mask': {0: 'batch', 1: 'total_seq'},
+        'encoder_hidden_states': {0: 'batch', 1: 'enc_seq'},
+        'logits': {0: 'batch', 1: 'seq'},
+        **{name: {0: 'batch', 2: 'total_seq'} for name in present_names}
+    }
 
-def download_blip_model():
-    model = BlipForConditionalGeneration.from_pretrained(
-        CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['download_path'],
-        cache_dir=CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['cache_dir']
+    input_ids = torch.tensor([[text_config.bos_token_id]])
+    torch.onnx.export(
+        TextDecoder(),
+        (input_ids, torch.ones_like(input_ids), image_embeds),
+        str(onnx_dir.joinpath(DECODER_FILE)),
+        input_names=['input_ids', 'attention_mask', 'encoder_hidden_states'],
+        output_names=['logits', *present_names],
+        dynamic_axes=dynamic_axes,
+        opset_version=17
     )
-    model.save_pretrained(CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['save_dir'])
+
+    past = [torch.randn(1, num_heads, 2, head_dim) for _ in past_names]
+    torch.onnx.export(
+        TextDecoder(),
+        (input_ids, torch.ones(1, 3, dtype=torch.long), image_embeds, *past),
+        str(onnx_dir.joinpath(DECODER_WITH_PAST_FILE)),
+        input_names=['input_ids', 'attention_mask', 'encoder_hidden_states',
+                     *past_names],
+        output_names=['logits', *present_names],
+        dynamic_axes={
+            **dynamic_axes,
+            **{name: {0: 'batch', 2: 'past_seq'} for name in past_names}
+        },
+        opset_version=17
+    )
+
+    with open(onnx_dir.joinpath(CONFIG_FILE), 'w') as f:
+        json.dump({
+            'bos_token_id': text_config.bos_token_id,
+            'eos_token_id': text_config.sep_token_id,
+            'pad_token_id': text_config.pad_token_id,
+            'num_layers': num_layers
+        }, f, indent=2)
+
+
+def download_marian(name: str, target_dir: Path) -> None:
+    """
+    Загрузка модели перевода MarianMT и ее токенизатора.
+
+    Модель и токенизатор загружаются параллельно, веса сохраняются в
+    safetensors.
+
+    :param name: Название переводчика.
+    :type name: str
+
+    :param target_dir: Папка для артефактов.
+    :type target_dir: Path
+    """
+
+    from transformers import MarianMTModel, MarianTokenizer
+
+    settings = TRANS_MODEL_SETTINGS[name]
+
+    def download_tokenizer() -> None:
+        tokenizer = MarianTokenizer.from_pretrained(
+            settings['download_path'],
+            cache_dir=settings['cache_dir']
+        )
+        tokenizer.save_pretrained(target_dir)
+
+    def download_model() -> None:
+        model = MarianMTModel.from_pretrained(
+            settings['download_path'],
+            cache_dir=settings['cache_dir']
+        )
+        model.save_pretrained(target_dir, safe_serialization=True)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(download_tokenizer),
+                   pool.submit(download_model)]
+    for future in futures:
+        future.result()
 
 
 # def download_blip2_processor():
@@ -37,7 +274,6 @@ def download_blip_model():
 #         CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['download_path'],
 #         cache_dir=CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['cache_dir']
 #     )
-#     time.sleep(10)
 #     processor.save_pretrained(CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['save_dir'])
 #
 #
@@ -46,35 +282,255 @@ def download_blip_model():
 #         CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['download_path'],
 #         cache_dir=CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['cache_dir']
 #     )
-#     time.sleep(10)
 #     model.save_pretrained(CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['save_dir'])
 
 
-if __name__ == '__main__':
-    # TODO: Доделать корректную загрузку моделей.
+# Способы подготовки артефактов по названиям моделей.
+_build_mapping: dict[str, Callable[[str, Path], None]] = {
+    BLIP_MODEL_NAME: download_blip,
+    ONNX_BLIP_MODEL_NAME: export_blip_onnx,
+    MARIAN_TRANS_NAME: download_marian,
+    # BLIP2_MODEL_NAME: download_blip2
+}
 
-    # Бред, но пока так
-    logging.config.dictConfig(LOGGING_CONFIG)
-    logger = logging.getLogger(__name__)
 
-    logger.info("Загрузка моделей...")
+def _dependencies(name: str) -> list[str]:
+    """
+    Получение моделей, из артефактов которых строится модель.
+
+    :param name: Название модели.
+    :type name: str
+
+    :return: Названия моделей.
+    :rtype: list[str]
+    """
+
+    return [
+        other for other, settings in _model_settings.items()
+        if other != name and other in _build_mapping
+        and settings['save_dir'] == _model_settings[name]['download_path']
+    ]
+
+
+def _is_ready(target_dir: Path, verify: str) -> bool:
+    """
+    Проверка готовности артефактов модели по манифесту.
+
+    :param target_dir: Папка артефактов.
+    :type target_dir: Path
+
+    :param verify: Способ проверки артефактов.
+    :type verify: str
+
+    :return: Совпадают ли артефакты с манифестом.
+    :rtype: bool
+    """
+
+    manifest = read_manifest(target_dir)
+    if manifest is None:
+        return False
+    try:
+        verify_artifacts(target_dir, manifest, verify)
+    except ValueError as e:
+        logger.warning(f"Артефакты {target_dir} будут подготовлены заново: "
+                       f"{e}")
+        return False
+
+    return True
+
+
+def _copy_resumable(src: Path, dst: Path, chunk_size: int = 1024 ** 2) -> None:
+    """
+    Копирование файла с продолжением после обрыва.
+
+    Файл копируется во временный файл рядом с целевым, дописывая его с
+    текущего размера, и переименовывается после полного копирования.
+
+    :param src: Исходный файл.
+    :type src: Path
+
+    :param dst: Целевой файл.
+    :type dst: Path
+    """
+
+    partial = dst.with_name(dst.name + '.partial')
+    offset = partial.stat().st_size if partial.exists() else 0
+    if offset > src.stat().st_size:
+        offset = 0
+    with open(src, 'rb') as fsrc, open(partial, 'r+b' if offset else 'wb') as fdst:
+        fsrc.seek(offset)
+        fdst.seek(offset)
+        fdst.truncate()
+        while chunk := fsrc.read(chunk_size):
+            fdst.write(chunk)
+    os.replace(partial, dst)
+
+
+def install_from_bundle(bundle_dir: Path, target_dir: Path) -> None:
+    """
+    Установка артефактов модели из локального набора.
+
+    Файлы, уже скопированные и совпадающие с манифестом набора,
+    пропускаются.
+
+    :param bundle_dir: Папка модели в наборе (с манифестом).
+    :type bundle_dir: Path
+
+    :param target_dir: Папка для артефактов.
+    :type target_dir: Path
+
+    :raises ValueError: Если в наборе нет манифеста.
+    :raises ValueError: Если файл набора не совпадает с манифестом.
+    """
 
-    download_blip_processor()
-    logger.debug("Загрузка BLIP процессора модели прошла успешно!")
+    manifest = read_manifest(bundle_dir)
+    if manifest is None:
+        raise ValueError(f"Нет манифеста в папке набора {bundle_dir}!")
 
-    time.sleep(10)
+    for name, info in manifest['files'].items():
+        src = bundle_dir.joinpath(name)
+        dst = target_dir.joinpath(name)
+        if (dst.is_file() and dst.stat().st_size == info['size']
+                and file_sha256(dst) == info['sha256']):
+            continue
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        _copy_resumable(src, dst)
+        if file_sha256(dst) != info['sha256']:
+            dst.unlink()
+            raise ValueError(f"Контрольная сумма файла {src} не совпадает "
+                             "с манифестом набора!")
 
-    download_blip_model()
-    logger.debug("Загрузка BLIP модели прошла успешно!")
 
-    # download_blip2_processor()
-    # logger.debug("Загрузка BLIP2 процессора модели прошла успешно!")
+def prepare(
+        name: str,
+        verify: str,
+        force: bool,
+        bundle: Path | None,
+        dependencies: list[Future]
+) -> str:
+    """
+    Подготовка артефактов модели.
 
-    # time.sleep(10)
+    :param name: Название модели.
+    :type name: str
 
-    # download_blip2_model()
-    # logger.debug("Загрузка BLIP2 модели прошла успешно!")
+    :param verify: Способ проверки готовых артефактов.
+    :type verify: str
 
-    logger.info("Загрузка моделей завершена!")
+    :param force: Подготовить ли артефакты, даже если они готовы.
+    :type force: bool
 
+    :param bundle: Папка локального набора (None - загрузка из сети).
+    :type bundle: Path | None
 
+    :param dependencies: Подготовка моделей, из артефактов которых
+                         строится модель.
+    :type dependencies: list[Future]
+
+    :return: Результат: 'skipped', 'bundle' или 'built'.
+    :rtype: str
+    """
+
+    for dependency in dependencies:
+        dependency.result()
+
+    target_dir = Path(_model_settings[name]['save_dir'])
+    if not force and _is_ready(target_dir, verify):
+        logger.info(f"Артефакты модели {name} готовы, подготовка пропущена")
+        return 'skipped'
+
+    # Промежуточная папка не удаляется при ошибке, чтобы продолжить
+    # копирование при следующем запуске.
+    staging_dir = target_dir.with_name(target_dir.name + '.staging')
+    staging_dir.mkdir(parents=True, exist_ok=True)
+    if bundle is not None and bundle.joinpath(name).is_dir():
+        logger.info(f"Установка модели {name} из набора {bundle}...")
+        install_from_bundle(bundle.joinpath(name), staging_dir)
+        result = 'bundle'
+    else:
+        logger.info(f"Подготовка модели {name}...")
+        _build_mapping[name](name, staging_dir)
+        result = 'built'
+    write_manifest(staging_dir)
+
+    if target_dir.exists():
+        shutil.rmtree(target_dir)
+    os.replace(staging_dir, target_dir)
+    logger.info(f"Артефакты модели {name} готовы")
+
+    return result
+
+
+@contextmanager
+def _build_lock(path: Path) -> Iterator[None]:
+    """
+    Блокировка подготовки артефактов между процессами.
+
+    Контейнеры, запускаемые одновременно с общим томом данных, готовят
+    артефакты по очереди (второй находит готовые артефакты).
+
+    :param path: Путь к файлу блокировки.
+    :type path: Path
+    """
+
+    if fcntl is None:
+        yield
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+@click.command()
+@click.option('--bundle', type=click.Path(exists=True, file_okay=False,
+                                          path_type=Path),
+              default=None,
+              help="Папка локального набора артефактов (без сети)")
+@click.option('--verify', type=click.Choice(VERIFY_MODES), default='sha256',
+              help="Проверка готовых артефактов по манифесту")
+@click.option('--force', is_flag=True,
+              help="Подготовить артефакты, даже если они готовы")
+def main(bundle: Path | None, verify: str, force: bool) -> None:
+    ensure_dirs()
+    logging.config.dictConfig(LOGGING_CONFIG)
+
+    if bundle is not None:
+        # Модели, которых нет в наборе, строятся из установленных
+        # артефактов без обращения к Hugging Face Hub.
+        os.environ['HF_HUB_OFFLINE'] = '1'
+
+    logger.info("Загрузка моделей...")
+
+    lock_path = Path(CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['save_dir']).parent
+    with _build_lock(lock_path.joinpath('.build.lock')):
+        futures: dict[str, Future] = {}
+        with ThreadPoolExecutor(max_workers=len(_build_mapping)) as pool:
+            # Модели-зависимости отправляются раньше зависимых.
+            pending = list(_build_mapping)
+            while pending:
+                for name in pending:
+                    deps = _dependencies(name)
+                    if all(dep in futures for dep in deps):
+                        futures[name] = pool.submit(
+                            prepare, name, verify, force, bundle,
+                            [futures[dep] for dep in deps]
+                        )
+                        pending.remove(name)
+                        break
+                else:
+                    raise ValueError(f"Циклическая зависимость моделей: "
+                                     f"{pending}!")
+
+        for name, future in futures.items():
+            logger.debug(f"Модель {name}: {future.result()}")
+
+    logger.info("Загрузка моделей завершена!")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,43 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Iterator, Sequence
+
+if TYPE_CHECKING:
+    from entities.cap_models.base import GenerationProfile
 
 
 class AbstractCapModelDirector(ABC):
 
+    @abstractmethod
+    def clone(self) -> 'AbstractCapModelDirector':
+        pass
+
     @abstractmethod
     def set_translator(self, *args, **kwargs) -> None:
         pass
 
     @abstractmethod
-    def get_descript(self, img: bytes, max_length: int) -> str:
+    def get_descript(
+            self,
+            img: bytes,
+            max_length: int | None,
+            profile: 'GenerationProfile | None' = None
+    ) -> str:
+        pass
+
+    @abstractmethod
+    def get_descript_stream(
+            self,
+            img: bytes,
+            max_length: int | None,
+            profile: 'GenerationProfile | None' = None
+    ) -> Iterator[str]:
+        pass
+
+    @abstractmethod
+    def get_descript_batch(
+            self,
+            images: Sequence[bytes],
+            max_lengths: int | Sequence[int | None] | None,
+            profile: 'GenerationProfile | None' = None
+    ) -> list[str]:
         pass
@@ -1,10 +1,15 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator, Sequence
 
 from entities.base import AbstractCapModelDirector
 from entities.translators import AbstractTranslator
 
 if TYPE_CHECKING:
     from entities.cap_models import AbstractCapModelBuilder
+    from entities.cap_models.base import GenerationProfile
+    from entities.cap_models.batching import (
+        CapModelBatcher,
+        CapModelBatcherStats
+    )
 
 
 class CapModelDirector(AbstractCapModelDirector):
@@ -13,19 +18,49 @@ class CapModelDirector(AbstractCapModelDirector):
 
     :ivar __builder: Атрибут строителя captioning-модели.
     :type __builder: AbstractCapModelBuilder
+
+    :ivar __batcher: Атрибут движка микро-батчинга captioning-модели.
+    :type __batcher: CapModelBatcher | None
     """
 
-    def __init__(self, builder: 'AbstractCapModelBuilder'):
+    def __init__(
+            self,
+            builder: 'AbstractCapModelBuilder',
+            batcher: 'CapModelBatcher | None' = None
+    ):
         """
         Инициализация директора captioning-моделей.
 
         :param builder: Строитель captioning-модели.
         :type builder: AbstractCapModelBuilder
+
+        :param batcher: Движок микро-батчинга captioning-модели (если
+                        не задан, то описание генерируется без
+                        батчинга).
+        :type batcher: CapModelBatcher | None
         """
 
         self.__builder = builder
+        self.__batcher = batcher
         self.__translator: AbstractTranslator | None = None
 
+    def clone(self) -> 'CapModelDirector':
+        """
+        Создание копии директора.
+
+        Копия использует тот же строитель и движок микро-батчинга, но
+        имеет собственный переводчик, поэтому копии можно безопасно
+        настраивать из разных потоков.
+
+        :return: Копия директора.
+        :rtype: CapModelDirector
+        """
+
+        director = CapModelDirector(self.__builder, batcher=self.__batcher)
+        director.set_translator(self.__translator)
+
+        return director
+
     def set_translator(self, translator: AbstractTranslator | None) -> None:
         """
         Назначение переводчика описания изображения.
@@ -41,7 +76,12 @@ class CapModelDirector(AbstractCapModelDirector):
             raise TypeError("Неверный тип переводчика описания изображения!")
         self.__translator = translator
 
-    def get_descript(self, img: bytes, max_length: int | None) -> str:
+    def get_descript(
+            self,
+            img: bytes,
+            max_length: int | None,
+            profile: 'GenerationProfile | None' = None
+    ) -> str:
         """
         Получение описания изображения.
 
@@ -51,20 +91,113 @@ class CapModelDirector(AbstractCapModelDirector):
         :param max_length: Максимальная длина описания изображения.
         :type max_length: int | None
 
+        :param profile: Профиль генерации (None - настройки модели).
+        :type profile: GenerationProfile | None
+
         :return: Описание изображения.
         :rtype: str
         """
 
-        # Инициализация строителя captioning-модели.
-        if max_length is not None:
-            self.__builder.set_max_length(max_length)
-        model = self.__builder.get_model()
-
-        # Получение результата описания изображения.
-        result = model.descript(img)
+        if self.__batcher is not None:
+            # Получение результата описания изображения через очередь
+            # батчинга.
+            result = self.__batcher.descript(img, max_length, profile)
+        else:
+            # Получение результата описания изображения.
+            model = self.__builder.get_model()
+            result = model.descript(img, max_length, profile=profile)
 
         # Проверка перевода результата описания изображения.
         if self.__translator is not None:
             result = self.__translator.translate(result)
 
         return result
+
+    def get_descript_stream(
+            self,
+            img: bytes,
+            max_length: int | None,
+            profile: 'GenerationProfile | None' = None
+    ) -> Iterator[str]:
+        """
+        Потоковое получение описания изображения.
+
+        Частичные описания отдаются по мере генерации токенов, минуя
+        очередь микро-батчинга. Перевод возможен только для полного
+        описания, поэтому переведенное описание отдается последним.
+
+        :param img: Изображение.
+        :type img: bytes
+
+        :param max_length: Максимальная длина описания изображения.
+        :type max_length: int | None
+
+        :param profile: Профиль генерации (None - настройки модели).
+        :type profile: GenerationProfile | None
+
+        :return: Итератор частичных описаний (последнее - полное, при
+                 необходимости переведенное, описание).
+        :rtype: Iterator[str]
+        """
+
+        # Получение частичных результатов описания изображения.
+        model = self.__builder.get_model()
+        result = ''
+        for result in model.descript_stream(img, max_length,
+                                            profile=profile):
+            yield result
+
+        # Проверка перевода результата описания изображения.
+        if self.__translator is not None:
+            yield self.__translator.translate(result)
+
+    def get_descript_batch(
+            self,
+            images: Sequence[bytes],
+            max_lengths: int | Sequence[int | None] | None,
+            profile: 'GenerationProfile | None' = None
+    ) -> list[str]:
+        """
+        Получение описаний батча изображений.
+
+        Батч описывается одним вызовом captioning-модели, минуя очередь
+        микро-батчинга.
+
+        :param images: Изображения.
+        :type images: Sequence[bytes]
+
+        :param max_lengths: Максимальная длина описания для всех
+                            изображений или для каждого изображения.
+        :type max_lengths: int | Sequence[int | None] | None
+
+        :param profile: Профиль генерации (None - настройки модели).
+        :type profile: GenerationProfile | None
+
+        :return: Описания изображений в порядке изображений.
+        :rtype: list[str]
+        """
+
+        # Получение результата описания изображений.
+        model = self.__builder.get_model()
+        results = model.descript_batch(
+            images, max_lengths=max_lengths, profile=profile
+        )
+
+        # Проверка перевода результата описания изображений.
+        if self.__translator is not None:
+            results = self.__translator.translate_batch(results)
+
+        return results
+
+    def get_batcher_stats(self) -> 'CapModelBatcherStats | None':
+        """
+        Получение счетчиков движка микро-батчинга.
+
+        :return: Счетчики движка или None, если батчинг отключен.
+        :rtype: CapModelBatcherStats | None
+        """
+
+        if self.__batcher is None:
+            return None
+
+        return self.__batcher.stats()
@@ -1,11 +1,63 @@
 from entities.cap_models.base import (
     AbstractCapModel,
-    AbstractCapModelBuilder
+    AbstractCapModelBuilder,
+    AbstractCapModelRegistry,
+    AbstractImageEmbedsCache,
+    AbstractTokenPrefixCache,
+    GenerationProfile
+)
+from entities.cap_models.batching import (
+    CapModelBatcher,
+    CapModelBatcherStats
 )
 from entities.cap_models.blip import BLIPCapModelBuilder
+from entities.cap_models.decoding import ImageDecoder
+from entities.cap_models.embeds_cache import (
+    ImageEmbedsCache,
+    ImageEmbedsCacheStats
+)
+from entities.cap_models.onnx_blip import ONNXBLIPCapModelBuilder
+from entities.cap_models.preprocessing import ImagePreprocessor
+from entities.cap_models.profiles import (
+    GenerationProfileController,
+    GenerationProfileStats
+)
+from entities.cap_models.token_cache import (
+    TokenPrefixCache,
+    TokenPrefixCacheStats
+)
+from entities.cap_models.registry import (
+    CapModelRegistry,
+    CapModelRegistryStats
+)
+from entities.cap_models.worker_pool import (
+    CapModelWorkerPool,
+    CapModelWorkerPoolStats,
+    PooledCapModelBuilder
+)
 
 __all__ = [
     'AbstractCapModel',
     'AbstractCapModelBuilder',
-    'BLIPCapModelBuilder'
+    'AbstractCapModelRegistry',
+    'AbstractImageEmbedsCache',
+    'AbstractTokenPrefixCache',
+    'BLIPCapModelBuilder',
+    'CapModelBatcher',
+    'CapModelBatcherStats',
+    'GenerationProfile',
+    'GenerationProfileController',
+    'GenerationProfileStats',
+    'ImageDecoder',
+    'ImageEmbedsCache',
+    'ImageEmbedsCacheStats',
+    'ImagePreprocessor',
+    'ONNXBLIPCapModelBuilder',
+    'CapModelRegistry',
+    'CapModelRegistryStats',
+    'CapModelWorkerPool',
+    'CapModelWorkerPoolStats',
+    'PooledCapModelBuilder',
+    'TokenPrefixCache',
+    'TokenPrefixCacheStats'
 ]
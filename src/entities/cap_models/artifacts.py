@@ -0,0 +1,219 @@
+import hashlib
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any
+
+
+# Манифест артефактов модели: размеры и контрольные суммы файлов.
+MANIFEST_FILE = 'manifest.json'
+
+# Способы проверки артефактов по манифесту.
+VERIFY_MODES = ('none', 'size', 'sha256')
+
+# Типы данных safetensors и соответствующие им типы torch.
+_SAFETENSORS_DTYPES = {
+    'F64': 'float64',
+    'F32': 'float32',
+    'F16': 'float16',
+    'BF16': 'bfloat16',
+    'I64': 'int64',
+    'I32': 'int32',
+    'I16': 'int16',
+    'I8': 'int8',
+    'U8': 'uint8',
+    'BOOL': 'bool'
+}
+
+
+def file_sha256(path: str | Path, chunk_size: int = 1024 ** 2) -> str:
+    """
+    Подсчет контрольной суммы файла.
+
+    :param path: Путь к файлу.
+    :type path: str | Path
+
+    :param chunk_size: Размер блока чтения в байтах.
+    :type chunk_size: int
+
+    :return: Контрольная сумма SHA-256.
+    :rtype: str
+    """
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def write_manifest(directory: str | Path) -> dict[str, Any]:
+    """
+    Создание манифеста артефактов модели.
+
+    В манифест записываются размеры и контрольные суммы всех файлов
+    папки (кроме самого манифеста).
+
+    :param directory: Путь к папке артефактов.
+    :type directory: str | Path
+
+    :return: Манифест артефактов.
+    :rtype: dict[str, Any]
+    """
+
+    directory = Path(directory)
+    files = {}
+    for path in sorted(directory.rglob('*')):
+        if not path.is_file() or path.name == MANIFEST_FILE:
+            continue
+        files[path.relative_to(directory).as_posix()] = {
+            'size': path.stat().st_size,
+            'sha256': file_sha256(path)
+        }
+    manifest = {'files': files}
+
+    tmp_path = directory.joinpath(MANIFEST_FILE + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, directory.joinpath(MANIFEST_FILE))
+
+    return manifest
+
+
+def read_manifest(directory: str | Path) -> dict[str, Any] | None:
+    """
+    Чтение манифеста артефактов модели.
+
+    :param directory: Путь к папке артефактов.
+    :type directory: str | Path
+
+    :return: Манифест артефактов или None, если манифеста нет.
+    :rtype: dict[str, Any] | None
+    """
+
+    path = Path(directory, MANIFEST_FILE)
+    if not path.is_file():
+        return None
+
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def weights_fingerprint(directory: str | Path) -> str:
+    """
+    Получение отпечатка весов модели.
+
+    Если в папке есть манифест build.py, то отпечаток - хеш контрольных
+    сумм файлов из манифеста, иначе - хеш имен, размеров и времени
+    изменения файлов папки. При замене весов меняется и отпечаток.
+
+    :param directory: Путь к папке артефактов.
+    :type directory: str | Path
+
+    :return: Отпечаток весов.
+    :rtype: str
+    """
+
+    directory = Path(directory)
+    digest = hashlib.sha1()
+    manifest = read_manifest(directory)
+    if manifest is not None:
+        for name, entry in sorted(manifest['files'].items()):
+            digest.update(f"{name}:{entry['sha256']};".encode())
+        return digest.hexdigest()
+
+    for path in sorted(directory.rglob('*')):
+        if path.is_file():
+            stat = path.stat()
+            digest.update(f"{path.relative_to(directory)}:{stat.st_size}:"
+                          f"{stat.st_mtime_ns};".encode())
+
+    return digest.hexdigest()
+
+
+def verify_artifacts(
+        directory: str | Path,
+        manifest: dict[str, Any],
+        mode: str = 'size'
+) -> None:
+    """
+    Проверка артефактов модели по манифесту.
+
+    :param directory: Путь к папке артефактов.
+    :type directory: str | Path
+
+    :param manifest: Манифест артефактов.
+    :type manifest: dict[str, Any]
+
+    :param mode: Способ проверки: 'none', 'size' (только размеры) или
+                 'sha256' (размеры и контрольные суммы, читает все
+                 файлы).
+    :type mode: str
+
+    :raises ValueError: Если способ проверки не поддерживается.
+    :raises ValueError: Если файла нет или он не совпадает с манифестом.
+    """
+
+    if mode not in VERIFY_MODES:
+        raise ValueError(f"Способ проверки {mode} не поддерживается! "
+                         f"Доступные способы: {', '.join(VERIFY_MODES)}.")
+    if mode == 'none':
+        return
+
+    for name, info in manifest['files'].items():
+        path = Path(directory, name)
+        if not path.is_file():
+            raise ValueError(f"Нет файла артефакта {path}! Нужно выполнить "
+                             "build.py.")
+        if path.stat().st_size != info['size']:
+            raise ValueError(f"Размер файла {path} не совпадает с "
+                             "манифестом! Нужно выполнить build.py.")
+        if mode == 'sha256' and file_sha256(path) != info['sha256']:
+            raise ValueError(f"Контрольная сумма файла {path} не совпадает "
+                             "с манифестом! Нужно выполнить build.py.")
+
+
+def load_safetensors_mmap(path: str | Path) -> dict[str, Any]:
+    """
+    Загрузка тензоров safetensors-файла без копирования.
+
+    Файл отображается в память целиком (MAP_PRIVATE), а тензоры
+    ссылаются на его страницы: страницы читаются с диска по мере
+    обращения и разделяются через страничный кеш между процессами,
+    отображающими тот же файл. Тензоры с невыровненным смещением
+    копируются.
+
+    :param path: Путь к safetensors-файлу.
+    :type path: str | Path
+
+    :return: Тензоры по названиям.
+    :rtype: dict[str, Any]
+    """
+
+    import torch
+
+    with open(path, 'rb') as f:
+        (header_size,) = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(header_size))
+    header.pop('__metadata__', None)
+    data_offset = 8 + header_size
+
+    storage = torch.UntypedStorage.from_file(
+        str(path), shared=False, nbytes=os.path.getsize(path)
+    )
+    tensors = {}
+    for name, info in header.items():
+        dtype = getattr(torch, _SAFETENSORS_DTYPES[info['dtype']])
+        start, end = info['data_offsets']
+        start += data_offset
+        raw = torch.empty(0, dtype=torch.uint8).set_(
+            storage, start, (end + data_offset - start,)
+        )
+        itemsize = torch.empty(0, dtype=dtype).element_size()
+        if start % itemsize:
+            raw = raw.clone()
+        tensors[name] = raw.view(dtype).reshape(info['shape'])
+
+    return tensors
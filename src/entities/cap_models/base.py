@@ -1,12 +1,120 @@
+import hashlib
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Sequence
+
+
+@dataclass(frozen=True)
+class GenerationProfile:
+    name: str
+    num_beams: int | None = None
+    max_length: int | None = None
+    image_size: int | None = None
+
+
+def image_key(model_key: str, img: bytes) -> str:
+    """
+    Получение ключа изображения для кешей captioning-модели.
+
+    :param model_key: Ключ модели (название, веса и режим точности).
+    :type model_key: str
+
+    :param img: Изображение.
+    :type img: bytes
+
+    :return: Хеш ключа модели и содержимого изображения.
+    :rtype: str
+    """
+
+    digest = hashlib.sha256(model_key.encode())
+    digest.update(img)
+
+    return digest.hexdigest()
+
+
+def normalize_max_lengths(
+        max_lengths: int | Sequence[int | None] | None,
+        count: int,
+        default: int
+) -> list[int]:
+    """
+    Приведение максимальных длин описаний к длине для каждого
+    изображения батча.
+
+    :param max_lengths: Максимальная длина описания для всех изображений
+                        или для каждого изображения.
+    :type max_lengths: int | Sequence[int | None] | None
+
+    :param count: Количество изображений в батче.
+    :type count: int
+
+    :param default: Максимальная длина описания по умолчанию.
+    :type default: int
+
+    :return: Максимальная длина описания для каждого изображения.
+    :rtype: list[int]
+
+    :raises ValueError: Если количество длин не совпадает с количеством
+                        изображений.
+    """
+
+    if max_lengths is None or isinstance(max_lengths, int):
+        return [max_lengths or default] * count
+
+    if len(max_lengths) != count:
+        raise ValueError("Количество максимальных длин описаний не "
+                         "совпадает с количеством изображений!")
+
+    return [length or default for length in max_lengths]
 
 
 class AbstractCapModel(ABC):
 
     @abstractmethod
-    def descript(self, img: bytes) -> str:
+    def descript(
+            self,
+            img: bytes,
+            max_length: int | None = None,
+            profile: GenerationProfile | None = None
+    ) -> str:
+        pass
+
+    @abstractmethod
+    def descript_batch(
+            self,
+            images: Sequence[bytes],
+            max_lengths: int | Sequence[int | None] | None = None,
+            profile: GenerationProfile | None = None
+    ) -> list[str]:
         pass
 
+    def descript_stream(
+            self,
+            img: bytes,
+            max_length: int | None = None,
+            profile: GenerationProfile | None = None
+    ) -> Iterator[str]:
+        """
+        Потоковая генерация описания изображения.
+
+        По умолчанию описание отдается целиком, когда оно готово.
+
+        :param img: Изображение.
+        :type img: bytes
+
+        :param max_length: Максимальная длина описания изображения.
+        :type max_length: int | None
+
+        :param profile: Профиль генерации (None - настройки модели).
+        :type profile: GenerationProfile | None
+
+        :return: Итератор частичных описаний (каждое следующее
+                 продолжает предыдущее, последнее - полное описание).
+        :rtype: Iterator[str]
+        """
+
+        yield self.descript(img, max_length, profile=profile)
+
 
 class AbstractCapModelBuilder(ABC):
 
@@ -17,3 +125,56 @@ class AbstractCapModelBuilder(ABC):
     @abstractmethod
     def get_model(self, *args, **kwargs) -> AbstractCapModel:
         pass
+
+
+class AbstractCapModelRegistry(ABC):
+
+    @abstractmethod
+    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        pass
+
+    @abstractmethod
+    def evict(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Any:
+        pass
+
+
+class AbstractImageEmbedsCache(ABC):
+
+    @abstractmethod
+    def make_key(self, model_key: str, img: bytes) -> str:
+        pass
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        pass
+
+    @abstractmethod
+    def put(self, key: str, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Any:
+        pass
+
+
+class AbstractTokenPrefixCache(ABC):
+
+    @abstractmethod
+    def get(self, key: str) -> tuple[tuple[int, ...], bool] | None:
+        pass
+
+    @abstractmethod
+    def put(self, key: str, tokens: Sequence[int], finished: bool) -> None:
+        pass
+
+    @abstractmethod
+    def record(self, hit: bool, resumed: bool, reused_tokens: int) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> Any:
+        pass
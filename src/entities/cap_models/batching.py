@@ -0,0 +1,320 @@
+import time
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from entities.cap_models.base import (
+        AbstractCapModelBuilder,
+        GenerationProfile
+    )
+
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class CapModelBatcherStats:
+    queue_depth: int = 0
+    requests: int = 0
+    batches: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    mean_batch_size: float = 0.0
+    mean_wait_time: float = 0.0
+    batch_size_histogram: dict[int, int] = field(default_factory=dict)
+
+
+@dataclass
+class _BatchRequest:
+    img: bytes
+    max_length: int
+    profile: 'GenerationProfile | None'
+    future: Future
+    created_at: float
+
+
+class CapModelBatcher:
+    """
+    Движок динамического микро-батчинга captioning-модели.
+
+    Запросы на описание изображений копятся в очереди, пока не наберется
+    максимальный размер батча или не истечет окно ожидания, после чего
+    выполняется батчевая генерация описаний (с максимальной длиной
+    описания каждого запроса), а результаты раздаются ожидающим
+    запросам через их future. Запросы с разными профилями генерации
+    собранного батча генерируются отдельными вызовами.
+
+    Если генерация батча завершилась ошибкой (например, одно из
+    изображений повреждено), то изображения батча описываются по
+    одному, и ошибкой завершаются только запросы, которые снова
+    завершились ошибкой. Для пула процессов инференса это значит, что
+    каждый такой запрос отправляется в пул отдельно.
+
+    :ivar __builder: Атрибут строителя captioning-модели.
+    :type __builder: AbstractCapModelBuilder
+
+    :ivar __max_batch_size: Атрибут максимального размера батча.
+    :type __max_batch_size: int
+
+    :ivar __max_wait: Атрибут окна ожидания запросов в секундах.
+    :type __max_wait: float
+
+    :ivar __default_max_length: Атрибут максимальной длины описания
+                                изображения по умолчанию.
+    :type __default_max_length: int
+
+    :ivar __queue: Атрибут очереди ожидающих запросов.
+    :type __queue: queue.Queue
+
+    :ivar __worker: Атрибут потока обработки батчей.
+    :type __worker: threading.Thread | None
+    """
+
+    def __init__(
+            self,
+            builder: 'AbstractCapModelBuilder',
+            max_batch_size: int,
+            max_wait_ms: float,
+            default_max_length: int
+    ) -> None:
+        """
+        Инициализация движка микро-батчинга.
+
+        :param builder: Строитель captioning-модели.
+        :type builder: AbstractCapModelBuilder
+
+        :param max_batch_size: Максимальный размер батча.
+        :type max_batch_size: int
+
+        :param max_wait_ms: Окно ожидания запросов в миллисекундах.
+        :type max_wait_ms: float
+
+        :param default_max_length: Максимальная длина описания
+                                   изображения по умолчанию.
+        :type default_max_length: int
+
+        :raises ValueError: Если максимальный размер батча меньше 1.
+        :raises ValueError: Если окно ожидания отрицательное.
+        """
+
+        if max_batch_size < 1:
+            raise ValueError("Максимальный размер батча должен быть больше "
+                             "0!")
+        if max_wait_ms < 0:
+            raise ValueError("Окно ожидания запросов не может быть "
+                             "отрицательным!")
+
+        self.__builder = builder
+        self.__max_batch_size = max_batch_size
+        self.__max_wait = max_wait_ms / 1000
+        self.__default_max_length = default_max_length
+
+        self.__queue: queue.Queue[_BatchRequest | None] = queue.Queue()
+        self.__worker: threading.Thread | None = None
+        self.__lock = threading.Lock()
+
+        self.__stats = CapModelBatcherStats()
+        self.__histogram: Counter[int] = Counter()
+        self.__wait_time_total = 0.0
+
+    def submit(
+            self,
+            img: bytes,
+            max_length: int | None,
+            profile: 'GenerationProfile | None' = None
+    ) -> Future:
+        """
+        Постановка запроса на описание изображения в очередь.
+
+        :param img: Изображение.
+        :type img: bytes
+
+        :param max_length: Максимальная длина описания изображения.
+        :type max_length: int | None
+
+        :param profile: Профиль генерации (None - настройки модели).
+        :type profile: GenerationProfile | None
+
+        :return: Future с описанием изображения.
+        :rtype: Future
+        """
+
+        self.__start()
+        future = Future()
+        self.__queue.put(_BatchRequest(
+            img=img,
+            max_length=max_length or self.__default_max_length,
+            profile=profile,
+            future=future,
+            created_at=time.perf_counter()
+        ))
+
+        return future
+
+    def descript(
+            self,
+            img: bytes,
+            max_length: int | None,
+            profile: 'GenerationProfile | None' = None
+    ) -> str:
+        """
+        Получение описания изображения через очередь батчинга.
+
+        :param img: Изображение.
+        :type img: bytes
+
+        :param max_length: Максимальная длина описания изображения.
+        :type max_length: int | None
+
+        :param profile: Профиль генерации (None - настройки модели).
+        :type profile: GenerationProfile | None
+
+        :return: Описание изображения.
+        :rtype: str
+        """
+
+        return self.submit(img, max_length, profile).result()
+
+    def stats(self) -> CapModelBatcherStats:
+        """
+        Получение счетчиков движка микро-батчинга.
+
+        :return: Копия счетчиков движка.
+        :rtype: CapModelBatcherStats
+        """
+
+        with self.__lock:
+            stats = self.__stats
+            return CapModelBatcherStats(
+                queue_depth=self.__queue.qsize(),
+                requests=stats.requests,
+                batches=stats.batches,
+                last_batch_size=stats.last_batch_size,
+                max_batch_size=stats.max_batch_size,
+                mean_batch_size=(stats.requests / stats.batches
+                                 if stats.batches else 0.0),
+                mean_wait_time=(self.__wait_time_total / stats.requests
+                                if stats.requests else 0.0),
+                batch_size_histogram=dict(sorted(self.__histogram.items()))
+            )
+
+    def close(self) -> None:
+        """ Остановка потока обработки батчей."""
+
+        with self.__lock:
+            worker, self.__worker = self.__worker, None
+        if worker is not None:
+            self.__queue.put(None)
+            worker.join()
+
+    def __start(self) -> None:
+        with self.__lock:
+            if self.__worker is None:
+                self.__worker = threading.Thread(
+                    target=self.__run,
+                    name='cap-model-batcher',
+                    daemon=True
+                )
+                self.__worker.start()
+
+    def __collect(self) -> list[_BatchRequest] | None:
+        """
+        Сбор батча запросов из очереди.
+
+        Блокирующее ожидание первого запроса, после чего запросы
+        собираются до заполнения батча или истечения окна ожидания.
+
+        :return: Батч запросов или None, если движок остановлен.
+        :rtype: list[_BatchRequest] | None
+        """
+
+        first = self.__queue.get()
+        if first is None:
+            return None
+
+        batch = [first]
+        deadline = time.perf_counter() + self.__max_wait
+        while len(batch) < self.__max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                item = (self.__queue.get(timeout=timeout) if timeout > 0
+                        else self.__queue.get_nowait())
+            except queue.Empty:
+                break
+            if item is None:
+                # Остановка после обработки уже собранного батча.
+                self.__queue.put(None)
+                break
+            batch.append(item)
+
+        return batch
+
+    def __descript_one(
+            self,
+            request: _BatchRequest,
+            profile: 'GenerationProfile | None'
+    ) -> tuple[str | None, Exception | None]:
+        try:
+            model = self.__builder.get_model()
+            return model.descript_batch(
+                [request.img],
+                max_lengths=[request.max_length],
+                profile=profile
+            )[0], None
+        except Exception as e:
+            return None, e
+
+    def __run(self) -> None:
+        while (batch := self.__collect()) is not None:
+            started_at = time.perf_counter()
+
+            groups: dict['GenerationProfile | None', list[_BatchRequest]] = {}
+            for request in batch:
+                groups.setdefault(request.profile, []).append(request)
+
+            for profile, requests in groups.items():
+                try:
+                    model = self.__builder.get_model()
+                    outcomes = [
+                        (result, None)
+                        for result in model.descript_batch(
+                            [request.img for request in requests],
+                            max_lengths=[request.max_length
+                                         for request in requests],
+                            profile=profile
+                        )
+                    ]
+                except Exception as e:
+                    if len(requests) > 1:
+                        logger.debug(f"Ошибка генерации батча из "
+                                     f"{len(requests)} изображений, "
+                                     f"генерация по одному: {e}")
+                        outcomes = [self.__descript_one(request, profile)
+                                    for request in requests]
+                    else:
+                        outcomes = [(None, e)]
+
+                for request, (result, error) in zip(requests, outcomes):
+                    if error is not None:
+                        request.future.set_exception(error)
+                    else:
+                        request.future.set_result(result)
+
+            with self.__lock:
+                self.__stats.requests += len(batch)
+                self.__stats.batches += 1
+                self.__stats.last_batch_size = len(batch)
+                self.__stats.max_batch_size = max(
+                    self.__stats.max_batch_size, len(batch)
+                )
+                self.__histogram[len(batch)] += 1
+                self.__wait_time_total += sum(
+                    started_at - request.created_at for request in batch
+                )
+
+            logger.debug(f"Обработан батч из {len(batch)} запросов")
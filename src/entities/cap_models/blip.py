@@ -1,16 +1,38 @@
+import itertools
+import threading
 from abc import abstractmethod
-from typing import Any
-from io import BytesIO
-
-from PIL import Image
+from functools import partial
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Iterator, Sequence
 
+from entities.cap_models.artifacts import (
+    VERIFY_MODES,
+    load_safetensors_mmap,
+    read_manifest,
+    verify_artifacts
+)
 from entities.cap_models.base import (
     AbstractCapModel,
-    AbstractCapModelBuilder
+    AbstractCapModelBuilder,
+    AbstractCapModelRegistry,
+    AbstractImageEmbedsCache,
+    AbstractTokenPrefixCache,
+    GenerationProfile,
+    image_key,
+    normalize_max_lengths
 )
+from entities.cap_models.decoding import ImageDecoder
+from entities.cap_models.preprocessing import ImagePreprocessor
 from infrastructure.config import DEFAULT_LENGTH_DESCRIPTION
 
 
+logger = getLogger(__name__)
+
+# Поддерживаемые режимы точности вычислений captioning-моделей.
+PRECISIONS = ('fp32', 'bf16', 'int8-dynamic')
+
+
 class AbstractBLIBCapModelBuilder(AbstractCapModelBuilder):
 
     @abstractmethod
@@ -34,9 +56,34 @@ class BLIPCapModel(AbstractCapModel):
 
     :ivar __max_length: Атрибут максимальной длины описания изображения.
     :type __max_length: int
+
+    :ivar __embeds_cache: Атрибут кеша эмбеддингов изображений.
+    :type __embeds_cache: AbstractImageEmbedsCache | None
+
+    :ivar __token_cache: Атрибут кеша последовательностей токенов.
+    :type __token_cache: AbstractTokenPrefixCache | None
+
+    :ivar __model_key: Атрибут ключа модели в кешах.
+    :type __model_key: str
+
+    :ivar __decoder: Атрибут декодера изображений.
+    :type __decoder: ImageDecoder
+
+    :ivar __preprocessor: Атрибут векторизованной обработки изображений.
+    :type __preprocessor: ImagePreprocessor | None
     """
 
-    def __init__(self, model: Any, processor: Any, max_length: int) -> None:
+    def __init__(
+            self,
+            model: Any,
+            processor: Any,
+            max_length: int,
+            embeds_cache: AbstractImageEmbedsCache | None = None,
+            token_cache: AbstractTokenPrefixCache | None = None,
+            model_key: str = '',
+            decoder: ImageDecoder | None = None,
+            preprocessor: ImagePreprocessor | None = None
+    ) -> None:
         """
         Инициализация общей BLIP captioning-модели.
 
@@ -48,34 +95,571 @@ class BLIPCapModel(AbstractCapModel):
 
         :param max_length: Максимальная длина описания изображения.
         :type max_length: int
+
+        :param embeds_cache: Кеш эмбеддингов изображений (None - без
+                             кеша).
+        :type embeds_cache: AbstractImageEmbedsCache | None
+
+        :param token_cache: Кеш последовательностей токенов (None - без
+                            кеша).
+        :type token_cache: AbstractTokenPrefixCache | None
+
+        :param model_key: Ключ модели в кешах.
+        :type model_key: str
+
+        :param decoder: Декодер изображений (None - полное
+                        декодирование).
+        :type decoder: ImageDecoder | None
+
+        :param preprocessor: Векторизованная обработка изображений (None
+                             - обработчик модели).
+        :type preprocessor: ImagePreprocessor | None
         """
 
         self.__model = model
         self.__processor = processor
         self.__max_length = max_length
+        self.__embeds_cache = embeds_cache
+        self.__token_cache = token_cache
+        self.__model_key = model_key
+        self.__decoder = decoder or ImageDecoder(draft=False)
+        self.__preprocessor = preprocessor
 
-    def descript(self, img: bytes) -> str:
+    def descript(
+            self,
+            img: bytes,
+            max_length: int | None = None,
+            profile: GenerationProfile | None = None
+    ) -> str:
         """
         Генерация описания изображения.
 
         :param img: Изображение.
         :type img: bytes
 
+        :param max_length: Максимальная длина описания изображения (если
+                           не задана, то используется длина модели).
+        :type max_length: int | None
+
+        :param profile: Профиль генерации (None - настройки модели).
+        :type profile: GenerationProfile | None
+
         :return: Описание изображения.
         :rtype: str
         """
 
-        img = Image.open(BytesIO(img)).convert('RGB')
-        proc_images = self.__processor(img, return_tensors="pt")
-        batch = self.__model.generate(
-            **proc_images, max_length=self.__max_length
+        return self.descript_batch(
+            [img], max_lengths=max_length, profile=profile
+        )[0]
+
+    def descript_batch(
+            self,
+            images: Sequence[bytes],
+            max_lengths: int | Sequence[int | None] | None = None,
+            profile: GenerationProfile | None = None
+    ) -> list[str]:
+        """
+        Генерация описаний батча изображений.
+
+        Изображения обрабатываются одним вызовом обработчика, а описания
+        генерируются одним вызовом генерации. При жадном декодировании
+        описание меньшей длины является префиксом описания большей
+        длины, поэтому генерация идет до наибольшей длины, а
+        последовательности токенов обрезаются до длины каждого
+        изображения. Иначе изображения генерируются группами по длине.
+
+        Если задан кеш эмбеддингов, то визуальный энкодер выполняется
+        только для изображений, которых нет в кеше, а генерация идет по
+        эмбеддингам. Если задан кеш последовательностей токенов, то при
+        жадном декодировании описания берутся или продолжаются с
+        сохраненных последовательностей.
+
+        Профиль генерации может задавать количество лучей поиска и
+        уменьшенный размер входа визуального энкодера (с интерполяцией
+        позиционных эмбеддингов).
+
+        :param images: Изображения.
+        :type images: Sequence[bytes]
+
+        :param max_lengths: Максимальная длина описания для всех
+                            изображений или для каждого изображения.
+        :type max_lengths: int | Sequence[int | None] | None
+
+        :param profile: Профиль генерации (None - настройки модели).
+        :type profile: GenerationProfile | None
+
+        :return: Описания изображений в порядке изображений.
+        :rtype: list[str]
+        """
+
+        if not images:
+            return []
+        lengths = normalize_max_lengths(
+            max_lengths, len(images), self.__max_length
         )
-        result = self.__processor.batch_decode(
-            batch, skip_special_tokens=True
-        )[0]  # Описание на английском
+
+        size = self.__input_size(profile)
+        num_beams = profile.num_beams if profile is not None else None
+        greedy = self.__is_greedy(num_beams)
+
+        # Кеши используются только у BLIP (у BLIP2 другой декодер).
+        is_blip = hasattr(self.__model, 'text_decoder')
+        keys = []
+        if is_blip and (self.__embeds_cache is not None
+                        or self.__token_cache is not None):
+            keys = [image_key(self.__cache_key(size), img) for img in images]
+
+        if self.__token_cache is not None and is_blip and greedy:
+            return self.__descript_from_prefixes(images, keys, lengths, size)
+
+        if self.__embeds_cache is not None and is_blip:
+            inputs = {
+                'image_embeds': self.__get_image_embeds(images, keys, size)
+            }
+            generate = partial(self.__generate_from_embeds,
+                               num_beams=num_beams)
+        else:
+            inputs = self.__preprocess(images, size)
+            generate_kwargs = {}
+            if num_beams is not None:
+                generate_kwargs['num_beams'] = num_beams
+            if size is not None:
+                generate_kwargs['interpolate_pos_encoding'] = True
+            generate = partial(self.__model.generate, **generate_kwargs)
+
+        if greedy:
+            groups = {max(lengths): list(range(len(images)))}
+        else:
+            groups = {}
+            for i, length in enumerate(lengths):
+                groups.setdefault(length, []).append(i)
+
+        result: list[str] = [''] * len(images)
+        for length, indexes in groups.items():
+            group_inputs = inputs
+            if len(indexes) != len(images):
+                group_inputs = {k: v[indexes] for k, v in inputs.items()}
+            batch = generate(**group_inputs, max_length=length)
+            sequences = [
+                batch[i][:lengths[index]] for i, index in enumerate(indexes)
+            ]
+            decoded = self.__processor.batch_decode(
+                sequences, skip_special_tokens=True
+            )  # Описания на английском
+            for index, desc in zip(indexes, decoded):
+                result[index] = desc
 
         return result
 
+    def descript_stream(
+            self,
+            img: bytes,
+            max_length: int | None = None,
+            profile: GenerationProfile | None = None
+    ) -> Iterator[str]:
+        """
+        Потоковая генерация описания изображения.
+
+        Генерация идет в отдельном потоке, а декодированный текст
+        отдается через стример transformers по мере генерации токенов.
+        Стример не поддерживает поиск лучами, поэтому из профиля
+        генерации используется только размер входа.
+
+        :param img: Изображение.
+        :type img: bytes
+
+        :param max_length: Максимальная длина описания изображения (если
+                           не задана, то используется длина модели).
+        :type max_length: int | None
+
+        :param profile: Профиль генерации (None - настройки модели).
+        :type profile: GenerationProfile | None
+
+        :return: Итератор частичных описаний (на английском).
+        :rtype: Iterator[str]
+
+        :raises Exception: Если ошибка при генерации описания.
+        """
+
+        from transformers import TextIteratorStreamer
+
+        length = max_length or self.__max_length
+        streamer = TextIteratorStreamer(
+            self.__processor.tokenizer,
+            skip_prompt=True,
+            skip_special_tokens=True
+        )
+
+        size = self.__input_size(profile)
+        if hasattr(self.__model, 'text_decoder'):
+            keys = ([image_key(self.__cache_key(size), img)]
+                    if self.__embeds_cache is not None else [])
+            image_embeds = self.__get_image_embeds([img], keys, size)
+
+            def generate() -> None:
+                self.__generate_from_embeds(
+                    image_embeds, length, streamer=streamer, num_beams=1
+                )
+        else:
+            inputs = self.__preprocess([img], size)
+            if size is not None:
+                inputs['interpolate_pos_encoding'] = True
+
+            def generate() -> None:
+                self.__model.generate(
+                    **inputs, max_length=length, streamer=streamer,
+                    num_beams=1
+                )
+
+        errors: list[Exception] = []
+
+        def run() -> None:
+            try:
+                generate()
+            except Exception as e:
+                errors.append(e)
+                # Остановка итерации по стримеру.
+                streamer.end()
+
+        thread = threading.Thread(
+            target=run, name='cap-model-stream', daemon=True
+        )
+        thread.start()
+
+        text = ''
+        for chunk in streamer:
+            if chunk:
+                text += chunk
+                yield text.strip()
+        thread.join()
+
+        if errors:
+            raise errors[0]
+
+    def share_memory(self) -> None:
+        """
+        Перенос весов captioning-модели в разделяемую память.
+
+        Нужен для использования весов процессами пула инференса без
+        копирования: при передаче процессу (в том числе через 'spawn'
+        и 'forkserver') тензоры в разделяемой памяти передаются
+        дескриптором, а не копией. Веса, отображенные из файла, тоже
+        переносятся (один раз), так как иначе они копировались бы при
+        передаче каждому процессу. Упакованные веса квантованных слоев
+        (int8-dynamic) не являются параметрами и копируются в каждый
+        процесс.
+        """
+
+        for tensor in itertools.chain(self.__model.parameters(),
+                                      self.__model.buffers()):
+            if not tensor.untyped_storage().is_shared():
+                tensor.share_memory_()
+
+    def __preprocess(
+            self,
+            images: Sequence[bytes],
+            size: tuple[int, int] | None = None
+    ) -> dict[str, Any]:
+        """
+        Обработка изображений обработчиком модели.
+
+        Если задана векторизованная обработка, то батч обрабатывается ею
+        (без обработчика модели).
+
+        :param images: Изображения.
+        :type images: Sequence[bytes]
+
+        :param size: Размер входа (ширина, высота; None - размер
+                     модели).
+        :type size: tuple[int, int] | None
+
+        :return: Входы модели.
+        :rtype: dict[str, Any]
+        """
+
+        if self.__preprocessor is not None:
+            import torch
+
+            size = size or self.__preprocessor.size
+            images = [self.__decoder.decode(img, size) for img in images]
+            proc_images = {
+                'pixel_values': torch.from_numpy(
+                    self.__preprocessor(images, size=size)
+                )
+            }
+        else:
+            if size is None:
+                model_size = self.__processor.image_processor.size
+                size = (model_size['width'], model_size['height'])
+            images = [self.__decoder.decode(img, size) for img in images]
+            proc_images = self.__processor(
+                images,
+                size={'width': size[0], 'height': size[1]},
+                return_tensors="pt"
+            )
+        # Приведение изображений к типу весов (например, bf16).
+        proc_images['pixel_values'] = proc_images['pixel_values'].to(
+            self.__model.dtype
+        )
+
+        return proc_images
+
+    def __descript_from_prefixes(
+            self,
+            images: Sequence[bytes],
+            keys: Sequence[str],
+            lengths: Sequence[int],
+            size: tuple[int, int] | None = None
+    ) -> list[str]:
+        """
+        Генерация описаний с переиспользованием последовательностей
+        токенов жадного декодирования.
+
+        Если сохраненная последовательность изображения завершена или не
+        короче нужной длины, то описание получается ее обрезкой без
+        генерации. Иначе генерация продолжается с сохраненной
+        последовательности (или начинается с BOS-токена). Продолжения с
+        префиксами одной длины генерируются одним батчем.
+
+        :param images: Изображения.
+        :type images: Sequence[bytes]
+
+        :param keys: Ключи изображений.
+        :type keys: Sequence[str]
+
+        :param lengths: Максимальная длина описания каждого изображения.
+        :type lengths: Sequence[int]
+
+        :param size: Размер входа (ширина, высота; None - размер
+                     модели).
+        :type size: tuple[int, int] | None
+
+        :return: Описания изображений в порядке изображений.
+        :rtype: list[str]
+        """
+
+        import torch
+
+        cache = self.__token_cache
+        text_config = self.__model.config.text_config
+
+        sequences: list[Sequence[int]] = [()] * len(images)
+        prefixes: dict[int, tuple[int, ...]] = {}
+        groups: dict[int, list[int]] = {}
+        for i, (key, length) in enumerate(zip(keys, lengths)):
+            entry = cache.get(key)
+            if entry is not None and (entry[1] or len(entry[0]) >= length):
+                sequences[i] = entry[0][:length]
+                cache.record(hit=True, resumed=False,
+                             reused_tokens=len(sequences[i]))
+                continue
+
+            prefix = (entry[0] if entry is not None
+                      else (text_config.bos_token_id,))
+            cache.record(hit=False, resumed=entry is not None,
+                         reused_tokens=len(prefix) if entry else 0)
+            prefixes[i] = prefix
+            groups.setdefault(len(prefix), []).append(i)
+
+        if groups:
+            missing = list(prefixes.keys())
+            embeds = self.__get_image_embeds(
+                [images[i] for i in missing],
+                [keys[i] for i in missing],
+                size
+            )
+            positions = {index: j for j, index in enumerate(missing)}
+
+            for indexes in groups.values():
+                batch = self.__generate_from_embeds(
+                    embeds[[positions[i] for i in indexes]],
+                    max(lengths[i] for i in indexes),
+                    input_ids=torch.tensor(
+                        [prefixes[i] for i in indexes],
+                        dtype=torch.long,
+                        device=embeds.device
+                    )
+                )
+                eos_token_id = text_config.sep_token_id
+                for row, index in zip(batch.tolist(), indexes):
+                    # Последовательность без PAD-токенов после EOS.
+                    finished = eos_token_id in row[1:]
+                    if finished:
+                        row = row[:row.index(eos_token_id, 1) + 1]
+                    cache.put(keys[index], row, finished)
+                    sequences[index] = row[:lengths[index]]
+
+        return self.__processor.batch_decode(
+            sequences, skip_special_tokens=True
+        )  # Описания на английском
+
+    def __get_image_embeds(
+            self,
+            images: Sequence[bytes],
+            keys: Sequence[str],
+            size: tuple[int, int] | None = None
+    ) -> Any:
+        """
+        Получение эмбеддингов изображений визуальным энкодером.
+
+        Если задан кеш эмбеддингов, то энкодер выполняется одним батчем
+        только для изображений, которых нет в кеше.
+
+        :param images: Изображения.
+        :type images: Sequence[bytes]
+
+        :param keys: Ключи изображений.
+        :type keys: Sequence[str]
+
+        :param size: Размер входа (ширина, высота; None - размер
+                     модели).
+        :type size: tuple[int, int] | None
+
+        :return: Эмбеддинги изображений батча.
+        :rtype: torch.Tensor
+        """
+
+        import torch
+
+        cache = self.__embeds_cache
+        embeds = ([cache.get(key) for key in keys] if cache is not None
+                  else [None] * len(images))
+
+        missing = [i for i, value in enumerate(embeds) if value is None]
+        if missing:
+            pixel_values = self.__preprocess(
+                [images[i] for i in missing], size
+            )['pixel_values']
+            with torch.no_grad():
+                new_embeds = self.__model.vision_model(
+                    pixel_values=pixel_values,
+                    interpolate_pos_encoding=size is not None
+                )[0]
+            for i, value in zip(missing, new_embeds):
+                embeds[i] = value
+                if cache is not None:
+                    # Копия, чтобы кеш не держал память всего батча.
+                    embeds[i] = value.clone()
+                    cache.put(keys[i], embeds[i])
+
+        return torch.stack(embeds)
+
+    def __generate_from_embeds(
+            self,
+            image_embeds: Any,
+            max_length: int,
+            input_ids: Any = None,
+            streamer: Any = None,
+            num_beams: int | None = None
+    ) -> Any:
+        """
+        Генерация токенов описаний по эмбеддингам изображений.
+
+        Повторяет generate BLIP после визуального энкодера.
+
+        :param image_embeds: Эмбеддинги изображений.
+        :type image_embeds: torch.Tensor
+
+        :param max_length: Максимальная длина описания.
+        :type max_length: int
+
+        :param input_ids: Префиксы последовательностей токенов одной
+                          длины (None - только BOS-токен).
+        :type input_ids: torch.Tensor | None
+
+        :param streamer: Стример генерируемых токенов (None - без
+                         стримера).
+        :type streamer: BaseStreamer | None
+
+        :param num_beams: Количество лучей поиска (None - настройки
+                          модели).
+        :type num_beams: int | None
+
+        :return: Последовательности токенов.
+        :rtype: torch.Tensor
+        """
+
+        import torch
+
+        text_config = self.__model.config.text_config
+        image_attention_mask = torch.ones(
+            image_embeds.shape[:-1], dtype=torch.long,
+            device=image_embeds.device
+        )
+        if input_ids is None:
+            input_ids = torch.full(
+                (image_embeds.shape[0], 1), text_config.bos_token_id,
+                dtype=torch.long, device=image_embeds.device
+            )
+
+        with torch.no_grad():
+            return self.__model.text_decoder.generate(
+                input_ids=input_ids,
+                eos_token_id=text_config.sep_token_id,
+                pad_token_id=text_config.pad_token_id,
+                encoder_hidden_states=image_embeds,
+                encoder_attention_mask=image_attention_mask,
+                max_length=max_length,
+                streamer=streamer,
+                **({'num_beams': num_beams} if num_beams is not None else {})
+            )
+
+    def __input_size(
+            self,
+            profile: GenerationProfile | None
+    ) -> tuple[int, int] | None:
+        """
+        Получение размера входа визуального энкодера по профилю.
+
+        :param profile: Профиль генерации.
+        :type profile: GenerationProfile | None
+
+        :return: Размер входа (ширина, высота) или None, если
+                 используется размер модели.
+        :rtype: tuple[int, int] | None
+        """
+
+        if profile is None or profile.image_size is None:
+            return None
+
+        return profile.image_size, profile.image_size
+
+    def __cache_key(self, size: tuple[int, int] | None) -> str:
+        """
+        Получение ключа модели в кешах с учетом размера входа.
+
+        :param size: Размер входа (None - размер модели).
+        :type size: tuple[int, int] | None
+
+        :return: Ключ модели в кешах.
+        :rtype: str
+        """
+
+        if size is None:
+            return self.__model_key
+
+        return f"{self.__model_key}:{size[0]}x{size[1]}"
+
+    def __is_greedy(self, num_beams: int | None = None) -> bool:
+        """
+        Проверка жадного декодирования captioning-модели.
+
+        :param num_beams: Количество лучей поиска из профиля генерации
+                          (None - настройки модели).
+        :type num_beams: int | None
+
+        :return: Используется ли жадное декодирование.
+        :rtype: bool
+        """
+
+        config = getattr(self.__model, 'generation_config', None)
+        if config is None:
+            return False
+        if num_beams is None:
+            num_beams = config.num_beams or 1
+
+        return num_beams == 1 and not config.do_sample
+
 
 class BLIPCapModelBuilder(AbstractBLIBCapModelBuilder):
     """
@@ -95,6 +679,33 @@ class BLIPCapModelBuilder(AbstractBLIBCapModelBuilder):
 
     :ivar __max_length: Атрибут максимальной длины описания изображения.
     :type __max_length: int
+
+    :ivar __registry: Атрибут реестра загруженных captioning-моделей.
+    :type __registry: AbstractCapModelRegistry
+
+    :ivar __precision: Атрибут режима точности вычислений модели.
+    :type __precision: str
+
+    :ivar __embeds_cache: Атрибут кеша эмбеддингов изображений.
+    :type __embeds_cache: AbstractImageEmbedsCache | None
+
+    :ivar __token_cache: Атрибут кеша последовательностей токенов.
+    :type __token_cache: AbstractTokenPrefixCache | None
+
+    :ivar __decoder: Атрибут декодера изображений.
+    :type __decoder: ImageDecoder | None
+
+    :ivar __vectorized_preprocessing: Атрибут использования
+                                      векторизованной обработки
+                                      изображений.
+    :type __vectorized_preprocessing: bool
+
+    :ivar __mmap_weights: Атрибут отображения safetensors-весов в
+                          память.
+    :type __mmap_weights: bool
+
+    :ivar __verify: Атрибут способа проверки артефактов по манифесту.
+    :type __verify: str
     """
 
     def __init__(
@@ -102,7 +713,15 @@ class BLIPCapModelBuilder(AbstractBLIBCapModelBuilder):
             model: Any,
             processor: Any,
             download_path: str,
-            cache_dir: str | None
+            cache_dir: str | None,
+            registry: AbstractCapModelRegistry,
+            precision: str = 'fp32',
+            embeds_cache: AbstractImageEmbedsCache | None = None,
+            token_cache: AbstractTokenPrefixCache | None = None,
+            decoder: ImageDecoder | None = None,
+            vectorized_preprocessing: bool = False,
+            mmap_weights: bool = False,
+            verify: str = 'size'
     ) -> None:
         """
         Инициализация строителя общей BLIP captioning-модели.
@@ -118,12 +737,65 @@ class BLIPCapModelBuilder(AbstractBLIBCapModelBuilder):
 
         :param cache_dir: Путь к папке кеша предобученных моделей.
         :type cache_dir: str | None
+
+        :param registry: Реестр загруженных captioning-моделей.
+        :type registry: AbstractCapModelRegistry
+
+        :param precision: Режим точности вычислений модели: 'fp32',
+                          'bf16' или 'int8-dynamic' (динамическое
+                          квантование Linear-слоев текстового декодера).
+        :type precision: str
+
+        :param embeds_cache: Кеш эмбеддингов изображений (None - без
+                             кеша).
+        :type embeds_cache: AbstractImageEmbedsCache | None
+
+        :param token_cache: Кеш последовательностей токенов жадного
+                            декодирования (None - без кеша).
+        :type token_cache: AbstractTokenPrefixCache | None
+
+        :param decoder: Декодер изображений с учетом размера модели
+                        (None - полное декодирование).
+        :type decoder: ImageDecoder | None
+
+        :param vectorized_preprocessing: Обрабатывать ли батч
+                                         изображений векторизованно
+                                         (иначе обработчиком модели).
+        :type vectorized_preprocessing: bool
+
+        :param mmap_weights: Отображать ли safetensors-веса из манифеста
+                             build.py в память (только для fp32, иначе
+                             веса все равно копируются при
+                             преобразовании).
+        :type mmap_weights: bool
+
+        :param verify: Способ проверки артефактов по манифесту: 'none',
+                       'size' или 'sha256'.
+        :type verify: str
+
+        :raises ValueError: Если режим точности не поддерживается.
+        :raises ValueError: Если способ проверки не поддерживается.
         """
 
+        if precision not in PRECISIONS:
+            raise ValueError(f"Режим точности {precision} не поддерживается! "
+                             f"Доступные режимы: {', '.join(PRECISIONS)}.")
+        if verify not in VERIFY_MODES:
+            raise ValueError(f"Способ проверки {verify} не поддерживается! "
+                             f"Доступные способы: {', '.join(VERIFY_MODES)}.")
+
         self.__model = model
         self.__processor = processor
         self.__download_path = download_path
         self.__cache_dir = cache_dir
+        self.__registry = registry
+        self.__precision = precision
+        self.__embeds_cache = embeds_cache
+        self.__token_cache = token_cache
+        self.__decoder = decoder
+        self.__vectorized_preprocessing = vectorized_preprocessing
+        self.__mmap_weights = mmap_weights
+        self.__verify = verify
 
         self.__max_length = DEFAULT_LENGTH_DESCRIPTION
 
@@ -184,21 +856,180 @@ class BLIPCapModelBuilder(AbstractBLIBCapModelBuilder):
         """
         Получение captioning-модели.
 
+        Веса модели и обработчик загружаются один раз и хранятся в
+        реестре captioning-моделей.
+
         :return: Captioning-модель.
         :rtype: BLIPCapModel
         """
 
-        cap_model = self.__model.from_pretrained(
-            self.__download_path,
-            cache_dir=self.__cache_dir
+        key = self.__key()
+        cap_model, cap_processor = self.__registry.get(key, self.__load)
+
+        return BLIPCapModel(
+            cap_model,
+            cap_processor,
+            self.__max_length,
+            embeds_cache=self.__embeds_cache,
+            token_cache=self.__token_cache,
+            model_key=key,
+            decoder=self.__decoder,
+            preprocessor=(
+                ImagePreprocessor.from_image_processor(
+                    cap_processor.image_processor
+                ) if self.__vectorized_preprocessing else None
+            )
         )
+
+    def get_weights(self) -> tuple[Any, Any]:
+        """
+        Получение весов captioning-модели и обработчика изображений.
+
+        Веса загружаются один раз и хранятся в реестре captioning-моделей.
+
+        :return: Captioning-модель и обработчик изображений.
+        :rtype: tuple[Any, Any]
+        """
+
+        return self.__registry.get(self.__key(), self.__load)
+
+    def set_weights(self, weights: tuple[Any, Any]) -> None:
+        """
+        Назначение уже загруженных весов captioning-модели.
+
+        Веса записываются в реестр вместо загрузки с диска, например, в
+        процессе пула инференса, получившем веса от основного процесса.
+        Если веса с таким ключом уже в реестре, то они не заменяются.
+
+        :param weights: Captioning-модель и обработчик изображений.
+        :type weights: tuple[Any, Any]
+        """
+
+        self.__registry.get(self.__key(), lambda: weights)
+
+    def __key(self) -> str:
+        return (f"{self.__model.__name__}:{self.__download_path}:"
+                f"{self.__precision}")
+
+    def __load(self) -> tuple[Any, Any]:
+        """
+        Загрузка весов captioning-модели и обработчика изображений.
+
+        Если в папке модели есть манифест build.py, то артефакты
+        проверяются по нему, а safetensors-веса отображаются в память.
+        Иначе веса загружаются transformers без промежуточной случайной
+        инициализации (low_cpu_mem_usage).
+
+        :return: Captioning-модель и обработчик изображений.
+        :rtype: tuple[Any, Any]
+
+        :raises ValueError: Если артефакты не совпадают с манифестом.
+        """
+
+        manifest = read_manifest(self.__download_path)
+        if manifest is not None:
+            verify_artifacts(self.__download_path, manifest, self.__verify)
+
+        cap_model = None
+        if (manifest is not None and self.__mmap_weights
+                and self.__precision == 'fp32'):
+            cap_model = self.__load_mapped(manifest)
+        if cap_model is None:
+            cap_model = self.__model.from_pretrained(
+                self.__download_path,
+                cache_dir=self.__cache_dir,
+                low_cpu_mem_usage=True,
+                use_safetensors=True if manifest is not None else None
+            )
+        cap_model = self.__apply_precision(cap_model.eval())
         cap_processor = self.__processor.from_pretrained(
             self.__download_path,
             cache_dir=self.__cache_dir
         )
 
-        return BLIPCapModel(
-            cap_model,
-            cap_processor,
-            self.__max_length
+        return cap_model, cap_processor
+
+    def __load_mapped(self, manifest: dict[str, Any]) -> Any:
+        """
+        Создание captioning-модели с весами, отображенными из
+        safetensors-файлов.
+
+        Модель создается без инициализации весов, после чего параметры
+        заменяются тензорами, ссылающимися на страницы файлов.
+
+        :param manifest: Манифест артефактов модели.
+        :type manifest: dict[str, Any]
+
+        :return: Captioning-модель или None, если в файлах не хватает
+                 весов.
+        :rtype: Any
+        """
+
+        from transformers.modeling_utils import no_init_weights
+
+        config = self.__model.config_class.from_pretrained(
+            self.__download_path
+        )
+        with no_init_weights():
+            cap_model = self.__model(config)
+
+        state_dict = {}
+        for name in manifest['files']:
+            if name.endswith('.safetensors'):
+                state_dict.update(load_safetensors_mmap(
+                    Path(self.__download_path, name)
+                ))
+        missing, _ = cap_model.load_state_dict(
+            state_dict, strict=False, assign=True
         )
+        cap_model.tie_weights()
+
+        # Связанные веса не хранятся в файле, но после tie_weights
+        # ссылаются на отображенные страницы.
+        mapped = {
+            tensor.untyped_storage().data_ptr()
+            for tensor in state_dict.values()
+        }
+        tensors = dict(itertools.chain(
+            cap_model.named_parameters(remove_duplicate=False),
+            cap_model.named_buffers(remove_duplicate=False)
+        ))
+        missing = [
+            key for key in missing
+            if tensors[key].untyped_storage().data_ptr() not in mapped
+        ]
+        if missing:
+            logger.warning(f"В safetensors-файлах нет весов {missing[:5]}, "
+                           "модель загружается без отображения в память")
+            return None
+
+        return cap_model
+
+    def __apply_precision(self, cap_model: Any) -> Any:
+        """
+        Применение режима точности вычислений к загруженной модели.
+
+        :param cap_model: Captioning-модель в fp32.
+        :type cap_model: Any
+
+        :return: Captioning-модель в заданном режиме точности.
+        :rtype: Any
+        """
+
+        import torch
+
+        match self.__precision:
+            case 'bf16':
+                cap_model = cap_model.to(torch.bfloat16)
+            case 'int8-dynamic':
+                # Текстовый декодер BLIP - text_decoder, BLIP2 -
+                # language_model.
+                name = ('text_decoder' if hasattr(cap_model, 'text_decoder')
+                        else 'language_model')
+                setattr(cap_model, name, torch.ao.quantization.quantize_dynamic(
+                    getattr(cap_model, name),
+                    {torch.nn.Linear},
+                    dtype=torch.qint8
+                ))
+
+        return cap_model
@@ -0,0 +1,135 @@
+from io import BytesIO
+from logging import getLogger
+from typing import Any
+
+from PIL import Image
+
+
+logger = getLogger(__name__)
+
+
+class ImageDecoder:
+    """
+    Декодер изображений с учетом целевого размера модели.
+
+    Обработчик captioning-модели все равно уменьшает изображение до
+    своего размера, поэтому полное декодирование больших фотографий
+    тратит время и память на отбрасываемые пиксели. JPEG декодируется
+    сразу в уменьшенном масштабе (draft-режим PIL или TurboJPEG с
+    масштабированием DCT), а остальные форматы уменьшаются дешевым
+    целочисленным усреднением (reduce) до конвертации в RGB. Размер
+    результата по каждой стороне не меньше целевого.
+
+    :ivar __draft: Атрибут использования уменьшенного декодирования.
+    :type __draft: bool
+
+    :ivar __turbojpeg: Атрибут декодера TurboJPEG (None - не
+                       используется).
+    :type __turbojpeg: Any | None
+    """
+
+    def __init__(self, draft: bool = True, turbojpeg: bool = False) -> None:
+        """
+        Инициализация декодера изображений.
+
+        :param draft: Использовать ли уменьшенное декодирование (иначе
+                      изображение декодируется полностью).
+        :type draft: bool
+
+        :param turbojpeg: Использовать ли TurboJPEG для JPEG (если
+                          библиотека недоступна, то используется PIL).
+        :type turbojpeg: bool
+        """
+
+        self.__draft = draft
+        self.__turbojpeg = self.__load_turbojpeg() if turbojpeg else None
+
+    def decode(self, img: bytes, size: tuple[int, int]) -> Image.Image:
+        """
+        Декодирование изображения в RGB.
+
+        :param img: Изображение.
+        :type img: bytes
+
+        :param size: Целевой размер модели (ширина, высота).
+        :type size: tuple[int, int]
+
+        :return: Изображение в RGB не меньше целевого размера (если
+                 исходное больше).
+        :rtype: Image.Image
+        """
+
+        if not self.__draft:
+            return Image.open(BytesIO(img)).convert('RGB')
+
+        if self.__turbojpeg is not None and img[:2] == b'\xff\xd8':
+            try:
+                return self.__decode_turbojpeg(img, size)
+            except Exception as e:
+                logger.debug(f"TurboJPEG не декодировал изображение, "
+                             f"используется PIL: {e}")
+
+        image = Image.open(BytesIO(img))
+        if image.format == 'JPEG':
+            # Масштабирование 1/2, 1/4 или 1/8 при декодировании.
+            image.draft('RGB', size)
+        else:
+            factor = min(image.width // size[0], image.height // size[1])
+            if factor > 1:
+                image = image.reduce(factor)
+
+        return image.convert('RGB')
+
+    def __decode_turbojpeg(
+            self,
+            img: bytes,
+            size: tuple[int, int]
+    ) -> Image.Image:
+        """
+        Декодирование JPEG через TurboJPEG с масштабированием DCT.
+
+        :param img: Изображение JPEG.
+        :type img: bytes
+
+        :param size: Целевой размер модели (ширина, высота).
+        :type size: tuple[int, int]
+
+        :return: Изображение в RGB.
+        :rtype: Image.Image
+        """
+
+        from turbojpeg import TJPF_RGB
+
+        width, height, _, _ = self.__turbojpeg.decode_header(img)
+        # Наименьший масштаб, при котором стороны не меньше целевых.
+        factors = sorted(self.__turbojpeg.scaling_factors,
+                         key=lambda f: f[0] / f[1])
+        scaling_factor = next(
+            (num, denom) for num, denom in factors
+            if (width * num + denom - 1) // denom >= min(size[0], width)
+            and (height * num + denom - 1) // denom >= min(size[1], height)
+        )
+
+        return Image.fromarray(self.__turbojpeg.decode(
+            img,
+            pixel_format=TJPF_RGB,
+            scaling_factor=scaling_factor
+        ))
+
+    @staticmethod
+    def __load_turbojpeg() -> Any | None:
+        """
+        Загрузка декодера TurboJPEG.
+
+        :return: Декодер TurboJPEG или None, если библиотека недоступна.
+        :rtype: Any | None
+        """
+
+        try:
+            from turbojpeg import TurboJPEG
+
+            return TurboJPEG()
+        except (ImportError, RuntimeError, OSError) as e:
+            logger.warning(f"TurboJPEG недоступен, JPEG декодируется PIL: "
+                           f"{e}")
+            return None
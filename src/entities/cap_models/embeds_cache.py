@@ -0,0 +1,355 @@
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+
+from entities.cap_models.base import AbstractImageEmbedsCache, image_key
+
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class ImageEmbedsCacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    hit_rate: float = 0.0
+    evictions: int = 0
+    spills: int = 0
+    entries: int = 0
+    memory_used: int = 0
+    memory_budget: int = 0
+    disk_used: int = 0
+    disk_budget: int = 0
+
+
+class ImageEmbedsCache(AbstractImageEmbedsCache):
+    """
+    Кеш эмбеддингов изображений визуального энкодера.
+
+    Эмбеддинги хранятся по хешу содержимого изображения и ключу модели
+    (эмбеддинги зависят от весов и режима точности). При превышении
+    бюджета памяти давно не использовавшиеся эмбеддинги (LRU) выгружаются
+    на диск, если задана папка выгрузки, иначе удаляются. Эмбеддинги с
+    диска при обращении возвращаются в память.
+
+    Выгруженные эмбеддинги лежат в подпапке версии (отпечатка весов и
+    режимов точности моделей), поэтому после пересборки весов или смены
+    точности эмбеддинги прошлых версий не читаются, а удаляются при
+    создании кеша. Запись и чтение файлов выполняются вне блокировки
+    кеша.
+
+    :ivar __memory_budget: Атрибут бюджета памяти кеша в байтах.
+    :type __memory_budget: int
+
+    :ivar __spill_dir: Атрибут папки выгрузки эмбеддингов текущей версии
+                       (None - без выгрузки).
+    :type __spill_dir: Path | None
+
+    :ivar __disk_budget: Атрибут бюджета диска в байтах (0 - без
+                         ограничений).
+    :type __disk_budget: int
+
+    :ivar __entries: Атрибут эмбеддингов в памяти, упорядоченных по
+                     времени последнего обращения.
+    :type __entries: OrderedDict[str, tuple[Any, int]]
+
+    :ivar __spilling: Атрибут эмбеддингов, которые выгружаются на диск.
+    :type __spilling: dict[str, Any]
+
+    :ivar __disk_entries: Атрибут выгруженных на диск эмбеддингов и их
+                          размеров, упорядоченных по времени выгрузки.
+    :type __disk_entries: OrderedDict[str, int]
+
+    :ivar __lock: Атрибут блокировки состояния кеша.
+    :type __lock: threading.Lock
+    """
+
+    def __init__(
+            self,
+            memory_budget: int,
+            spill_dir: str | None = None,
+            disk_budget: int = 0,
+            version: str = ''
+    ) -> None:
+        """
+        Инициализация кеша эмбеддингов изображений.
+
+        Папка выгрузки должна существовать (создается
+        config.ensure_dirs()).
+
+        :param memory_budget: Бюджет памяти кеша в байтах.
+        :type memory_budget: int
+
+        :param spill_dir: Папка выгрузки эмбеддингов на диск (None - без
+                          выгрузки).
+        :type spill_dir: str | None
+
+        :param disk_budget: Бюджет диска в байтах (0 - без ограничений).
+        :type disk_budget: int
+
+        :param version: Версия эмбеддингов (отпечаток весов и режимов
+                        точности), подпапка выгрузки.
+        :type version: str
+
+        :raises ValueError: Если бюджет памяти меньше 1 байта.
+        :raises ValueError: Если бюджет диска отрицательный.
+        """
+
+        if memory_budget < 1:
+            raise ValueError("Бюджет памяти кеша эмбеддингов должен быть "
+                             "больше 0!")
+        if disk_budget < 0:
+            raise ValueError("Бюджет диска кеша эмбеддингов не может быть "
+                             "отрицательным!")
+
+        self.__memory_budget = memory_budget
+        self.__spill_dir = (Path(spill_dir, version or 'default')
+                            if spill_dir else None)
+        self.__disk_budget = disk_budget
+
+        self.__entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self.__spilling: dict[str, Any] = {}
+        self.__disk_entries: OrderedDict[str, int] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__stats = ImageEmbedsCacheStats(
+            memory_budget=memory_budget,
+            disk_budget=disk_budget
+        )
+
+        if self.__spill_dir is not None:
+            self.__load_spilled()
+
+    def make_key(self, model_key: str, img: bytes) -> str:
+        """
+        Получение ключа эмбеддинга изображения.
+
+        :param model_key: Ключ модели (название, веса и режим точности).
+        :type model_key: str
+
+        :param img: Изображение.
+        :type img: bytes
+
+        :return: Ключ эмбеддинга.
+        :rtype: str
+        """
+
+        return image_key(model_key, img)
+
+    def get(self, key: str) -> Any | None:
+        """
+        Получение эмбеддинга изображения.
+
+        :param key: Ключ эмбеддинга.
+        :type key: str
+
+        :return: Эмбеддинг или None, если его нет в кеше.
+        :rtype: Any | None
+        """
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                self.__stats.hits += 1
+                return self.__entries[key][0]
+            if key in self.__spilling:
+                self.__stats.hits += 1
+                return self.__spilling[key]
+            if key not in self.__disk_entries:
+                self.__stats.misses += 1
+                return None
+
+        try:
+            value = self.__read(key)
+        except Exception as e:
+            logger.warning(f"Невозможно прочитать эмбеддинг {key} с диска: "
+                           f"{e}!")
+            value = None
+
+        with self.__lock:
+            dropped = self.__drop_from_disk(key)
+            if value is None:
+                self.__stats.misses += 1
+                spills = []
+            else:
+                self.__stats.disk_hits += 1
+                # Эмбеддинг мог быть прочитан с диска другим потоком.
+                if key in self.__entries:
+                    self.__entries.move_to_end(key)
+                    value = self.__entries[key][0]
+                    spills = []
+                else:
+                    spills = self.__insert(key, value)
+        self.__unlink(dropped)
+        self.__spill(spills)
+
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Сохранение эмбеддинга изображения.
+
+        :param key: Ключ эмбеддинга.
+        :type key: str
+
+        :param value: Эмбеддинг (тензор torch).
+        :type value: Any
+        """
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                return
+            spills = self.__insert(key, value)
+        self.__spill(spills)
+
+    def stats(self) -> ImageEmbedsCacheStats:
+        """
+        Получение счетчиков кеша.
+
+        :return: Копия счетчиков кеша.
+        :rtype: ImageEmbedsCacheStats
+        """
+
+        with self.__lock:
+            stats = self.__stats
+            lookups = stats.hits + stats.disk_hits + stats.misses
+            return ImageEmbedsCacheStats(
+                hits=stats.hits,
+                disk_hits=stats.disk_hits,
+                misses=stats.misses,
+                hit_rate=((stats.hits + stats.disk_hits) / lookups
+                          if lookups else 0.0),
+                evictions=stats.evictions,
+                spills=stats.spills,
+                entries=len(self.__entries),
+                memory_used=stats.memory_used,
+                memory_budget=stats.memory_budget,
+                disk_used=stats.disk_used,
+                disk_budget=stats.disk_budget
+            )
+
+    def __load_spilled(self) -> None:
+        """
+        Учет выгруженных ранее эмбеддингов текущей версии и удаление
+        эмбеддингов других версий.
+        """
+
+        os.makedirs(self.__spill_dir, exist_ok=True)
+        for path in self.__spill_dir.parent.iterdir():
+            if path == self.__spill_dir:
+                continue
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+            logger.info(f"Удалены эмбеддинги прошлой версии: {path}")
+
+        for path in sorted(self.__spill_dir.glob('*.pt'),
+                           key=lambda p: p.stat().st_mtime):
+            size = path.stat().st_size
+            self.__disk_entries[path.stem] = size
+            self.__stats.disk_used += size
+
+    def __spill_path(self, key: str) -> Path:
+        return self.__spill_dir.joinpath(f'{key}.pt')
+
+    def __read(self, key: str) -> Any:
+        import torch
+
+        return torch.load(
+            self.__spill_path(key), map_location='cpu', weights_only=True
+        )
+
+    def __insert(self, key: str, value: Any) -> list[tuple[str, Any]]:
+        """
+        Добавление эмбеддинга в память (под блокировкой).
+
+        :return: Вытесненные эмбеддинги, которые нужно выгрузить на
+                 диск после снятия блокировки.
+        :rtype: list[tuple[str, Any]]
+        """
+
+        size = int(getattr(value, 'nbytes', 0))
+        self.__entries[key] = (value, size)
+        self.__stats.memory_used += size
+
+        spills = []
+        while (self.__stats.memory_used > self.__memory_budget
+               and len(self.__entries) > 1):
+            old_key, (old_value, old_size) = self.__entries.popitem(
+                last=False
+            )
+            self.__stats.memory_used -= old_size
+            self.__stats.evictions += 1
+            if self.__spill_dir is not None:
+                self.__spilling[old_key] = old_value
+                spills.append((old_key, old_value))
+
+        return spills
+
+    def __spill(self, spills: list[tuple[str, Any]]) -> None:
+        """
+        Выгрузка вытесненных эмбеддингов на диск с соблюдением бюджета
+        диска (вне блокировки).
+
+        :param spills: Вытесненные эмбеддинги.
+        :type spills: list[tuple[str, Any]]
+        """
+
+        if not spills:
+            return
+
+        import torch
+
+        for key, value in spills:
+            path = self.__spill_path(key)
+            try:
+                torch.save(value, path)
+                size = path.stat().st_size
+            except Exception as e:
+                logger.warning(f"Невозможно выгрузить эмбеддинг {key} на "
+                               f"диск: {e}!")
+                size = None
+
+            with self.__lock:
+                self.__spilling.pop(key, None)
+                if size is None:
+                    continue
+                self.__disk_entries[key] = size
+                self.__stats.disk_used += size
+                self.__stats.spills += 1
+
+                dropped = []
+                while (self.__disk_budget
+                       and self.__stats.disk_used > self.__disk_budget
+                       and self.__disk_entries):
+                    dropped.extend(self.__drop_from_disk(
+                        next(iter(self.__disk_entries))
+                    ))
+            self.__unlink(dropped)
+
+    def __drop_from_disk(self, key: str) -> list[Path]:
+        """
+        Удаление эмбеддинга из учета диска (под блокировкой).
+
+        :return: Файлы, которые нужно удалить после снятия блокировки.
+        :rtype: list[Path]
+        """
+
+        size = self.__disk_entries.pop(key, None)
+        if size is None:
+            return []
+        self.__stats.disk_used -= size
+
+        return [self.__spill_path(key)]
+
+    @staticmethod
+    def __unlink(paths: list[Path]) -> None:
+        for path in paths:
+            path.unlink(missing_ok=True)
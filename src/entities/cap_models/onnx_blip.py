@@ -0,0 +1,406 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+from entities.cap_models.base import (
+    AbstractCapModel,
+    AbstractCapModelBuilder,
+    AbstractCapModelRegistry,
+    GenerationProfile,
+    normalize_max_lengths
+)
+from entities.cap_models.decoding import ImageDecoder
+from entities.cap_models.preprocessing import ImagePreprocessor
+from infrastructure.config import DEFAULT_LENGTH_DESCRIPTION
+
+
+# Файлы артефактов ONNX-экспорта BLIP captioning-модели.
+ENCODER_FILE = 'vision_encoder.onnx'
+DECODER_FILE = 'text_decoder.onnx'
+DECODER_WITH_PAST_FILE = 'text_decoder_with_past.onnx'
+CONFIG_FILE = 'onnx_config.json'
+
+
+@dataclass
+class ONNXBLIPArtifacts:
+    encoder: Any
+    decoder: Any
+    decoder_with_past: Any
+    processor: Any
+    bos_token_id: int
+    eos_token_id: int
+    pad_token_id: int
+    num_layers: int
+    memory_size: int
+
+
+class ONNXBLIPCapModel(AbstractCapModel):
+    """
+    BLIP captioning-модель на ONNX Runtime.
+
+    Описание генерируется жадным декодированием: граф визуального
+    энкодера считается один раз на изображение, а граф текстового
+    декодера вызывается по одному токену с KV-кешем. Графы экспортируются
+    с фиксированным размером входа и без поиска лучами, поэтому из
+    профиля генерации используется только ограничение длины (оно
+    применяется до вызова модели).
+
+    :ivar __artifacts: Атрибут сессий ONNX Runtime и параметров модели.
+    :type __artifacts: ONNXBLIPArtifacts
+
+    :ivar __max_length: Атрибут максимальной длины описания изображения.
+    :type __max_length: int
+
+    :ivar __decoder: Атрибут декодера изображений.
+    :type __decoder: ImageDecoder
+
+    :ivar __preprocessor: Атрибут векторизованной обработки изображений.
+    :type __preprocessor: ImagePreprocessor | None
+    """
+
+    def __init__(
+            self,
+            artifacts: ONNXBLIPArtifacts,
+            max_length: int,
+            decoder: ImageDecoder | None = None,
+            preprocessor: ImagePreprocessor | None = None
+    ) -> None:
+        """
+        Инициализация BLIP captioning-модели на ONNX Runtime.
+
+        :param artifacts: Сессии ONNX Runtime и параметры модели.
+        :type artifacts: ONNXBLIPArtifacts
+
+        :param max_length: Максимальная длина описания изображения.
+        :type max_length: int
+
+        :param decoder: Декодер изображений (None - полное
+                        декодирование).
+        :type decoder: ImageDecoder | None
+
+        :param preprocessor: Векторизованная обработка изображений (None
+                             - обработчик модели).
+        :type preprocessor: ImagePreprocessor | None
+        """
+
+        self.__artifacts = artifacts
+        self.__max_length = max_length
+        self.__decoder = decoder or ImageDecoder(draft=False)
+        self.__preprocessor = preprocessor
+
+    def descript(
+            self,
+            img: bytes,
+            max_length: int | None = None,
+            profile: GenerationProfile | None = None
+    ) -> str:
+        """
+        Генерация описания изображения.
+
+        :param img: Изображение.
+        :type img: bytes
+
+        :param max_length: Максимальная длина описания изображения (если
+                           не задана, то используется длина модели).
+        :type max_length: int | None
+
+        :param profile: Профиль генерации (не влияет на генерацию).
+        :type profile: GenerationProfile | None
+
+        :return: Описание изображения.
+        :rtype: str
+        """
+
+        return self.descript_batch([img], max_lengths=max_length)[0]
+
+    def descript_batch(
+            self,
+            images: Sequence[bytes],
+            max_lengths: int | Sequence[int | None] | None = None,
+            profile: GenerationProfile | None = None
+    ) -> list[str]:
+        """
+        Генерация описаний батча изображений.
+
+        Генерация идет до наибольшей длины, а последовательности токенов
+        обрезаются до длины каждого изображения (декодирование жадное).
+
+        :param images: Изображения.
+        :type images: Sequence[bytes]
+
+        :param max_lengths: Максимальная длина описания для всех
+                            изображений или для каждого изображения.
+        :type max_lengths: int | Sequence[int | None] | None
+
+        :param profile: Профиль генерации (не влияет на генерацию).
+        :type profile: GenerationProfile | None
+
+        :return: Описания изображений в порядке изображений.
+        :rtype: list[str]
+        """
+
+        if not images:
+            return []
+        lengths = normalize_max_lengths(
+            max_lengths, len(images), self.__max_length
+        )
+
+        sequences = self.generate_ids(images, max(lengths))
+
+        return self.__artifacts.processor.batch_decode(
+            [seq[:length] for seq, length in zip(sequences, lengths)],
+            skip_special_tokens=True
+        )  # Описания на английском
+
+    def generate_ids(
+            self,
+            images: Sequence[bytes],
+            max_length: int
+    ) -> list[list[int]]:
+        """
+        Жадная генерация токенов описаний изображений.
+
+        Последовательности совпадают с результатом generate torch-модели:
+        начинаются с BOS-токена, а после EOS-токена дополняются
+        PAD-токенами до общей длины.
+
+        :param images: Изображения.
+        :type images: Sequence[bytes]
+
+        :param max_length: Максимальная длина последовательности.
+        :type max_length: int
+
+        :return: Последовательности токенов.
+        :rtype: list[list[int]]
+        """
+
+        art = self.__artifacts
+
+        if self.__preprocessor is not None:
+            pixel_values = self.__preprocessor([
+                self.__decoder.decode(img, self.__preprocessor.size)
+                for img in images
+            ])
+        else:
+            size = art.processor.image_processor.size
+            pil_images = [
+                self.__decoder.decode(img, (size['width'], size['height']))
+                for img in images
+            ]
+            pixel_values = art.processor(
+                images=pil_images, return_tensors="np"
+            )['pixel_values'].astype(np.float32)
+        image_embeds = art.encoder.run(
+            None, {'pixel_values': pixel_values}
+        )[0]
+
+        batch_size = len(images)
+        input_ids = np.full((batch_size, 1), art.bos_token_id, dtype=np.int64)
+        sequences = input_ids
+        finished = np.zeros(batch_size, dtype=bool)
+
+        outputs = art.decoder.run(None, {
+            'input_ids': input_ids,
+            'attention_mask': np.ones_like(input_ids),
+            'encoder_hidden_states': image_embeds
+        })
+        while True:
+            logits, past = outputs[0], outputs[1:]
+
+            next_tokens = logits[:, -1, :].argmax(axis=-1)
+            next_tokens = np.where(finished, art.pad_token_id, next_tokens)
+            sequences = np.concatenate(
+                [sequences, next_tokens[:, None]], axis=1
+            )
+            finished |= next_tokens == art.eos_token_id
+
+            if finished.all() or sequences.shape[1] >= max_length:
+                break
+
+            feed = {
+                'input_ids': next_tokens[:, None].astype(np.int64),
+                'attention_mask': np.ones_like(sequences),
+                'encoder_hidden_states': image_embeds
+            }
+            for i in range(art.num_layers):
+                feed[f'past_key_values.{i}.key'] = past[2 * i]
+                feed[f'past_key_values.{i}.value'] = past[2 * i + 1]
+            outputs = art.decoder_with_past.run(None, feed)
+
+        return sequences.tolist()
+
+
+class ONNXBLIPCapModelBuilder(AbstractCapModelBuilder):
+    """
+    Строитель BLIP captioning-модели на ONNX Runtime.
+
+    :ivar __processor: Атрибут класса обработчика изображений.
+    :type __processor: Any
+
+    :ivar __onnx_dir: Атрибут пути к папке ONNX-артефактов.
+    :type __onnx_dir: str
+
+    :ivar __registry: Атрибут реестра загруженных captioning-моделей.
+    :type __registry: AbstractCapModelRegistry
+
+    :ivar __threads: Атрибут количества потоков ONNX Runtime (0 - по
+                     умолчанию).
+    :type __threads: int
+
+    :ivar __max_length: Атрибут максимальной длины описания изображения.
+    :type __max_length: int
+
+    :ivar __decoder: Атрибут декодера изображений.
+    :type __decoder: ImageDecoder | None
+
+    :ivar __vectorized_preprocessing: Атрибут использования
+                                      векторизованной обработки
+                                      изображений.
+    :type __vectorized_preprocessing: bool
+    """
+
+    def __init__(
+            self,
+            processor: Any,
+            onnx_dir: str,
+            registry: AbstractCapModelRegistry,
+            threads: int = 0,
+            decoder: ImageDecoder | None = None,
+            vectorized_preprocessing: bool = False
+    ) -> None:
+        """
+        Инициализация строителя BLIP captioning-модели на ONNX Runtime.
+
+        :param processor: Класс обработчика изображений.
+        :type processor: Any
+
+        :param onnx_dir: Путь к папке ONNX-артефактов (создаются
+                         build.py).
+        :type onnx_dir: str
+
+        :param registry: Реестр загруженных captioning-моделей.
+        :type registry: AbstractCapModelRegistry
+
+        :param threads: Количество потоков ONNX Runtime (0 - по
+                        умолчанию).
+        :type threads: int
+
+        :param decoder: Декодер изображений с учетом размера модели
+                        (None - полное декодирование).
+        :type decoder: ImageDecoder | None
+
+        :param vectorized_preprocessing: Обрабатывать ли батч
+                                         изображений векторизованно
+                                         (иначе обработчиком модели).
+        :type vectorized_preprocessing: bool
+        """
+
+        self.__processor = processor
+        self.__onnx_dir = onnx_dir
+        self.__registry = registry
+        self.__threads = threads
+        self.__decoder = decoder
+        self.__vectorized_preprocessing = vectorized_preprocessing
+
+        self.__max_length = DEFAULT_LENGTH_DESCRIPTION
+
+    def set_max_length(self, value: int) -> None:
+        """
+        Назначение максимальной длины описания изображения.
+
+        :param value: Значение длины описания изображения.
+        :type value: int
+
+        :raises TypeError: Если максимальная длина описания изображения
+                           не является целым числом.
+        :raises ValueError: Если максимальная длина описания
+                            изображения меньше 1 символа.
+        """
+
+        if not isinstance(value, int):
+            raise TypeError("Максимальная длина описания изображения должна "
+                            "быть целым числом.")
+        elif value < 1:
+            raise ValueError("Максимальная длина описания изображения должна "
+                             "быть больше 1 символа.")
+        self.__max_length = value
+
+    def get_model(self) -> ONNXBLIPCapModel:
+        """
+        Получение captioning-модели.
+
+        Сессии ONNX Runtime создаются один раз и хранятся в реестре
+        captioning-моделей.
+
+        :return: Captioning-модель.
+        :rtype: ONNXBLIPCapModel
+        """
+
+        artifacts = self.__registry.get(
+            f"ONNXBLIP:{self.__onnx_dir}",
+            self.__load
+        )
+
+        return ONNXBLIPCapModel(
+            artifacts,
+            self.__max_length,
+            decoder=self.__decoder,
+            preprocessor=(
+                ImagePreprocessor.from_image_processor(
+                    artifacts.processor.image_processor
+                ) if self.__vectorized_preprocessing else None
+            )
+        )
+
+    def __load(self) -> ONNXBLIPArtifacts:
+        """
+        Создание сессий ONNX Runtime и загрузка обработчика изображений.
+
+        :return: Сессии ONNX Runtime и параметры модели.
+        :rtype: ONNXBLIPArtifacts
+
+        :raises FileNotFoundError: Если нет ONNX-артефактов.
+        """
+
+        import onnxruntime as ort
+
+        onnx_dir = Path(self.__onnx_dir)
+        if not onnx_dir.joinpath(CONFIG_FILE).exists():
+            raise FileNotFoundError(f"Нет ONNX-артефактов в папке {onnx_dir}! "
+                                    "Нужно выполнить build.py.")
+
+        with open(onnx_dir.joinpath(CONFIG_FILE), 'r') as f:
+            config = json.load(f)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = (
+            ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        if self.__threads:
+            options.intra_op_num_threads = self.__threads
+
+        def session(name: str) -> Any:
+            return ort.InferenceSession(
+                str(onnx_dir.joinpath(name)),
+                sess_options=options,
+                providers=['CPUExecutionProvider']
+            )
+
+        return ONNXBLIPArtifacts(
+            encoder=session(ENCODER_FILE),
+            decoder=session(DECODER_FILE),
+            decoder_with_past=session(DECODER_WITH_PAST_FILE),
+            processor=self.__processor.from_pretrained(str(onnx_dir)),
+            bos_token_id=config['bos_token_id'],
+            eos_token_id=config['eos_token_id'],
+            pad_token_id=config['pad_token_id'],
+            num_layers=config['num_layers'],
+            memory_size=sum(
+                onnx_dir.joinpath(name).stat().st_size
+                for name in (ENCODER_FILE, DECODER_FILE,
+                             DECODER_WITH_PAST_FILE)
+            )
+        )
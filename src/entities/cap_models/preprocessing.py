@@ -0,0 +1,159 @@
+from typing import Any, Sequence
+
+import numpy as np
+from PIL import Image
+
+
+class ImagePreprocessor:
+    """
+    Векторизованная обработка батча изображений для captioning-модели.
+
+    Повторяет resize, rescale и normalize обработчика изображений BLIP,
+    но без обобщенного кода transformers для каждого изображения:
+    изображения уменьшаются PIL сразу в ячейки заранее выделенного
+    массива батча, после чего rescale и normalize выполняются одной
+    операцией над всем батчем (как умножение и сдвиг по каналам) в
+    непрерывный массив (N, 3, H, W).
+
+    :ivar __size: Атрибут размера входа модели (ширина, высота).
+    :type __size: tuple[int, int]
+
+    :ivar __resample: Атрибут фильтра изменения размера PIL.
+    :type __resample: Image.Resampling
+
+    :ivar __do_resize: Атрибут необходимости изменения размера.
+    :type __do_resize: bool
+
+    :ivar __scale: Атрибут множителя по каналам (rescale / std).
+    :type __scale: np.ndarray
+
+    :ivar __shift: Атрибут сдвига по каналам (-mean / std).
+    :type __shift: np.ndarray
+    """
+
+    def __init__(
+            self,
+            size: tuple[int, int],
+            image_mean: Sequence[float],
+            image_std: Sequence[float],
+            rescale_factor: float = 1 / 255,
+            resample: int = Image.Resampling.BICUBIC,
+            do_resize: bool = True,
+            do_rescale: bool = True,
+            do_normalize: bool = True
+    ) -> None:
+        """
+        Инициализация векторизованной обработки изображений.
+
+        :param size: Размер входа модели (ширина, высота).
+        :type size: tuple[int, int]
+
+        :param image_mean: Среднее по каналам для нормализации.
+        :type image_mean: Sequence[float]
+
+        :param image_std: Стандартное отклонение по каналам для
+                          нормализации.
+        :type image_std: Sequence[float]
+
+        :param rescale_factor: Множитель перевода пикселей в [0, 1].
+        :type rescale_factor: float
+
+        :param resample: Фильтр изменения размера PIL.
+        :type resample: int
+
+        :param do_resize: Изменять ли размер изображений.
+        :type do_resize: bool
+
+        :param do_rescale: Переводить ли пиксели в [0, 1].
+        :type do_rescale: bool
+
+        :param do_normalize: Нормализовать ли пиксели.
+        :type do_normalize: bool
+        """
+
+        self.__size = size
+        self.__resample = Image.Resampling(int(resample))
+        self.__do_resize = do_resize
+
+        mean = np.asarray(image_mean if do_normalize else (0.0,) * 3,
+                          dtype=np.float32)
+        std = np.asarray(image_std if do_normalize else (1.0,) * 3,
+                         dtype=np.float32)
+        factor = np.float32(rescale_factor if do_rescale else 1.0)
+        self.__scale = (factor / std)[:, None, None]
+        self.__shift = (-mean / std)[:, None, None]
+
+    @classmethod
+    def from_image_processor(cls, image_processor: Any) -> 'ImagePreprocessor':
+        """
+        Создание обработки по параметрам обработчика изображений BLIP.
+
+        :param image_processor: Обработчик изображений transformers
+                                (BlipImageProcessor).
+        :type image_processor: Any
+
+        :return: Векторизованная обработка изображений.
+        :rtype: ImagePreprocessor
+        """
+
+        size = image_processor.size
+
+        return cls(
+            size=(size['width'], size['height']),
+            image_mean=image_processor.image_mean,
+            image_std=image_processor.image_std,
+            rescale_factor=image_processor.rescale_factor,
+            resample=image_processor.resample,
+            do_resize=image_processor.do_resize,
+            do_rescale=image_processor.do_rescale,
+            do_normalize=image_processor.do_normalize
+        )
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """ Размер входа модели (ширина, высота)."""
+
+        return self.__size
+
+    def __call__(
+            self,
+            images: Sequence[Image.Image],
+            size: tuple[int, int] | None = None
+    ) -> np.ndarray:
+        """
+        Обработка батча изображений.
+
+        :param images: Изображения в RGB.
+        :type images: Sequence[Image.Image]
+
+        :param size: Размер входа (ширина, высота; None - размер
+                     модели).
+        :type size: tuple[int, int] | None
+
+        :return: Непрерывный массив float32 формы (N, 3, H, W).
+        :rtype: np.ndarray
+
+        :raises ValueError: Если без изменения размера размеры
+                            изображений не совпадают с размером модели.
+        """
+
+        size = size or self.__size
+        width, height = size
+        pixels = np.empty((len(images), height, width, 3), dtype=np.uint8)
+        for i, image in enumerate(images):
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            if self.__do_resize:
+                image = image.resize(size, self.__resample)
+            elif image.size != size:
+                raise ValueError(f"Размер изображения {image.size} не "
+                                 f"совпадает с размером модели {size}!")
+            pixels[i] = np.asarray(image)
+
+        pixel_values = np.empty((len(images), 3, height, width),
+                                dtype=np.float32)
+        np.multiply(pixels.transpose(0, 3, 1, 2), self.__scale,
+                    out=pixel_values)
+        pixel_values += self.__shift
+
+        return pixel_values
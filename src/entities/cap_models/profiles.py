@@ -0,0 +1,304 @@
+import time
+import threading
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Callable, Iterator, Sequence
+
+from entities.cap_models.base import GenerationProfile
+
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class GenerationProfileStats:
+    active: str = ''
+    default: str = ''
+    auto: bool = True
+    queue_depth: int = 0
+    in_flight: int = 0
+    latency_p95: float = 0.0
+    switches: int = 0
+    requests: dict[str, int] = field(default_factory=dict)
+    pinned: int = 0
+
+
+class GenerationProfileController:
+    """
+    Контроллер профилей генерации описаний.
+
+    Профили упорядочены от самого качественного к самому быстрому.
+    Запросы без явно заданного профиля получают активный профиль. При
+    перегрузке (глубина очереди или p95 задержки выше верхних порогов)
+    активный профиль сдвигается на один шаг к более быстрому, а когда
+    нагрузка опускается ниже нижних порогов - на шаг обратно, но не
+    дальше профиля по умолчанию. Между переключениями выдерживается
+    пауза, чтобы профиль не колебался.
+
+    :ivar __profiles: Атрибут профилей генерации в порядке убывания
+                      качества.
+    :type __profiles: list[GenerationProfile]
+
+    :ivar __default: Атрибут индекса профиля по умолчанию.
+    :type __default: int
+
+    :ivar __active: Атрибут индекса активного профиля.
+    :type __active: int
+
+    :ivar __auto: Атрибут автоматического переключения профилей.
+    :type __auto: bool
+
+    :ivar __queue_depth_high: Атрибут глубины очереди для перехода к
+                              более быстрому профилю.
+    :type __queue_depth_high: int
+
+    :ivar __queue_depth_low: Атрибут глубины очереди для возврата к
+                             более качественному профилю.
+    :type __queue_depth_low: int
+
+    :ivar __latency_p95_high: Атрибут p95 задержки (в секундах) для
+                              перехода к более быстрому профилю.
+    :type __latency_p95_high: float
+
+    :ivar __latency_p95_low: Атрибут p95 задержки (в секундах) для
+                             возврата к более качественному профилю.
+    :type __latency_p95_low: float
+
+    :ivar __cooldown: Атрибут паузы между переключениями в секундах.
+    :type __cooldown: float
+
+    :ivar __queue_depth: Атрибут источника глубины очереди (None -
+                         количество выполняющихся запросов).
+    :type __queue_depth: Callable[[], int] | None
+
+    :ivar __latencies: Атрибут окна последних задержек запросов.
+    :type __latencies: deque[float]
+    """
+
+    def __init__(
+            self,
+            profiles: Sequence[GenerationProfile],
+            default: str,
+            auto: bool = True,
+            queue_depth_high: int = 16,
+            queue_depth_low: int = 4,
+            latency_p95_high_ms: float = 5000,
+            latency_p95_low_ms: float = 2000,
+            window: int = 100,
+            cooldown_s: float = 10.0
+    ) -> None:
+        """
+        Инициализация контроллера профилей генерации.
+
+        :param profiles: Профили генерации в порядке убывания качества.
+        :type profiles: Sequence[GenerationProfile]
+
+        :param default: Название профиля по умолчанию.
+        :type default: str
+
+        :param auto: Переключать ли профили автоматически по нагрузке.
+        :type auto: bool
+
+        :param queue_depth_high: Глубина очереди для перехода к более
+                                 быстрому профилю.
+        :type queue_depth_high: int
+
+        :param queue_depth_low: Глубина очереди для возврата к более
+                                качественному профилю.
+        :type queue_depth_low: int
+
+        :param latency_p95_high_ms: p95 задержки в миллисекундах для
+                                    перехода к более быстрому профилю.
+        :type latency_p95_high_ms: float
+
+        :param latency_p95_low_ms: p95 задержки в миллисекундах для
+                                   возврата к более качественному
+                                   профилю.
+        :type latency_p95_low_ms: float
+
+        :param window: Количество последних запросов для расчета p95.
+        :type window: int
+
+        :param cooldown_s: Пауза между переключениями в секундах.
+        :type cooldown_s: float
+
+        :raises ValueError: Если нет профилей генерации.
+        :raises ValueError: Если нет профиля по умолчанию.
+        :raises ValueError: Если нижние пороги выше верхних.
+        """
+
+        names = [profile.name for profile in profiles]
+        if not names:
+            raise ValueError("Нужен хотя бы один профиль генерации!")
+        if default not in names:
+            raise ValueError(f"Нет профиля генерации по умолчанию: "
+                             f"{default}!")
+        if (queue_depth_low > queue_depth_high
+                or latency_p95_low_ms > latency_p95_high_ms):
+            raise ValueError("Нижние пороги нагрузки не могут быть выше "
+                             "верхних!")
+
+        self.__profiles = list(profiles)
+        self.__default = names.index(default)
+        self.__active = self.__default
+        self.__auto = auto
+        self.__queue_depth_high = queue_depth_high
+        self.__queue_depth_low = queue_depth_low
+        self.__latency_p95_high = latency_p95_high_ms / 1000
+        self.__latency_p95_low = latency_p95_low_ms / 1000
+        self.__cooldown = cooldown_s
+        self.__queue_depth: Callable[[], int] | None = None
+
+        self.__latencies: deque[float] = deque(maxlen=window)
+        self.__in_flight = 0
+        self.__switched_at = 0.0
+        self.__lock = threading.Lock()
+        self.__stats = GenerationProfileStats(
+            active=default, default=default, auto=auto
+        )
+        self.__requests: Counter[str] = Counter()
+
+    @property
+    def names(self) -> list[str]:
+        """ Названия профилей генерации в порядке убывания качества."""
+
+        return [profile.name for profile in self.__profiles]
+
+    def set_queue_depth(self, source: Callable[[], int] | None) -> None:
+        """
+        Назначение источника глубины очереди запросов.
+
+        :param source: Источник глубины очереди (None - количество
+                       выполняющихся запросов).
+        :type source: Callable[[], int] | None
+        """
+
+        self.__queue_depth = source
+
+    def select(self, name: str | None = None) -> GenerationProfile:
+        """
+        Выбор профиля генерации.
+
+        :param name: Название закрепленного клиентом профиля (None -
+                     активный профиль).
+        :type name: str | None
+
+        :return: Профиль генерации.
+        :rtype: GenerationProfile
+
+        :raises ValueError: Если нет профиля генерации.
+        """
+
+        if name is None:
+            with self.__lock:
+                return self.__profiles[self.__active]
+
+        for profile in self.__profiles:
+            if profile.name == name:
+                return profile
+
+        raise ValueError(f"Нет такого профиля генерации: {name}!")
+
+    @contextmanager
+    def track(
+            self,
+            profile: GenerationProfile,
+            pinned: bool = False
+    ) -> Iterator[GenerationProfile]:
+        """
+        Выполнение запроса с выбранным профилем генерации.
+
+        Запрос учитывается в нагрузке, а его задержка - в окне для p95.
+
+        :param profile: Профиль генерации запроса.
+        :type profile: GenerationProfile
+
+        :param pinned: Закреплен ли профиль клиентом.
+        :type pinned: bool
+
+        :return: Профиль генерации запроса.
+        :rtype: Iterator[GenerationProfile]
+        """
+
+        with self.__lock:
+            self.__in_flight += 1
+            self.__requests[profile.name] += 1
+            if pinned:
+                self.__stats.pinned += 1
+            self.__adapt()
+
+        start = time.perf_counter()
+        try:
+            yield profile
+        finally:
+            latency = time.perf_counter() - start
+            with self.__lock:
+                self.__in_flight -= 1
+                self.__latencies.append(latency)
+                self.__adapt()
+
+    def stats(self) -> GenerationProfileStats:
+        """
+        Получение счетчиков контроллера.
+
+        :return: Копия счетчиков контроллера.
+        :rtype: GenerationProfileStats
+        """
+
+        with self.__lock:
+            return GenerationProfileStats(
+                active=self.__profiles[self.__active].name,
+                default=self.__stats.default,
+                auto=self.__auto,
+                queue_depth=self.__get_queue_depth(),
+                in_flight=self.__in_flight,
+                latency_p95=self.__latency_p95(),
+                switches=self.__stats.switches,
+                requests=dict(self.__requests),
+                pinned=self.__stats.pinned
+            )
+
+    def __get_queue_depth(self) -> int:
+        if self.__queue_depth is None:
+            return self.__in_flight
+
+        return self.__queue_depth()
+
+    def __latency_p95(self) -> float:
+        if not self.__latencies:
+            return 0.0
+
+        latencies = sorted(self.__latencies)
+        return latencies[max(int(len(latencies) * 0.95) - 1, 0)]
+
+    def __adapt(self) -> None:
+        """ Переключение активного профиля по текущей нагрузке."""
+
+        if not self.__auto:
+            return
+        now = time.monotonic()
+        if now - self.__switched_at < self.__cooldown:
+            return
+
+        queue_depth = self.__get_queue_depth()
+        latency_p95 = self.__latency_p95()
+        active = self.__active
+        if (queue_depth > self.__queue_depth_high
+                or latency_p95 > self.__latency_p95_high):
+            active = min(active + 1, len(self.__profiles) - 1)
+        elif (queue_depth < self.__queue_depth_low
+              and latency_p95 < self.__latency_p95_low):
+            active = max(active - 1, self.__default)
+
+        if active != self.__active:
+            logger.info(f"Профиль генерации переключен: "
+                        f"{self.__profiles[self.__active].name} -> "
+                        f"{self.__profiles[active].name} (очередь "
+                        f"{queue_depth}, p95 {latency_p95:.2f} с)")
+            self.__active = active
+            self.__switched_at = now
+            self.__stats.switches += 1
+            # Задержки прошлого профиля не описывают новый.
+            self.__latencies.clear()
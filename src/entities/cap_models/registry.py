@@ -0,0 +1,240 @@
+import time
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any, Callable
+
+from entities.cap_models.base import AbstractCapModelRegistry
+
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class CapModelRegistryStats:
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    evictions: int = 0
+    load_time_total: float = 0.0
+    load_time_last: float = 0.0
+    memory_used: int = 0
+    memory_budget: int = 0
+    rss_last: int = 0
+    models: list[str] = field(default_factory=list)
+
+
+class CapModelRegistry(AbstractCapModelRegistry):
+    """
+    Реестр загруженных captioning-моделей процесса.
+
+    Модели загружаются лениво при первом обращении и остаются в памяти
+    до тех пор, пока суммарный объем моделей не превысит бюджет памяти.
+    При превышении бюджета выгружаются давно не использовавшиеся модели
+    (LRU).
+
+    :ivar __memory_budget: Атрибут бюджета памяти реестра в байтах
+                           (0 - без ограничений).
+    :type __memory_budget: int
+
+    :ivar __entries: Атрибут загруженных моделей, упорядоченных по
+                     времени последнего обращения.
+    :type __entries: OrderedDict[str, tuple[Any, int]]
+
+    :ivar __key_locks: Атрибут блокировок загрузки по ключам моделей.
+    :type __key_locks: dict[str, threading.Lock]
+
+    :ivar __lock: Атрибут блокировки состояния реестра.
+    :type __lock: threading.Lock
+
+    :ivar __stats: Атрибут счетчиков реестра.
+    :type __stats: CapModelRegistryStats
+    """
+
+    def __init__(self, memory_budget: int = 0) -> None:
+        """
+        Инициализация реестра captioning-моделей.
+
+        :param memory_budget: Бюджет памяти реестра в байтах
+                              (0 - без ограничений).
+        :type memory_budget: int
+
+        :raises ValueError: Если бюджет памяти отрицательный.
+        """
+
+        if memory_budget < 0:
+            raise ValueError("Бюджет памяти реестра не может быть "
+                             "отрицательным!")
+
+        self.__memory_budget = memory_budget
+        self.__entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self.__key_locks: dict[str, threading.Lock] = {}
+        self.__lock = threading.Lock()
+        self.__stats = CapModelRegistryStats(memory_budget=memory_budget)
+
+    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        """
+        Получение загруженной модели по ключу.
+
+        Если модели нет в реестре, то она загружается с помощью
+        загрузчика. Одна и та же модель не загружается параллельно
+        несколькими потоками.
+
+        :param key: Ключ модели.
+        :type key: str
+
+        :param loader: Загрузчик модели.
+        :type loader: Callable[[], Any]
+
+        :return: Загруженная модель.
+        :rtype: Any
+        """
+
+        with self.__lock:
+            if key in self.__entries:
+                return self.__hit(key)
+            key_lock = self.__key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Модель могла быть загружена другим потоком.
+            with self.__lock:
+                if key in self.__entries:
+                    return self.__hit(key)
+                self.__stats.misses += 1
+
+            start = time.perf_counter()
+            value = loader()
+            load_time = time.perf_counter() - start
+            size = self._estimate_size(value)
+            rss = self._rss()
+
+            logger.info(f"Модель {key} загружена за {load_time:.2f} с "
+                        f"({size / 1024 ** 2:.0f} МБ, RSS процесса "
+                        f"{rss / 1024 ** 2:.0f} МБ)")
+
+            with self.__lock:
+                self.__entries[key] = (value, size)
+                self.__stats.loads += 1
+                self.__stats.load_time_total += load_time
+                self.__stats.load_time_last = load_time
+                self.__stats.rss_last = rss
+                self.__stats.memory_used += size
+                self.__evict(keep=key)
+
+        return value
+
+    def evict(self, key: str) -> bool:
+        """
+        Выгрузка модели из реестра.
+
+        :param key: Ключ модели.
+        :type key: str
+
+        :return: Была ли модель выгружена.
+        :rtype: bool
+        """
+
+        with self.__lock:
+            if key not in self.__entries:
+                return False
+            self.__remove(key)
+
+        return True
+
+    def stats(self) -> CapModelRegistryStats:
+        """
+        Получение счетчиков реестра.
+
+        :return: Копия счетчиков реестра.
+        :rtype: CapModelRegistryStats
+        """
+
+        with self.__lock:
+            return CapModelRegistryStats(
+                hits=self.__stats.hits,
+                misses=self.__stats.misses,
+                loads=self.__stats.loads,
+                evictions=self.__stats.evictions,
+                load_time_total=self.__stats.load_time_total,
+                load_time_last=self.__stats.load_time_last,
+                memory_used=self.__stats.memory_used,
+                memory_budget=self.__stats.memory_budget,
+                rss_last=self.__stats.rss_last,
+                models=list(self.__entries.keys())
+            )
+
+    def __hit(self, key: str) -> Any:
+        self.__entries.move_to_end(key)
+        self.__stats.hits += 1
+        return self.__entries[key][0]
+
+    def __remove(self, key: str) -> None:
+        _, size = self.__entries.pop(key)
+        self.__stats.memory_used -= size
+        self.__stats.evictions += 1
+        logger.info(f"Модель {key} выгружена из реестра")
+
+    def __evict(self, keep: str) -> None:
+        if self.__memory_budget == 0:
+            return
+
+        for key in list(self.__entries.keys()):
+            if self.__stats.memory_used <= self.__memory_budget:
+                break
+            if key != keep:
+                self.__remove(key)
+
+        if self.__stats.memory_used > self.__memory_budget:
+            logger.warning(f"Модель {keep} превышает бюджет памяти реестра "
+                           f"({self.__memory_budget} байт)!")
+
+    @staticmethod
+    def _rss() -> int:
+        """
+        Получение резидентной памяти процесса.
+
+        Веса, отображенные из файлов, учитываются только в прочитанной
+        части.
+
+        :return: Резидентная память в байтах (0, если недоступна).
+        :rtype: int
+        """
+
+        try:
+            with open('/proc/self/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+
+        return 0
+
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        """
+        Оценка объема памяти, занимаемого весами модели.
+
+        :param value: Загруженная модель, кортеж из модели и обработчика
+                      или объект с атрибутом memory_size.
+        :type value: Any
+
+        :return: Объем памяти в байтах.
+        :rtype: int
+        """
+
+        # Объекты без тензоров (например, сессии ONNX Runtime) могут сами
+        # сообщать свой объем.
+        if isinstance(getattr(value, 'memory_size', None), int):
+            return value.memory_size
+
+        items = value if isinstance(value, tuple) else (value,)
+        size = 0
+        for item in items:
+            for getter in ('parameters', 'buffers'):
+                tensors = getattr(item, getter, None)
+                if callable(tensors):
+                    size += sum(t.numel() * t.element_size() for t in tensors())
+
+        return size
@@ -0,0 +1,157 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Sequence
+
+from entities.cap_models.base import AbstractTokenPrefixCache
+
+
+@dataclass
+class TokenPrefixCacheStats:
+    hits: int = 0
+    resumes: int = 0
+    misses: int = 0
+    hit_rate: float = 0.0
+    reused_tokens: int = 0
+    evictions: int = 0
+    entries: int = 0
+    max_entries: int = 0
+
+
+class TokenPrefixCache(AbstractTokenPrefixCache):
+    """
+    Кеш последовательностей токенов жадного декодирования.
+
+    При жадном декодировании описание меньшей длины является префиксом
+    описания большей длины, поэтому для изображения хранится самая
+    длинная сгенерированная последовательность токенов и признак ее
+    завершения EOS-токеном. Более короткие описания получаются обрезкой
+    последовательности, а более длинные - продолжением генерации с нее.
+
+    :ivar __max_entries: Атрибут максимального количества
+                         последовательностей.
+    :type __max_entries: int
+
+    :ivar __entries: Атрибут последовательностей токенов и признаков их
+                     завершения, упорядоченных по времени последнего
+                     обращения.
+    :type __entries: OrderedDict[str, tuple[tuple[int, ...], bool]]
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Инициализация кеша последовательностей токенов.
+
+        :param max_entries: Максимальное количество последовательностей.
+        :type max_entries: int
+
+        :raises ValueError: Если максимальное количество
+                            последовательностей меньше 1.
+        """
+
+        if max_entries < 1:
+            raise ValueError("Максимальное количество последовательностей "
+                             "должно быть больше 0!")
+
+        self.__max_entries = max_entries
+        self.__entries: OrderedDict[str, tuple[tuple[int, ...], bool]] = (
+            OrderedDict()
+        )
+        self.__lock = threading.Lock()
+        self.__stats = TokenPrefixCacheStats(max_entries=max_entries)
+
+    def get(self, key: str) -> tuple[tuple[int, ...], bool] | None:
+        """
+        Получение последовательности токенов изображения.
+
+        :param key: Ключ изображения.
+        :type key: str
+
+        :return: Последовательность токенов и признак ее завершения или
+                 None, если ее нет в кеше.
+        :rtype: tuple[tuple[int, ...], bool] | None
+        """
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+
+        return entry
+
+    def put(self, key: str, tokens: Sequence[int], finished: bool) -> None:
+        """
+        Сохранение последовательности токенов изображения.
+
+        Последовательность заменяет сохраненную только если она длиннее
+        или завершена.
+
+        :param key: Ключ изображения.
+        :type key: str
+
+        :param tokens: Последовательность токенов (с BOS-токеном, без
+                       PAD-токенов).
+        :type tokens: Sequence[int]
+
+        :param finished: Завершена ли последовательность EOS-токеном.
+        :type finished: bool
+        """
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and (
+                    entry[1] or (len(entry[0]) >= len(tokens) and not finished)
+            ):
+                self.__entries.move_to_end(key)
+                return
+
+            self.__entries[key] = (tuple(tokens), finished)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+                self.__stats.evictions += 1
+
+    def record(self, hit: bool, resumed: bool, reused_tokens: int) -> None:
+        """
+        Учет обращения к кешу.
+
+        :param hit: Получено ли описание обрезкой без генерации.
+        :type hit: bool
+
+        :param resumed: Продолжена ли генерация с сохраненного префикса.
+        :type resumed: bool
+
+        :param reused_tokens: Количество переиспользованных токенов.
+        :type reused_tokens: int
+        """
+
+        with self.__lock:
+            if hit:
+                self.__stats.hits += 1
+            elif resumed:
+                self.__stats.resumes += 1
+            else:
+                self.__stats.misses += 1
+            self.__stats.reused_tokens += reused_tokens
+
+    def stats(self) -> TokenPrefixCacheStats:
+        """
+        Получение счетчиков кеша.
+
+        :return: Копия счетчиков кеша.
+        :rtype: TokenPrefixCacheStats
+        """
+
+        with self.__lock:
+            stats = self.__stats
+            lookups = stats.hits + stats.resumes + stats.misses
+            return TokenPrefixCacheStats(
+                hits=stats.hits,
+                resumes=stats.resumes,
+                misses=stats.misses,
+                hit_rate=stats.hits / lookups if lookups else 0.0,
+                reused_tokens=stats.reused_tokens,
+                evictions=stats.evictions,
+                entries=len(self.__entries),
+                max_entries=stats.max_entries
+            )
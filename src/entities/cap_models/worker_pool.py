@@ -0,0 +1,735 @@
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from logging import getLogger
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+from entities.cap_models.base import (
+    AbstractCapModel,
+    AbstractCapModelBuilder,
+    GenerationProfile,
+    normalize_max_lengths
+)
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class CapModelWorkerPoolStats:
+    workers: int = 0
+    started: bool = False
+    tasks: int = 0
+    images: int = 0
+    in_flight: int = 0
+    errors: int = 0
+    restarts: int = 0
+    timeouts: int = 0
+    failed: bool = False
+
+
+@dataclass
+class _WorkerSlot:
+    process: Any
+    tasks: 'Queue'
+    in_flight: set[int] = field(default_factory=set)
+    # Завершений подряд без единого результата.
+    failures: int = 0
+    # Время перезапуска завершившегося процесса (None - процесс
+    # работает).
+    restart_at: float | None = None
+
+
+def _worker_main(
+        factory: Callable[[Any], AbstractCapModel],
+        weights: Any,
+        tasks: 'Queue',
+        results: 'Queue',
+        torch_threads: int
+) -> None:
+    """
+    Цикл процесса-обработчика пула.
+
+    Процесс создает captioning-модель поверх переданных весов, после
+    чего получает из очереди задач имя блока разделяемой памяти с
+    изображениями и их смещения, генерирует описания и возвращает их в
+    очередь результатов.
+
+    :param factory: Функция создания captioning-модели по весам (должна
+                    сериализоваться pickle для 'spawn' и 'forkserver').
+    :type factory: Callable[[Any], AbstractCapModel]
+
+    :param weights: Веса модели в разделяемой памяти (None - модель
+                    загружает веса сама).
+    :type weights: Any
+
+    :param tasks: Очередь задач обработчика.
+    :type tasks: Queue
+
+    :param results: Очередь результатов.
+    :type results: Queue
+
+    :param torch_threads: Количество потоков torch в процессе.
+    :type torch_threads: int
+    """
+
+    import torch
+
+    torch.set_num_threads(torch_threads)
+    model = factory(weights)
+
+    while (task := tasks.get()) is not None:
+        task_id, shm_name, offsets, max_lengths, profile = task
+        try:
+            shm = SharedMemory(name=shm_name, track=False)
+            try:
+                images = [bytes(shm.buf[start:end]) for start, end in offsets]
+            finally:
+                shm.close()
+            results.put((task_id, model.descript_batch(
+                images, max_lengths, profile=profile
+            ), None))
+        except Exception as e:
+            results.put((task_id, None, f"{type(e).__name__}: {e}"))
+
+
+class CapModelWorkerPool:
+    """
+    Пул процессов инференса captioning-модели.
+
+    Веса модели загружаются один раз в основном процессе и переносятся
+    в разделяемую память torch, а процессы-обработчики получают их без
+    копирования (дескрипторами разделяемой памяти) и создают поверх них
+    модель через factory. Готовый экземпляр модели не передается (он
+    содержит блокировки), поэтому пул работает с любым способом запуска
+    процессов. Изображения передаются обработчикам через блоки
+    разделяемой памяти, а не через сериализацию pickle. Батч изображений
+    делится между наименее загруженными обработчиками.
+
+    Если процесс-обработчик завершился (нехватка памяти, падение
+    torch), то его задачи завершаются ошибкой, а процесс перезапускается
+    с экспоненциальной задержкой. Если процесс и после max_restarts
+    перезапусков подряд завершается, не вернув ни одного результата
+    (например, модель не создается из-за ошибки настроек или нет
+    весов), то он больше не перезапускается, а когда так отключены все процессы, пул
+    считается неисправным и запросы сразу завершаются ошибкой.
+
+    :ivar __factory: Атрибут функции создания captioning-модели по
+                     весам в процессе-обработчике.
+    :type __factory: Callable[[Any], AbstractCapModel]
+
+    :ivar __weights: Атрибут весов модели в разделяемой памяти.
+    :type __weights: Any
+
+    :ivar __workers: Атрибут количества процессов-обработчиков.
+    :type __workers: int
+
+    :ivar __torch_threads: Атрибут количества потоков torch в каждом
+                           обработчике.
+    :type __torch_threads: int
+
+    :ivar __start_method: Атрибут способа запуска процессов ('fork',
+                          'spawn' или 'forkserver').
+    :type __start_method: str
+
+    :ivar __result_timeout: Атрибут времени ожидания результата в
+                            секундах (None - без ограничения).
+    :type __result_timeout: float | None
+
+    :ivar __check_interval: Атрибут периода проверки процессов в
+                            секундах.
+    :type __check_interval: float
+
+    :ivar __max_restarts: Атрибут количества перезапусков процесса
+                          подряд без результата, после которого он
+                          отключается.
+    :type __max_restarts: int
+
+    :ivar __restart_backoff: Атрибут начальной задержки перезапуска в
+                             секундах.
+    :type __restart_backoff: float
+
+    :ivar __error: Атрибут ошибки неисправного пула (None - пул
+                   исправен).
+    :type __error: str | None
+
+    :ivar __slots: Атрибут процессов-обработчиков с их очередями задач.
+    :type __slots: list[_WorkerSlot]
+
+    :ivar __futures: Атрибут ожидающих результата задач.
+    :type __futures: dict[int, Future]
+    """
+
+    def __init__(
+            self,
+            factory: Callable[[Any], AbstractCapModel],
+            workers: int,
+            weights: Any = None,
+            torch_threads: int = 1,
+            start_method: str = 'forkserver',
+            result_timeout_s: float | None = None,
+            check_interval_s: float = 1.0,
+            max_restarts: int = 5,
+            restart_backoff_s: float = 1.0
+    ) -> None:
+        """
+        Инициализация пула процессов инференса.
+
+        :param factory: Функция создания captioning-модели по весам в
+                        процессе-обработчике.
+        :type factory: Callable[[Any], AbstractCapModel]
+
+        :param workers: Количество процессов-обработчиков.
+        :type workers: int
+
+        :param weights: Веса модели в разделяемой памяти, общие для
+                        обработчиков (None - каждый обработчик загружает
+                        веса сам).
+        :type weights: Any
+
+        :param torch_threads: Количество потоков torch в каждом
+                              обработчике.
+        :type torch_threads: int
+
+        :param start_method: Способ запуска процессов.
+        :type start_method: str
+
+        :param result_timeout_s: Время ожидания результата в секундах
+                                 (None - без ограничения).
+        :type result_timeout_s: float | None
+
+        :param check_interval_s: Период проверки процессов в секундах.
+        :type check_interval_s: float
+
+        :param max_restarts: Количество перезапусков процесса подряд без
+                             результата, после которого он отключается.
+        :type max_restarts: int
+
+        :param restart_backoff_s: Начальная задержка перезапуска в
+                                  секундах (удваивается с каждым
+                                  перезапуском подряд, но не больше
+                                  минуты).
+        :type restart_backoff_s: float
+
+        :raises ValueError: Если количество обработчиков меньше 1.
+        :raises ValueError: Если время ожидания результата не больше 0.
+        :raises ValueError: Если количество перезапусков отрицательное.
+        """
+
+        if workers < 1:
+            raise ValueError("Количество процессов-обработчиков должно быть "
+                             "больше 0!")
+        if result_timeout_s is not None and result_timeout_s <= 0:
+            raise ValueError("Время ожидания результата должно быть больше "
+                             "0!")
+        if max_restarts < 0:
+            raise ValueError("Количество перезапусков не может быть "
+                             "отрицательным!")
+
+        self.__factory = factory
+        self.__weights = weights
+        self.__workers = workers
+        self.__torch_threads = torch_threads
+        self.__start_method = start_method
+        self.__result_timeout = result_timeout_s
+        self.__check_interval = check_interval_s
+        self.__max_restarts = max_restarts
+        self.__restart_backoff = restart_backoff_s
+        self.__error: str | None = None
+
+        self.__ctx: Any = None
+        self.__slots: list[_WorkerSlot] = []
+        self.__results: 'Queue | None' = None
+        self.__collector: threading.Thread | None = None
+        self.__futures: dict[int, Future] = {}
+        self.__task_ids = itertools.count()
+        self.__lock = threading.Lock()
+        self.__stats = CapModelWorkerPoolStats(workers=workers)
+
+    @property
+    def workers(self) -> int:
+        """ Количество процессов-обработчиков."""
+
+        return self.__workers
+
+    def start(self) -> None:
+        """
+        Запуск процессов-обработчиков.
+
+        Пул нужно запускать при старте приложения, до создания потоков:
+        при способе 'fork' процесс, имеющий потоки (и инициализированный
+        torch), может зависнуть после fork. Повторный вызов ничего не
+        делает.
+        """
+
+        with self.__lock:
+            if self.__stats.started:
+                return
+
+            import torch.multiprocessing as mp
+
+            self.__ctx = mp.get_context(self.__start_method)
+            self.__results = self.__ctx.Queue()
+            self.__slots = [self.__spawn(i) for i in range(self.__workers)]
+
+            self.__collector = threading.Thread(
+                target=self.__collect,
+                name='cap-model-worker-collector',
+                daemon=True
+            )
+            self.__collector.start()
+            self.__stats.started = True
+
+        logger.info(f"Запущен пул из {self.__workers} процессов инференса")
+
+    def descript_batch(
+            self,
+            images: Sequence[bytes],
+            max_lengths: Sequence[int],
+            profile: GenerationProfile | None = None
+    ) -> list[str]:
+        """
+        Генерация описаний батча изображений в процессах-обработчиках.
+
+        :param images: Изображения.
+        :type images: Sequence[bytes]
+
+        :param max_lengths: Максимальная длина описания каждого
+                            изображения.
+        :type max_lengths: Sequence[int]
+
+        :param profile: Профиль генерации (None - настройки модели).
+        :type profile: GenerationProfile | None
+
+        :return: Описания изображений в порядке изображений.
+        :rtype: list[str]
+
+        :raises RuntimeError: Если ошибка или завершение процесса
+                              инференса.
+        :raises RuntimeError: Если пул неисправен или нет работающих
+                              процессов.
+        :raises TimeoutError: Если результат не получен за время
+                              ожидания.
+        """
+
+        self.start()
+        with self.__lock:
+            if self.__error is not None:
+                raise RuntimeError(self.__error)
+
+        # Деление батча между обработчиками.
+        chunk_size = -(-len(images) // self.__workers)
+        chunks = [
+            (images[i:i + chunk_size], max_lengths[i:i + chunk_size])
+            for i in range(0, len(images), chunk_size)
+        ]
+
+        blocks: list[SharedMemory] = []
+        futures: list[Future] = []
+        try:
+            for chunk_images, chunk_lengths in chunks:
+                block, offsets = self.__to_shared_memory(chunk_images)
+                blocks.append(block)
+                futures.append(self.__submit(block.name, offsets,
+                                             list(chunk_lengths), profile))
+
+            deadline = (time.monotonic() + self.__result_timeout
+                        if self.__result_timeout is not None else None)
+            result = []
+            for future in futures:
+                timeout = (max(deadline - time.monotonic(), 0)
+                           if deadline is not None else None)
+                try:
+                    result.extend(future.result(timeout=timeout))
+                except TimeoutError:
+                    with self.__lock:
+                        self.__stats.timeouts += 1
+                    raise TimeoutError(f"Процесс инференса не вернул "
+                                       f"результат за "
+                                       f"{self.__result_timeout} с!")
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        return result
+
+    def pids(self) -> list[int]:
+        """
+        Получение идентификаторов процессов-обработчиков.
+
+        :return: Идентификаторы запущенных процессов.
+        :rtype: list[int]
+        """
+
+        with self.__lock:
+            return [slot.process.pid for slot in self.__slots
+                    if slot.restart_at is None]
+
+    def stats(self) -> CapModelWorkerPoolStats:
+        """
+        Получение счетчиков пула.
+
+        :return: Копия счетчиков пула.
+        :rtype: CapModelWorkerPoolStats
+        """
+
+        with self.__lock:
+            return CapModelWorkerPoolStats(
+                workers=self.__stats.workers,
+                started=self.__stats.started,
+                tasks=self.__stats.tasks,
+                images=self.__stats.images,
+                in_flight=len(self.__futures),
+                errors=self.__stats.errors,
+                restarts=self.__stats.restarts,
+                timeouts=self.__stats.timeouts,
+                failed=self.__error is not None
+            )
+
+    def close(self) -> None:
+        """ Остановка процессов-обработчиков."""
+
+        with self.__lock:
+            if not self.__stats.started:
+                return
+            for slot in self.__slots:
+                if slot.restart_at is None:
+                    slot.tasks.put(None)
+            slots, self.__slots = self.__slots, []
+            self.__stats.started = False
+
+        for slot in slots:
+            slot.process.join()
+        self.__results.put(None)
+        self.__collector.join()
+
+    @staticmethod
+    def __to_shared_memory(
+            images: Sequence[bytes]
+    ) -> tuple[SharedMemory, list[tuple[int, int]]]:
+        """
+        Запись изображений в один блок разделяемой памяти.
+
+        :param images: Изображения.
+        :type images: Sequence[bytes]
+
+        :return: Блок разделяемой памяти и границы изображений в нем.
+        :rtype: tuple[SharedMemory, list[tuple[int, int]]]
+        """
+
+        block = SharedMemory(create=True, size=max(sum(map(len, images)), 1))
+        offsets = []
+        start = 0
+        for img in images:
+            end = start + len(img)
+            block.buf[start:end] = img
+            offsets.append((start, end))
+            start = end
+
+        return block, offsets
+
+    def __spawn(self, index: int) -> _WorkerSlot:
+        """
+        Запуск процесса-обработчика со своей очередью задач.
+
+        Своя очередь у каждого обработчика нужна, чтобы при его
+        завершении знать, какие задачи не будут выполнены.
+        """
+
+        tasks = self.__ctx.Queue()
+        process = self.__ctx.Process(
+            target=_worker_main,
+            args=(self.__factory, self.__weights, tasks, self.__results,
+                  self.__torch_threads),
+            name=f'cap-model-worker-{index}',
+            daemon=True
+        )
+        process.start()
+
+        return _WorkerSlot(process, tasks)
+
+    def __submit(
+            self,
+            shm_name: str,
+            offsets: list[tuple[int, int]],
+            max_lengths: list[int],
+            profile: GenerationProfile | None
+    ) -> Future:
+        future = Future()
+        with self.__lock:
+            slots = [slot for slot in self.__slots if slot.restart_at is None]
+            if not slots:
+                raise RuntimeError("Нет работающих процессов инференса, "
+                                   "процессы перезапускаются!")
+            task_id = next(self.__task_ids)
+            slot = min(slots, key=lambda s: len(s.in_flight))
+            slot.in_flight.add(task_id)
+            self.__futures[task_id] = future
+            self.__stats.tasks += 1
+            self.__stats.images += len(offsets)
+            slot.tasks.put(
+                (task_id, shm_name, offsets, max_lengths, profile)
+            )
+
+        return future
+
+    def __collect(self) -> None:
+        checked_at = time.monotonic()
+        while True:
+            try:
+                item = self.__results.get(timeout=self.__check_interval)
+            except queue.Empty:
+                item = ()
+            if item is None:
+                break
+
+            if time.monotonic() - checked_at >= self.__check_interval:
+                self.__check_workers()
+                checked_at = time.monotonic()
+            if not item:
+                continue
+
+            task_id, result, error = item
+            with self.__lock:
+                future = self.__futures.pop(task_id, None)
+                for slot in self.__slots:
+                    if task_id in slot.in_flight:
+                        slot.in_flight.discard(task_id)
+                        # Процесс создал модель и работает.
+                        slot.failures = 0
+                if error is not None:
+                    self.__stats.errors += 1
+            if future is None or future.done():
+                continue
+            if error is not None:
+                future.set_exception(RuntimeError(
+                    f"Ошибка в процессе инференса: {error}!"
+                ))
+            else:
+                future.set_result(result)
+
+    def __check_workers(self) -> None:
+        """
+        Перезапуск завершившихся процессов-обработчиков.
+
+        Задачи завершившегося обработчика завершаются ошибкой, чтобы
+        ожидающие их запросы не зависали. Процесс перезапускается после
+        задержки, а после max_restarts завершений подряд без результата
+        отключается.
+        """
+
+        now = time.monotonic()
+        failed: list[tuple[int, int | None, list[Future]]] = []
+        stopped: list[Future] = []
+        with self.__lock:
+            if not self.__stats.started or self.__error is not None:
+                return
+            for i, slot in enumerate(self.__slots):
+                if slot.restart_at is not None:
+                    if now >= slot.restart_at:
+                        restarted = self.__spawn(i)
+                        restarted.failures = slot.failures
+                        self.__slots[i] = restarted
+                        self.__stats.restarts += 1
+                    continue
+                if slot.process.is_alive():
+                    continue
+
+                futures = [self.__futures.pop(task_id)
+                           for task_id in slot.in_flight
+                           if task_id in self.__futures]
+                failed.append((i, slot.process.exitcode, futures))
+                self.__stats.errors += len(futures)
+
+                slot.tasks.cancel_join_thread()
+                slot.tasks.close()
+                slot.in_flight.clear()
+                slot.failures += 1
+                slot.restart_at = (
+                    now + min(self.__restart_backoff
+                              * 2 ** (slot.failures - 1), 60.0)
+                    if slot.failures <= self.__max_restarts
+                    else float('inf')
+                )
+
+            if all(slot.restart_at == float('inf') for slot in self.__slots):
+                self.__error = (f"Пул процессов инференса неисправен: "
+                                f"процессы завершаются "
+                                f"{self.__max_restarts + 1} раз подряд "
+                                f"без результата!")
+                stopped = list(self.__futures.values())
+                self.__futures.clear()
+
+        for i, exitcode, futures in failed:
+            logger.error(f"Процесс инференса {i} завершился с кодом "
+                         f"{exitcode}")
+            for future in futures:
+                if not future.done():
+                    future.set_exception(RuntimeError(
+                        f"Процесс инференса завершился с кодом {exitcode}!"
+                    ))
+
+        if self.__error is not None:
+            logger.error(self.__error)
+            for future in stopped:
+                if not future.done():
+                    future.set_exception(RuntimeError(self.__error))
+
+
+class PooledCapModel(AbstractCapModel):
+    """
+    Captioning-модель, выполняемая пулом процессов инференса.
+
+    :ivar __pool: Атрибут пула процессов инференса.
+    :type __pool: CapModelWorkerPool
+
+    :ivar __max_length: Атрибут максимальной длины описания изображения.
+    :type __max_length: int
+    """
+
+    def __init__(self, pool: CapModelWorkerPool, max_length: int) -> None:
+        """
+        Инициализация captioning-модели пула процессов.
+
+        :param pool: Пул процессов инференса.
+        :type pool: CapModelWorkerPool
+
+        :param max_length: Максимальная длина описания изображения.
+        :type max_length: int
+        """
+
+        self.__pool = pool
+        self.__max_length = max_length
+
+    def descript(
+            self,
+            img: bytes,
+            max_length: int | None = None,
+            profile: GenerationProfile | None = None
+    ) -> str:
+        """
+        Генерация описания изображения.
+
+        :param img: Изображение.
+        :type img: bytes
+
+        :param max_length: Максимальная длина описания изображения.
+        :type max_length: int | None
+
+        :param profile: Профиль генерации (None - настройки модели).
+        :type profile: GenerationProfile | None
+
+        :return: Описание изображения.
+        :rtype: str
+        """
+
+        return self.descript_batch(
+            [img], max_lengths=max_length, profile=profile
+        )[0]
+
+    def descript_batch(
+            self,
+            images: Sequence[bytes],
+            max_lengths: int | Sequence[int | None] | None = None,
+            profile: GenerationProfile | None = None
+    ) -> list[str]:
+        """
+        Генерация описаний батча изображений.
+
+        :param images: Изображения.
+        :type images: Sequence[bytes]
+
+        :param max_lengths: Максимальная длина описания для всех
+                            изображений или для каждого изображения.
+        :type max_lengths: int | Sequence[int | None] | None
+
+        :param profile: Профиль генерации (None - настройки модели).
+        :type profile: GenerationProfile | None
+
+        :return: Описания изображений в порядке изображений.
+        :rtype: list[str]
+        """
+
+        if not images:
+            return []
+
+        return self.__pool.descript_batch(
+            images,
+            normalize_max_lengths(max_lengths, len(images), self.__max_length),
+            profile=profile
+        )
+
+
+class PooledCapModelBuilder(AbstractCapModelBuilder):
+    """
+    Строитель captioning-модели, выполняемой пулом процессов.
+
+    :ivar __pool: Атрибут пула процессов инференса.
+    :type __pool: CapModelWorkerPool
+
+    :ivar __max_length: Атрибут максимальной длины описания изображения.
+    :type __max_length: int
+    """
+
+    def __init__(self, pool: CapModelWorkerPool, max_length: int) -> None:
+        """
+        Инициализация строителя captioning-модели пула процессов.
+
+        :param pool: Пул процессов инференса.
+        :type pool: CapModelWorkerPool
+
+        :param max_length: Максимальная длина описания изображения.
+        :type max_length: int
+        """
+
+        self.__pool = pool
+        self.__max_length = max_length
+
+    def set_max_length(self, value: int) -> None:
+        """
+        Назначение максимальной длины описания изображения.
+
+        :param value: Значение длины описания изображения.
+        :type value: int
+
+        :raises TypeError: Если максимальная длина описания изображения
+                           не является целым числом.
+        :raises ValueError: Если максимальная длина описания
+                            изображения меньше 1 символа.
+        """
+
+        if not isinstance(value, int):
+            raise TypeError("Максимальная длина описания изображения должна "
+                            "быть целым числом.")
+        elif value < 1:
+            raise ValueError("Максимальная длина описания изображения должна "
+                             "быть больше 1 символа.")
+        self.__max_length = value
+
+    def get_model(self) -> PooledCapModel:
+        """
+        Получение captioning-модели.
+
+        :return: Captioning-модель пула процессов.
+        :rtype: PooledCapModel
+        """
+
+        return PooledCapModel(self.__pool, self.__max_length)
+
+    def get_pool_stats(self) -> CapModelWorkerPoolStats:
+        """
+        Получение счетчиков пула процессов.
+
+        :return: Счетчики пула процессов.
+        :rtype: CapModelWorkerPoolStats
+        """
+
+        return self.__pool.stats()
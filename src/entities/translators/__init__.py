@@ -1,9 +1,41 @@
-from entities.translators.base import AbstractTranslator
+from entities.translators.base import (
+    AbstractTranslationCache,
+    AbstractTranslator,
+    TranslationResult
+)
+from entities.translators.batching import (
+    BatchingTranslator,
+    TranslationBatcherStats
+)
+from entities.translators.cached import CachedTranslator
 from entities.translators.google import GoogleTranslator
+from entities.translators.loop import BackgroundLoop
+from entities.translators.marian import MarianTranslator, MarianTranslatorStats
+from entities.translators.mymemory import MyMemoryClient, MyMemoryClientStats
+from entities.translators.resilient import (
+    CircuitBreaker,
+    CircuitBreakerStats,
+    ResilientTranslator,
+    ResilientTranslatorStats
+)
 from entities.translators.translator import AppTranslator
 
 __all__ = [
+    'AbstractTranslationCache',
     'AbstractTranslator',
     'AppTranslator',
-    'GoogleTranslator'
+    'BackgroundLoop',
+    'BatchingTranslator',
+    'CachedTranslator',
+    'CircuitBreaker',
+    'CircuitBreakerStats',
+    'GoogleTranslator',
+    'MarianTranslator',
+    'MarianTranslatorStats',
+    'MyMemoryClient',
+    'MyMemoryClientStats',
+    'ResilientTranslator',
+    'ResilientTranslatorStats',
+    'TranslationBatcherStats',
+    'TranslationResult'
 ]
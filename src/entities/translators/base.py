@@ -1,4 +1,14 @@
+import asyncio
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Sequence
+
+
+@dataclass
+class TranslationResult:
+    text: str
+    translated: bool = True
+    provider: str | None = None
 
 
 class AbstractTranslator(ABC):
@@ -10,3 +20,52 @@ class AbstractTranslator(ABC):
     @abstractmethod
     def translate(self, text: str) -> str:
         pass
+
+    def translate_batch(self, texts: Sequence[str]) -> list[str]:
+        return [self.translate(text) for text in texts]
+
+    async def atranslate(self, text: str) -> str:
+        return await asyncio.to_thread(self.translate, text)
+
+    async def atranslate_batch(self, texts: Sequence[str]) -> list[str]:
+        return await asyncio.to_thread(self.translate_batch, texts)
+
+    def translate_result(self, text: str) -> TranslationResult:
+        return TranslationResult(self.translate(text))
+
+    async def atranslate_result(self, text: str) -> TranslationResult:
+        return TranslationResult(await self.atranslate(text))
+
+    def translate_batch_result(
+            self,
+            texts: Sequence[str]
+    ) -> list[TranslationResult]:
+        return [
+            TranslationResult(text) for text in self.translate_batch(texts)
+        ]
+
+    async def atranslate_batch_result(
+            self,
+            texts: Sequence[str]
+    ) -> list[TranslationResult]:
+        return [
+            TranslationResult(text)
+            for text in await self.atranslate_batch(texts)
+        ]
+
+
+class AbstractTranslationCache(ABC):
+
+    @abstractmethod
+    def get(self, provider: str, lang: str, text: str) -> str | None:
+        pass
+
+    @abstractmethod
+    def put(
+            self,
+            provider: str,
+            lang: str,
+            text: str,
+            translation: str
+    ) -> None:
+        pass
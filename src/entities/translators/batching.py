@@ -0,0 +1,388 @@
+import asyncio
+import time
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Sequence
+
+from entities.translators.base import AbstractTranslator
+
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class TranslationBatcherStats:
+    queue_depth: int = 0
+    requests: int = 0
+    coalesced: int = 0
+    batches: int = 0
+    last_batch_size: int = 0
+    max_batch_size: int = 0
+    mean_batch_size: float = 0.0
+    mean_wait_time: float = 0.0
+
+
+@dataclass
+class _TranslationRequest:
+    lang: str
+    text: str
+    future: Future
+    created_at: float
+
+
+class BatchingTranslator(AbstractTranslator):
+    """
+    Переводчик с батчингом запросов.
+
+    Тексты на перевод копятся в очереди, пока не наберется
+    максимальный размер батча или не истечет окно ожидания, после чего
+    переводятся одним вызовом translate_batch переводчика, а результаты
+    раздаются ожидающим запросам через их future. Одинаковые тексты,
+    уже ожидающие перевода на тот же язык, не ставятся в очередь
+    повторно: запросы получают future первого запроса.
+
+    Если перевод батча завершился ошибкой, то тексты батча переводятся
+    по одному, чтобы ошибка одного текста не завершала остальные
+    запросы.
+
+    Язык перевода запоминается в каждом запросе при постановке в
+    очередь, а переводчику назначается потоком батчинга перед переводом
+    батча. Поэтому смена языка не влияет на уже ожидающие тексты, а
+    тексты на разные языки переводятся разными батчами.
+
+    :ivar __translator: Атрибут переводчика описания изображения.
+    :type __translator: AbstractTranslator
+
+    :ivar __lang: Атрибут языка перевода новых запросов.
+    :type __lang: str
+
+    :ivar __max_batch_size: Атрибут максимального размера батча.
+    :type __max_batch_size: int
+
+    :ivar __max_wait: Атрибут окна ожидания запросов в секундах.
+    :type __max_wait: float
+
+    :ivar __queue: Атрибут очереди ожидающих запросов.
+    :type __queue: queue.Queue
+
+    :ivar __in_flight: Атрибут future текстов, ожидающих перевода, по
+                       языку и тексту.
+    :type __in_flight: dict[tuple[str, str], Future]
+
+    :ivar __worker: Атрибут потока обработки батчей.
+    :type __worker: threading.Thread | None
+    """
+
+    def __init__(
+            self,
+            translator: AbstractTranslator,
+            lang: str,
+            max_batch_size: int,
+            max_wait_ms: float
+    ) -> None:
+        """
+        Инициализация переводчика с батчингом запросов.
+
+        :param translator: Переводчик описания изображения.
+        :type translator: AbstractTranslator
+
+        :param lang: Язык перевода.
+        :type lang: str
+
+        :param max_batch_size: Максимальный размер батча.
+        :type max_batch_size: int
+
+        :param max_wait_ms: Окно ожидания запросов в миллисекундах.
+        :type max_wait_ms: float
+
+        :raises ValueError: Если максимальный размер батча меньше 1.
+        :raises ValueError: Если окно ожидания отрицательное.
+        """
+
+        if max_batch_size < 1:
+            raise ValueError("Максимальный размер батча должен быть больше "
+                             "0!")
+        if max_wait_ms < 0:
+            raise ValueError("Окно ожидания запросов не может быть "
+                             "отрицательным!")
+
+        self.__translator = translator
+        self.__lang = lang
+        self.__max_batch_size = max_batch_size
+        self.__max_wait = max_wait_ms / 1000
+
+        self.__queue: queue.Queue[_TranslationRequest | None] = queue.Queue()
+        self.__in_flight: dict[tuple[str, str], Future] = {}
+        self.__worker: threading.Thread | None = None
+        self.__lock = threading.Lock()
+
+        self.__stats = TranslationBatcherStats()
+        self.__wait_time_total = 0.0
+
+    def set_lang(self, value: str) -> None:
+        """
+        Назначение языка, на который будет переводиться описание
+        изображения.
+
+        :param value: Язык, на который будет переводиться описание
+                      изображения.
+        :type value: str
+        """
+
+        # Переводчику язык назначается потоком батчинга перед переводом
+        # батча, чтобы не менять язык уже ожидающих текстов.
+        with self.__lock:
+            self.__lang = value
+
+    def submit(self, text: str) -> Future:
+        """
+        Постановка текста в очередь на перевод.
+
+        :param text: Текст, который нужно перевести.
+        :type text: str
+
+        :return: Future с переводом.
+        :rtype: Future
+        """
+
+        self.__start()
+        with self.__lock:
+            self.__stats.requests += 1
+            lang = self.__lang
+            future = self.__in_flight.get((lang, text))
+            if future is not None:
+                self.__stats.coalesced += 1
+                return future
+
+            future = Future()
+            self.__in_flight[lang, text] = future
+
+        self.__queue.put(_TranslationRequest(
+            lang=lang,
+            text=text,
+            future=future,
+            created_at=time.perf_counter()
+        ))
+
+        return future
+
+    def translate(self, desc: str) -> str:
+        """
+        Перевод описания изображения через очередь батчинга.
+
+        :param desc: Описание изображения, которое нужно перевести.
+        :type desc: str
+
+        :return: Переведенное описание изображения.
+        :rtype: str
+        """
+
+        return self.submit(desc).result()
+
+    def translate_batch(self, texts: Sequence[str]) -> list[str]:
+        """
+        Перевод нескольких текстов через очередь батчинга.
+
+        :param texts: Тексты, которые нужно перевести.
+        :type texts: Sequence[str]
+
+        :return: Переводы в порядке текстов.
+        :rtype: list[str]
+        """
+
+        futures = [self.submit(text) for text in texts]
+
+        return [future.result() for future in futures]
+
+    async def atranslate(self, desc: str) -> str:
+        """
+        Асинхронный перевод описания изображения через очередь батчинга.
+
+        :param desc: Описание изображения, которое нужно перевести.
+        :type desc: str
+
+        :return: Переведенное описание изображения.
+        :rtype: str
+        """
+
+        # Future может быть общим для нескольких запросов, поэтому
+        # отмена ожидания (например, проигравший хеджированный запрос)
+        # не отменяет сам перевод.
+        return await asyncio.shield(asyncio.wrap_future(self.submit(desc)))
+
+    async def atranslate_batch(self, texts: Sequence[str]) -> list[str]:
+        """
+        Асинхронный перевод нескольких текстов через очередь батчинга.
+
+        :param texts: Тексты, которые нужно перевести.
+        :type texts: Sequence[str]
+
+        :return: Переводы в порядке текстов.
+        :rtype: list[str]
+        """
+
+        return list(await asyncio.shield(asyncio.gather(*(
+            asyncio.wrap_future(self.submit(text)) for text in texts
+        ))))
+
+    def stats(self) -> TranslationBatcherStats:
+        """
+        Получение счетчиков батчинга.
+
+        :return: Копия счетчиков батчинга.
+        :rtype: TranslationBatcherStats
+        """
+
+        with self.__lock:
+            stats = self.__stats
+            queued = stats.requests - stats.coalesced
+            return TranslationBatcherStats(
+                queue_depth=self.__queue.qsize(),
+                requests=stats.requests,
+                coalesced=stats.coalesced,
+                batches=stats.batches,
+                last_batch_size=stats.last_batch_size,
+                max_batch_size=stats.max_batch_size,
+                mean_batch_size=(queued / stats.batches
+                                 if stats.batches else 0.0),
+                mean_wait_time=(self.__wait_time_total / queued
+                                if queued else 0.0)
+            )
+
+    def close(self) -> None:
+        """ Остановка потока обработки батчей."""
+
+        with self.__lock:
+            worker, self.__worker = self.__worker, None
+        if worker is not None:
+            self.__queue.put(None)
+            worker.join()
+
+    def __start(self) -> None:
+        with self.__lock:
+            if self.__worker is None:
+                self.__worker = threading.Thread(
+                    target=self.__run,
+                    name='translation-batcher',
+                    daemon=True
+                )
+                self.__worker.start()
+
+    def __collect(self) -> list[_TranslationRequest] | None:
+        """
+        Сбор батча запросов из очереди.
+
+        Блокирующее ожидание первого запроса, после чего запросы
+        собираются до заполнения батча или истечения окна ожидания.
+
+        :return: Батч запросов или None, если движок остановлен.
+        :rtype: list[_TranslationRequest] | None
+        """
+
+        first = self.__queue.get()
+        if first is None:
+            return None
+
+        batch = [first]
+        deadline = time.perf_counter() + self.__max_wait
+        while len(batch) < self.__max_batch_size:
+            timeout = deadline - time.perf_counter()
+            try:
+                item = (self.__queue.get(timeout=timeout) if timeout > 0
+                        else self.__queue.get_nowait())
+            except queue.Empty:
+                break
+            if item is None:
+                # Остановка после обработки уже собранного батча.
+                self.__queue.put(None)
+                break
+            batch.append(item)
+
+        return batch
+
+    def __translate_one(
+            self,
+            text: str
+    ) -> tuple[str | None, Exception | None]:
+        try:
+            return self.__translator.translate(text), None
+        except Exception as e:
+            return None, e
+
+    def __translate_group(
+            self,
+            lang: str,
+            texts: list[str]
+    ) -> list[tuple[str | None, Exception | None]]:
+        """
+        Перевод текстов батча на один язык.
+
+        :param lang: Язык перевода.
+        :type lang: str
+
+        :param texts: Тексты, которые нужно перевести.
+        :type texts: list[str]
+
+        :return: Перевод или ошибка каждого текста в порядке текстов.
+        :rtype: list[tuple[str | None, Exception | None]]
+        """
+
+        try:
+            self.__translator.set_lang(lang)
+        except Exception as e:
+            return [(None, e)] * len(texts)
+
+        try:
+            return [
+                (result, None)
+                for result in self.__translator.translate_batch(texts)
+            ]
+        except Exception as e:
+            logger.debug(f"Ошибка перевода батча из {len(texts)} "
+                         f"текстов, перевод по одному: {e}")
+            return [self.__translate_one(text) for text in texts]
+
+    def __run(self) -> None:
+        while (batch := self.__collect()) is not None:
+            started_at = time.perf_counter()
+
+            groups: dict[str, list[_TranslationRequest]] = {}
+            for request in batch:
+                groups.setdefault(request.lang, []).append(request)
+
+            for lang, requests in groups.items():
+                outcomes = self.__translate_group(
+                    lang, [request.text for request in requests]
+                )
+
+                # Future снимается с ожидания до выдачи результата, чтобы
+                # следующий такой же текст переводился заново (например,
+                # после ошибки).
+                with self.__lock:
+                    for request in requests:
+                        self.__in_flight.pop(
+                            (request.lang, request.text), None
+                        )
+                    self.__stats.batches += 1
+                    self.__stats.last_batch_size = len(requests)
+                    self.__stats.max_batch_size = max(
+                        self.__stats.max_batch_size, len(requests)
+                    )
+                    self.__wait_time_total += sum(
+                        started_at - request.created_at
+                        for request in requests
+                    )
+
+                for request, (result, error) in zip(requests, outcomes):
+                    if request.future.done():
+                        continue
+                    if error is not None:
+                        request.future.set_exception(error)
+                    else:
+                        request.future.set_result(result)
+
+                logger.debug(f"Переведен батч из {len(requests)} текстов "
+                             f"на язык {lang}")
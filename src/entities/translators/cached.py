@@ -0,0 +1,208 @@
+import asyncio
+from typing import Sequence
+
+from entities.translators.base import (
+    AbstractTranslationCache,
+    AbstractTranslator,
+    TranslationResult
+)
+
+
+class CachedTranslator(AbstractTranslator):
+    """
+    Переводчик с кешем переводов.
+
+    Описания BLIP короткие и часто повторяются, поэтому перевод ищется
+    в кеше по переводчику, исходному тексту и языку перевода, и только
+    при промахе выполняется удаленный запрос.
+
+    :ivar __translator: Атрибут переводчика описания изображения.
+    :type __translator: AbstractTranslator
+
+    :ivar __cache: Атрибут кеша переводов.
+    :type __cache: AbstractTranslationCache
+
+    :ivar __provider: Атрибут названия переводчика в ключе кеша.
+    :type __provider: str
+
+    :ivar __lang: Атрибут языка перевода в ключе кеша.
+    :type __lang: str
+    """
+
+    def __init__(
+            self,
+            translator: AbstractTranslator,
+            cache: AbstractTranslationCache,
+            provider: str,
+            lang: str
+    ) -> None:
+        """
+        Инициализация переводчика с кешем переводов.
+
+        :param translator: Переводчик описания изображения.
+        :type translator: AbstractTranslator
+
+        :param cache: Кеш переводов.
+        :type cache: AbstractTranslationCache
+
+        :param provider: Название переводчика в ключе кеша.
+        :type provider: str
+
+        :param lang: Язык перевода.
+        :type lang: str
+        """
+
+        self.__translator = translator
+        self.__cache = cache
+        self.__provider = provider
+        self.__lang = lang
+
+    def set_lang(self, value: str) -> None:
+        """
+        Назначение языка, на который будет переводиться описание
+        изображения.
+
+        :param value: Язык, на который будет переводиться описание
+                      изображения.
+        :type value: str
+        """
+
+        self.__translator.set_lang(value)
+        self.__lang = value
+
+    def translate(self, desc: str) -> str:
+        """
+        Перевод описания изображения.
+
+        :param desc: Описание изображения, которое нужно перевести.
+        :type desc: str
+
+        :return: Переведенное описание изображения.
+        :rtype: str
+        """
+
+        return self.translate_result(desc).text
+
+    def translate_result(self, desc: str) -> TranslationResult:
+        """
+        Перевод описания изображения с признаком перевода.
+
+        Непереведенный текст (переводчик вернул исходный текст с
+        признаком translated=False) в кеш не сохраняется.
+
+        :param desc: Описание изображения, которое нужно перевести.
+        :type desc: str
+
+        :return: Результат перевода.
+        :rtype: TranslationResult
+        """
+
+        result = self.__cache.get(self.__provider, self.__lang, desc)
+        if result is not None:
+            return TranslationResult(result, provider=self.__provider)
+
+        translation = self.__translator.translate_result(desc)
+        if translation.translated:
+            self.__cache.put(
+                self.__provider, self.__lang, desc, translation.text
+            )
+
+        return translation
+
+    def translate_batch(self, texts: Sequence[str]) -> list[str]:
+        """
+        Перевод нескольких описаний изображений.
+
+        :param texts: Описания изображений, которые нужно перевести.
+        :type texts: Sequence[str]
+
+        :return: Переведенные описания в порядке исходных.
+        :rtype: list[str]
+        """
+
+        return [result.text for result in self.translate_batch_result(texts)]
+
+    def translate_batch_result(
+            self,
+            texts: Sequence[str]
+    ) -> list[TranslationResult]:
+        """
+        Перевод нескольких описаний изображений с признаком перевода.
+
+        Переводчику одним вызовом передаются только тексты, которых нет
+        в кеше (без повторов). Непереведенные тексты в кеш не
+        сохраняются.
+
+        :param texts: Описания изображений, которые нужно перевести.
+        :type texts: Sequence[str]
+
+        :return: Результаты перевода в порядке исходных описаний.
+        :rtype: list[TranslationResult]
+        """
+
+        results = {}
+        for text in texts:
+            if text not in results:
+                result = self.__cache.get(self.__provider, self.__lang, text)
+                results[text] = (
+                    TranslationResult(result, provider=self.__provider)
+                    if result is not None else None
+                )
+
+        misses = [text for text, result in results.items() if result is None]
+        if misses:
+            for text, translation in zip(
+                    misses, self.__translator.translate_batch_result(misses)
+            ):
+                results[text] = translation
+                if translation.translated:
+                    self.__cache.put(
+                        self.__provider, self.__lang, text, translation.text
+                    )
+
+        return [results[text] for text in texts]
+
+    async def atranslate(self, desc: str) -> str:
+        """
+        Асинхронный перевод описания изображения.
+
+        :param desc: Описание изображения, которое нужно перевести.
+        :type desc: str
+
+        :return: Переведенное описание изображения.
+        :rtype: str
+        """
+
+        return (await self.atranslate_result(desc)).text
+
+    async def atranslate_result(self, desc: str) -> TranslationResult:
+        """
+        Асинхронный перевод описания изображения с признаком перевода.
+
+        Обращения к кешу выполняются в потоке, так как второй уровень
+        кеша может быть в БД. Непереведенный текст в кеш не сохраняется.
+
+        :param desc: Описание изображения, которое нужно перевести.
+        :type desc: str
+
+        :return: Результат перевода.
+        :rtype: TranslationResult
+        """
+
+        result = await asyncio.to_thread(
+            self.__cache.get, self.__provider, self.__lang, desc
+        )
+        if result is not None:
+            return TranslationResult(result, provider=self.__provider)
+
+        translation = await self.__translator.atranslate_result(desc)
+        if translation.translated:
+            await asyncio.to_thread(
+                self.__cache.put,
+                self.__provider,
+                self.__lang,
+                desc,
+                translation.text
+            )
+
+        return translation
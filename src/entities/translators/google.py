@@ -1,7 +1,7 @@
-import asyncio
-from typing import Any
+from typing import Any, Sequence
 
 from entities.translators.base import AbstractTranslator
+from entities.translators.loop import BackgroundLoop
 
 
 class GoogleTranslator(AbstractTranslator):
@@ -19,13 +19,18 @@ class GoogleTranslator(AbstractTranslator):
     ::ivar __support_langs: Атрибут списка поддерживаемых языков
                             перевода.
     :type __support_langs: list[str]
+
+    :ivar __loop: Атрибут фонового цикла событий, в котором выполняются
+                  запросы переводчика.
+    :type __loop: BackgroundLoop
     """
 
     def __init__(
             self,
             translator: Any,
             to_lang: str,
-            support_langs: list[str]
+            support_langs: list[str],
+            loop: BackgroundLoop | None = None
     ) -> None:
         """
         Инициализация Google-переводчика.
@@ -40,11 +45,18 @@ class GoogleTranslator(AbstractTranslator):
 
         :param support_langs: Список поддерживаемых языков.
         :type support_langs: list[str]
+
+        :param loop: Фоновый цикл событий запросов переводчика (None -
+                     собственный цикл). Асинхронный HTTP-клиент
+                     переводчика и его пул соединений живут в этом
+                     цикле.
+        :type loop: BackgroundLoop | None
         """
 
         self.__translator = translator
         self.__to_lang = to_lang
         self.__support_langs = support_langs
+        self.__loop = loop or BackgroundLoop(name='google-translator')
 
     def set_lang(self, value: str) -> None:
         """
@@ -71,6 +83,40 @@ class GoogleTranslator(AbstractTranslator):
         """
         Перевод описания изображения.
 
+        Синхронная обертка над atranslate: запрос выполняется в фоновом
+        цикле событий переводчика.
+
+        :param desc: Описание изображения, которое нужно перевести.
+        :type desc: str
+
+        :return: Переведенное описание изображения.
+        :rtype: str
+        """
+
+        return self.__loop.run(self.__request(desc)).text
+
+    def translate_batch(self, texts: Sequence[str]) -> list[str]:
+        """
+        Перевод нескольких описаний изображений одним запросом.
+
+        :param texts: Описания изображений, которые нужно перевести.
+        :type texts: Sequence[str]
+
+        :return: Переведенные описания в порядке исходных.
+        :rtype: list[str]
+        """
+
+        if not texts:
+            return []
+
+        results = self.__loop.run(self.__request(list(texts)))
+
+        return [result.text for result in results]
+
+    async def atranslate(self, desc: str) -> str:
+        """
+        Асинхронный перевод описания изображения.
+
         :param desc: Описание изображения, которое нужно перевести.
         :type desc: str
 
@@ -78,22 +124,32 @@ class GoogleTranslator(AbstractTranslator):
         :rtype: str
         """
 
-        # TODO: Исправить проблему перевода через раз.
+        return (await self.__loop.wrap(self.__request(desc))).text
+
+    async def atranslate_batch(self, texts: Sequence[str]) -> list[str]:
+        """
+        Асинхронный перевод нескольких описаний изображений одним
+        запросом.
 
-        # loop = asyncio.new_event_loop()
-        # asyncio.set_event_loop(loop)
+        :param texts: Описания изображений, которые нужно перевести.
+        :type texts: Sequence[str]
+
+        :return: Переведенные описания в порядке исходных.
+        :rtype: list[str]
+        """
+
+        if not texts:
+            return []
+
+        results = await self.__loop.wrap(self.__request(list(texts)))
+
+        return [result.text for result in results]
+
+    async def __request(self, text: str | list[str]) -> Any:
         try:
-            # result = loop.run_until_complete(
-            #     self.__translator.translate(
-            #         text=desc, dest=self.__lang
-            #     )
-            # )
-            result = asyncio.run(self.__translator.translate(
-                text=desc, dest=self.__to_lang
-            ))
+            return await self.__translator.translate(
+                text, dest=self.__to_lang
+            )
         except Exception as e:
-            raise Exception(f"Ошибка при переводе описания изображения: {e}!")
-        # finally:
-        #     loop.close()
-
-        return result.text
+            raise Exception(f"Ошибка при переводе описания изображения: "
+                            f"{e}!")
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, TypeVar
+
+
+T = TypeVar('T')
+
+
+class BackgroundLoop:
+    """
+    Цикл событий в фоновом потоке.
+
+    Асинхронные клиенты (например, HTTP-клиент googletrans) привязывают
+    пул соединений к циклу событий первого запроса, поэтому все их
+    запросы выполняются в одном долгоживущем цикле. Синхронные
+    вызывающие (Gradio, CLI, потоки инференса) ждут результат через
+    run, асинхронные - через wrap, не блокируя свой цикл событий.
+
+    :ivar __name: Атрибут названия потока цикла событий.
+    :type __name: str
+
+    :ivar __loop: Атрибут цикла событий.
+    :type __loop: asyncio.AbstractEventLoop | None
+
+    :ivar __thread: Атрибут потока цикла событий.
+    :type __thread: threading.Thread | None
+    """
+
+    def __init__(self, name: str = 'background-loop') -> None:
+        """
+        Инициализация цикла событий в фоновом потоке.
+
+        Поток запускается при первой задаче.
+
+        :param name: Название потока цикла событий.
+        :type name: str
+        """
+
+        self.__name = name
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__thread: threading.Thread | None = None
+        self.__lock = threading.Lock()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future:
+        """
+        Постановка корутины в цикл событий.
+
+        :param coro: Корутина.
+        :type coro: Coroutine[Any, Any, T]
+
+        :return: Future с результатом корутины.
+        :rtype: Future
+        """
+
+        return asyncio.run_coroutine_threadsafe(coro, self.__start())
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Синхронное выполнение корутины в цикле событий.
+
+        :param coro: Корутина.
+        :type coro: Coroutine[Any, Any, T]
+
+        :return: Результат корутины.
+        :rtype: T
+
+        :raises RuntimeError: Если вызвано из потока цикла событий.
+        """
+
+        if threading.current_thread() is self.__thread:
+            coro.close()
+            raise RuntimeError("Синхронный вызов из цикла событий "
+                               "заблокирует его, нужно использовать wrap!")
+
+        return self.submit(coro).result()
+
+    async def wrap(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Асинхронное выполнение корутины в цикле событий.
+
+        Вызывающий цикл событий не блокируется: результат ожидается
+        через future.
+
+        :param coro: Корутина.
+        :type coro: Coroutine[Any, Any, T]
+
+        :return: Результат корутины.
+        :rtype: T
+        """
+
+        if asyncio.get_running_loop() is self.__loop:
+            return await coro
+
+        return await asyncio.wrap_future(self.submit(coro))
+
+    def close(self) -> None:
+        """ Остановка цикла событий и его потока."""
+
+        with self.__lock:
+            loop, self.__loop = self.__loop, None
+            thread, self.__thread = self.__thread, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def __start(self) -> asyncio.AbstractEventLoop:
+        with self.__lock:
+            if self.__loop is None:
+                loop = asyncio.new_event_loop()
+                self.__thread = threading.Thread(
+                    target=self.__run,
+                    args=(loop,),
+                    name=self.__name,
+                    daemon=True
+                )
+                self.__thread.start()
+                self.__loop = loop
+            return self.__loop
+
+    @staticmethod
+    def __run(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
@@ -0,0 +1,255 @@
+import threading
+import time
+from dataclasses import dataclass
+from logging import getLogger
+from typing import Any, Sequence
+
+from entities.cap_models.artifacts import (
+    VERIFY_MODES,
+    read_manifest,
+    verify_artifacts
+)
+from entities.translators.base import AbstractTranslator
+
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class MarianTranslatorStats:
+    loaded: bool = False
+    load_time: float = 0.0
+    batches: int = 0
+    texts: int = 0
+    mean_batch_size: float = 0.0
+    mean_latency: float = 0.0
+
+
+class MarianTranslator(AbstractTranslator):
+    """
+    Локальный переводчик описания изображения на модели MarianMT.
+
+    Модель перевода выполняется на CPU без обращения к сети, поэтому
+    задержка перевода не зависит от внешних сервисов. Модель загружается
+    один раз (при прогреве или первом переводе), а тексты батча
+    переводятся одним вызовом generate. Модель MarianMT обучена на одну
+    пару языков, поэтому язык перевода задается моделью.
+
+    :ivar __model: Атрибут класса модели перевода.
+    :type __model: Any
+
+    :ivar __tokenizer: Атрибут класса токенизатора модели перевода.
+    :type __tokenizer: Any
+
+    :ivar __model_dir: Атрибут пути к папке модели перевода.
+    :type __model_dir: str
+
+    :ivar __to_lang: Атрибут языка, на который переводит модель.
+    :type __to_lang: str
+
+    :ivar __num_beams: Атрибут количества лучей поиска.
+    :type __num_beams: int
+
+    :ivar __max_length: Атрибут максимального количества токенов
+                        перевода.
+    :type __max_length: int
+
+    :ivar __verify: Атрибут способа проверки артефактов по манифесту.
+    :type __verify: str
+
+    :ivar __loaded: Атрибут загруженных модели и токенизатора.
+    :type __loaded: tuple[Any, Any] | None
+    """
+
+    def __init__(
+            self,
+            model: Any,
+            tokenizer: Any,
+            model_dir: str,
+            to_lang: str,
+            num_beams: int = 1,
+            max_length: int = 256,
+            verify: str = 'size'
+    ) -> None:
+        """
+        Инициализация локального переводчика.
+
+        :param model: Класс модели перевода (MarianMTModel).
+        :type model: Any
+
+        :param tokenizer: Класс токенизатора модели перевода
+                          (MarianTokenizer).
+        :type tokenizer: Any
+
+        :param model_dir: Путь к папке модели перевода (подготавливается
+                          build.py).
+        :type model_dir: str
+
+        :param to_lang: Язык, на который переводит модель.
+        :type to_lang: str
+
+        :param num_beams: Количество лучей поиска.
+        :type num_beams: int
+
+        :param max_length: Максимальное количество токенов перевода.
+        :type max_length: int
+
+        :param verify: Способ проверки артефактов по манифесту: 'none',
+                       'size' или 'sha256'.
+        :type verify: str
+
+        :raises ValueError: Если способ проверки не поддерживается.
+        :raises ValueError: Если количество лучей или токенов меньше 1.
+        """
+
+        if verify not in VERIFY_MODES:
+            raise ValueError(f"Способ проверки {verify} не поддерживается! "
+                             f"Доступные способы: {', '.join(VERIFY_MODES)}.")
+        if num_beams < 1 or max_length < 1:
+            raise ValueError("Количество лучей и токенов перевода должно "
+                             "быть больше 0!")
+
+        self.__model = model
+        self.__tokenizer = tokenizer
+        self.__model_dir = model_dir
+        self.__to_lang = to_lang
+        self.__num_beams = num_beams
+        self.__max_length = max_length
+        self.__verify = verify
+
+        self.__loaded: tuple[Any, Any] | None = None
+        self.__lock = threading.Lock()
+        self.__stats = MarianTranslatorStats()
+        self.__latency_total = 0.0
+
+    def set_lang(self, value: str) -> None:
+        """
+        Назначение языка, на который будет переводиться описание
+        изображения.
+
+        :param value: Язык, на который будет переводиться описание
+                      изображения.
+        :type value: str
+
+        :raises ValueError: Если модель переводит на другой язык.
+        """
+
+        if value != self.__to_lang:
+            raise ValueError(f"Модель перевода переводит только на язык "
+                             f"{self.__to_lang}, а не {value}!")
+
+    def load(self) -> None:
+        """
+        Загрузка модели перевода и токенизатора.
+
+        Модель загружается один раз, даже при параллельных вызовах.
+
+        :raises ValueError: Если артефакты не совпадают с манифестом.
+        """
+
+        if self.__loaded is not None:
+            return
+
+        with self.__lock:
+            if self.__loaded is not None:
+                return
+
+            start = time.perf_counter()
+            manifest = read_manifest(self.__model_dir)
+            if manifest is not None:
+                verify_artifacts(self.__model_dir, manifest, self.__verify)
+
+            model = self.__model.from_pretrained(
+                self.__model_dir,
+                low_cpu_mem_usage=True,
+                use_safetensors=True if manifest is not None else None
+            ).eval()
+            tokenizer = self.__tokenizer.from_pretrained(self.__model_dir)
+            self.__loaded = model, tokenizer
+
+            self.__stats.loaded = True
+            self.__stats.load_time = time.perf_counter() - start
+            logger.info(f"Модель перевода {self.__model_dir} загружена за "
+                        f"{self.__stats.load_time:.2f} с")
+
+    def translate(self, desc: str) -> str:
+        """
+        Перевод описания изображения.
+
+        :param desc: Описание изображения, которое нужно перевести.
+        :type desc: str
+
+        :return: Переведенное описание изображения.
+        :rtype: str
+        """
+
+        return self.translate_batch([desc])[0]
+
+    def translate_batch(self, texts: Sequence[str]) -> list[str]:
+        """
+        Перевод нескольких описаний изображений одним вызовом модели.
+
+        :param texts: Описания изображений, которые нужно перевести.
+        :type texts: Sequence[str]
+
+        :return: Переведенные описания в порядке исходных.
+        :rtype: list[str]
+
+        :raises Exception: Если ошибка при переводе.
+        """
+
+        if not texts:
+            return []
+
+        import torch
+
+        self.load()
+        model, tokenizer = self.__loaded
+
+        start = time.perf_counter()
+        try:
+            inputs = tokenizer(
+                list(texts),
+                return_tensors='pt',
+                padding=True,
+                truncation=True
+            )
+            with torch.inference_mode():
+                output_ids = model.generate(
+                    **inputs,
+                    num_beams=self.__num_beams,
+                    max_new_tokens=self.__max_length
+                )
+            results = tokenizer.batch_decode(
+                output_ids, skip_special_tokens=True
+            )
+        except Exception as e:
+            raise Exception(f"Ошибка при переводе описания изображения: {e}!")
+
+        with self.__lock:
+            self.__stats.batches += 1
+            self.__stats.texts += len(texts)
+            self.__latency_total += time.perf_counter() - start
+
+        return results
+
+    def stats(self) -> MarianTranslatorStats:
+        """
+        Получение счетчиков переводчика.
+
+        :return: Копия счетчиков переводчика.
+        :rtype: MarianTranslatorStats
+        """
+
+        with self.__lock:
+            stats = self.__stats
+            return MarianTranslatorStats(
+                loaded=stats.loaded,
+                load_time=stats.load_time,
+                batches=stats.batches,
+                texts=stats.texts,
+                mean_batch_size=(stats.texts / stats.batches
+                                 if stats.batches else 0.0),
+                mean_latency=(self.__latency_total / stats.batches
+                              if stats.batches else 0.0)
+            )
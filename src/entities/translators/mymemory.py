@@ -0,0 +1,303 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+
+# Статусы ответа, при которых запрос к переводчику повторяется.
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+@dataclass
+class MyMemoryClientStats:
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    pool_size: int = 0
+    pool_utilization: float = 0.0
+    idle_connections: int = 0
+    active_connections: int = 0
+    mean_latency: float = 0.0
+    latency_p95: float = 0.0
+
+
+class MyMemoryClient:
+    """
+    HTTP-клиент переводчика MyMemory с пулом соединений.
+
+    Замена translate.Translator(provider='mymemory'), который открывает
+    новое соединение (TCP и TLS) на каждый перевод. Клиент держит
+    keep-alive соединения в пуле сессии requests, ограничивает время
+    запроса и повторяет запрос с экспоненциальной задержкой при ошибках
+    соединения и статусах 429 и 5xx. Параллельных запросов не больше
+    размера пула: запрос ждет свободного соединения ограниченное время,
+    а не бесконечно.
+
+    :ivar __url: Атрибут адреса API переводчика.
+    :type __url: str
+
+    :ivar __langpair: Атрибут пары языков перевода.
+    :type __langpair: str
+
+    :ivar __email: Атрибут почты для увеличенной квоты переводчика.
+    :type __email: str | None
+
+    :ivar __pool_size: Атрибут размера пула соединений.
+    :type __pool_size: int
+
+    :ivar __timeout: Атрибут времени ожидания запроса в секундах.
+    :type __timeout: float
+
+    :ivar __pool_timeout: Атрибут времени ожидания свободного
+                          соединения в секундах.
+    :type __pool_timeout: float
+
+    :ivar __slots: Атрибут семафора свободных соединений пула.
+    :type __slots: threading.BoundedSemaphore
+
+    :ivar __session: Атрибут HTTP-сессии с пулом соединений.
+    :type __session: requests.Session
+
+    :ivar __latencies: Атрибут окна задержек последних запросов.
+    :type __latencies: deque[float]
+    """
+
+    def __init__(
+            self,
+            to_lang: str,
+            from_lang: str = 'en',
+            url: str = 'https://api.mymemory.translated.net/get',
+            email: str | None = None,
+            pool_size: int = 8,
+            timeout_s: float = 5.0,
+            pool_timeout_s: float | None = None,
+            retries: int = 2,
+            backoff_s: float = 0.3,
+            window: int = 100
+    ) -> None:
+        """
+        Инициализация HTTP-клиента переводчика MyMemory.
+
+        :param to_lang: Язык, на который будет переводиться текст.
+        :type to_lang: str
+
+        :param from_lang: Язык исходного текста.
+        :type from_lang: str
+
+        :param url: Адрес API переводчика.
+        :type url: str
+
+        :param email: Почта для увеличенной квоты переводчика (None -
+                      анонимная квота).
+        :type email: str | None
+
+        :param pool_size: Размер пула соединений (максимум параллельных
+                          запросов).
+        :type pool_size: int
+
+        :param timeout_s: Время ожидания запроса в секундах.
+        :type timeout_s: float
+
+        :param pool_timeout_s: Время ожидания свободного соединения в
+                               секундах (None - как у запроса).
+        :type pool_timeout_s: float | None
+
+        :param retries: Количество повторов запроса.
+        :type retries: int
+
+        :param backoff_s: Базовая задержка между повторами в секундах.
+        :type backoff_s: float
+
+        :param window: Количество последних запросов для подсчета p95
+                       задержки.
+        :type window: int
+
+        :raises ValueError: Если размер пула соединений меньше 1.
+        :raises ValueError: Если время ожидания запроса не больше 0.
+        :raises ValueError: Если время ожидания соединения не больше 0.
+        :raises ValueError: Если количество повторов отрицательное.
+        """
+
+        if pool_size < 1:
+            raise ValueError("Размер пула соединений должен быть больше 0!")
+        if timeout_s <= 0:
+            raise ValueError("Время ожидания запроса должно быть больше 0!")
+        if pool_timeout_s is not None and pool_timeout_s <= 0:
+            raise ValueError("Время ожидания соединения должно быть больше "
+                             "0!")
+        if retries < 0:
+            raise ValueError("Количество повторов не может быть "
+                             "отрицательным!")
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self.__url = url
+        self.__langpair = f"{from_lang}|{to_lang}"
+        self.__email = email
+        self.__pool_size = pool_size
+        self.__timeout = timeout_s
+        self.__pool_timeout = (pool_timeout_s if pool_timeout_s is not None
+                               else timeout_s)
+        # requests не передает urllib3 время ожидания соединения пула,
+        # поэтому с pool_block=True запрос при занятом пуле ждал бы
+        # бесконечно. Пул не блокирует, а параллельные запросы
+        # ограничивает семафор с таймаутом.
+        self.__slots = threading.BoundedSemaphore(pool_size)
+
+        self.__adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            pool_block=False,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_s,
+                status_forcelist=_RETRY_STATUSES,
+                allowed_methods=frozenset({'GET'}),
+                raise_on_status=False
+            )
+        )
+        self.__session = requests.Session()
+        self.__session.mount('http://', self.__adapter)
+        self.__session.mount('https://', self.__adapter)
+
+        self.__lock = threading.Lock()
+        self.__latencies: deque[float] = deque(maxlen=window)
+        self.__stats = MyMemoryClientStats(pool_size=pool_size)
+        self.__latency_total = 0.0
+
+    def translate(self, text: str) -> str:
+        """
+        Перевод текста.
+
+        :param text: Текст, который нужно перевести.
+        :type text: str
+
+        :return: Переведенный текст.
+        :rtype: str
+
+        :raises TimeoutError: Если нет свободного соединения за время
+                              ожидания.
+        :raises Exception: Если переводчик вернул ошибку.
+        """
+
+        params = {'q': text, 'langpair': self.__langpair}
+        if self.__email:
+            params['de'] = self.__email
+
+        start = time.perf_counter()
+        if not self.__slots.acquire(timeout=self.__pool_timeout):
+            latency = time.perf_counter() - start
+            with self.__lock:
+                self.__stats.requests += 1
+                self.__stats.errors += 1
+                self.__latencies.append(latency)
+                self.__latency_total += latency
+            raise TimeoutError("Нет свободного соединения с переводчиком "
+                               f"MyMemory за {self.__pool_timeout} с!")
+
+        with self.__lock:
+            self.__stats.requests += 1
+            self.__stats.in_flight += 1
+            self.__stats.max_in_flight = max(
+                self.__stats.max_in_flight, self.__stats.in_flight
+            )
+
+        try:
+            response = self.__session.get(
+                self.__url, params=params, timeout=self.__timeout
+            )
+            response.raise_for_status()
+            return self.__parse(response.json())
+        except Exception:
+            with self.__lock:
+                self.__stats.errors += 1
+            raise
+        finally:
+            self.__slots.release()
+            latency = time.perf_counter() - start
+            with self.__lock:
+                self.__stats.in_flight -= 1
+                self.__latencies.append(latency)
+                self.__latency_total += latency
+
+    def stats(self) -> MyMemoryClientStats:
+        """
+        Получение счетчиков клиента.
+
+        :return: Копия счетчиков клиента.
+        :rtype: MyMemoryClientStats
+        """
+
+        idle_connections, active_connections = self.__pool_connections()
+        with self.__lock:
+            stats = self.__stats
+            latencies = sorted(self.__latencies)
+            return MyMemoryClientStats(
+                requests=stats.requests,
+                errors=stats.errors,
+                in_flight=stats.in_flight,
+                max_in_flight=stats.max_in_flight,
+                pool_size=stats.pool_size,
+                pool_utilization=stats.in_flight / stats.pool_size,
+                idle_connections=idle_connections,
+                active_connections=active_connections,
+                mean_latency=(self.__latency_total / stats.requests
+                              if stats.requests else 0.0),
+                latency_p95=(
+                    latencies[max(int(len(latencies) * 0.95) - 1, 0)]
+                    if latencies else 0.0
+                )
+            )
+
+    def __pool_connections(self) -> tuple[int, int]:
+        """
+        Получение текущего количества соединений пула.
+
+        Очередь пула urllib3 хранит свободные соединения и пустые места
+        (None) под еще не открытые, а выданные запросам соединения из
+        нее забираются.
+
+        :return: Количество открытых свободных соединений и соединений,
+                 занятых запросами.
+        :rtype: tuple[int, int]
+        """
+
+        connections = self.__adapter.poolmanager.connection_from_url(
+            self.__url
+        ).pool
+        if connections is None:
+            return 0, 0
+
+        with connections.mutex:
+            idle = sum(conn is not None for conn in connections.queue)
+            return idle, connections.maxsize - len(connections.queue)
+
+    def close(self) -> None:
+        """ Закрытие соединений пула."""
+
+        self.__session.close()
+
+    @staticmethod
+    def __parse(data: dict[str, Any]) -> str:
+        """
+        Получение перевода из ответа переводчика.
+
+        :param data: Ответ переводчика.
+        :type data: dict[str, Any]
+
+        :return: Переведенный текст.
+        :rtype: str
+
+        :raises Exception: Если переводчик вернул ошибку.
+        """
+
+        status = int(data.get('responseStatus', 200))
+        if status != 200:
+            raise Exception(f"Переводчик MyMemory вернул ошибку {status}: "
+                            f"{data.get('responseDetails')}")
+
+        return data['responseData']['translatedText']
@@ -0,0 +1,607 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any, Awaitable, Callable, Mapping, Sequence
+
+from entities.translators.base import AbstractTranslator, TranslationResult
+from entities.translators.loop import BackgroundLoop
+
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class CircuitBreakerStats:
+    state: str = 'closed'
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    trips: int = 0
+    latency_p95: float = 0.0
+
+
+class CircuitBreaker:
+    """
+    Предохранитель переводчика.
+
+    После failure_threshold ошибок подряд предохранитель размыкается
+    (open), и переводчик не вызывается reset_timeout_s секунд. Затем
+    пропускается один пробный запрос (half_open): при успехе
+    предохранитель замыкается (closed), при ошибке снова размыкается.
+    Также хранит задержки последних успешных запросов, по которым
+    выбирается задержка хеджирования.
+
+    :ivar __failure_threshold: Атрибут количества ошибок подряд для
+                               размыкания.
+    :type __failure_threshold: int
+
+    :ivar __reset_timeout: Атрибут времени (в секундах) до пробного
+                           запроса.
+    :type __reset_timeout: float
+
+    :ivar __state: Атрибут состояния: closed, open или half_open.
+    :type __state: str
+
+    :ivar __latencies: Атрибут окна задержек успешных запросов.
+    :type __latencies: deque[float]
+    """
+
+    def __init__(
+            self,
+            failure_threshold: int = 5,
+            reset_timeout_s: float = 30.0,
+            window: int = 100
+    ) -> None:
+        """
+        Инициализация предохранителя.
+
+        :param failure_threshold: Количество ошибок подряд для
+                                  размыкания.
+        :type failure_threshold: int
+
+        :param reset_timeout_s: Время в секундах до пробного запроса.
+        :type reset_timeout_s: float
+
+        :param window: Количество последних успешных запросов для
+                       подсчета квантилей задержки.
+        :type window: int
+
+        :raises ValueError: Если количество ошибок меньше 1.
+        :raises ValueError: Если время до пробного запроса
+                            отрицательное.
+        """
+
+        if failure_threshold < 1:
+            raise ValueError("Количество ошибок для размыкания должно быть "
+                             "больше 0!")
+        if reset_timeout_s < 0:
+            raise ValueError("Время до пробного запроса не может быть "
+                             "отрицательным!")
+
+        self.__failure_threshold = failure_threshold
+        self.__reset_timeout = reset_timeout_s
+        self.__state = 'closed'
+        self.__opened_at = 0.0
+        self.__probing = False
+        self.__latencies: deque[float] = deque(maxlen=window)
+        self.__stats = CircuitBreakerStats()
+        self.__lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        Проверка, можно ли вызвать переводчик.
+
+        :return: Можно ли вызвать переводчик.
+        :rtype: bool
+        """
+
+        with self.__lock:
+            if self.__state == 'open':
+                if time.monotonic() - self.__opened_at < self.__reset_timeout:
+                    return False
+                self.__state = 'half_open'
+            if self.__state == 'half_open':
+                if self.__probing:
+                    return False
+                self.__probing = True
+
+            return True
+
+    def record_success(self, latency: float) -> None:
+        """
+        Учет успешного запроса.
+
+        :param latency: Задержка запроса в секундах.
+        :type latency: float
+        """
+
+        with self.__lock:
+            self.__state = 'closed'
+            self.__probing = False
+            self.__stats.successes += 1
+            self.__stats.consecutive_failures = 0
+            self.__latencies.append(latency)
+
+    def record_failure(self) -> None:
+        """ Учет ошибки или превышения времени запроса."""
+
+        with self.__lock:
+            self.__stats.failures += 1
+            self.__stats.consecutive_failures += 1
+            if (self.__state == 'half_open'
+                    or self.__stats.consecutive_failures
+                    >= self.__failure_threshold):
+                if self.__state != 'open':
+                    self.__stats.trips += 1
+                    logger.warning("Предохранитель переводчика разомкнут")
+                self.__state = 'open'
+                self.__opened_at = time.monotonic()
+            self.__probing = False
+
+    def latency_quantile(self, q: float) -> float | None:
+        """
+        Получение квантиля задержки успешных запросов.
+
+        :param q: Квантиль (от 0 до 1).
+        :type q: float
+
+        :return: Задержка в секундах или None, если запросов не было.
+        :rtype: float | None
+        """
+
+        with self.__lock:
+            return self.__quantile(q)
+
+    def stats(self) -> CircuitBreakerStats:
+        """
+        Получение счетчиков предохранителя.
+
+        :return: Копия счетчиков предохранителя.
+        :rtype: CircuitBreakerStats
+        """
+
+        with self.__lock:
+            stats = self.__stats
+            return CircuitBreakerStats(
+                state=self.__state,
+                successes=stats.successes,
+                failures=stats.failures,
+                consecutive_failures=stats.consecutive_failures,
+                trips=stats.trips,
+                latency_p95=self.__quantile(0.95) or 0.0
+            )
+
+    def __quantile(self, q: float) -> float | None:
+        if not self.__latencies:
+            return None
+
+        latencies = sorted(self.__latencies)
+        return latencies[max(int(len(latencies) * q) - 1, 0)]
+
+
+@dataclass
+class ResilientTranslatorStats:
+    requests: int = 0
+    hedged: int = 0
+    failovers: int = 0
+    budget_exceeded: int = 0
+    fallbacks: int = 0
+    wins: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Call:
+    provider: str
+    started_at: float
+    settled: bool = False
+
+
+class ResilientTranslator(AbstractTranslator):
+    """
+    Переводчик с бюджетом задержки, хеджированием и запасными
+    переводчиками.
+
+    Запрос отправляется первому переводчику с замкнутым
+    предохранителем. Если ответа нет дольше квантиля его задержки
+    (hedge_quantile), то такой же запрос отправляется следующему
+    переводчику, а при ошибке - сразу. Берется первый успешный ответ.
+    Если за бюджет задержки ни один переводчик не ответил успешно,
+    возвращается исходный текст с признаком translated=False, чтобы
+    ошибка перевода не отменяла уже сгенерированное описание.
+    Проигравшие запросы не отменяются (их результат может быть общим
+    для нескольких запросов), а превысившие бюджет считаются ошибками
+    предохранителей.
+
+    :ivar __providers: Атрибут переводчиков по порядку предпочтения.
+    :type __providers: list[tuple[str, AbstractTranslator]]
+
+    :ivar __breakers: Атрибут предохранителей по названиям
+                      переводчиков.
+    :type __breakers: Mapping[str, CircuitBreaker]
+
+    :ivar __loop: Атрибут фонового цикла событий синхронных вызовов.
+    :type __loop: BackgroundLoop
+
+    :ivar __budget: Атрибут бюджета задержки в секундах.
+    :type __budget: float
+
+    :ivar __hedge_quantile: Атрибут квантиля задержки, после которого
+                            отправляется хеджированный запрос.
+    :type __hedge_quantile: float
+
+    :ivar __hedge_min: Атрибут минимальной задержки хеджирования в
+                       секундах.
+    :type __hedge_min: float
+    """
+
+    def __init__(
+            self,
+            providers: Sequence[tuple[str, AbstractTranslator]],
+            breakers: Mapping[str, CircuitBreaker],
+            loop: BackgroundLoop,
+            budget_ms: float = 2000,
+            hedge_quantile: float = 0.95,
+            hedge_min_ms: float = 50
+    ) -> None:
+        """
+        Инициализация переводчика с запасными переводчиками.
+
+        :param providers: Названия и переводчики по порядку
+                          предпочтения.
+        :type providers: Sequence[tuple[str, AbstractTranslator]]
+
+        :param breakers: Предохранители по названиям переводчиков (общие
+                         для всех переводчиков с запасными).
+        :type breakers: Mapping[str, CircuitBreaker]
+
+        :param loop: Фоновый цикл событий синхронных вызовов.
+        :type loop: BackgroundLoop
+
+        :param budget_ms: Бюджет задержки перевода в миллисекундах.
+        :type budget_ms: float
+
+        :param hedge_quantile: Квантиль задержки переводчика, после
+                               которого отправляется хеджированный
+                               запрос.
+        :type hedge_quantile: float
+
+        :param hedge_min_ms: Минимальная задержка хеджирования в
+                             миллисекундах.
+        :type hedge_min_ms: float
+
+        :raises ValueError: Если нет переводчиков.
+        :raises ValueError: Если нет предохранителя переводчика.
+        :raises ValueError: Если бюджет задержки не больше 0.
+        :raises ValueError: Если квантиль не в диапазоне (0, 1].
+        """
+
+        if not providers:
+            raise ValueError("Нужен хотя бы один переводчик!")
+        for name, _ in providers:
+            if name not in breakers:
+                raise ValueError(f"Нет предохранителя переводчика {name}!")
+        if budget_ms <= 0:
+            raise ValueError("Бюджет задержки перевода должен быть больше "
+                             "0!")
+        if not 0 < hedge_quantile <= 1:
+            raise ValueError("Квантиль хеджирования должен быть в "
+                             "диапазоне (0, 1]!")
+
+        self.__providers = list(providers)
+        self.__breakers = breakers
+        self.__loop = loop
+        self.__budget = budget_ms / 1000
+        self.__hedge_quantile = hedge_quantile
+        self.__hedge_min = hedge_min_ms / 1000
+
+        self.__stats = ResilientTranslatorStats()
+        self.__lock = threading.Lock()
+
+    def set_lang(self, value: str) -> None:
+        """
+        Назначение языка, на который будет переводиться описание
+        изображения.
+
+        :param value: Язык, на который будет переводиться описание
+                      изображения.
+        :type value: str
+        """
+
+        for _, translator in self.__providers:
+            translator.set_lang(value)
+
+    def translate(self, desc: str) -> str:
+        """
+        Перевод описания изображения.
+
+        :param desc: Описание изображения, которое нужно перевести.
+        :type desc: str
+
+        :return: Переведенное описание изображения (или исходное, если
+                 ни один переводчик не ответил).
+        :rtype: str
+        """
+
+        return self.translate_result(desc).text
+
+    def translate_result(self, desc: str) -> TranslationResult:
+        """
+        Перевод описания изображения с признаком перевода.
+
+        :param desc: Описание изображения, которое нужно перевести.
+        :type desc: str
+
+        :return: Результат перевода.
+        :rtype: TranslationResult
+        """
+
+        return self.__loop.run(self.atranslate_result(desc))
+
+    def translate_batch(self, texts: Sequence[str]) -> list[str]:
+        """
+        Перевод нескольких описаний изображений.
+
+        :param texts: Описания изображений, которые нужно перевести.
+        :type texts: Sequence[str]
+
+        :return: Переведенные описания в порядке исходных (или исходные,
+                 если ни один переводчик не ответил).
+        :rtype: list[str]
+        """
+
+        return [
+            result.text for result in self.translate_batch_result(texts)
+        ]
+
+    def translate_batch_result(
+            self,
+            texts: Sequence[str]
+    ) -> list[TranslationResult]:
+        """
+        Перевод нескольких описаний изображений с признаком перевода.
+
+        :param texts: Описания изображений, которые нужно перевести.
+        :type texts: Sequence[str]
+
+        :return: Результаты перевода в порядке исходных описаний.
+        :rtype: list[TranslationResult]
+        """
+
+        return self.__loop.run(self.atranslate_batch_result(texts))
+
+    async def atranslate(self, desc: str) -> str:
+        """
+        Асинхронный перевод описания изображения.
+
+        :param desc: Описание изображения, которое нужно перевести.
+        :type desc: str
+
+        :return: Переведенное описание изображения (или исходное, если
+                 ни один переводчик не ответил).
+        :rtype: str
+        """
+
+        return (await self.atranslate_result(desc)).text
+
+    async def atranslate_result(self, desc: str) -> TranslationResult:
+        """
+        Асинхронный перевод описания изображения с признаком перевода.
+
+        :param desc: Описание изображения, которое нужно перевести.
+        :type desc: str
+
+        :return: Результат перевода.
+        :rtype: TranslationResult
+        """
+
+        result, provider = await self.__resolve(
+            lambda translator: translator.atranslate(desc)
+        )
+        if provider is None:
+            return TranslationResult(desc, translated=False)
+
+        return TranslationResult(result, provider=provider)
+
+    async def atranslate_batch(self, texts: Sequence[str]) -> list[str]:
+        """
+        Асинхронный перевод нескольких описаний изображений.
+
+        :param texts: Описания изображений, которые нужно перевести.
+        :type texts: Sequence[str]
+
+        :return: Переведенные описания в порядке исходных (или исходные,
+                 если ни один переводчик не ответил).
+        :rtype: list[str]
+        """
+
+        return [
+            result.text
+            for result in await self.atranslate_batch_result(texts)
+        ]
+
+    async def atranslate_batch_result(
+            self,
+            texts: Sequence[str]
+    ) -> list[TranslationResult]:
+        """
+        Асинхронный перевод нескольких описаний изображений с признаком
+        перевода.
+
+        :param texts: Описания изображений, которые нужно перевести.
+        :type texts: Sequence[str]
+
+        :return: Результаты перевода в порядке исходных описаний.
+        :rtype: list[TranslationResult]
+        """
+
+        if not texts:
+            return []
+
+        results, provider = await self.__resolve(
+            lambda translator: translator.atranslate_batch(texts)
+        )
+        if provider is None:
+            return [TranslationResult(text, translated=False)
+                    for text in texts]
+
+        return [TranslationResult(result, provider=provider)
+                for result in results]
+
+    def stats(self) -> ResilientTranslatorStats:
+        """
+        Получение счетчиков переводчика.
+
+        :return: Копия счетчиков переводчика.
+        :rtype: ResilientTranslatorStats
+        """
+
+        with self.__lock:
+            stats = self.__stats
+            return ResilientTranslatorStats(
+                requests=stats.requests,
+                hedged=stats.hedged,
+                failovers=stats.failovers,
+                budget_exceeded=stats.budget_exceeded,
+                fallbacks=stats.fallbacks,
+                wins=dict(stats.wins)
+            )
+
+    async def __resolve(
+            self,
+            request: Callable[[AbstractTranslator], Awaitable[Any]]
+    ) -> tuple[Any, str | None]:
+        """
+        Выполнение запроса с хеджированием и запасными переводчиками.
+
+        :param request: Запрос к переводчику.
+        :type request: Callable[[AbstractTranslator], Awaitable[Any]]
+
+        :return: Результат и название ответившего переводчика или
+                 (None, None), если ни один переводчик не ответил.
+        :rtype: tuple[Any, str | None]
+        """
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.__budget
+        providers = iter(self.__providers)
+        pending: dict[asyncio.Task, _Call] = {}
+
+        def launch() -> bool:
+            for name, translator in providers:
+                if not self.__breakers[name].allow():
+                    continue
+                call = _Call(provider=name, started_at=time.perf_counter())
+                task = asyncio.ensure_future(
+                    self.__call(call, request(translator))
+                )
+                # Ошибки брошенных запросов учтены в предохранителе.
+                task.add_done_callback(
+                    lambda t: t.cancelled() or t.exception()
+                )
+                pending[task] = call
+                return True
+            return False
+
+        with self.__lock:
+            self.__stats.requests += 1
+
+        last = launch()
+        while pending:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            timeout = remaining
+            if last:
+                newest = next(reversed(pending.values()))
+                timeout = min(remaining, self.__hedge_delay(newest.provider))
+            done, _ = await asyncio.wait(
+                pending, timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+
+            for task in done:
+                call = pending.pop(task)
+                if task.exception() is None:
+                    with self.__lock:
+                        wins = self.__stats.wins
+                        wins[call.provider] = wins.get(call.provider, 0) + 1
+                    return task.result(), call.provider
+                logger.warning(f"Ошибка переводчика {call.provider}: "
+                               f"{task.exception()}")
+
+            if not done and last:
+                # Хеджированный запрос к следующему переводчику.
+                last = launch()
+                if last:
+                    with self.__lock:
+                        self.__stats.hedged += 1
+            elif not pending:
+                # Все отправленные запросы завершились ошибкой.
+                last = launch()
+                if last:
+                    with self.__lock:
+                        self.__stats.failovers += 1
+
+        with self.__lock:
+            if pending:
+                self.__stats.budget_exceeded += 1
+            self.__stats.fallbacks += 1
+        for call in pending.values():
+            call.settled = True
+            self.__breakers[call.provider].record_failure()
+        logger.warning("Ни один переводчик не ответил, описание не "
+                       "переведено")
+
+        return None, None
+
+    async def __call(self, call: _Call, coro: Awaitable[Any]) -> Any:
+        """
+        Запрос к переводчику с учетом результата в предохранителе.
+
+        :param call: Запрос к переводчику.
+        :type call: _Call
+
+        :param coro: Корутина запроса.
+        :type coro: Awaitable[Any]
+
+        :return: Результат запроса.
+        :rtype: Any
+        """
+
+        breaker = self.__breakers[call.provider]
+        try:
+            result = await coro
+        except Exception:
+            if not call.settled:
+                breaker.record_failure()
+            raise
+
+        if not call.settled:
+            breaker.record_success(time.perf_counter() - call.started_at)
+
+        return result
+
+    def __hedge_delay(self, provider: str) -> float:
+        """
+        Получение задержки хеджирования переводчика.
+
+        :param provider: Название переводчика.
+        :type provider: str
+
+        :return: Задержка в секундах: квантиль задержки переводчика (или
+                 половина бюджета, если запросов еще не было), но не
+                 меньше минимальной.
+        :rtype: float
+        """
+
+        latency = self.__breakers[provider].latency_quantile(
+            self.__hedge_quantile
+        )
+        if latency is None:
+            latency = self.__budget / 2
+
+        return max(latency, self.__hedge_min)
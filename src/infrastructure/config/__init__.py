@@ -1,47 +1,108 @@
-from infrastructure.config.config import (
-    PATH_TO_IMG_DIR,
-    BLIP_MODEL_NAME,
-    # BLIP2_MODEL_NAME,
-    CAP_MODEL_SETTINGS,
-    MAX_LENGTH_DESCRIPTION,
-    MIN_LENGTH_DESCRIPTION,
-    DEFAULT_LENGTH_DESCRIPTION,
-    STEP_LENGTH_DESCRIPTION,
-    APPTRANS_TRANS_NAME,
-    GOOGLE_TRANS_NAME,
-    TRANS_MODEL_SETTINGS,
-    LOGGING_CONFIG,
-    GRADIO_LOGS_PATH,
-    GRADIO_LOGGING_CONFIG,
-    GRADIO_CAP_MODEL_NAME_MAP,
-    GRADIO_TRANS_NAME_MAP,
-    FASTAPI_LOGS_PATH,
-    FASTAPI_LOGGING_CONFIG,
-    DB_USER,
-    DB_PASSWORD,
-    DB_NAME,
-    DB_HOST,
-    DB_PORT,
-    DB_URL,
-    GRADIO_HOST,
-    GRADIO_PORT,
-    FASTAPI_HOST,
-    FASTAPI_PORT,
-
-)
+from typing import Any
+
+from infrastructure.config import config as _config
+from infrastructure.config.config import ensure_dirs, load_config
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Получение параметра конфигурации при первом обращении к нему, чтобы
+    импорт конфигурации не читал config.yml.
+
+    :param name: Название параметра.
+    :type name: str
+
+    :return: Значение параметра.
+    :rtype: Any
+
+    :raises AttributeError: Если нет параметра.
+    """
+
+    if name not in __all__:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+
+    return getattr(_config, name)
+
 
 __all__ = [
     'PATH_TO_IMG_DIR',
     'BLIP_MODEL_NAME',
+    'ONNX_BLIP_MODEL_NAME',
     # 'BLIP2_MODEL_NAME',
     'CAP_MODEL_SETTINGS',
     'MAX_LENGTH_DESCRIPTION',
     'MIN_LENGTH_DESCRIPTION',
     'DEFAULT_LENGTH_DESCRIPTION',
     'STEP_LENGTH_DESCRIPTION',
+    'CAP_MODEL_REGISTRY_MEMORY_BUDGET',
+    'CAP_MODEL_BATCHING_ENABLED',
+    'CAP_MODEL_BATCH_MAX_SIZE',
+    'CAP_MODEL_BATCH_MAX_WAIT_MS',
+    'CAP_MODEL_DECODING_DRAFT',
+    'CAP_MODEL_DECODING_TURBOJPEG',
+    'CAP_MODEL_PREPROCESSING_VECTORIZED',
+    'CAP_MODEL_ARTIFACTS_MMAP',
+    'CAP_MODEL_ARTIFACTS_VERIFY',
+    'CAP_MODEL_EMBEDS_CACHE_ENABLED',
+    'CAP_MODEL_EMBEDS_CACHE_MEMORY_BUDGET',
+    'CAP_MODEL_EMBEDS_CACHE_SPILL_DIR',
+    'CAP_MODEL_EMBEDS_CACHE_DISK_BUDGET',
+    'CAP_MODEL_TOKEN_CACHE_ENABLED',
+    'CAP_MODEL_TOKEN_CACHE_MAX_ENTRIES',
+    'CAP_MODEL_WORKERS',
+    'CAP_MODEL_WORKER_TORCH_THREADS',
+    'CAP_MODEL_WORKER_START_METHOD',
+    'CAP_MODEL_WORKER_RESULT_TIMEOUT',
+    'CAP_MODEL_WORKER_MAX_RESTARTS',
+    'GENERATION_PROFILES',
+    'GENERATION_DEFAULT_PROFILE',
+    'GENERATION_CONTROLLER_AUTO',
+    'GENERATION_QUEUE_DEPTH_HIGH',
+    'GENERATION_QUEUE_DEPTH_LOW',
+    'GENERATION_LATENCY_P95_HIGH_MS',
+    'GENERATION_LATENCY_P95_LOW_MS',
+    'GENERATION_LATENCY_WINDOW',
+    'GENERATION_COOLDOWN',
+    'WARM_UP_ENABLED',
+    'WARM_UP_ITERATIONS',
+    'WARM_UP_BATCH_SIZES',
+    'WARM_UP_IMAGE_SIZE',
+    'WARM_UP_TRANSLATORS',
+    'CAPTION_CACHE_ENABLED',
+    'CAPTION_CACHE_MAX_ENTRIES',
+    'CAPTION_CACHE_TTL',
+    'TRANSLATION_CACHE_ENABLED',
+    'TRANSLATION_CACHE_MAX_ENTRIES',
+    'TRANSLATION_CACHE_PERSISTENT',
+    'TRANSLATION_RESILIENCE_ENABLED',
+    'TRANSLATION_FALLBACKS',
+    'TRANSLATION_BUDGET_MS',
+    'TRANSLATION_HEDGE_QUANTILE',
+    'TRANSLATION_HEDGE_MIN_MS',
+    'TRANSLATION_BREAKER_FAILURES',
+    'TRANSLATION_BREAKER_RESET',
+    'TRANSLATION_LATENCY_WINDOW',
+    'TRANSLATION_BATCHING_ENABLED',
+    'TRANSLATION_BATCH_MAX_SIZE',
+    'TRANSLATION_BATCH_MAX_WAIT_MS',
+    'PIPELINE_ENABLED',
+    'PIPELINE_QUEUE_SIZE',
+    'PIPELINE_WORKERS',
+    'INFERENCE_THREADS',
+    'IO_THREADS',
     'APPTRANS_TRANS_NAME',
     'GOOGLE_TRANS_NAME',
+    'MARIAN_TRANS_NAME',
     'TRANS_MODEL_SETTINGS',
+    'APPTRANS_URL',
+    'APPTRANS_EMAIL',
+    'APPTRANS_POOL_SIZE',
+    'APPTRANS_TIMEOUT',
+    'APPTRANS_POOL_TIMEOUT',
+    'APPTRANS_RETRIES',
+    'APPTRANS_BACKOFF',
     'LOGGING_CONFIG',
     'GRADIO_LOGS_PATH',
     'GRADIO_LOGGING_CONFIG',
@@ -58,5 +119,7 @@ __all__ = [
     'GRADIO_HOST',
     'GRADIO_PORT',
     'FASTAPI_HOST',
-    'FASTAPI_PORT'
+    'FASTAPI_PORT',
+    'ensure_dirs',
+    'load_config'
 ]
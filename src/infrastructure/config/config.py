@@ -1,110 +1,344 @@
 import yaml
 import os
-from pathlib import Path
 from copy import deepcopy
+from functools import cache
+from pathlib import Path
+from typing import Any
 
 
-with open('./config.yml', 'r') as config_file:
-    config = yaml.safe_load(config_file)
-
-# Параметры изображений.
-PATH_TO_IMG_DIR = Path(config['images']['path_to_dir'])
-
-# Параметры captioning-моделей.
-BLIP_MODEL_NAME = config['cap_model']['blip_name']
-# BLIP2_MODEL_NAME = config['cap_model']['blip2_name']
-CAP_MODEL_SETTINGS = {
-    BLIP_MODEL_NAME: {
-        'download_path': config['cap_model']['download_blip_path'],
-        'save_dir': config['cap_model']['save_blip_dir'],
-        'cache_dir': config['cap_model']['cache_blip_dir']
-    },
-    # BLIP2_MODEL_NAME: {
-    #     'download_path': config['cap_model']['download_blip2_path'],
-    #     'save_dir': config['cap_model']['save_blip2_dir'],
-    #     'cache_dir': config['cap_model']['cache_blip2_dir']
-    # }
-}
-
-MAX_LENGTH_DESCRIPTION = config['cap_model']['max_length']
-MIN_LENGTH_DESCRIPTION = config['cap_model']['min_length']
-DEFAULT_LENGTH_DESCRIPTION = config['cap_model']['default_length']
-STEP_LENGTH_DESCRIPTION = config['cap_model']['step_length']
-
-# Параметры переводчиков.
-APPTRANS_TRANS_NAME = config['translator']['apptrans_name']
-GOOGLE_TRANS_NAME = config['translator']['google_name']
-TRANS_MODEL_SETTINGS = {
-    APPTRANS_TRANS_NAME: {'lang': config['translator']['lang']},
-    GOOGLE_TRANS_NAME: {'lang': config['translator']['lang']}
-}
-
-# Параметры логов.
-LOGGING_CONFIG = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "standard": {
-            "format": "%(asctime)s - %(levelname)s - %(name)s - %(message)s",
-            "datefmt": "%Y-%m-%d %H:%M:%S"
-        }
-    },
-    "handlers": {
-        "console": {
-            "class": "logging.StreamHandler",
-            "level": config['logs']['level_to_console'],
-            "formatter": "standard",
-            "stream": "ext://sys.stdout",
+@cache
+def load_config() -> dict[str, Any]:
+    """
+    Чтение и разбор config.yml.
+
+    Файл читается при первом обращении к параметрам, а не при импорте
+    конфигурации, после чего результат переиспользуется.
+
+    :return: Конфигурация из config.yml.
+    :rtype: dict[str, Any]
+    """
+
+    with open('./config.yml', 'r') as config_file:
+        return yaml.safe_load(config_file)
+
+
+@cache
+def _load_settings() -> dict[str, Any]:
+    """
+    Построение параметров из config.yml.
+
+    :return: Параметры по названиям.
+    :rtype: dict[str, Any]
+    """
+
+    config = load_config()
+
+    # Параметры изображений.
+    PATH_TO_IMG_DIR = Path(config['images']['path_to_dir'])
+
+    # Параметры captioning-моделей.
+    BLIP_MODEL_NAME = config['cap_model']['blip_name']
+    ONNX_BLIP_MODEL_NAME = config['cap_model']['onnx_blip_name']
+    # BLIP2_MODEL_NAME = config['cap_model']['blip2_name']
+    CAP_MODEL_SETTINGS = {
+        BLIP_MODEL_NAME: {
+            'download_path': config['cap_model']['download_blip_path'],
+            'save_dir': config['cap_model']['save_blip_dir'],
+            'cache_dir': config['cap_model']['cache_blip_dir'],
+            'precision': config['cap_model']['precision_blip'],
+            'backend': 'torch'
         },
-        "file": {
-            "class": "logging.handlers.RotatingFileHandler",
-            "level": config['logs']['level_to_file'],
-            "formatter": "standard",
-            "filename": str(Path(
-                config['logs']['path_to_dir'],
-                config['logs']['filename']
-            )),
-            "maxBytes": config['logs']['max_bytes'],
-            "backupCount": config['logs']['backup_count'],
-            "encoding": "utf-8",
+        ONNX_BLIP_MODEL_NAME: {
+            'download_path': config['cap_model']['save_blip_dir'],
+            'save_dir': config['cap_model']['save_onnx_blip_dir'],
+            'cache_dir': config['cap_model']['cache_blip_dir'],
+            'threads': config['cap_model']['onnx_threads'],
+            'backend': 'onnx'
+        },
+        # BLIP2_MODEL_NAME: {
+        #     'download_path': config['cap_model']['download_blip2_path'],
+        #     'save_dir': config['cap_model']['save_blip2_dir'],
+        #     'cache_dir': config['cap_model']['cache_blip2_dir'],
+        #     'precision': config['cap_model']['precision_blip2'],
+        #     'backend': 'torch'
+        # }
+    }
+
+    MAX_LENGTH_DESCRIPTION = config['cap_model']['max_length']
+    MIN_LENGTH_DESCRIPTION = config['cap_model']['min_length']
+    DEFAULT_LENGTH_DESCRIPTION = config['cap_model']['default_length']
+    STEP_LENGTH_DESCRIPTION = config['cap_model']['step_length']
+
+    # Бюджет памяти реестра captioning-моделей (в байтах, 0 - без ограничений).
+    CAP_MODEL_REGISTRY_MEMORY_BUDGET = (
+        config['cap_model']['registry_memory_budget_mb'] * 1024 ** 2
+    )
+
+    # Параметры микро-батчинга captioning-моделей.
+    CAP_MODEL_BATCHING_ENABLED = config['cap_model']['batching']['enabled']
+    CAP_MODEL_BATCH_MAX_SIZE = (
+        config['cap_model']['batching']['max_batch_size']
+    )
+    CAP_MODEL_BATCH_MAX_WAIT_MS = (
+        config['cap_model']['batching']['max_wait_ms']
+    )
+
+    # Параметры декодирования изображений.
+    CAP_MODEL_DECODING_DRAFT = config['cap_model']['decoding']['draft']
+    CAP_MODEL_DECODING_TURBOJPEG = config['cap_model']['decoding']['turbojpeg']
+
+    # Параметры обработки изображений.
+    CAP_MODEL_PREPROCESSING_VECTORIZED = (
+        config['cap_model']['preprocessing']['vectorized']
+    )
+
+    # Параметры артефактов captioning-моделей.
+    CAP_MODEL_ARTIFACTS_MMAP = config['cap_model']['artifacts']['mmap']
+    CAP_MODEL_ARTIFACTS_VERIFY = config['cap_model']['artifacts']['verify']
+
+    # Параметры кеша эмбеддингов изображений.
+    CAP_MODEL_EMBEDS_CACHE_ENABLED = (
+        config['cap_model']['embeds_cache']['enabled']
+    )
+    CAP_MODEL_EMBEDS_CACHE_MEMORY_BUDGET = (
+        config['cap_model']['embeds_cache']['memory_budget_mb'] * 1024 ** 2
+    )
+    CAP_MODEL_EMBEDS_CACHE_SPILL_DIR = (
+        config['cap_model']['embeds_cache']['spill_dir'] or None
+    )
+    CAP_MODEL_EMBEDS_CACHE_DISK_BUDGET = (
+        config['cap_model']['embeds_cache']['disk_budget_mb'] * 1024 ** 2
+    )
+
+    # Параметры кеша последовательностей токенов жадного декодирования.
+    CAP_MODEL_TOKEN_CACHE_ENABLED = (
+        config['cap_model']['token_cache']['enabled']
+    )
+    CAP_MODEL_TOKEN_CACHE_MAX_ENTRIES = (
+        config['cap_model']['token_cache']['max_entries']
+    )
+
+    # Параметры пула процессов инференса (0 процессов - пул отключен).
+    CAP_MODEL_WORKERS = config['cap_model']['worker_pool']['workers']
+    CAP_MODEL_WORKER_TORCH_THREADS = (
+        config['cap_model']['worker_pool']['torch_threads']
+    )
+    CAP_MODEL_WORKER_START_METHOD = (
+        config['cap_model']['worker_pool']['start_method']
+    )
+    CAP_MODEL_WORKER_RESULT_TIMEOUT = (
+        config['cap_model']['worker_pool']['result_timeout_s']
+    )
+    CAP_MODEL_WORKER_MAX_RESTARTS = (
+        config['cap_model']['worker_pool']['max_restarts']
+    )
+
+    # Параметры профилей генерации описаний (от самого качественного к самому
+    # быстрому).
+    GENERATION_PROFILES = {
+        name: {
+            'num_beams': profile.get('num_beams'),
+            'max_length': profile.get('max_length'),
+            'image_size': profile.get('image_size')
         }
-    },
-    "loggers": {
-        "": {
-            "level": "DEBUG",
-            "handlers": ["console", "file"]
+        for name, profile in config['generation']['profiles'].items()
+    }
+    GENERATION_DEFAULT_PROFILE = config['generation']['default_profile']
+    GENERATION_CONTROLLER_AUTO = config['generation']['controller']['auto']
+    GENERATION_QUEUE_DEPTH_HIGH = (
+        config['generation']['controller']['queue_depth_high']
+    )
+    GENERATION_QUEUE_DEPTH_LOW = (
+        config['generation']['controller']['queue_depth_low']
+    )
+    GENERATION_LATENCY_P95_HIGH_MS = (
+        config['generation']['controller']['latency_p95_high_ms']
+    )
+    GENERATION_LATENCY_P95_LOW_MS = (
+        config['generation']['controller']['latency_p95_low_ms']
+    )
+    GENERATION_LATENCY_WINDOW = config['generation']['controller']['window']
+    GENERATION_COOLDOWN = config['generation']['controller']['cooldown_s']
+
+    # Параметры кеша описаний изображений.
+    CAPTION_CACHE_ENABLED = config['caption_cache']['enabled']
+    CAPTION_CACHE_MAX_ENTRIES = config['caption_cache']['max_entries']
+    CAPTION_CACHE_TTL = config['caption_cache']['ttl_s']
+
+    # Параметры кеша переводов описаний изображений.
+    TRANSLATION_CACHE_ENABLED = config['translation_cache']['enabled']
+    TRANSLATION_CACHE_MAX_ENTRIES = config['translation_cache']['max_entries']
+    TRANSLATION_CACHE_PERSISTENT = config['translation_cache']['persistent']
+
+    # Параметры хеджирования и запасных переводчиков.
+    TRANSLATION_RESILIENCE_ENABLED = (
+        config['translation_resilience']['enabled']
+    )
+    TRANSLATION_FALLBACKS = config['translation_resilience']['fallbacks']
+    TRANSLATION_BUDGET_MS = config['translation_resilience']['budget_ms']
+    TRANSLATION_HEDGE_QUANTILE = (
+        config['translation_resilience']['hedge_quantile']
+    )
+    TRANSLATION_HEDGE_MIN_MS = config['translation_resilience']['hedge_min_ms']
+    TRANSLATION_BREAKER_FAILURES = (
+        config['translation_resilience']['failure_threshold']
+    )
+    TRANSLATION_BREAKER_RESET = (
+        config['translation_resilience']['reset_timeout_s']
+    )
+    TRANSLATION_LATENCY_WINDOW = config['translation_resilience']['window']
+
+    # Параметры батчинга запросов к переводчикам.
+    TRANSLATION_BATCHING_ENABLED = config['translation_batching']['enabled']
+    TRANSLATION_BATCH_MAX_SIZE = (
+        config['translation_batching']['max_batch_size']
+    )
+    TRANSLATION_BATCH_MAX_WAIT_MS = (
+        config['translation_batching']['max_wait_ms']
+    )
+
+    # Параметры конвейера получения описания изображения.
+    PIPELINE_ENABLED = config['pipeline']['enabled']
+    PIPELINE_QUEUE_SIZE = config['pipeline']['queue_size']
+    PIPELINE_WORKERS = config['pipeline']['workers']
+
+    # Параметры прогрева captioning-моделей при старте.
+    WARM_UP_ENABLED = config['warm_up']['enabled']
+    WARM_UP_ITERATIONS = config['warm_up']['iterations']
+    WARM_UP_BATCH_SIZES = config['warm_up']['batch_sizes']
+    WARM_UP_IMAGE_SIZE = (
+        config['warm_up']['image_width'],
+        config['warm_up']['image_height']
+    )
+    WARM_UP_TRANSLATORS = config['warm_up']['translators']
+
+    # Параметры пулов исполнения блокирующих задач.
+    INFERENCE_THREADS = config['executors']['inference_threads']
+    IO_THREADS = config['executors']['io_threads']
+
+    # Параметры переводчиков.
+    APPTRANS_TRANS_NAME = config['translator']['apptrans_name']
+    GOOGLE_TRANS_NAME = config['translator']['google_name']
+    MARIAN_TRANS_NAME = config['translator']['marian_name']
+    TRANS_MODEL_SETTINGS = {
+        APPTRANS_TRANS_NAME: {'lang': config['translator']['lang']},
+        GOOGLE_TRANS_NAME: {'lang': config['translator']['lang']},
+        MARIAN_TRANS_NAME: {
+            'lang': config['translator']['lang'],
+            'download_path': config['translator']['marian']['download_path'],
+            'save_dir': config['translator']['marian']['save_dir'],
+            'cache_dir': config['translator']['marian']['cache_dir'],
+            'num_beams': config['translator']['marian']['num_beams'],
+            'max_length': config['translator']['marian']['max_length']
         }
     }
-}
-
-# Параметры реализации на Gradio
-GRADIO_LOGS_PATH = str(Path(
-    config['logs']['path_to_dir'],
-    config['logs']['gradio_folder'],
-    config['logs']['filename']
-))
-GRADIO_LOGGING_CONFIG = deepcopy(LOGGING_CONFIG)
-GRADIO_LOGGING_CONFIG['handlers']['file']['filename'] = GRADIO_LOGS_PATH
-
-GRADIO_CAP_MODEL_NAME_MAP = {
-    "BLIP": BLIP_MODEL_NAME,
-    # "BLIP2": BLIP2_MODEL_NAME
-}
-GRADIO_TRANS_NAME_MAP = {
-    "Без перевода": None,
-    "App Translator": APPTRANS_TRANS_NAME,
-    "Google Translate (работает через раз)": GOOGLE_TRANS_NAME
-}
-
-
-# Параметры реализации на FastAPI
-FASTAPI_LOGS_PATH = str(Path(
-    config['logs']['path_to_dir'],
-    config['logs']['fastapi_folder'],
-    config['logs']['filename']
-))
-FASTAPI_LOGGING_CONFIG = deepcopy(LOGGING_CONFIG)
-FASTAPI_LOGGING_CONFIG['handlers']['file']['filename'] = FASTAPI_LOGS_PATH
+
+    # Параметры HTTP-клиента App Translator (MyMemory).
+    APPTRANS_URL = config['translator']['apptrans']['url']
+    APPTRANS_EMAIL = os.getenv("APPTRANS_EMAIL") or None
+    APPTRANS_POOL_SIZE = config['translator']['apptrans']['pool_size']
+    APPTRANS_TIMEOUT = config['translator']['apptrans']['timeout_s']
+    APPTRANS_POOL_TIMEOUT = config['translator']['apptrans']['pool_timeout_s']
+    APPTRANS_RETRIES = config['translator']['apptrans']['retries']
+    APPTRANS_BACKOFF = config['translator']['apptrans']['backoff_s']
+
+    # Параметры логов.
+    LOGGING_CONFIG = {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {
+            "standard": {
+                "format": ("%(asctime)s - %(levelname)s - %(name)s - "
+                           "%(message)s"),
+                "datefmt": "%Y-%m-%d %H:%M:%S"
+            }
+        },
+        "handlers": {
+            "console": {
+                "class": "logging.StreamHandler",
+                "level": config['logs']['level_to_console'],
+                "formatter": "standard",
+                "stream": "ext://sys.stdout",
+            },
+            "file": {
+                "class": "logging.handlers.RotatingFileHandler",
+                "level": config['logs']['level_to_file'],
+                "formatter": "standard",
+                "filename": str(Path(
+                    config['logs']['path_to_dir'],
+                    config['logs']['filename']
+                )),
+                "maxBytes": config['logs']['max_bytes'],
+                "backupCount": config['logs']['backup_count'],
+                "encoding": "utf-8",
+            }
+        },
+        "loggers": {
+            "": {
+                "level": "DEBUG",
+                "handlers": ["console", "file"]
+            }
+        }
+    }
+
+    # Параметры реализации на Gradio
+    GRADIO_LOGS_PATH = str(Path(
+        config['logs']['path_to_dir'],
+        config['logs']['gradio_folder'],
+        config['logs']['filename']
+    ))
+    GRADIO_LOGGING_CONFIG = deepcopy(LOGGING_CONFIG)
+    GRADIO_LOGGING_CONFIG['handlers']['file']['filename'] = GRADIO_LOGS_PATH
+
+    GRADIO_CAP_MODEL_NAME_MAP = {
+        "BLIP": BLIP_MODEL_NAME,
+        "BLIP (ONNX Runtime)": ONNX_BLIP_MODEL_NAME,
+        # "BLIP2": BLIP2_MODEL_NAME
+    }
+    GRADIO_TRANS_NAME_MAP = {
+        "Без перевода": None,
+        "App Translator": APPTRANS_TRANS_NAME,
+        "Google Translate (работает через раз)": GOOGLE_TRANS_NAME,
+        "MarianMT (локально)": MARIAN_TRANS_NAME
+    }
+
+
+    # Параметры реализации на FastAPI
+    FASTAPI_LOGS_PATH = str(Path(
+        config['logs']['path_to_dir'],
+        config['logs']['fastapi_folder'],
+        config['logs']['filename']
+    ))
+    FASTAPI_LOGGING_CONFIG = deepcopy(LOGGING_CONFIG)
+    FASTAPI_LOGGING_CONFIG['handlers']['file']['filename'] = FASTAPI_LOGS_PATH
+
+    return {
+        name: value for name, value in locals().items() if name.isupper()
+    }
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Получение параметра из config.yml при первом обращении к нему.
+
+    :param name: Название параметра.
+    :type name: str
+
+    :return: Значение параметра.
+    :rtype: Any
+
+    :raises AttributeError: Если нет параметра.
+    """
+
+    # Служебные атрибуты (например, __path__ при импорте) не требуют
+    # чтения config.yml.
+    if not name.isupper() or name not in _load_settings():
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+
+    return _load_settings()[name]
+
 
 # Параметры Базы данных.
 DB_USER = os.getenv("DB_USER", "myuser")
@@ -121,18 +355,44 @@ GRADIO_PORT = int(os.getenv("GRADIO_PORT", 7860))
 FASTAPI_HOST = os.getenv("FASTAPI_HOST", "0.0.0.0")
 FASTAPI_PORT = int(os.getenv("FASTAPI_PORT", 8000))
 
-# Создание папок.
-os.makedirs(PATH_TO_IMG_DIR, exist_ok=True)
-os.makedirs(CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['save_dir'], exist_ok=True)
-os.makedirs(CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['cache_dir'], exist_ok=True)
-# os.makedirs(CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['save_dir'], exist_ok=True)
-# os.makedirs(CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['cache_dir'], exist_ok=True)
-os.makedirs(
-    Path(config['logs']['path_to_dir'], config['logs']['gradio_folder']),
-    exist_ok=True
-)
-os.makedirs(
-    Path(config['logs']['path_to_dir'],
-         config['logs']['fastapi_folder']),
-    exist_ok=True
-)
+
+def ensure_dirs() -> None:
+    """
+    Создание папок изображений, моделей, выгрузки эмбеддингов и логов.
+
+    Вызывается при запуске приложений, а не при импорте конфигурации,
+    чтобы импорт не обращался к файловой системе.
+    """
+
+    config = load_config()
+    settings = _load_settings()
+    blip_settings = settings['CAP_MODEL_SETTINGS'][
+        settings['BLIP_MODEL_NAME']
+    ]
+    onnx_blip_settings = settings['CAP_MODEL_SETTINGS'][
+        settings['ONNX_BLIP_MODEL_NAME']
+    ]
+    marian_settings = settings['TRANS_MODEL_SETTINGS'][
+        settings['MARIAN_TRANS_NAME']
+    ]
+
+    os.makedirs(settings['PATH_TO_IMG_DIR'], exist_ok=True)
+    os.makedirs(blip_settings['save_dir'], exist_ok=True)
+    os.makedirs(blip_settings['cache_dir'], exist_ok=True)
+    os.makedirs(onnx_blip_settings['save_dir'], exist_ok=True)
+    os.makedirs(marian_settings['save_dir'], exist_ok=True)
+    os.makedirs(marian_settings['cache_dir'], exist_ok=True)
+    if settings['CAP_MODEL_EMBEDS_CACHE_SPILL_DIR']:
+        os.makedirs(settings['CAP_MODEL_EMBEDS_CACHE_SPILL_DIR'],
+                    exist_ok=True)
+    # os.makedirs(CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['save_dir'], exist_ok=True)
+    # os.makedirs(CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['cache_dir'], exist_ok=True)
+    os.makedirs(
+        Path(config['logs']['path_to_dir'], config['logs']['gradio_folder']),
+        exist_ok=True
+    )
+    os.makedirs(
+        Path(config['logs']['path_to_dir'],
+             config['logs']['fastapi_folder']),
+        exist_ok=True
+    )
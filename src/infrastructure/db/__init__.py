@@ -1,16 +1,31 @@
-from infrastructure.db.session import Session, get_session
+from infrastructure.db.session import (
+    Session,
+    get_engine,
+    get_session,
+    repositories_scope
+)
 from infrastructure.db.repositories import (
+    AbstractCaptionCacheRepository,
     AbstractImageRepository,
     AbstractDescriptionRepository,
+    AbstractTranslationCacheRepository,
+    CaptionCacheRepository,
     ImageRepository,
-    DescriptionRepository
+    DescriptionRepository,
+    TranslationCacheRepository
 )
 
 __all__ = [
     'Session',
+    'get_engine',
     'get_session',
+    'repositories_scope',
+    'AbstractCaptionCacheRepository',
     'AbstractImageRepository',
     'AbstractDescriptionRepository',
+    'AbstractTranslationCacheRepository',
+    'CaptionCacheRepository',
     'ImageRepository',
-    'DescriptionRepository'
+    'DescriptionRepository',
+    'TranslationCacheRepository'
 ]
@@ -1,4 +1,6 @@
 from infrastructure.db.orm.base import Base
+from infrastructure.db.orm.caption_cache import CaptionCacheORM
 from infrastructure.db.orm.request import RequestORM
+from infrastructure.db.orm.translation_cache import TranslationCacheORM
 
-__all__ = ['Base', 'RequestORM']
+__all__ = ['Base', 'CaptionCacheORM', 'RequestORM', 'TranslationCacheORM']
@@ -0,0 +1,19 @@
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.db.orm.base import Base
+
+
+class CaptionCacheORM(Base):
+    """ ORM для кеша описаний изображений."""
+
+    __tablename__ = 'caption_cache'
+
+    key: Mapped[str] = mapped_column(
+        primary_key=True,
+        nullable=False,
+        unique=True
+    )
+    name_cap_model: Mapped[str] = mapped_column(nullable=False, index=True)
+    model_version: Mapped[str] = mapped_column(nullable=False)
+    description: Mapped[str] = mapped_column(nullable=False)
+    created_at: Mapped[float] = mapped_column(nullable=False)
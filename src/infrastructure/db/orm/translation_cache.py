@@ -0,0 +1,20 @@
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.db.orm.base import Base
+
+
+class TranslationCacheORM(Base):
+    """ ORM для кеша переводов описаний изображений."""
+
+    __tablename__ = 'translation_cache'
+
+    key: Mapped[str] = mapped_column(
+        primary_key=True,
+        nullable=False,
+        unique=True
+    )
+    provider: Mapped[str] = mapped_column(nullable=False, index=True)
+    lang: Mapped[str] = mapped_column(nullable=False)
+    source: Mapped[str] = mapped_column(nullable=False)
+    translation: Mapped[str] = mapped_column(nullable=False)
+    created_at: Mapped[float] = mapped_column(nullable=False)
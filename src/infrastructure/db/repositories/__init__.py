@@ -1,17 +1,29 @@
 from infrastructure.db.repositories.base import (
     AbstractRepository,
+    AbstractCaptionCacheRepository,
     AbstractDescriptionRepository,
-    AbstractImageRepository
+    AbstractImageRepository,
+    AbstractTranslationCacheRepository
+)
+from infrastructure.db.repositories.caption_cache_repos import (
+    CaptionCacheRepository
 )
 from infrastructure.db.repositories.desc_repos import (
     DescriptionRepository
 )
 from infrastructure.db.repositories.img_repos import ImageRepository
+from infrastructure.db.repositories.translation_cache_repos import (
+    TranslationCacheRepository
+)
 
 __all__ = [
     'AbstractRepository',
+    'AbstractCaptionCacheRepository',
     'AbstractDescriptionRepository',
     'AbstractImageRepository',
+    'AbstractTranslationCacheRepository',
+    'CaptionCacheRepository',
     'DescriptionRepository',
-    'ImageRepository'
+    'ImageRepository',
+    'TranslationCacheRepository'
 ]
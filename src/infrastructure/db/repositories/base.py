@@ -31,3 +31,48 @@ class AbstractDescriptionRepository(AbstractRepository):
     @abstractmethod
     def set_description_by_uuid(self, uuid: 'UUID', desc: str) -> None:
         pass
+
+
+class AbstractCaptionCacheRepository(AbstractRepository):
+
+    @abstractmethod
+    def get_caption(self, key: str) -> tuple[str, float] | None:
+        pass
+
+    @abstractmethod
+    def set_caption(
+            self,
+            key: str,
+            name_cap_model: str,
+            model_version: str,
+            desc: str,
+            created_at: float
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def delete_caption(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def delete_captions(self, name_cap_model: str | None = None) -> int:
+        pass
+
+
+class AbstractTranslationCacheRepository(ABC):
+
+    @abstractmethod
+    def get_translation(self, key: str) -> str | None:
+        pass
+
+    @abstractmethod
+    def set_translation(
+            self,
+            key: str,
+            provider: str,
+            lang: str,
+            text: str,
+            translation: str,
+            created_at: float
+    ) -> None:
+        pass
@@ -0,0 +1,162 @@
+from logging import getLogger
+
+from sqlalchemy import Delete, delete
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from infrastructure.db.orm import CaptionCacheORM
+from infrastructure.db.repositories.base import (
+    AbstractCaptionCacheRepository
+)
+
+
+logger = getLogger(__name__)
+
+
+class CaptionCacheRepository(AbstractCaptionCacheRepository):
+    """
+    Репозиторий кеша описаний изображений.
+
+    :ivar __session: Атрибут сессии подключения к БД.
+    :type __session: Session
+    """
+
+    def __init__(self, session: Session) -> None:
+        """
+        Инициализация репозитория кеша описаний изображений.
+
+        :param session: Сессия подключения к БД.
+        :type session: Session
+        """
+
+        self.__session = session
+
+    def set_session(self, session: Session) -> None:
+        """
+        Установка сессии подключения к БД.
+
+        :param session: Сессия подключения к БД.
+        :type session: Session
+        """
+
+        if not isinstance(session, Session):
+            raise TypeError("Сессия подключения к БД не типа Session!")
+
+        self.__session = session
+
+    def get_caption(self, key: str) -> tuple[str, float] | None:
+        """
+        Получение описания изображения из кеша в БД.
+
+        :param key: Ключ описания.
+        :type key: str
+
+        :return: Описание и время его записи или None, если его нет в
+                 кеше.
+        :rtype: tuple[str, float] | None
+
+        :raises SQLAlchemyError: Если сбой при получении описания из БД.
+        """
+
+        try:
+            result = self.__session.get(CaptionCacheORM, key)
+        except Exception as e:
+            self.__session.rollback()
+            msg = f"Ошибка при получении описания из кеша в БД: {key}!"
+            logger.error(f"{msg} - {e}")
+            raise SQLAlchemyError(msg)
+
+        if result is None:
+            return None
+
+        return result.description, result.created_at
+
+    def set_caption(
+            self,
+            key: str,
+            name_cap_model: str,
+            model_version: str,
+            desc: str,
+            created_at: float
+    ) -> None:
+        """
+        Запись описания изображения в кеш в БД.
+
+        :param key: Ключ описания.
+        :type key: str
+
+        :param name_cap_model: Название captioning-модели.
+        :type name_cap_model: str
+
+        :param model_version: Версия весов captioning-модели.
+        :type model_version: str
+
+        :param desc: Описание изображения.
+        :type desc: str
+
+        :param created_at: Время записи описания (unix-время).
+        :type created_at: float
+
+        :raises SQLAlchemyError: Если сбой при записи описания в БД.
+        """
+
+        try:
+            self.__session.merge(CaptionCacheORM(
+                key=key,
+                name_cap_model=name_cap_model,
+                model_version=model_version,
+                description=desc,
+                created_at=created_at
+            ))
+            self.__session.commit()
+        except Exception as e:
+            self.__session.rollback()
+            msg = f"Ошибка при записи описания в кеш в БД: {key}!"
+            logger.error(f"{msg} - {e}")
+            raise SQLAlchemyError(msg)
+
+    def delete_caption(self, key: str) -> None:
+        """
+        Удаление описания изображения из кеша в БД.
+
+        :param key: Ключ описания.
+        :type key: str
+
+        :raises SQLAlchemyError: Если сбой при удалении описания из БД.
+        """
+
+        self.__delete(delete(CaptionCacheORM).where(
+            CaptionCacheORM.key == key
+        ))
+
+    def delete_captions(self, name_cap_model: str | None = None) -> int:
+        """
+        Удаление описаний изображений из кеша в БД.
+
+        :param name_cap_model: Название captioning-модели, описания
+                               которой удаляются (None - все описания).
+        :type name_cap_model: str | None
+
+        :return: Количество удаленных описаний.
+        :rtype: int
+
+        :raises SQLAlchemyError: Если сбой при удалении описаний из БД.
+        """
+
+        stmt = delete(CaptionCacheORM)
+        if name_cap_model is not None:
+            stmt = stmt.where(CaptionCacheORM.name_cap_model == name_cap_model)
+
+        return self.__delete(stmt)
+
+    def __delete(self, stmt: Delete) -> int:
+        try:
+            result = self.__session.execute(stmt)
+            self.__session.commit()
+        except Exception as e:
+            self.__session.rollback()
+            msg = "Ошибка при удалении описаний из кеша в БД!"
+            logger.error(f"{msg} - {e}")
+            raise SQLAlchemyError(msg)
+
+        return result.rowcount
@@ -0,0 +1,111 @@
+from logging import getLogger
+from typing import Callable
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from infrastructure.db.orm import TranslationCacheORM
+from infrastructure.db.repositories.base import (
+    AbstractTranslationCacheRepository
+)
+
+
+logger = getLogger(__name__)
+
+
+class TranslationCacheRepository(AbstractTranslationCacheRepository):
+    """
+    Репозиторий кеша переводов описаний изображений.
+
+    Кеш переводов общий для процесса и используется из разных потоков,
+    поэтому репозиторий открывает короткую сессию на каждую операцию, а
+    не работает в сессии запроса.
+
+    :ivar __session_factory: Атрибут фабрики сессий подключения к БД.
+    :type __session_factory: Callable[[], Session]
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]) -> None:
+        """
+        Инициализация репозитория кеша переводов.
+
+        :param session_factory: Фабрика сессий подключения к БД.
+        :type session_factory: Callable[[], Session]
+        """
+
+        self.__session_factory = session_factory
+
+    def get_translation(self, key: str) -> str | None:
+        """
+        Получение перевода из кеша в БД.
+
+        :param key: Ключ перевода.
+        :type key: str
+
+        :return: Перевод или None, если его нет в кеше.
+        :rtype: str | None
+
+        :raises SQLAlchemyError: Если сбой при получении перевода из БД.
+        """
+
+        try:
+            with self.__session_factory() as session:
+                result = session.get(TranslationCacheORM, key)
+        except Exception as e:
+            msg = f"Ошибка при получении перевода из кеша в БД: {key}!"
+            logger.error(f"{msg} - {e}")
+            raise SQLAlchemyError(msg)
+
+        if result is None:
+            return None
+
+        return result.translation
+
+    def set_translation(
+            self,
+            key: str,
+            provider: str,
+            lang: str,
+            text: str,
+            translation: str,
+            created_at: float
+    ) -> None:
+        """
+        Запись перевода в кеш в БД.
+
+        :param key: Ключ перевода.
+        :type key: str
+
+        :param provider: Название переводчика.
+        :type provider: str
+
+        :param lang: Язык перевода.
+        :type lang: str
+
+        :param text: Исходный текст.
+        :type text: str
+
+        :param translation: Перевод.
+        :type translation: str
+
+        :param created_at: Время записи перевода (unix-время).
+        :type created_at: float
+
+        :raises SQLAlchemyError: Если сбой при записи перевода в БД.
+        """
+
+        try:
+            with self.__session_factory() as session:
+                session.merge(TranslationCacheORM(
+                    key=key,
+                    provider=provider,
+                    lang=lang,
+                    source=text,
+                    translation=translation,
+                    created_at=created_at
+                ))
+                session.commit()
+        except Exception as e:
+            msg = f"Ошибка при записи перевода в кеш в БД: {key}!"
+            logger.error(f"{msg} - {e}")
+            raise SQLAlchemyError(msg)
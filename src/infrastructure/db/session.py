@@ -1,13 +1,62 @@
-from sqlalchemy import create_engine
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import sessionmaker
 
 from infrastructure.db.orm import Base
+from infrastructure.db.repositories import (
+    CaptionCacheRepository,
+    ImageRepository,
+    DescriptionRepository
+)
 from infrastructure.config import DB_URL
 
 
-engine = create_engine(DB_URL, echo=True)
-Base.metadata.create_all(engine)
-Session = sessionmaker(bind=engine)
+class LazySessionmaker(sessionmaker):
+    """
+    Фабрика сессий, подключающаяся к БД при создании первой сессии.
+
+    Импорт модуля не создает подключение и таблицы, поэтому команды,
+    которым не нужна БД, запускаются без нее.
+    """
+
+    def __call__(self, **local_kw):
+        get_engine()
+        return super().__call__(**local_kw)
+
+
+Session = LazySessionmaker()
+
+_engine: Engine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """
+    Получение движка БД.
+
+    При первом вызове движок создается, таблицы создаются в БД, а
+    фабрика сессий привязывается к движку.
+
+    :return: Движок БД.
+    :rtype: Engine
+    """
+
+    global _engine
+
+    if _engine is not None:
+        return _engine
+
+    with _engine_lock:
+        if _engine is None:
+            engine = create_engine(DB_URL, echo=True)
+            Base.metadata.create_all(engine)
+            Session.configure(bind=engine)
+            _engine = engine
+
+    return _engine
 
 
 def get_session():
@@ -16,3 +65,27 @@ def get_session():
         yield session
     finally:
         session.close()
+
+
+@contextmanager
+def repositories_scope() -> Iterator[
+    tuple[ImageRepository, DescriptionRepository, CaptionCacheRepository]
+]:
+    """
+    Получение репозиториев с собственной короткой сессией.
+
+    Сессия не потокобезопасна, поэтому код, работающий в потоках
+    конвейера, а не в потоке запроса, открывает свою сессию, а не
+    использует сессию запроса.
+
+    :return: Репозитории изображений, описаний и кеша описаний.
+    :rtype: Iterator[tuple[ImageRepository, DescriptionRepository,
+            CaptionCacheRepository]]
+    """
+
+    with Session() as session:
+        yield (
+            ImageRepository(session),
+            DescriptionRepository(session),
+            CaptionCacheRepository(session)
+        )
@@ -0,0 +1,3 @@
+from infrastructure.executors.executors import ExecutionLayer, execution_layer
+
+__all__ = ['ExecutionLayer', 'execution_layer']
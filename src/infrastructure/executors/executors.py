@@ -0,0 +1,163 @@
+import asyncio
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from logging import getLogger
+from typing import Any, Callable, TypeVar
+
+from infrastructure.config import INFERENCE_THREADS, IO_THREADS
+
+
+logger = getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class ExecutionLayer:
+    """
+    Слой исполнения блокирующих задач вне цикла событий.
+
+    Содержит отдельные пулы для инференса captioning-моделей (потоки,
+    так как torch освобождает GIL во время вычислений) и для
+    блокирующего ввода-вывода (БД, файловая система, HTTP-переводчики).
+    Пулы создаются лениво при первом обращении. Инференс в отдельных
+    процессах выполняет пул процессов captioning-модели
+    (cap_model.worker_pool), а не слой исполнения.
+
+    :ivar __inference_threads: Атрибут размера пула инференса.
+    :type __inference_threads: int
+
+    :ivar __io_threads: Атрибут размера пула ввода-вывода.
+    :type __io_threads: int
+
+    :ivar __executors: Атрибут созданных пулов по названиям.
+    :type __executors: dict[str, Executor]
+
+    :ivar __pending_inference: Атрибут количества задач инференса в
+                               очереди и в работе.
+    :type __pending_inference: int
+    """
+
+    def __init__(
+            self,
+            inference_threads: int,
+            io_threads: int
+    ) -> None:
+        """
+        Инициализация слоя исполнения.
+
+        :param inference_threads: Размер пула потоков инференса.
+        :type inference_threads: int
+
+        :param io_threads: Размер пула потоков ввода-вывода.
+        :type io_threads: int
+
+        :raises ValueError: Если размер пула потоков меньше 1.
+        """
+
+        if inference_threads < 1 or io_threads < 1:
+            raise ValueError("Размер пула потоков должен быть больше 0!")
+
+        self.__inference_threads = inference_threads
+        self.__io_threads = io_threads
+        self.__executors: dict[str, Executor] = {}
+        self.__pending_inference = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def inference(self) -> Executor:
+        """ Пул потоков инференса captioning-моделей."""
+
+        return self.__get_executor('inference', lambda: ThreadPoolExecutor(
+            max_workers=self.__inference_threads,
+            thread_name_prefix='inference'
+        ))
+
+    @property
+    def pending_inference(self) -> int:
+        """ Количество задач инференса в очереди и в работе."""
+
+        return self.__pending_inference
+
+    @property
+    def io(self) -> Executor:
+        """ Пул потоков блокирующего ввода-вывода."""
+
+        return self.__get_executor('io', lambda: ThreadPoolExecutor(
+            max_workers=self.__io_threads,
+            thread_name_prefix='io'
+        ))
+
+    async def run_inference(
+            self,
+            fn: Callable[..., T],
+            *args: Any,
+            **kwargs: Any
+    ) -> T:
+        """
+        Выполнение задачи инференса в пуле потоков инференса.
+
+        :param fn: Блокирующая функция.
+        :type fn: Callable[..., T]
+
+        :return: Результат функции.
+        :rtype: T
+        """
+
+        with self.__lock:
+            self.__pending_inference += 1
+        try:
+            return await self.__run(self.inference, fn, *args, **kwargs)
+        finally:
+            with self.__lock:
+                self.__pending_inference -= 1
+
+    async def run_io(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Выполнение задачи ввода-вывода в пуле потоков ввода-вывода.
+
+        :param fn: Блокирующая функция.
+        :type fn: Callable[..., T]
+
+        :return: Результат функции.
+        :rtype: T
+        """
+
+        return await self.__run(self.io, fn, *args, **kwargs)
+
+    def shutdown(self) -> None:
+        """ Остановка всех созданных пулов."""
+
+        with self.__lock:
+            executors, self.__executors = self.__executors, {}
+        for name, executor in executors.items():
+            executor.shutdown(wait=True, cancel_futures=True)
+            logger.info(f"Пул {name} остановлен")
+
+    def __get_executor(
+            self,
+            name: str,
+            factory: Callable[[], Executor]
+    ) -> Executor:
+        with self.__lock:
+            if name not in self.__executors:
+                self.__executors[name] = factory()
+            return self.__executors[name]
+
+    @staticmethod
+    async def __run(
+            executor: Executor,
+            fn: Callable[..., T],
+            *args: Any,
+            **kwargs: Any
+    ) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, partial(fn, *args, **kwargs)
+        )
+
+
+execution_layer = ExecutionLayer(
+    inference_threads=INFERENCE_THREADS,
+    io_threads=IO_THREADS
+)
@@ -1,12 +1,74 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 
+from infrastructure.db import Session, TranslationCacheRepository, get_engine
 from infrastructure.ui.api.routers import router
-from infrastructure.config import FASTAPI_HOST, FASTAPI_PORT
+from infrastructure.executors import execution_layer
+from infrastructure.config import (
+    FASTAPI_HOST,
+    FASTAPI_PORT,
+    TRANSLATION_CACHE_PERSISTENT
+)
+from use_cases import WarmUp
+from use_cases.get_descript import (
+    close_cap_model_worker_pools,
+    descript_pipeline,
+    generation_controller,
+    start_cap_model_worker_pools,
+    translation_cache,
+    translation_loop
+)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """
+    Жизненный цикл приложения.
+
+    Пулы процессов инференса запускаются первыми, пока в процессе нет
+    потоков. Подключение к БД создается при старте, а не при импорте, и
+    к кешу переводов подключается таблица в БД. Нагрузка для выбора
+    профиля генерации считается по очереди пула инференса и этапов
+    чтения и генерации конвейера (включая ждущих места в очереди). Captioning-модели прогреваются в фоне, поэтому
+    /healthz отвечает сразу, а /readyz - после прогрева. По окончании
+    пулы исполнения, пулы процессов инференса, конвейер и цикл событий
+    переводчиков останавливаются.
+    """
+
+    start_cap_model_worker_pools()
+    await execution_layer.run_io(get_engine)
+    if translation_cache is not None and TRANSLATION_CACHE_PERSISTENT:
+        translation_cache.set_repository(TranslationCacheRepository(Session))
+    generation_controller.set_queue_depth(
+        lambda: execution_layer.pending_inference + (
+            descript_pipeline.pending('read')
+            + descript_pipeline.pending('describe')
+            if descript_pipeline is not None else 0
+        )
+    )
+    warm_up = asyncio.create_task(
+        execution_layer.run_inference(WarmUp().execute)
+    )
+    yield
+    if not warm_up.done():
+        warm_up.cancel()
+    if translation_cache is not None:
+        translation_cache.set_repository(None)
+    generation_controller.set_queue_depth(None)
+    execution_layer.shutdown()
+    close_cap_model_worker_pools()
+    if descript_pipeline is not None:
+        descript_pipeline.close()
+    translation_loop.close()
+
 
 app = FastAPI(
     title='VMDescImg API',
-    description="API для получения описания изображения."
+    description="API для получения описания изображения.",
+    lifespan=lifespan
 )
 
 app.include_router(router)
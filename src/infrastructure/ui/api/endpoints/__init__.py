@@ -1,4 +1,19 @@
 from infrastructure.ui.api.endpoints.get_descript import router as get_descript_router
+from infrastructure.ui.api.endpoints.get_descript_batch import router as get_descript_batch_router
+from infrastructure.ui.api.endpoints.get_descript_stream import router as get_descript_stream_router
+from infrastructure.ui.api.endpoints.get_health import router as get_health_router
+from infrastructure.ui.api.endpoints.get_metrics import router as get_metrics_router
+from infrastructure.ui.api.endpoints.get_readiness import router as get_readiness_router
+from infrastructure.ui.api.endpoints.invalidate_caption_cache import router as invalidate_caption_cache_router
 from infrastructure.ui.api.endpoints.upload_img import router as upload_img_router
 
-__all__ = ['get_descript_router', 'upload_img_router']
+__all__ = [
+    'get_descript_router',
+    'get_descript_batch_router',
+    'get_descript_stream_router',
+    'get_health_router',
+    'get_metrics_router',
+    'get_readiness_router',
+    'invalidate_caption_cache_router',
+    'upload_img_router'
+]
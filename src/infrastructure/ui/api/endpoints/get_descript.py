@@ -8,8 +8,11 @@ from infrastructure.ui.api.models import (
     GetDescriptRequest,
     GetDescriptResponse
 )
+from infrastructure.executors import execution_layer
 from infrastructure.db import (
     get_session,
+    repositories_scope,
+    CaptionCacheRepository,
     ImageRepository,
     DescriptionRepository
 )
@@ -48,19 +51,27 @@ async def get_descript(
     """
 
     # Получение описания изображения.
-    get_descript_result = DescriptHandler(
+    handler = DescriptHandler(
         GetDescriptViewer(),
-        GetDescript(ImageRepository(session), DescriptionRepository(session))
-    ).get(
+        GetDescript(
+            ImageRepository(session),
+            DescriptionRepository(session),
+            CaptionCacheRepository(session),
+            run_blocking=execution_layer.run_inference,
+            repos_scope=repositories_scope
+        )
+    )
+    get_descript_result = await handler.aget(
         data.uuid,
         data.name_cap_model,
         data.name_translator,
-        data.max_length
+        data.max_length,
+        data.profile
     )
 
     if get_descript_result.code != 200:
         logger.debug(get_descript_result.error)
-        session.rollback()
+        await execution_layer.run_io(session.rollback)
         raise HTTPException(
             status_code=get_descript_result.code,
             detail=get_descript_result.msg
@@ -68,4 +79,8 @@ async def get_descript(
 
     logger.debug(get_descript_result.msg)
 
-    return JSONResponse(content={'desc': get_descript_result.desc})
+    return JSONResponse(content={
+        'desc': get_descript_result.desc,
+        'profile': get_descript_result.profile,
+        'translated': get_descript_result.translated
+    })
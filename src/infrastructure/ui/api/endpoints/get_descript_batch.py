@@ -0,0 +1,81 @@
+from typing import TYPE_CHECKING
+from logging import getLogger
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
+
+from infrastructure.ui.api.models import (
+    GetDescriptBatchRequest,
+    GetDescriptBatchResponse
+)
+from infrastructure.executors import execution_layer
+from infrastructure.db import (
+    get_session,
+    ImageRepository,
+    DescriptionRepository
+)
+from interface_adapters.presenters import GetDescriptBatchViewer
+from interface_adapters.controllers import DescriptBatchHandler
+from use_cases import GetDescriptBatch
+
+if TYPE_CHECKING:
+    from infrastructure.db import Session
+
+
+logger = getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.post('/get_descript_batch', response_model=GetDescriptBatchResponse)
+async def get_descript_batch(
+        data: GetDescriptBatchRequest,
+        session: 'Session' = Depends(get_session)
+) -> JSONResponse:
+    """
+    Получение описаний батча изображений.
+
+    :param data: Данные для получения описаний изображений.
+    :type data: GetDescriptBatchRequest
+
+    :param session: Сессия подключения к БД.
+    :type session: Session
+
+    :return: Результат получения описаний изображений.
+    :rtype: JSONResponse
+
+    :raises HTTPException: Если ошибка при получении описаний
+                           изображений.
+    """
+
+    # Получение описаний изображений.
+    handler = DescriptBatchHandler(
+        GetDescriptBatchViewer(),
+        GetDescriptBatch(
+            ImageRepository(session),
+            DescriptionRepository(session)
+        )
+    )
+    get_descript_batch_result = await execution_layer.run_inference(
+        handler.get,
+        data.uuids,
+        data.name_cap_model,
+        data.name_translator,
+        data.max_lengths,
+        data.profile
+    )
+
+    if get_descript_batch_result.code != 200:
+        logger.debug(get_descript_batch_result.error)
+        await execution_layer.run_io(session.rollback)
+        raise HTTPException(
+            status_code=get_descript_batch_result.code,
+            detail=get_descript_batch_result.msg
+        )
+
+    logger.debug(get_descript_batch_result.msg)
+
+    return JSONResponse(content={
+        'descs': get_descript_batch_result.descs,
+        'profile': get_descript_batch_result.profile
+    })
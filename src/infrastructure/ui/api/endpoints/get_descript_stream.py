@@ -0,0 +1,142 @@
+import json
+from logging import getLogger
+from typing import AsyncIterator, Iterator
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from infrastructure.ui.api.models import GetDescriptRequest
+from infrastructure.executors import execution_layer
+from infrastructure.db import (
+    Session,
+    CaptionCacheRepository,
+    ImageRepository,
+    DescriptionRepository
+)
+from interface_adapters.presenters import GetDescriptStreamViewer
+from interface_adapters.controllers import DescriptHandler
+from use_cases import GetDescriptStream
+
+
+logger = getLogger(__name__)
+
+router = APIRouter()
+
+
+def _sse(event: str, data: dict) -> str:
+    """
+    Формирование события Server-Sent Events.
+
+    :param event: Название события.
+    :type event: str
+
+    :param data: Данные события.
+    :type data: dict
+
+    :return: Событие в формате text/event-stream.
+    :rtype: str
+    """
+
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _stream_events(
+        stream: Iterator[str],
+        session: Session,
+        profile: str
+) -> AsyncIterator[str]:
+    """
+    Отдача частичных описаний изображения событиями SSE.
+
+    Каждый шаг генерации выполняется в пуле потоков инференса, чтобы не
+    блокировать цикл событий.
+
+    :param stream: Итератор частичных описаний изображения.
+    :type stream: Iterator[str]
+
+    :param session: Сессия подключения к БД (закрывается по окончании).
+    :type session: Session
+
+    :param profile: Название профиля генерации.
+    :type profile: str
+
+    :return: События SSE: 'token' с частичным описанием, 'done' с полным
+             описанием и профилем генерации или 'error' с ошибкой.
+    :rtype: AsyncIterator[str]
+    """
+
+    desc = ''
+    try:
+        while (chunk := await execution_layer.run_inference(
+                next, stream, None)) is not None:
+            desc = chunk
+            yield _sse('token', {'desc': desc})
+        yield _sse('done', {'desc': desc, 'profile': profile})
+    except Exception as e:
+        logger.debug(f"Ошибка при потоковом получении описания: {e}")
+        await execution_layer.run_io(session.rollback)
+        yield _sse('error', {
+            'detail': "Ошибка, при потоковом получении описания изображения!"
+        })
+    finally:
+        await execution_layer.run_io(session.close)
+
+
+@router.post('/get_descript_stream')
+async def get_descript_stream(data: GetDescriptRequest) -> StreamingResponse:
+    """
+    Потоковое получение описания изображения (Server-Sent Events).
+
+    Частичные описания отправляются событиями 'token' по мере генерации
+    токенов, полное описание - событием 'done'.
+
+    :param data: Данные для получения описания изображения.
+    :type data: GetDescriptRequest
+
+    :return: Поток событий получения описания изображения.
+    :rtype: StreamingResponse
+
+    :raises HTTPException: Если ошибка при получении описания
+                           изображения до начала генерации.
+    """
+
+    # Сессия живет, пока идет поток событий.
+    session = Session()
+
+    handler = DescriptHandler(
+        GetDescriptStreamViewer(),
+        GetDescriptStream(
+            ImageRepository(session),
+            DescriptionRepository(session),
+            CaptionCacheRepository(session)
+        )
+    )
+    get_descript_result = await execution_layer.run_inference(
+        handler.get,
+        data.uuid,
+        data.name_cap_model,
+        data.name_translator,
+        data.max_length,
+        data.profile
+    )
+
+    if get_descript_result.code != 200:
+        logger.debug(get_descript_result.error)
+        await execution_layer.run_io(session.rollback)
+        await execution_layer.run_io(session.close)
+        raise HTTPException(
+            status_code=get_descript_result.code,
+            detail=get_descript_result.msg
+        )
+
+    logger.debug(get_descript_result.msg)
+
+    return StreamingResponse(
+        _stream_events(
+            get_descript_result.stream,
+            session,
+            get_descript_result.profile
+        ),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
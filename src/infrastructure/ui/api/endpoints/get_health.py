@@ -0,0 +1,22 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from infrastructure.ui.api.models import GetHealthResponse
+
+
+router = APIRouter()
+
+
+@router.get('/healthz', response_model=GetHealthResponse)
+async def get_health() -> JSONResponse:
+    """
+    Проверка жизни процесса сервиса.
+
+    Не зависит от состояния captioning-моделей, поэтому отвечает и во
+    время прогрева.
+
+    :return: Результат проверки жизни процесса.
+    :rtype: JSONResponse
+    """
+
+    return JSONResponse(content={'status': 'ok'})
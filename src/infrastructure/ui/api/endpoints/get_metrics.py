@@ -0,0 +1,40 @@
+from logging import getLogger
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
+
+from infrastructure.ui.api.models import GetMetricsResponse
+from interface_adapters.presenters import MetricsViewer
+from interface_adapters.controllers import MetricsHandler
+from use_cases import GetMetrics
+
+
+logger = getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get('/metrics', response_model=GetMetricsResponse)
+async def get_metrics() -> JSONResponse:
+    """
+    Получение метрик сервиса.
+
+    :return: Результат получения метрик сервиса.
+    :rtype: JSONResponse
+
+    :raises HTTPException: Если ошибка при получении метрик.
+    """
+
+    get_metrics_result = MetricsHandler(
+        MetricsViewer(),
+        GetMetrics()
+    ).get()
+
+    if get_metrics_result.code != 200:
+        logger.debug(get_metrics_result.error)
+        raise HTTPException(
+            status_code=get_metrics_result.code,
+            detail=get_metrics_result.msg
+        )
+
+    return JSONResponse(content={'metrics': get_metrics_result.metrics})
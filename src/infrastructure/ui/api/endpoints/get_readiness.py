@@ -0,0 +1,53 @@
+from logging import getLogger
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
+
+from infrastructure.ui.api.models import GetReadinessResponse
+from interface_adapters.presenters import ReadinessViewer
+from interface_adapters.controllers import HealthHandler
+from use_cases import GetReadiness
+
+
+logger = getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get(
+    '/readyz',
+    response_model=GetReadinessResponse,
+    responses={503: {'model': GetReadinessResponse}}
+)
+async def get_readiness() -> JSONResponse:
+    """
+    Проверка готовности сервиса.
+
+    Пока идет прогрев captioning-моделей (или если ни одна модель не
+    прогрета), отвечает кодом 503.
+
+    :return: Результат проверки готовности сервиса.
+    :rtype: JSONResponse
+
+    :raises HTTPException: Если ошибка при получении готовности.
+    """
+
+    get_readiness_result = HealthHandler(
+        ReadinessViewer(),
+        GetReadiness()
+    ).get()
+
+    if get_readiness_result.code not in (200, 503):
+        logger.debug(get_readiness_result.error)
+        raise HTTPException(
+            status_code=get_readiness_result.code,
+            detail=get_readiness_result.msg
+        )
+
+    return JSONResponse(
+        status_code=get_readiness_result.code,
+        content={
+            'ready': get_readiness_result.ready,
+            'warm_up': get_readiness_result.warm_up
+        }
+    )
@@ -0,0 +1,68 @@
+from typing import TYPE_CHECKING
+from logging import getLogger
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
+
+from infrastructure.ui.api.models import (
+    InvalidateCaptionCacheRequest,
+    InvalidateCaptionCacheResponse
+)
+from infrastructure.executors import execution_layer
+from infrastructure.db import get_session, CaptionCacheRepository
+from interface_adapters.presenters import InvalidateCaptionCacheViewer
+from interface_adapters.controllers import CaptionCacheHandler
+from use_cases import InvalidateCaptionCache
+
+if TYPE_CHECKING:
+    from infrastructure.db import Session
+
+
+logger = getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.post(
+    '/invalidate_caption_cache',
+    response_model=InvalidateCaptionCacheResponse
+)
+async def invalidate_caption_cache(
+        data: InvalidateCaptionCacheRequest,
+        session: 'Session' = Depends(get_session)
+) -> JSONResponse:
+    """
+    Инвалидация кеша описаний изображений.
+
+    :param data: Данные для инвалидации кеша описаний.
+    :type data: InvalidateCaptionCacheRequest
+
+    :param session: Сессия подключения к БД.
+    :type session: Session
+
+    :return: Результат инвалидации кеша описаний.
+    :rtype: JSONResponse
+
+    :raises HTTPException: Если ошибка при инвалидации кеша описаний.
+    """
+
+    handler = CaptionCacheHandler(
+        InvalidateCaptionCacheViewer(),
+        InvalidateCaptionCache(CaptionCacheRepository(session))
+    )
+    invalidate_result = await execution_layer.run_io(
+        handler.invalidate,
+        data.name_cap_model
+    )
+
+    if invalidate_result.code != 200:
+        logger.debug(invalidate_result.error)
+        await execution_layer.run_io(session.rollback)
+        raise HTTPException(
+            status_code=invalidate_result.code,
+            detail=invalidate_result.msg
+        )
+
+    logger.debug(invalidate_result.msg)
+
+    return JSONResponse(content={'removed': invalidate_result.removed})
@@ -6,6 +6,7 @@ from fastapi.responses import JSONResponse
 
 from infrastructure.ui.api.models import UploadImgResponse
 from infrastructure.db import get_session, ImageRepository
+from infrastructure.executors import execution_layer
 from interface_adapters.presenters import UploadImgViewer
 from interface_adapters.controllers import ImgHandler
 from use_cases import UploadImg
@@ -62,15 +63,16 @@ async def upload_img(
         )
 
     # Загрузка изображения.
-    upload_img_result = ImgHandler(
+    handler = ImgHandler(
         UploadImgViewer(),
         UploadImg(ImageRepository(session))
-    ).upload(img)
+    )
+    upload_img_result = await execution_layer.run_io(handler.upload, img)
 
     # Обработка ошибки.
     if upload_img_result.code != 200:
         logger.debug(upload_img_result.error)
-        session.rollback()
+        await execution_layer.run_io(session.rollback)
         raise HTTPException(
             status_code=upload_img_result.code,
             detail=upload_img_result.msg
@@ -1,7 +1,29 @@
+from infrastructure.ui.api.models.caption_cache import (
+    InvalidateCaptionCacheRequest,
+    InvalidateCaptionCacheResponse
+)
 from infrastructure.ui.api.models.descript import (
     GetDescriptRequest,
-    GetDescriptResponse
+    GetDescriptResponse,
+    GetDescriptBatchRequest,
+    GetDescriptBatchResponse
+)
+from infrastructure.ui.api.models.health import (
+    GetHealthResponse,
+    GetReadinessResponse
 )
 from infrastructure.ui.api.models.img import UploadImgResponse
+from infrastructure.ui.api.models.metrics import GetMetricsResponse
 
-__all__ = ['GetDescriptRequest', 'GetDescriptResponse', 'UploadImgResponse']
+__all__ = [
+    'InvalidateCaptionCacheRequest',
+    'InvalidateCaptionCacheResponse',
+    'GetDescriptRequest',
+    'GetDescriptResponse',
+    'GetDescriptBatchRequest',
+    'GetDescriptBatchResponse',
+    'GetHealthResponse',
+    'GetReadinessResponse',
+    'UploadImgResponse',
+    'GetMetricsResponse'
+]
@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+
+from infrastructure.config import CAP_MODEL_SETTINGS
+
+
+class InvalidateCaptionCacheRequest(BaseModel):
+    name_cap_model: str | None = Field(
+        default=None,
+        title="Captioning-модель",
+        description="Название captioning-модели, описания которой "
+                    "удаляются из кеша (если не задано, то удаляются "
+                    "описания всех моделей).",
+        examples=list(CAP_MODEL_SETTINGS.keys())
+    )
+
+
+class InvalidateCaptionCacheResponse(BaseModel):
+    removed: int = Field(
+        default=0,
+        title="Удалено описаний",
+        description="Количество описаний, удаленных из кеша.",
+        examples=[42]
+    )
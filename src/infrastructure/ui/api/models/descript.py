@@ -3,6 +3,7 @@ from pydantic import BaseModel, Field
 from infrastructure.config import (
     BLIP_MODEL_NAME,
     CAP_MODEL_SETTINGS,
+    GENERATION_PROFILES,
     TRANS_MODEL_SETTINGS,
     MIN_LENGTH_DESCRIPTION,
     MAX_LENGTH_DESCRIPTION
@@ -37,6 +38,13 @@ class GetDescriptRequest(BaseModel):
                     "использовании переводчика может измениться).",
         examples=[MIN_LENGTH_DESCRIPTION, MAX_LENGTH_DESCRIPTION]
     )
+    profile: str | None = Field(
+        default=None,
+        title="Профиль генерации",
+        description="Закрепленный профиль генерации описания (если не "
+                    "задан, то выбирается по нагрузке сервиса).",
+        examples=list(GENERATION_PROFILES.keys())
+    )
 
 
 class GetDescriptResponse(BaseModel):
@@ -46,3 +54,71 @@ class GetDescriptResponse(BaseModel):
         description="Описание изображения или ошибка его получения.",
         examples=["Блаблабла", "Ошибка, при получении описания изображения!"]
     )
+    profile: str = Field(
+        default="",
+        title="Профиль генерации",
+        description="Профиль генерации, с которым получено описание.",
+        examples=list(GENERATION_PROFILES.keys())
+    )
+    translated: bool = Field(
+        default=True,
+        title="Описание переведено",
+        description="False, если все переводчики недоступны и описание "
+                    "возвращено без перевода.",
+        examples=[True, False]
+    )
+
+
+class GetDescriptBatchRequest(BaseModel):
+    uuids: list[str] = Field(
+        default_factory=list,
+        title="UUID",
+        description="UUID загруженных изображений.",
+        examples=[[
+            "65c45216-145b-4b9a-b78c-3fe620e9138d",
+            "0b8f2a3e-4c1d-4d2b-9a57-6a3c2f1e9d10"
+        ]]
+    )
+    name_cap_model: str = Field(
+        default=BLIP_MODEL_NAME,
+        title="Captioning-модель",
+        description="Название captioning-модели, которая будет "
+                    "использоваться для описания изображений.",
+        examples=list(CAP_MODEL_SETTINGS.keys())
+    )
+    name_translator: str | None = Field(
+        default=None,
+        title="Переводчик",
+        description="Переводчик, который будет использоваться для перевода "
+                    "описаний изображений.",
+        examples=list(TRANS_MODEL_SETTINGS.keys())
+    )
+    max_lengths: int | list[int | None] | None = Field(
+        default=None,
+        title="Максимальные длины",
+        description="Максимальная длина описания для всех изображений или "
+                    "список длин для каждого изображения.",
+        examples=[MAX_LENGTH_DESCRIPTION, [MIN_LENGTH_DESCRIPTION, None]]
+    )
+    profile: str | None = Field(
+        default=None,
+        title="Профиль генерации",
+        description="Закрепленный профиль генерации описаний (если не "
+                    "задан, то выбирается по нагрузке сервиса).",
+        examples=list(GENERATION_PROFILES.keys())
+    )
+
+
+class GetDescriptBatchResponse(BaseModel):
+    descs: list[str] = Field(
+        default_factory=list,
+        title="Результат получения описаний изображений",
+        description="Описания изображений в порядке UUID.",
+        examples=[["Блаблабла", "Блаблабла"]]
+    )
+    profile: str = Field(
+        default="",
+        title="Профиль генерации",
+        description="Профиль генерации, с которым получены описания.",
+        examples=list(GENERATION_PROFILES.keys())
+    )
@@ -0,0 +1,37 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class GetHealthResponse(BaseModel):
+    status: str = Field(
+        default='ok',
+        title="Статус процесса",
+        description="Процесс сервиса жив и отвечает на запросы.",
+        examples=["ok"]
+    )
+
+
+class GetReadinessResponse(BaseModel):
+    ready: bool = Field(
+        default=False,
+        title="Готовность сервиса",
+        description="Прогреты ли captioning-модели.",
+        examples=[True]
+    )
+    warm_up: dict[str, Any] = Field(
+        default_factory=dict,
+        title="Прогрев captioning-моделей",
+        description="Статус, длительность, время прогонов (в секундах) "
+                    "по моделям и размерам батча и ошибки прогрева.",
+        examples=[{
+            "status": "ready",
+            "started_at": 1760774400.0,
+            "finished_at": 1760774431.5,
+            "duration": 31.5,
+            "timings": {
+                "blip": {"1": [2.41, 0.38], "8": [1.92, 1.87]}
+            },
+            "errors": {}
+        }]
+    )
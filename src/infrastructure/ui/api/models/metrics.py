@@ -0,0 +1,24 @@
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class GetMetricsResponse(BaseModel):
+    metrics: dict[str, Any] = Field(
+        default_factory=dict,
+        title="Метрики сервиса",
+        description="Счетчики сервиса по названиям источников метрик.",
+        examples=[{
+            "cap_model_registry": {
+                "hits": 10,
+                "misses": 1,
+                "loads": 1,
+                "evictions": 0,
+                "load_time_total": 3.2,
+                "load_time_last": 3.2,
+                "memory_used": 989777920,
+                "memory_budget": 8589934592,
+                "models": ["BlipForConditionalGeneration:./blip"]
+            }
+        }]
+    )
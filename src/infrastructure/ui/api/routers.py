@@ -2,10 +2,22 @@ from fastapi import APIRouter
 
 from infrastructure.ui.api.endpoints import (
     get_descript_router,
+    get_descript_batch_router,
+    get_descript_stream_router,
+    get_health_router,
+    get_metrics_router,
+    get_readiness_router,
+    invalidate_caption_cache_router,
     upload_img_router
 )
 
 
 router = APIRouter()
 router.include_router(get_descript_router)
+router.include_router(get_descript_batch_router)
+router.include_router(get_descript_stream_router)
+router.include_router(get_health_router)
+router.include_router(get_metrics_router)
+router.include_router(get_readiness_router)
+router.include_router(invalidate_caption_cache_router)
 router.include_router(upload_img_router)
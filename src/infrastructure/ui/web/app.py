@@ -1,13 +1,32 @@
 from logging import getLogger
-from typing import Any
+from typing import Any, Iterator
 from io import BytesIO
 
 import gradio as gr
 
-from infrastructure.db import Session, ImageRepository, DescriptionRepository
-from interface_adapters.presenters import UploadImgViewer, GetDescriptViewer
-from interface_adapters.controllers import ImgHandler, DescriptHandler
-from use_cases import UploadImg, GetDescript
+from infrastructure.db import (
+    Session,
+    get_engine,
+    CaptionCacheRepository,
+    ImageRepository,
+    DescriptionRepository,
+    TranslationCacheRepository
+)
+from interface_adapters.presenters import (
+    UploadImgViewer,
+    GetDescriptBatchViewer,
+    GetDescriptStreamViewer
+)
+from interface_adapters.controllers import (
+    ImgHandler,
+    DescriptHandler,
+    DescriptBatchHandler
+)
+from use_cases import UploadImg, GetDescriptBatch, GetDescriptStream, WarmUp
+from use_cases.get_descript import (
+    start_cap_model_worker_pools,
+    translation_cache
+)
 
 from infrastructure.config import (
     GRADIO_CAP_MODEL_NAME_MAP,
@@ -17,7 +36,8 @@ from infrastructure.config import (
     DEFAULT_LENGTH_DESCRIPTION,
     STEP_LENGTH_DESCRIPTION,
     GRADIO_HOST,
-    GRADIO_PORT
+    GRADIO_PORT,
+    TRANSLATION_CACHE_PERSISTENT
 )
 
 
@@ -29,9 +49,11 @@ def get_descript(
         name_cap_model: str,
         name_translator: str,
         max_length: int | None
-) -> str:
+) -> Iterator[str]:
     """
-    Получение описания изображения.
+    Потоковое получение описания изображения.
+
+    Частичное описание выводится по мере генерации токенов.
 
     :param image: Изображение, описание которого нужно получить.
     :type image: Any
@@ -45,8 +67,9 @@ def get_descript(
     :param max_length: Максимальная длина описания изображения.
     :type max_length: int | None
 
-    :return: Описание изображения или ошибка при его получении.
-    :rtype: str
+    :return: Итератор частичных описаний изображения или ошибка при его
+             получении.
+    :rtype: Iterator[str]
     """
 
     logger.debug("Начало получения описания изображения")
@@ -58,7 +81,8 @@ def get_descript(
             img = buff.getvalue()
         except Exception as e:
             logger.debug(f"Ошибка при конвертации изображения в байты: {e}!")
-            return "Ошибка при конвертации изображения!"
+            yield "Ошибка при конвертации изображения!"
+            return
     logger.debug("Конвертация изображения в байты прошла успешно")
 
     with Session() as session:
@@ -73,16 +97,18 @@ def get_descript(
         if upload_img_result.code != 200:
             logger.debug(upload_img_result.error)
             session.rollback()
-            return upload_img_result.msg
+            yield upload_img_result.msg
+            return
         logger.debug("Загрузка изображения прошла успешно: "
                      f"{upload_img_result.uuid}")
 
         # Получение описания изображения.
         get_descript_result = DescriptHandler(
-            GetDescriptViewer(),
-            GetDescript(
+            GetDescriptStreamViewer(),
+            GetDescriptStream(
                 ImageRepository(session),
-                DescriptionRepository(session)
+                DescriptionRepository(session),
+                CaptionCacheRepository(session)
             )
         ).get(
             upload_img_result.uuid,
@@ -91,50 +117,187 @@ def get_descript(
             max_length
         )
 
-        # Обработка результата описания изображения.
+        # Обработка ошибки описания изображения.
         if get_descript_result.code != 200:
             logger.debug(get_descript_result.error)
             session.rollback()
-            return get_descript_result.msg
-        logger.debug("Получение описания изображения прошло успешно: "
-                     f"{get_descript_result.desc}")
+            yield get_descript_result.msg
+            return
+
+        # Вывод частичных описаний изображения.
+        desc = ''
+        try:
+            for desc in get_descript_result.stream:
+                yield desc
+        except Exception as e:
+            logger.debug(f"Ошибка при потоковом получении описания: {e}")
+            session.rollback()
+            yield "Ошибка, при получении описания изображения!"
+            return
+        logger.debug(f"Получение описания изображения прошло успешно "
+                     f"(профиль {get_descript_result.profile}): {desc}")
+
+
+def get_descript_batch(
+        images: list[bytes] | None,
+        name_cap_model: str,
+        name_translator: str,
+        max_length: int | None
+) -> str:
+    """
+    Получение описаний батча изображений.
+
+    :param images: Изображения в байтах, описания которых нужно
+                   получить.
+    :type images: list[bytes] | None
+
+    :param name_cap_model: Название captioning-модели.
+    :type name_cap_model: str
+
+    :param name_translator: Название переводчика.
+    :type name_translator: str
+
+    :param max_length: Максимальная длина описания изображений.
+    :type max_length: int | None
+
+    :return: Описания изображений (по одному на строку) или ошибка при
+             их получении.
+    :rtype: str
+    """
+
+    logger.debug("Начало получения описаний батча изображений")
+
+    if not images:
+        return "Изображения не загружены!"
+
+    with Session() as session:
+
+        # Загрузка изображений.
+        uuids = []
+        for img in images:
+            upload_img_result = ImgHandler(
+                UploadImgViewer(),
+                UploadImg(ImageRepository(session))
+            ).upload(img)
+
+            # Обработка ошибки загрузки изображения.
+            if upload_img_result.code != 200:
+                logger.debug(upload_img_result.error)
+                session.rollback()
+                return upload_img_result.msg
+            uuids.append(upload_img_result.uuid)
+        logger.debug(f"Загрузка изображений прошла успешно: {uuids}")
+
+        # Получение описаний изображений.
+        get_descript_batch_result = DescriptBatchHandler(
+            GetDescriptBatchViewer(),
+            GetDescriptBatch(
+                ImageRepository(session),
+                DescriptionRepository(session)
+            )
+        ).get(
+            uuids,
+            GRADIO_CAP_MODEL_NAME_MAP[name_cap_model],
+            GRADIO_TRANS_NAME_MAP[name_translator],
+            max_length
+        )
+
+        # Обработка результата описания изображений.
+        if get_descript_batch_result.code != 200:
+            logger.debug(get_descript_batch_result.error)
+            session.rollback()
+            return get_descript_batch_result.msg
+        logger.debug("Получение описаний изображений прошло успешно: "
+                     f"{get_descript_batch_result.descs}")
+
+    return "\n".join(get_descript_batch_result.descs)
 
-    return get_descript_result.desc
 
 def main() -> None:
-    """ Запуск интерфейса."""
+    """
+    Запуск интерфейса.
+
+    Интерфейс запускается после подключения к БД и прогрева
+    captioning-моделей, чтобы первые пользователи не ждали загрузки
+    весов. Пулы процессов инференса запускаются до создания потоков.
+    """
+
+    start_cap_model_worker_pools()
+    get_engine()
+    if translation_cache is not None and TRANSLATION_CACHE_PERSISTENT:
+        translation_cache.set_repository(TranslationCacheRepository(Session))
+    warm_up = WarmUp().execute()
+    logger.info(f"Прогрев captioning-моделей: {warm_up.status} за "
+                f"{warm_up.duration:.1f} с")
 
     with gr.Blocks() as ui:
         gr.Markdown("# Сервис описания изображений")
 
-        image = gr.Image(type="pil")
-        name_cap_model = gr.Dropdown(
-            choices=list(GRADIO_CAP_MODEL_NAME_MAP.keys()),
-            label="Captioning-модель"
-        )
-        name_translator = gr.Dropdown(
-            choices=(list(GRADIO_TRANS_NAME_MAP.keys())),
-            label="Переводчик"
-        )
-        max_length = gr.Slider(
-            minimum=MIN_LENGTH_DESCRIPTION,
-            maximum=MAX_LENGTH_DESCRIPTION,
-            value=DEFAULT_LENGTH_DESCRIPTION,
-            step=STEP_LENGTH_DESCRIPTION,
-            label="Максимальная длина описания изображения"
-        )
-        result = gr.Textbox(label="Описание изображения")
-
-        button = gr.Button("Получить описание изображения")
-        button.click(
-            fn=get_descript,
-            inputs=[
-                image,
-                name_cap_model,
-                name_translator,
-                max_length
-            ],
-            outputs=result
-        )
+        with gr.Tab("Изображение"):
+            image = gr.Image(type="pil")
+            name_cap_model = gr.Dropdown(
+                choices=list(GRADIO_CAP_MODEL_NAME_MAP.keys()),
+                label="Captioning-модель"
+            )
+            name_translator = gr.Dropdown(
+                choices=(list(GRADIO_TRANS_NAME_MAP.keys())),
+                label="Переводчик"
+            )
+            max_length = gr.Slider(
+                minimum=MIN_LENGTH_DESCRIPTION,
+                maximum=MAX_LENGTH_DESCRIPTION,
+                value=DEFAULT_LENGTH_DESCRIPTION,
+                step=STEP_LENGTH_DESCRIPTION,
+                label="Максимальная длина описания изображения"
+            )
+            result = gr.Textbox(label="Описание изображения")
+
+            button = gr.Button("Получить описание изображения")
+            button.click(
+                fn=get_descript,
+                inputs=[
+                    image,
+                    name_cap_model,
+                    name_translator,
+                    max_length
+                ],
+                outputs=result
+            )
+
+        with gr.Tab("Пакет изображений"):
+            images = gr.File(
+                file_count="multiple",
+                file_types=["image"],
+                type="binary",
+                label="Изображения"
+            )
+            batch_name_cap_model = gr.Dropdown(
+                choices=list(GRADIO_CAP_MODEL_NAME_MAP.keys()),
+                label="Captioning-модель"
+            )
+            batch_name_translator = gr.Dropdown(
+                choices=(list(GRADIO_TRANS_NAME_MAP.keys())),
+                label="Переводчик"
+            )
+            batch_max_length = gr.Slider(
+                minimum=MIN_LENGTH_DESCRIPTION,
+                maximum=MAX_LENGTH_DESCRIPTION,
+                value=DEFAULT_LENGTH_DESCRIPTION,
+                step=STEP_LENGTH_DESCRIPTION,
+                label="Максимальная длина описания изображений"
+            )
+            batch_result = gr.Textbox(label="Описания изображений")
+
+            batch_button = gr.Button("Получить описания изображений")
+            batch_button.click(
+                fn=get_descript_batch,
+                inputs=[
+                    images,
+                    batch_name_cap_model,
+                    batch_name_translator,
+                    batch_max_length
+                ],
+                outputs=batch_result
+            )
 
     ui.launch(server_name=GRADIO_HOST, server_port=GRADIO_PORT)
@@ -1,4 +1,19 @@
+from interface_adapters.controllers.caption_cache_handler import (
+    CaptionCacheHandler
+)
 from interface_adapters.controllers.descript_handler import DescriptHandler
+from interface_adapters.controllers.descript_batch_handler import (
+    DescriptBatchHandler
+)
+from interface_adapters.controllers.health_handler import HealthHandler
 from interface_adapters.controllers.img_handler import ImgHandler
+from interface_adapters.controllers.metrics_handler import MetricsHandler
 
-__all__ = ['DescriptHandler', 'ImgHandler']
+__all__ = [
+    'CaptionCacheHandler',
+    'DescriptHandler',
+    'DescriptBatchHandler',
+    'HealthHandler',
+    'ImgHandler',
+    'MetricsHandler'
+]
@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING, Union
+
+from infrastructure.config import CAP_MODEL_SETTINGS
+
+if TYPE_CHECKING:
+    from interface_adapters.presenters import AbstractViewer
+    from interface_adapters.presenters.dto import (
+        InvalidateCaptionCacheResponse,
+        ErrorResponse
+    )
+    from use_cases import AbstractUseCase
+
+
+class CaptionCacheHandler:
+    """
+    Обработчик кеша описаний изображений.
+
+    :ivar __pres: Атрибут представления инвалидации кеша описаний.
+    :type __pres: AbstractViewer
+
+    :ivar __invalidate: Атрибут инвалидации кеша описаний.
+    :type __invalidate: InvalidateCaptionCache
+    """
+
+    def __init__(
+            self,
+            pres: 'AbstractViewer',
+            invalidate: 'AbstractUseCase'
+    ) -> None:
+        """
+        Инициализация обработчика кеша описаний.
+
+        :param pres: Представление инвалидации кеша описаний.
+        :type pres: AbstractViewer
+
+        :param invalidate: Инвалидация кеша описаний.
+        :type invalidate: AbstractUseCase
+        """
+
+        self.__pres = pres
+        self.__invalidate = invalidate
+
+    def invalidate(
+            self,
+            name_cap_model: str | None
+    ) -> Union['InvalidateCaptionCacheResponse', 'ErrorResponse']:
+        """
+        Инвалидация кеша описаний.
+
+        :param name_cap_model: Название captioning-модели (None - все
+                               модели).
+        :type name_cap_model: str | None
+
+        :return: Количество удаленных описаний или ошибка.
+        :rtype: InvalidateCaptionCacheResponse | ErrorResponse
+        """
+
+        if (name_cap_model is not None
+                and name_cap_model not in CAP_MODEL_SETTINGS.keys()):
+            return self.__pres.present_error(
+                error=(f"Captioning-модели с именем {name_cap_model} не "
+                       "существует!"),
+                code=400
+            )
+
+        try:
+            result = self.__invalidate.execute(name_cap_model)
+        except Exception as e:
+            return self.__pres.present_error(error=str(e), code=500)
+
+        return self.__pres.present(result)
@@ -0,0 +1,121 @@
+from typing import TYPE_CHECKING, Union
+from uuid import UUID
+
+from interface_adapters.controllers.descript_handler import _validate_params
+
+if TYPE_CHECKING:
+    from interface_adapters.presenters import AbstractViewer
+    from interface_adapters.presenters.dto import (
+        GetDescriptBatchResponse,
+        ErrorResponse
+    )
+    from use_cases import AbstractUseCase
+
+
+class DescriptBatchHandler:
+    """
+    Обработчик описания батча изображений.
+
+    :ivar __pres: Атрибут представления описаний изображений.
+    :type __pres: AbstractViewer
+
+    :ivar __get_descript_batch: Атрибут получения описаний батча
+                                изображений.
+    :type __get_descript_batch: AbstractUseCase
+    """
+
+    def __init__(
+            self,
+            pres: 'AbstractViewer',
+            get_descript_batch: 'AbstractUseCase'
+    ) -> None:
+        """
+        Инициализация обработчика описания батча изображений.
+
+        :param pres: Представление описаний изображений.
+        :type pres: AbstractViewer
+
+        :param get_descript_batch: Получение описаний батча изображений.
+        :type get_descript_batch: AbstractUseCase
+        """
+
+        self.__pres = pres
+        self.__get_descript_batch = get_descript_batch
+
+    def get(
+            self,
+            uuids: list[str],
+            name_cap_model: str,
+            name_translator: str | None,
+            max_lengths: int | list[int | None] | None,
+            name_profile: str | None = None
+    ) -> Union['GetDescriptBatchResponse', 'ErrorResponse']:
+        """
+        Получение описаний батча изображений.
+
+        :param uuids: UUID загруженных изображений.
+        :type uuids: list[str]
+
+        :param name_cap_model: Название captioning-модели.
+        :type name_cap_model: str
+
+        :param name_translator: Название переводчика описания
+                                изображения.
+        :type name_translator: str | None
+
+        :param max_lengths: Максимальная длина описания для всех
+                            изображений или для каждого изображения.
+        :type max_lengths: int | list[int | None] | None
+
+        :param name_profile: Название профиля генерации (None - по
+                             нагрузке).
+        :type name_profile: str | None
+
+        :return: Описания изображений или ошибка.
+        :rtype: GetDescriptBatchResponse | ErrorResponse
+        """
+
+        if not uuids:
+            return self.__pres.present_error(
+                error="Список UUID пуст!",
+                code=400
+            )
+
+        try:
+            uuids = [UUID(uuid) for uuid in uuids]
+        except ValueError:
+            return self.__pres.present_error(
+                error=f"Среди UUID {uuids} есть некорректные!",
+                code=400
+            )
+
+        if isinstance(max_lengths, list):
+            if len(max_lengths) != len(uuids):
+                return self.__pres.present_error(
+                    error="Количество максимальных длин описаний не "
+                          "совпадает с количеством UUID!",
+                    code=400
+                )
+            lengths = max_lengths
+        else:
+            lengths = [max_lengths]
+
+        for max_length in lengths:
+            error = _validate_params(
+                name_cap_model, name_translator, max_length, name_profile
+            )
+            if error is not None:
+                return self.__pres.present_error(error=error, code=400)
+
+        try:
+            result, profile = self.__get_descript_batch.execute(
+                uuids,
+                name_cap_model,
+                name_translator,
+                max_lengths,
+                name_profile
+            )
+        except Exception as e:
+            return self.__pres.present_error(error=str(e), code=500)
+
+        return self.__pres.present(result, profile)
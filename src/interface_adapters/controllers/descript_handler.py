@@ -3,6 +3,7 @@ from uuid import UUID
 
 from infrastructure.config import (
     CAP_MODEL_SETTINGS,
+    GENERATION_PROFILES,
     TRANS_MODEL_SETTINGS,
     MIN_LENGTH_DESCRIPTION,
     MAX_LENGTH_DESCRIPTION
@@ -12,11 +13,58 @@ if TYPE_CHECKING:
     from interface_adapters.presenters import AbstractViewer
     from interface_adapters.presenters.dto import (
         GetDescriptResponse,
+        GetDescriptStreamResponse,
         ErrorResponse
     )
     from use_cases import AbstractUseCase
 
 
+def _validate_params(
+        name_cap_model: str,
+        name_translator: str | None,
+        max_length: int | None,
+        name_profile: str | None = None
+) -> str | None:
+    """
+    Проверка параметров получения описания изображения.
+
+    :param name_cap_model: Название captioning-модели.
+    :type name_cap_model: str
+
+    :param name_translator: Название переводчика описания изображения.
+    :type name_translator: str | None
+
+    :param max_length: Максимальная длина описания изображения.
+    :type max_length: int | None
+
+    :param name_profile: Название профиля генерации.
+    :type name_profile: str | None
+
+    :return: Текст ошибки или None, если параметры корректны.
+    :rtype: str | None
+    """
+
+    if name_cap_model not in CAP_MODEL_SETTINGS.keys():
+        return (f"Captioning-модели с именем {name_cap_model} не "
+                "существует!")
+
+    if (name_translator is not None) and (name_translator not in
+                                          TRANS_MODEL_SETTINGS.keys()):
+        return f"Переводчик с именем {name_translator} не существует!"
+
+    if (max_length is not None) and (max_length < MIN_LENGTH_DESCRIPTION or
+                                     max_length > MAX_LENGTH_DESCRIPTION):
+        return ("Максимальная длина описания должна быть больше "
+                f"{MIN_LENGTH_DESCRIPTION} и меньше "
+                f"{MAX_LENGTH_DESCRIPTION} символов!")
+
+    if (name_profile is not None) and (name_profile not in
+                                       GENERATION_PROFILES.keys()):
+        return f"Профиля генерации с именем {name_profile} не существует!"
+
+    return None
+
+
 class DescriptHandler:
     """
     Обработчик описания изображения.
@@ -51,11 +99,19 @@ class DescriptHandler:
             uuid: str,
             name_cap_model: str,
             name_translator: str | None,
-            max_length: int | None
-    ) -> Union['GetDescriptResponse', 'ErrorResponse']:
+            max_length: int | None,
+            name_profile: str | None = None
+    ) -> Union[
+        'GetDescriptResponse',
+        'GetDescriptStreamResponse',
+        'ErrorResponse'
+    ]:
         """
         Получение описания изображения.
 
+        Получение может быть потоковым, если потоковые и представление,
+        и получение описания.
+
         :param uuid: UUID загруженного изображения.
         :type uuid: str
 
@@ -69,50 +125,115 @@ class DescriptHandler:
         :param max_length: Максимальная длина описания изображения.
         :type max_length: int | None
 
-        :return: Описание изображения или ошибка.
-        :rtype: GetDescriptResponse | ErrorResponse
+        :param name_profile: Название профиля генерации (None - по
+                             нагрузке).
+        :type name_profile: str | None
+
+        :return: Описание изображения (или поток частичных описаний)
+                 или ошибка.
+        :rtype: GetDescriptResponse | GetDescriptStreamResponse |
+                ErrorResponse
         """
 
+        checked = self.__check(
+            uuid, name_cap_model, name_translator, max_length, name_profile
+        )
+        if not isinstance(checked, UUID):
+            return checked
+
         try:
-            uuid = UUID(uuid)
-        except ValueError:
-            return self.__pres.present_error(
-                error=f"UUID {uuid} некорректный!",
-                code=400
+            result = self.__get_descript.execute(
+                checked,
+                name_cap_model,
+                name_translator,
+                max_length,
+                name_profile
             )
+        except Exception as e:
+            return self.__pres.present_error(error=str(e), code=500)
 
-        if name_cap_model not in CAP_MODEL_SETTINGS.keys():
-            return self.__pres.present_error(
-                error=f"Captioning-модели с именем {name_cap_model} не "
-                      "существует!",
-                code=400
-            )
+        return self.__pres.present(*result)
 
-        if (name_translator is not None) and (name_translator not in
-                                              TRANS_MODEL_SETTINGS.keys()):
-            return self.__pres.present_error(
-                error=f"Переводчик с именем {name_translator} не "
-                      "существует!",
-                code=400
-            )
+    async def aget(
+            self,
+            uuid: str,
+            name_cap_model: str,
+            name_translator: str | None,
+            max_length: int | None,
+            name_profile: str | None = None
+    ) -> Union['GetDescriptResponse', 'ErrorResponse']:
+        """
+        Асинхронное получение описания изображения.
 
-        if (max_length is not None) and (max_length < MIN_LENGTH_DESCRIPTION or
-                                         max_length > MAX_LENGTH_DESCRIPTION):
-            return self.__pres.present_error(
-                error="Максимальная длина описания должна быть больше "
-                      f"{MIN_LENGTH_DESCRIPTION} и меньше "
-                      f"{MAX_LENGTH_DESCRIPTION} символов!",
-                code=400
-            )
+        Получение описания должно поддерживать aexecute.
+
+        :param uuid: UUID загруженного изображения.
+        :type uuid: str
+
+        :param name_cap_model: Название captioning-модели.
+        :type name_cap_model: str
+
+        :param name_translator: Название переводчика описания
+                                изображения.
+        :type name_translator: str | None
+
+        :param max_length: Максимальная длина описания изображения.
+        :type max_length: int | None
+
+        :param name_profile: Название профиля генерации (None - по
+                             нагрузке).
+        :type name_profile: str | None
+
+        :return: Описание изображения или ошибка.
+        :rtype: GetDescriptResponse | ErrorResponse
+        """
+
+        checked = self.__check(
+            uuid, name_cap_model, name_translator, max_length, name_profile
+        )
+        if not isinstance(checked, UUID):
+            return checked
 
         try:
-            result = self.__get_descript.execute(
-                uuid,
+            result = await self.__get_descript.aexecute(
+                checked,
                 name_cap_model,
                 name_translator,
-                max_length
+                max_length,
+                name_profile
             )
         except Exception as e:
             return self.__pres.present_error(error=str(e), code=500)
 
-        return self.__pres.present(result)
+        return self.__pres.present(*result)
+
+    def __check(
+            self,
+            uuid: str,
+            name_cap_model: str,
+            name_translator: str | None,
+            max_length: int | None,
+            name_profile: str | None
+    ) -> Union[UUID, 'ErrorResponse']:
+        """
+        Проверка UUID и параметров получения описания изображения.
+
+        :return: UUID изображения или ошибка.
+        :rtype: UUID | ErrorResponse
+        """
+
+        try:
+            uuid = UUID(uuid)
+        except ValueError:
+            return self.__pres.present_error(
+                error=f"UUID {uuid} некорректный!",
+                code=400
+            )
+
+        error = _validate_params(
+            name_cap_model, name_translator, max_length, name_profile
+        )
+        if error is not None:
+            return self.__pres.present_error(error=error, code=400)
+
+        return uuid
@@ -0,0 +1,54 @@
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from interface_adapters.presenters import AbstractViewer
+    from interface_adapters.presenters.dto import (
+        ReadinessResponse,
+        ErrorResponse
+    )
+    from use_cases import AbstractUseCase
+
+
+class HealthHandler:
+    """
+    Обработчик готовности сервиса.
+
+    :ivar __pres: Атрибут представления готовности сервиса.
+    :type __pres: AbstractViewer
+
+    :ivar __get_readiness: Атрибут получения готовности сервиса.
+    :type __get_readiness: AbstractUseCase
+    """
+
+    def __init__(
+            self,
+            pres: 'AbstractViewer',
+            get_readiness: 'AbstractUseCase'
+    ) -> None:
+        """
+        Инициализация обработчика готовности сервиса.
+
+        :param pres: Представление готовности сервиса.
+        :type pres: AbstractViewer
+
+        :param get_readiness: Получение готовности сервиса.
+        :type get_readiness: AbstractUseCase
+        """
+
+        self.__pres = pres
+        self.__get_readiness = get_readiness
+
+    def get(self) -> Union['ReadinessResponse', 'ErrorResponse']:
+        """
+        Получение готовности сервиса.
+
+        :return: Готовность сервиса или ошибка.
+        :rtype: ReadinessResponse | ErrorResponse
+        """
+
+        try:
+            result = self.__get_readiness.execute()
+        except Exception as e:
+            return self.__pres.present_error(error=str(e), code=500)
+
+        return self.__pres.present(result)
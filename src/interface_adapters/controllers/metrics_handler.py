@@ -0,0 +1,54 @@
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from interface_adapters.presenters import AbstractViewer
+    from interface_adapters.presenters.dto import (
+        MetricsResponse,
+        ErrorResponse
+    )
+    from use_cases import AbstractUseCase
+
+
+class MetricsHandler:
+    """
+    Обработчик метрик сервиса.
+
+    :ivar __pres: Атрибут представления метрик сервиса.
+    :type __pres: AbstractViewer
+
+    :ivar __get_metrics: Атрибут получения метрик сервиса.
+    :type __get_metrics: AbstractUseCase
+    """
+
+    def __init__(
+            self,
+            pres: 'AbstractViewer',
+            get_metrics: 'AbstractUseCase'
+    ) -> None:
+        """
+        Инициализация обработчика метрик сервиса.
+
+        :param pres: Представление метрик сервиса.
+        :type pres: AbstractViewer
+
+        :param get_metrics: Получение метрик сервиса.
+        :type get_metrics: AbstractUseCase
+        """
+
+        self.__pres = pres
+        self.__get_metrics = get_metrics
+
+    def get(self) -> Union['MetricsResponse', 'ErrorResponse']:
+        """
+        Получение метрик сервиса.
+
+        :return: Метрики сервиса или ошибка.
+        :rtype: MetricsResponse | ErrorResponse
+        """
+
+        try:
+            result = self.__get_metrics.execute()
+        except Exception as e:
+            return self.__pres.present_error(error=str(e), code=500)
+
+        return self.__pres.present(result)
@@ -1,5 +1,23 @@
 from interface_adapters.presenters.base import AbstractViewer
-from interface_adapters.presenters.descript_viewer import GetDescriptViewer
+from interface_adapters.presenters.caption_cache_viewer import (
+    InvalidateCaptionCacheViewer
+)
+from interface_adapters.presenters.descript_viewer import (
+    GetDescriptViewer,
+    GetDescriptBatchViewer,
+    GetDescriptStreamViewer
+)
+from interface_adapters.presenters.health_viewer import ReadinessViewer
 from interface_adapters.presenters.img_viewer import UploadImgViewer
+from interface_adapters.presenters.metrics_viewer import MetricsViewer
 
-__all__ = ['AbstractViewer', 'GetDescriptViewer', 'UploadImgViewer']
+__all__ = [
+    'AbstractViewer',
+    'GetDescriptViewer',
+    'GetDescriptBatchViewer',
+    'GetDescriptStreamViewer',
+    'InvalidateCaptionCacheViewer',
+    'UploadImgViewer',
+    'MetricsViewer',
+    'ReadinessViewer'
+]
@@ -0,0 +1,48 @@
+from interface_adapters.presenters.base import AbstractViewer
+from interface_adapters.presenters.dto import (
+    InvalidateCaptionCacheResponse,
+    ErrorResponse
+)
+
+
+class InvalidateCaptionCacheViewer(AbstractViewer):
+    """ Представление результата инвалидации кеша описаний."""
+
+    @staticmethod
+    def present(removed: int) -> InvalidateCaptionCacheResponse:
+        """
+        Представление количества удаленных описаний.
+
+        :param removed: Количество удаленных описаний.
+        :type removed: int
+
+        :return: Результат представления инвалидации кеша описаний.
+        :rtype: InvalidateCaptionCacheResponse
+        """
+
+        return InvalidateCaptionCacheResponse(
+            removed=removed,
+            msg="Инвалидация кеша описаний прошла успешно!",
+            code=200
+        )
+
+    @staticmethod
+    def present_error(error: str, code: int) -> ErrorResponse:
+        """
+        Представление ошибки.
+
+        :param error: Текст ошибки.
+        :type error: str
+
+        :param code: Код ошибки.
+        :type code: int
+
+        :return: Результат представления ошибки.
+        :rtype: ErrorResponse
+        """
+
+        return ErrorResponse(
+            error=error,
+            msg="Ошибка, при инвалидации кеша описаний!",
+            code=code
+        )
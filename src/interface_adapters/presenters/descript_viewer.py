@@ -1,6 +1,10 @@
+from typing import Iterator
+
 from interface_adapters.presenters.base import AbstractViewer
 from interface_adapters.presenters.dto import (
     GetDescriptResponse,
+    GetDescriptBatchResponse,
+    GetDescriptStreamResponse,
     ErrorResponse
 )
 
@@ -9,19 +13,31 @@ class GetDescriptViewer(AbstractViewer):
     """ Представление результата получения описания изображения."""
 
     @staticmethod
-    def present(desc: str) -> GetDescriptResponse:
+    def present(
+            desc: str,
+            profile: str,
+            translated: bool = True
+    ) -> GetDescriptResponse:
         """
         Представление описания изображения.
 
         :param desc: Описание изображения.
         :type desc: str
 
+        :param profile: Название профиля генерации.
+        :type profile: str
+
+        :param translated: Признак того, что описание переведено.
+        :type translated: bool
+
         :return: Результат представления описания изображения.
         :rtype: GetDescriptResponse
         """
 
         return GetDescriptResponse(
             desc=desc,
+            profile=profile,
+            translated=translated,
             msg="Получение описания изображения прошло успешно!",
             code=200
         )
@@ -46,3 +62,100 @@ class GetDescriptViewer(AbstractViewer):
             msg="Ошибка, при получении описания изображения!",
             code=code
         )
+
+
+class GetDescriptBatchViewer(AbstractViewer):
+    """ Представление результата получения описаний батча изображений."""
+
+    @staticmethod
+    def present(descs: list[str], profile: str) -> GetDescriptBatchResponse:
+        """
+        Представление описаний изображений.
+
+        :param descs: Описания изображений.
+        :type descs: list[str]
+
+        :param profile: Название профиля генерации.
+        :type profile: str
+
+        :return: Результат представления описаний изображений.
+        :rtype: GetDescriptBatchResponse
+        """
+
+        return GetDescriptBatchResponse(
+            descs=descs,
+            profile=profile,
+            msg="Получение описаний изображений прошло успешно!",
+            code=200
+        )
+
+    @staticmethod
+    def present_error(error: str, code: int) -> ErrorResponse:
+        """
+        Представление ошибки.
+
+        :param error: Текст ошибки.
+        :type error: str
+
+        :param code: Код ошибки.
+        :type code: int
+
+        :return: Результат представления ошибки.
+        :rtype: ErrorResponse
+        """
+
+        return ErrorResponse(
+            error=error,
+            msg="Ошибка, при получении описаний изображений!",
+            code=code
+        )
+
+
+class GetDescriptStreamViewer(AbstractViewer):
+    """ Представление результата потокового получения описания."""
+
+    @staticmethod
+    def present(
+            stream: Iterator[str],
+            profile: str
+    ) -> GetDescriptStreamResponse:
+        """
+        Представление потока частичных описаний изображения.
+
+        :param stream: Итератор частичных описаний изображения.
+        :type stream: Iterator[str]
+
+        :param profile: Название профиля генерации.
+        :type profile: str
+
+        :return: Результат представления потока описаний.
+        :rtype: GetDescriptStreamResponse
+        """
+
+        return GetDescriptStreamResponse(
+            stream=stream,
+            profile=profile,
+            msg="Потоковое получение описания изображения началось!",
+            code=200
+        )
+
+    @staticmethod
+    def present_error(error: str, code: int) -> ErrorResponse:
+        """
+        Представление ошибки.
+
+        :param error: Текст ошибки.
+        :type error: str
+
+        :param code: Код ошибки.
+        :type code: int
+
+        :return: Результат представления ошибки.
+        :rtype: ErrorResponse
+        """
+
+        return ErrorResponse(
+            error=error,
+            msg="Ошибка, при потоковом получении описания изображения!",
+            code=code
+        )
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Iterator
 
 
 @dataclass
@@ -10,6 +11,20 @@ class Response:
 @dataclass
 class GetDescriptResponse(Response):
     desc: str
+    profile: str
+    translated: bool
+
+
+@dataclass
+class GetDescriptBatchResponse(Response):
+    descs: list[str]
+    profile: str
+
+
+@dataclass
+class GetDescriptStreamResponse(Response):
+    stream: Iterator[str]
+    profile: str
 
 
 @dataclass
@@ -20,3 +35,19 @@ class UploadImgResponse(Response):
 @dataclass
 class ErrorResponse(Response):
     error: str
+
+
+@dataclass
+class MetricsResponse(Response):
+    metrics: dict
+
+
+@dataclass
+class InvalidateCaptionCacheResponse(Response):
+    removed: int
+
+
+@dataclass
+class ReadinessResponse(Response):
+    ready: bool
+    warm_up: dict
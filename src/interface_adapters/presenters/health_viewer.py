@@ -0,0 +1,65 @@
+from dataclasses import asdict
+from typing import TYPE_CHECKING
+
+from interface_adapters.presenters.base import AbstractViewer
+from interface_adapters.presenters.dto import (
+    ReadinessResponse,
+    ErrorResponse
+)
+
+if TYPE_CHECKING:
+    from use_cases.warm_up import WarmUpStats
+
+
+class ReadinessViewer(AbstractViewer):
+    """ Представление результата получения готовности сервиса."""
+
+    @staticmethod
+    def present(stats: 'WarmUpStats') -> ReadinessResponse:
+        """
+        Представление готовности сервиса.
+
+        Пока captioning-модели не прогреты, сервис не готов (код 503).
+
+        :param stats: Счетчики прогрева captioning-моделей.
+        :type stats: WarmUpStats
+
+        :return: Результат представления готовности сервиса.
+        :rtype: ReadinessResponse
+        """
+
+        if stats.ready:
+            return ReadinessResponse(
+                ready=True,
+                warm_up=asdict(stats),
+                msg="Сервис готов к обработке запросов!",
+                code=200
+            )
+
+        return ReadinessResponse(
+            ready=False,
+            warm_up=asdict(stats),
+            msg="Сервис не готов к обработке запросов!",
+            code=503
+        )
+
+    @staticmethod
+    def present_error(error: str, code: int) -> ErrorResponse:
+        """
+        Представление ошибки.
+
+        :param error: Текст ошибки.
+        :type error: str
+
+        :param code: Код ошибки.
+        :type code: int
+
+        :return: Результат представления ошибки.
+        :rtype: ErrorResponse
+        """
+
+        return ErrorResponse(
+            error=error,
+            msg="Ошибка, при получении готовности сервиса!",
+            code=code
+        )
@@ -0,0 +1,50 @@
+from typing import Any
+
+from interface_adapters.presenters.base import AbstractViewer
+from interface_adapters.presenters.dto import (
+    MetricsResponse,
+    ErrorResponse
+)
+
+
+class MetricsViewer(AbstractViewer):
+    """ Представление результата получения метрик сервиса."""
+
+    @staticmethod
+    def present(metrics: dict[str, Any]) -> MetricsResponse:
+        """
+        Представление метрик сервиса.
+
+        :param metrics: Метрики сервиса.
+        :type metrics: dict[str, Any]
+
+        :return: Результат представления метрик сервиса.
+        :rtype: MetricsResponse
+        """
+
+        return MetricsResponse(
+            metrics=metrics,
+            msg="Получение метрик прошло успешно!",
+            code=200
+        )
+
+    @staticmethod
+    def present_error(error: str, code: int) -> ErrorResponse:
+        """
+        Представление ошибки.
+
+        :param error: Текст ошибки.
+        :type error: str
+
+        :param code: Код ошибки.
+        :type code: int
+
+        :return: Результат представления ошибки.
+        :rtype: ErrorResponse
+        """
+
+        return ErrorResponse(
+            error=error,
+            msg="Ошибка, при получении метрик!",
+            code=code
+        )
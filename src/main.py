@@ -3,26 +3,32 @@ import logging.config
 import click
 from dotenv import load_dotenv
 
-from infrastructure.ui.api import app as fastapi_app
-from infrastructure.ui.web import app as gradio_app
 from infrastructure.config import (
     LOGGING_CONFIG,
     GRADIO_LOGGING_CONFIG,
-    FASTAPI_LOGGING_CONFIG
+    FASTAPI_LOGGING_CONFIG,
+    ensure_dirs
 )
 
 
 @click.command()
 @click.option('--app', help="Реализация приложения")
 def main(app: str):
+    ensure_dirs()
+    # Приложения импортируются только при запуске, чтобы не загружать
+    # зависимости другой реализации.
     match app:
         case 'fastapi':
+            from infrastructure.ui.api import app as fastapi_app
+
             logging.config.dictConfig(FASTAPI_LOGGING_CONFIG)
             logger = logging.getLogger(__name__)
             logger.info(f"Старт приложения {app}!")
             fastapi_app.main()
             logger.info(f"Завершение приложения {app}!")
         case 'gradio':
+            from infrastructure.ui.web import app as gradio_app
+
             logging.config.dictConfig(GRADIO_LOGGING_CONFIG)
             logger = logging.getLogger(__name__)
             logger.info(f"Старт приложения {app}!")
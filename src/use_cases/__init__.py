@@ -1,5 +1,21 @@
 from use_cases.base import AbstractUseCase
 from use_cases.get_descript import GetDescript
+from use_cases.get_descript_batch import GetDescriptBatch
+from use_cases.get_descript_stream import GetDescriptStream
+from use_cases.get_metrics import GetMetrics
+from use_cases.get_readiness import GetReadiness
+from use_cases.invalidate_caption_cache import InvalidateCaptionCache
 from use_cases.upload_img import UploadImg
+from use_cases.warm_up import WarmUp
 
-__all__ = ['AbstractUseCase', 'GetDescript', 'UploadImg']
+__all__ = [
+    'AbstractUseCase',
+    'GetDescript',
+    'GetDescriptBatch',
+    'GetDescriptStream',
+    'GetMetrics',
+    'GetReadiness',
+    'InvalidateCaptionCache',
+    'UploadImg',
+    'WarmUp'
+]
@@ -0,0 +1,363 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from entities.cap_models.artifacts import weights_fingerprint
+from infrastructure.config import CAP_MODEL_SETTINGS
+
+if TYPE_CHECKING:
+    from infrastructure.db import AbstractCaptionCacheRepository
+
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class CaptionCacheStats:
+    hits: int = 0
+    db_hits: int = 0
+    misses: int = 0
+    hit_rate: float = 0.0
+    expired: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    db_errors: int = 0
+    entries: int = 0
+    max_entries: int = 0
+    ttl: float = 0.0
+
+
+def _model_version(name_cap_model: str) -> str:
+    """
+    Получение версии captioning-модели.
+
+    Версия - хеш отпечатка весов, режима точности и движка инференса
+    (torch или ONNX Runtime), поэтому при замене весов, смене точности
+    или движка меняется и версия.
+
+    :param name_cap_model: Название captioning-модели.
+    :type name_cap_model: str
+
+    :return: Версия модели.
+    :rtype: str
+    """
+
+    settings = CAP_MODEL_SETTINGS[name_cap_model]
+    digest = hashlib.sha1(
+        f"{weights_fingerprint(settings['save_dir'])}|"
+        f"{settings.get('precision')}|{settings.get('backend')}".encode()
+    )
+
+    return digest.hexdigest()
+
+
+class CaptionCache:
+    """
+    Двухуровневый кеш готовых описаний изображений.
+
+    Первый уровень - LRU в памяти процесса, второй - таблица в БД
+    (через репозиторий кеша описаний). Ключ описания - название
+    captioning-модели и хеш содержимого изображения, версии модели
+    (весов, режима точности и движка инференса), максимальной длины описания, переводчика и языка перевода.
+    Описания старше TTL считаются устаревшими.
+
+    :ivar __max_entries: Атрибут максимального количества описаний в
+                         памяти.
+    :type __max_entries: int
+
+    :ivar __ttl: Атрибут времени жизни описания в секундах (0 - без
+                 ограничений).
+    :type __ttl: float
+
+    :ivar __entries: Атрибут описаний в памяти и времени их записи,
+                     упорядоченных по времени последнего обращения.
+    :type __entries: OrderedDict[str, tuple[str, float]]
+
+    :ivar __versions: Атрибут версий весов captioning-моделей.
+    :type __versions: dict[str, str]
+    """
+
+    def __init__(self, max_entries: int, ttl: float = 0) -> None:
+        """
+        Инициализация кеша описаний изображений.
+
+        :param max_entries: Максимальное количество описаний в памяти.
+        :type max_entries: int
+
+        :param ttl: Время жизни описания в секундах (0 - без
+                    ограничений).
+        :type ttl: float
+
+        :raises ValueError: Если максимальное количество описаний
+                            меньше 1.
+        :raises ValueError: Если время жизни описания отрицательное.
+        """
+
+        if max_entries < 1:
+            raise ValueError("Максимальное количество описаний в кеше "
+                             "должно быть больше 0!")
+        if ttl < 0:
+            raise ValueError("Время жизни описания в кеше не может быть "
+                             "отрицательным!")
+
+        self.__max_entries = max_entries
+        self.__ttl = ttl
+
+        self.__entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self.__versions: dict[str, str] = {}
+        self.__lock = threading.Lock()
+        self.__stats = CaptionCacheStats(max_entries=max_entries, ttl=ttl)
+
+    def make_key(
+            self,
+            img: bytes,
+            name_cap_model: str,
+            max_length: int,
+            name_translator: str | None,
+            lang: str | None,
+            name_profile: str | None = None
+    ) -> str:
+        """
+        Получение ключа описания изображения.
+
+        :param img: Изображение.
+        :type img: bytes
+
+        :param name_cap_model: Название captioning-модели.
+        :type name_cap_model: str
+
+        :param max_length: Максимальная длина описания изображения.
+        :type max_length: int
+
+        :param name_translator: Название переводчика.
+        :type name_translator: str | None
+
+        :param lang: Язык перевода.
+        :type lang: str | None
+
+        :param name_profile: Название профиля генерации.
+        :type name_profile: str | None
+
+        :return: Ключ описания.
+        :rtype: str
+        """
+
+        digest = hashlib.sha256(img)
+        digest.update(
+            f"|{self.get_model_version(name_cap_model)}|{max_length}|"
+            f"{name_translator}|{lang}|{name_profile}".encode()
+        )
+
+        return f"{name_cap_model}:{digest.hexdigest()}"
+
+    def get_model_version(self, name_cap_model: str) -> str:
+        """
+        Получение версии captioning-модели (весов, режима точности и
+        движка инференса).
+
+        Версия вычисляется один раз и сбрасывается при инвалидации.
+
+        :param name_cap_model: Название captioning-модели.
+        :type name_cap_model: str
+
+        :return: Версия модели.
+        :rtype: str
+        """
+
+        with self.__lock:
+            version = self.__versions.get(name_cap_model)
+        if version is None:
+            version = _model_version(name_cap_model)
+            with self.__lock:
+                self.__versions[name_cap_model] = version
+
+        return version
+
+    def get(
+            self,
+            key: str,
+            caption_repos: 'AbstractCaptionCacheRepository | None' = None
+    ) -> str | None:
+        """
+        Получение описания изображения из кеша.
+
+        Сначала описание ищется в памяти, затем в БД. Найденное в БД
+        описание переносится в память.
+
+        :param key: Ключ описания.
+        :type key: str
+
+        :param caption_repos: Репозиторий кеша описаний (None - только
+                              память).
+        :type caption_repos: AbstractCaptionCacheRepository | None
+
+        :return: Описание или None, если его нет в кеше.
+        :rtype: str | None
+        """
+
+        now = time.time()
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                desc, created_at = entry
+                if not self.__is_expired(created_at, now):
+                    self.__entries.move_to_end(key)
+                    self.__stats.hits += 1
+                    return desc
+                del self.__entries[key]
+                self.__stats.expired += 1
+
+        if caption_repos is not None:
+            try:
+                row = caption_repos.get_caption(key)
+                if row is not None and self.__is_expired(row[1], now):
+                    caption_repos.delete_caption(key)
+                    with self.__lock:
+                        self.__stats.expired += 1
+                    row = None
+            except Exception as e:
+                logger.warning(f"Кеш описаний в БД недоступен: {e}")
+                row = None
+                with self.__lock:
+                    self.__stats.db_errors += 1
+
+            if row is not None:
+                desc, created_at = row
+                with self.__lock:
+                    self.__stats.db_hits += 1
+                    self.__insert(key, desc, created_at)
+                return desc
+
+        with self.__lock:
+            self.__stats.misses += 1
+
+        return None
+
+    def put(
+            self,
+            key: str,
+            name_cap_model: str,
+            desc: str,
+            caption_repos: 'AbstractCaptionCacheRepository | None' = None
+    ) -> None:
+        """
+        Сохранение описания изображения в кеш.
+
+        :param key: Ключ описания.
+        :type key: str
+
+        :param name_cap_model: Название captioning-модели.
+        :type name_cap_model: str
+
+        :param desc: Описание изображения.
+        :type desc: str
+
+        :param caption_repos: Репозиторий кеша описаний (None - только
+                              память).
+        :type caption_repos: AbstractCaptionCacheRepository | None
+        """
+
+        created_at = time.time()
+        with self.__lock:
+            self.__insert(key, desc, created_at)
+
+        if caption_repos is not None:
+            try:
+                caption_repos.set_caption(
+                    key,
+                    name_cap_model=name_cap_model,
+                    model_version=self.get_model_version(name_cap_model),
+                    desc=desc,
+                    created_at=created_at
+                )
+            except Exception as e:
+                logger.warning(f"Невозможно записать описание в кеш в БД: "
+                               f"{e}")
+                with self.__lock:
+                    self.__stats.db_errors += 1
+
+    def invalidate(
+            self,
+            name_cap_model: str | None = None,
+            caption_repos: 'AbstractCaptionCacheRepository | None' = None
+    ) -> int:
+        """
+        Инвалидация описаний кеша (например, после замены весов модели).
+
+        Удаляются описания captioning-модели из памяти и БД, а версия
+        весов модели вычисляется заново.
+
+        :param name_cap_model: Название captioning-модели (None - все
+                               модели).
+        :type name_cap_model: str | None
+
+        :param caption_repos: Репозиторий кеша описаний (None - только
+                              память).
+        :type caption_repos: AbstractCaptionCacheRepository | None
+
+        :return: Количество удаленных описаний.
+        :rtype: int
+        """
+
+        with self.__lock:
+            if name_cap_model is None:
+                removed = len(self.__entries)
+                self.__entries.clear()
+                self.__versions.clear()
+            else:
+                keys = [key for key in self.__entries
+                        if key.startswith(f"{name_cap_model}:")]
+                for key in keys:
+                    del self.__entries[key]
+                removed = len(keys)
+                self.__versions.pop(name_cap_model, None)
+            self.__stats.invalidations += 1
+
+        if caption_repos is not None:
+            removed += caption_repos.delete_captions(name_cap_model)
+
+        target = name_cap_model or 'все модели'
+        logger.info(f"Кеш описаний инвалидирован ({target}), удалено "
+                    f"описаний: {removed}")
+
+        return removed
+
+    def stats(self) -> CaptionCacheStats:
+        """
+        Получение счетчиков кеша.
+
+        :return: Копия счетчиков кеша.
+        :rtype: CaptionCacheStats
+        """
+
+        with self.__lock:
+            stats = self.__stats
+            lookups = stats.hits + stats.db_hits + stats.misses
+            return CaptionCacheStats(
+                hits=stats.hits,
+                db_hits=stats.db_hits,
+                misses=stats.misses,
+                hit_rate=((stats.hits + stats.db_hits) / lookups
+                          if lookups else 0.0),
+                expired=stats.expired,
+                evictions=stats.evictions,
+                invalidations=stats.invalidations,
+                db_errors=stats.db_errors,
+                entries=len(self.__entries),
+                max_entries=stats.max_entries,
+                ttl=stats.ttl
+            )
+
+    def __is_expired(self, created_at: float, now: float) -> bool:
+        return self.__ttl > 0 and now - created_at > self.__ttl
+
+    def __insert(self, key: str, desc: str, created_at: float) -> None:
+        self.__entries[key] = (desc, created_at)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__max_entries:
+            self.__entries.popitem(last=False)
+            self.__stats.evictions += 1
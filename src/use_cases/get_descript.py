@@ -1,64 +1,492 @@
-from enum import Enum
-from typing import TYPE_CHECKING
-
-from transformers import (
-    BlipForConditionalGeneration,
-    BlipProcessor,
-    # Blip2ForConditionalGeneration,
-    # Blip2Processor
-)
-from googletrans import Translator as GTranslator
-from googletrans.constants import LANGUAGES
-from translate import Translator
+import asyncio
+import hashlib
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator
 
 from entities.cap_model_director import CapModelDirector
-from entities.cap_models import BLIPCapModelBuilder
-from entities.translators import GoogleTranslator, AppTranslator
+from entities.cap_models.artifacts import weights_fingerprint
+from entities.cap_models import (
+    BLIPCapModelBuilder,
+    CapModelBatcher,
+    CapModelRegistry,
+    CapModelWorkerPool,
+    GenerationProfile,
+    GenerationProfileController,
+    ImageDecoder,
+    ImageEmbedsCache,
+    ONNXBLIPCapModelBuilder,
+    PooledCapModelBuilder,
+    TokenPrefixCache
+)
+from entities.translators import (
+    AbstractTranslator,
+    AppTranslator,
+    BackgroundLoop,
+    BatchingTranslator,
+    CachedTranslator,
+    CircuitBreaker,
+    GoogleTranslator,
+    MarianTranslator,
+    MyMemoryClient,
+    ResilientTranslator,
+    TranslationResult
+)
 from use_cases.base import AbstractUseCase
+from use_cases.caption_cache import CaptionCache
+from use_cases.pipeline import Pipeline, PipelineStage
+from use_cases.providers import LazyProviderRegistry
+from use_cases.translation_cache import TranslationCache
 from infrastructure.config import (
     BLIP_MODEL_NAME,
     # BLIP2_MODEL_NAME,
+    ONNX_BLIP_MODEL_NAME,
     CAP_MODEL_SETTINGS,
+    CAP_MODEL_REGISTRY_MEMORY_BUDGET,
+    CAP_MODEL_BATCHING_ENABLED,
+    CAP_MODEL_BATCH_MAX_SIZE,
+    CAP_MODEL_BATCH_MAX_WAIT_MS,
+    CAP_MODEL_DECODING_DRAFT,
+    CAP_MODEL_DECODING_TURBOJPEG,
+    CAP_MODEL_PREPROCESSING_VECTORIZED,
+    CAP_MODEL_ARTIFACTS_MMAP,
+    CAP_MODEL_ARTIFACTS_VERIFY,
+    CAP_MODEL_EMBEDS_CACHE_ENABLED,
+    CAP_MODEL_EMBEDS_CACHE_MEMORY_BUDGET,
+    CAP_MODEL_EMBEDS_CACHE_SPILL_DIR,
+    CAP_MODEL_EMBEDS_CACHE_DISK_BUDGET,
+    CAP_MODEL_TOKEN_CACHE_ENABLED,
+    CAP_MODEL_TOKEN_CACHE_MAX_ENTRIES,
+    CAP_MODEL_WORKERS,
+    CAP_MODEL_WORKER_TORCH_THREADS,
+    CAP_MODEL_WORKER_START_METHOD,
+    CAP_MODEL_WORKER_RESULT_TIMEOUT,
+    CAP_MODEL_WORKER_MAX_RESTARTS,
+    GENERATION_PROFILES,
+    GENERATION_DEFAULT_PROFILE,
+    GENERATION_CONTROLLER_AUTO,
+    GENERATION_QUEUE_DEPTH_HIGH,
+    GENERATION_QUEUE_DEPTH_LOW,
+    GENERATION_LATENCY_P95_HIGH_MS,
+    GENERATION_LATENCY_P95_LOW_MS,
+    GENERATION_LATENCY_WINDOW,
+    GENERATION_COOLDOWN,
+    CAPTION_CACHE_ENABLED,
+    CAPTION_CACHE_MAX_ENTRIES,
+    CAPTION_CACHE_TTL,
+    TRANSLATION_CACHE_ENABLED,
+    TRANSLATION_CACHE_MAX_ENTRIES,
+    TRANSLATION_RESILIENCE_ENABLED,
+    TRANSLATION_FALLBACKS,
+    TRANSLATION_BUDGET_MS,
+    TRANSLATION_HEDGE_QUANTILE,
+    TRANSLATION_HEDGE_MIN_MS,
+    TRANSLATION_BREAKER_FAILURES,
+    TRANSLATION_BREAKER_RESET,
+    TRANSLATION_LATENCY_WINDOW,
+    TRANSLATION_BATCHING_ENABLED,
+    TRANSLATION_BATCH_MAX_SIZE,
+    TRANSLATION_BATCH_MAX_WAIT_MS,
+    PIPELINE_ENABLED,
+    PIPELINE_QUEUE_SIZE,
+    PIPELINE_WORKERS,
+    DEFAULT_LENGTH_DESCRIPTION,
     TRANS_MODEL_SETTINGS,
     APPTRANS_TRANS_NAME,
-    GOOGLE_TRANS_NAME
+    APPTRANS_URL,
+    APPTRANS_EMAIL,
+    APPTRANS_POOL_SIZE,
+    APPTRANS_TIMEOUT,
+    APPTRANS_POOL_TIMEOUT,
+    APPTRANS_RETRIES,
+    APPTRANS_BACKOFF,
+    GOOGLE_TRANS_NAME,
+    MARIAN_TRANS_NAME
 )
 
 if TYPE_CHECKING:
     from uuid import UUID
 
     from entities import AbstractCapModelDirector
+    from entities.cap_models import AbstractCapModel, AbstractCapModelBuilder
     from infrastructure.db import (
+        AbstractCaptionCacheRepository,
         AbstractImageRepository,
         AbstractDescriptionRepository
     )
 
+    _Repositories = tuple[
+        AbstractImageRepository,
+        AbstractDescriptionRepository,
+        AbstractCaptionCacheRepository | None
+    ]
+    _RepositoriesScope = Callable[[], AbstractContextManager[_Repositories]]
+
+
+cap_model_registry = CapModelRegistry(CAP_MODEL_REGISTRY_MEMORY_BUDGET)
+cap_model_worker_pools: dict[str, CapModelWorkerPool] = {}
+cap_model_decoder = ImageDecoder(
+    draft=CAP_MODEL_DECODING_DRAFT,
+    turbojpeg=CAP_MODEL_DECODING_TURBOJPEG
+)
+
+
+def _embeds_cache_version() -> str:
+    """
+    Получение версии эмбеддингов изображений.
+
+    Версия - хеш отпечатков весов и режимов точности captioning-моделей,
+    поэтому после пересборки весов или смены точности выгруженные на
+    диск эмбеддинги не используются.
+
+    :return: Версия эмбеддингов.
+    :rtype: str
+    """
+
+    digest = hashlib.sha1()
+    for name, settings in sorted(CAP_MODEL_SETTINGS.items()):
+        digest.update(f"{name}:{settings.get('precision')}:"
+                      f"{weights_fingerprint(settings['save_dir'])};"
+                      .encode())
+
+    return digest.hexdigest()[:16]
+
+
+def _make_embeds_cache() -> ImageEmbedsCache:
+    """
+    Создание кеша эмбеддингов изображений.
+
+    :return: Кеш эмбеддингов изображений.
+    :rtype: ImageEmbedsCache
+    """
+
+    return ImageEmbedsCache(
+        CAP_MODEL_EMBEDS_CACHE_MEMORY_BUDGET,
+        spill_dir=CAP_MODEL_EMBEDS_CACHE_SPILL_DIR,
+        disk_budget=CAP_MODEL_EMBEDS_CACHE_DISK_BUDGET,
+        version=_embeds_cache_version()
+    )
+
+
+# Кеш эмбеддингов создается при первом обращении (при создании
+# директора BLIP), так как он читает веса моделей и папку выгрузки.
+cap_model_embeds_caches: LazyProviderRegistry[ImageEmbedsCache] = (
+    LazyProviderRegistry(
+        {'embeds': _make_embeds_cache}
+        if CAP_MODEL_EMBEDS_CACHE_ENABLED else {}
+    )
+)
+cap_model_token_cache = (
+    TokenPrefixCache(CAP_MODEL_TOKEN_CACHE_MAX_ENTRIES)
+    if CAP_MODEL_TOKEN_CACHE_ENABLED else None
+)
+caption_cache = (
+    CaptionCache(CAPTION_CACHE_MAX_ENTRIES, ttl=CAPTION_CACHE_TTL)
+    if CAPTION_CACHE_ENABLED else None
+)
+translation_cache = (
+    TranslationCache(TRANSLATION_CACHE_MAX_ENTRIES)
+    if TRANSLATION_CACHE_ENABLED else None
+)
+translation_batchers: dict[str, BatchingTranslator] = {}
+translation_clients: dict[str, MyMemoryClient] = {}
+translation_models: dict[str, MarianTranslator] = {}
+# Общий цикл событий асинхронных HTTP-клиентов переводчиков.
+translation_loop = BackgroundLoop(name='translation-loop')
+# Предохранители переводчиков, общие для всех цепочек запасных
+# переводчиков.
+translation_breakers = {
+    name: CircuitBreaker(
+        failure_threshold=TRANSLATION_BREAKER_FAILURES,
+        reset_timeout_s=TRANSLATION_BREAKER_RESET,
+        window=TRANSLATION_LATENCY_WINDOW
+    )
+    for name in TRANS_MODEL_SETTINGS
+}
+generation_controller = GenerationProfileController(
+    [
+        GenerationProfile(name, **params)
+        for name, params in GENERATION_PROFILES.items()
+    ],
+    default=GENERATION_DEFAULT_PROFILE,
+    auto=GENERATION_CONTROLLER_AUTO,
+    queue_depth_high=GENERATION_QUEUE_DEPTH_HIGH,
+    queue_depth_low=GENERATION_QUEUE_DEPTH_LOW,
+    latency_p95_high_ms=GENERATION_LATENCY_P95_HIGH_MS,
+    latency_p95_low_ms=GENERATION_LATENCY_P95_LOW_MS,
+    window=GENERATION_LATENCY_WINDOW,
+    cooldown_s=GENERATION_COOLDOWN
+)
+
+
+def _make_blip_builder(in_worker: bool = False) -> BLIPCapModelBuilder:
+    """
+    Создание строителя BLIP captioning-модели.
+
+    :param in_worker: Строитель для пула процессов инференса (без
+                      кеша эмбеддингов, так как его папка выгрузки
+                      общая с основным процессом).
+    :type in_worker: bool
+
+    :return: Строитель captioning-модели.
+    :rtype: BLIPCapModelBuilder
+    """
+
+    from transformers import BlipForConditionalGeneration, BlipProcessor
+
+    return BLIPCapModelBuilder(
+        model=BlipForConditionalGeneration,
+        processor=BlipProcessor,
+        download_path=CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['save_dir'],
+        cache_dir=CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['cache_dir'],
+        registry=cap_model_registry,
+        precision=CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['precision'],
+        embeds_cache=(None if in_worker
+                      else cap_model_embeds_caches.get('embeds')),
+        token_cache=cap_model_token_cache,
+        decoder=cap_model_decoder,
+        vectorized_preprocessing=CAP_MODEL_PREPROCESSING_VECTORIZED,
+        mmap_weights=CAP_MODEL_ARTIFACTS_MMAP,
+        verify=CAP_MODEL_ARTIFACTS_VERIFY
+    )
+
+
+def _make_onnx_blip_builder(
+        in_worker: bool = False
+) -> ONNXBLIPCapModelBuilder:
+    """
+    Создание строителя BLIP captioning-модели на ONNX Runtime.
+
+    :param in_worker: Строитель создается в процессе пула инференса.
+    :type in_worker: bool
+
+    :return: Строитель captioning-модели.
+    :rtype: ONNXBLIPCapModelBuilder
+    """
+
+    from transformers import BlipProcessor
+
+    return ONNXBLIPCapModelBuilder(
+        processor=BlipProcessor,
+        onnx_dir=CAP_MODEL_SETTINGS[ONNX_BLIP_MODEL_NAME]['save_dir'],
+        registry=cap_model_registry,
+        threads=CAP_MODEL_SETTINGS[ONNX_BLIP_MODEL_NAME]['threads'],
+        decoder=cap_model_decoder,
+        vectorized_preprocessing=CAP_MODEL_PREPROCESSING_VECTORIZED
+    )
+
+
+# def _make_blip2_builder(in_worker: bool = False) -> BLIPCapModelBuilder:
+#     from transformers import Blip2ForConditionalGeneration, Blip2Processor
+#
+#     return BLIPCapModelBuilder(
+#         model=Blip2ForConditionalGeneration,
+#         processor=Blip2Processor,
+#         download_path=CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['save_dir'],
+#         cache_dir=CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['cache_dir'],
+#         registry=cap_model_registry,
+#         precision=CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['precision']
+#     )
+
+
+_builder_factories: dict[str, Callable[..., 'AbstractCapModelBuilder']] = {
+    BLIP_MODEL_NAME: _make_blip_builder,
+    ONNX_BLIP_MODEL_NAME: _make_onnx_blip_builder,
+    # BLIP2_MODEL_NAME: _make_blip2_builder
+}
+
+
+def _load_worker_weights(name: str) -> Any:
+    """
+    Загрузка весов captioning-модели для пула процессов инференса.
+
+    Веса загружаются в основном процессе один раз и переносятся в
+    разделяемую память, откуда их используют все процессы пула.
+    Модели ONNX Runtime загружают веса в каждом процессе сами.
+
+    :param name: Название captioning-модели.
+    :type name: str
+
+    :return: Веса модели в разделяемой памяти или None.
+    :rtype: Any
+    """
+
+    builder = _builder_factories[name](in_worker=True)
+    if not isinstance(builder, BLIPCapModelBuilder):
+        return None
+    builder.get_model().share_memory()
+
+    return builder.get_weights()
+
+
+def _build_worker_model(name: str, weights: Any) -> 'AbstractCapModel':
+    """
+    Создание captioning-модели в процессе пула инференса.
+
+    Функция передается процессам вместо экземпляра модели, поэтому
+    сериализуется pickle по имени при любом способе запуска процессов.
+
+    :param name: Название captioning-модели.
+    :type name: str
+
+    :param weights: Веса модели из основного процесса (None - модель
+                    загружает веса сама).
+    :type weights: Any
+
+    :return: Captioning-модель.
+    :rtype: AbstractCapModel
+    """
+
+    builder = _builder_factories[name](in_worker=True)
+    if weights is not None:
+        builder.set_weights(weights)
+
+    return builder.get_model()
+
+
+def _make_director(name: str) -> CapModelDirector:
+    """
+    Создание директора captioning-модели.
 
-class BuilderNameEnum(Enum):
-    BLIP_DIR: 'AbstractCapModelDirector' = CapModelDirector(
-        BLIPCapModelBuilder(
-            model=BlipForConditionalGeneration,
-            processor=BlipProcessor,
-            download_path=CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['save_dir'],
-            cache_dir=CAP_MODEL_SETTINGS[BLIP_MODEL_NAME]['cache_dir']
+    Если пул процессов инференса включен, то веса модели загружаются
+    в основном процессе один раз, а модель выполняется процессами пула
+    поверх этих весов. Если микро-батчинг включен, то директору
+    назначается собственный движок микро-батчинга.
+
+    :param name: Название captioning-модели.
+    :type name: str
+
+    :return: Директор captioning-модели.
+    :rtype: CapModelDirector
+    """
+
+    if CAP_MODEL_WORKERS > 0:
+        pool = CapModelWorkerPool(
+            partial(_build_worker_model, name),
+            workers=CAP_MODEL_WORKERS,
+            weights=_load_worker_weights(name),
+            torch_threads=CAP_MODEL_WORKER_TORCH_THREADS,
+            start_method=CAP_MODEL_WORKER_START_METHOD,
+            result_timeout_s=CAP_MODEL_WORKER_RESULT_TIMEOUT,
+            max_restarts=CAP_MODEL_WORKER_MAX_RESTARTS
+        )
+        cap_model_worker_pools[name] = pool
+        builder = PooledCapModelBuilder(
+            pool,
+            max_length=DEFAULT_LENGTH_DESCRIPTION
+        )
+    else:
+        builder = _builder_factories[name]()
+
+    batcher = None
+    if CAP_MODEL_BATCHING_ENABLED:
+        batcher = CapModelBatcher(
+            builder,
+            max_batch_size=CAP_MODEL_BATCH_MAX_SIZE,
+            max_wait_ms=CAP_MODEL_BATCH_MAX_WAIT_MS,
+            default_max_length=DEFAULT_LENGTH_DESCRIPTION
+        )
+
+    return CapModelDirector(builder, batcher=batcher)
+
+
+def start_cap_model_worker_pools() -> None:
+    """
+    Запуск пулов процессов инференса всех captioning-моделей.
+
+    Вызывается при старте приложения до создания потоков (пулов
+    исполнения, цикла событий переводчиков), чтобы процессы (или сервер
+    forkserver) создавались из однопоточного процесса.
+    """
+
+    if CAP_MODEL_WORKERS < 1:
+        return
+
+    # Создание директоров создает и регистрирует их пулы процессов.
+    _director_mapping.warm()
+    for pool in cap_model_worker_pools.values():
+        pool.start()
+
+
+def close_cap_model_worker_pools() -> None:
+    """ Остановка пулов процессов инференса."""
+
+    for pool in cap_model_worker_pools.values():
+        pool.close()
+
+
+def _wrap_translator(
+        name: str,
+        translator: AbstractTranslator,
+        batching: bool = False
+) -> AbstractTranslator:
+    """
+    Подключение батчинга запросов и кеша переводов к переводчику.
+
+    Кеш стоит перед батчингом: найденные в кеше переводы возвращаются
+    сразу, а в батчи к переводчику попадают только промахи.
+
+    Батчинг подключается только к переводчикам с настоящим переводом
+    батча одним вызовом: у остальных поток батчинга переводил бы
+    тексты по одному и только выстраивал запросы в очередь.
+
+    :param name: Название переводчика.
+    :type name: str
+
+    :param translator: Переводчик.
+    :type translator: AbstractTranslator
+
+    :param batching: Переводчик переводит батч одним вызовом.
+    :type batching: bool
+
+    :return: Переводчик с батчингом и кешем переводов (если они
+             включены).
+    :rtype: AbstractTranslator
+    """
+
+    if batching and TRANSLATION_BATCHING_ENABLED:
+        translator = BatchingTranslator(
+            translator,
+            lang=TRANS_MODEL_SETTINGS[name]['lang'],
+            max_batch_size=TRANSLATION_BATCH_MAX_SIZE,
+            max_wait_ms=TRANSLATION_BATCH_MAX_WAIT_MS
         )
+        translation_batchers[name] = translator
+
+    if translation_cache is None:
+        return translator
+
+    return CachedTranslator(
+        translator,
+        translation_cache,
+        provider=name,
+        lang=TRANS_MODEL_SETTINGS[name]['lang']
+    )
+
+
+def _make_apptrans_translator() -> AbstractTranslator:
+    """
+    Создание переводчика App Translator (MyMemory).
+
+    :return: Переводчик.
+    :rtype: AbstractTranslator
+    """
+
+    client = MyMemoryClient(
+        to_lang=TRANS_MODEL_SETTINGS[APPTRANS_TRANS_NAME]['lang'],
+        url=APPTRANS_URL,
+        email=APPTRANS_EMAIL,
+        pool_size=APPTRANS_POOL_SIZE,
+        timeout_s=APPTRANS_TIMEOUT,
+        pool_timeout_s=APPTRANS_POOL_TIMEOUT,
+        retries=APPTRANS_RETRIES,
+        backoff_s=APPTRANS_BACKOFF
     )
-    # BLIP2_DIR: 'AbstractCapModelDirector' = CapModelDirector(
-    #     BLIPCapModelBuilder(
-    #         model=Blip2ForConditionalGeneration,
-    #         processor=Blip2Processor,
-    #         download_path=CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['save_dir'],
-    #         cache_dir=CAP_MODEL_SETTINGS[BLIP2_MODEL_NAME]['cache_dir']
-    #     )
-    # )
-
-
-class TranslatorNameEnum(Enum):
-    APPTRANS = AppTranslator(
-        Translator(
-            to_lang=TRANS_MODEL_SETTINGS[APPTRANS_TRANS_NAME]['lang'],
-            provider='mymemory'
-        ),
+    translation_clients[APPTRANS_TRANS_NAME] = client
+
+    return _wrap_translator(APPTRANS_TRANS_NAME, AppTranslator(
+        client,
         support_langs=[
             'af', 'sq', 'am', 'ar', 'hy', 'az', 'bjs',
             'rm', 'eu', 'bem', 'bn', 'be', 'bi', 'bs',
@@ -83,23 +511,428 @@ class TranslatorNameEnum(Enum):
             'tr', 'tk', 'tvl', 'uk', 'ppk', 'uz', 'vi',
             'wls', 'cy', 'wo', 'xh', 'yi', 'zu'
         ]
-    )
-    GOOGLE = GoogleTranslator(
+    ))
+
+
+def _make_google_translator() -> AbstractTranslator:
+    """
+    Создание переводчика Google Translate.
+
+    :return: Переводчик.
+    :rtype: AbstractTranslator
+    """
+
+    from googletrans import Translator as GTranslator
+    from googletrans.constants import LANGUAGES
+
+    return _wrap_translator(GOOGLE_TRANS_NAME, GoogleTranslator(
         GTranslator(),
         to_lang=TRANS_MODEL_SETTINGS[GOOGLE_TRANS_NAME]['lang'],
-        support_langs=(LANGUAGES.keys())
+        support_langs=(LANGUAGES.keys()),
+        loop=translation_loop
+    ))
+
+
+def _make_marian_translator() -> AbstractTranslator:
+    """
+    Создание локального переводчика MarianMT.
+
+    :return: Переводчик.
+    :rtype: AbstractTranslator
+    """
+
+    from transformers import MarianMTModel, MarianTokenizer
+
+    settings = TRANS_MODEL_SETTINGS[MARIAN_TRANS_NAME]
+    translator = MarianTranslator(
+        model=MarianMTModel,
+        tokenizer=MarianTokenizer,
+        model_dir=settings['save_dir'],
+        to_lang=settings['lang'],
+        num_beams=settings['num_beams'],
+        max_length=settings['max_length'],
+        verify=CAP_MODEL_ARTIFACTS_VERIFY
     )
+    translation_models[MARIAN_TRANS_NAME] = translator
 
+    return _wrap_translator(MARIAN_TRANS_NAME, translator, batching=True)
 
-_director_mapping = {
-    'blip': BuilderNameEnum.BLIP_DIR.value,
-    # 'blip2': BuilderNameEnum.BLIP2_DIR.value
-}
 
-_translator_mapping = {
-    'google': TranslatorNameEnum.GOOGLE.value,
-    'apptrans': TranslatorNameEnum.APPTRANS.value
-}
+# Директоры и переводчики создаются при первом обращении, чтобы импорт
+# use_cases не тянул transformers, googletrans и requests.
+_director_mapping: LazyProviderRegistry['AbstractCapModelDirector'] = (
+    LazyProviderRegistry({
+        name: partial(_make_director, name) for name in _builder_factories
+    })
+)
+
+_translator_mapping: LazyProviderRegistry[AbstractTranslator] = (
+    LazyProviderRegistry({
+        'google': _make_google_translator,
+        'apptrans': _make_apptrans_translator,
+        'marian': _make_marian_translator
+    })
+)
+
+
+def _make_resilient_translator(name: str) -> AbstractTranslator:
+    """
+    Создание переводчика с хеджированием и запасными переводчиками.
+
+    Выбранный переводчик идет первым, за ним - запасные переводчики из
+    конфигурации.
+
+    :param name: Название выбранного переводчика.
+    :type name: str
+
+    :return: Переводчик.
+    :rtype: AbstractTranslator
+    """
+
+    names = [name] + [
+        fallback for fallback in TRANSLATION_FALLBACKS if fallback != name
+    ]
+
+    return ResilientTranslator(
+        [(provider, _translator_mapping[provider]) for provider in names],
+        translation_breakers,
+        loop=translation_loop,
+        budget_ms=TRANSLATION_BUDGET_MS,
+        hedge_quantile=TRANSLATION_HEDGE_QUANTILE,
+        hedge_min_ms=TRANSLATION_HEDGE_MIN_MS
+    )
+
+
+_resilient_mapping: LazyProviderRegistry[ResilientTranslator] = (
+    LazyProviderRegistry({
+        name: partial(_make_resilient_translator, name)
+        for name in _translator_mapping
+    })
+)
+
+
+def _read_img(img_repos: 'AbstractImageRepository', uuid: 'UUID') -> bytes:
+    """
+    Получение изображения по UUID запроса.
+
+    :param img_repos: Репозиторий изображений, для доступа к хранилищу.
+    :type img_repos: AbstractImageRepository
+
+    :param uuid: UUID загруженного изображения.
+    :type uuid: UUID
+
+    :return: Изображение.
+    :rtype: bytes
+
+    :raises ValueError: Если нет файла изображения.
+    :raises PermissionError: Если нет прав для получения изображения.
+    :raises OSError: Если невозможно получить изображение.
+    :raises Exception: Если неизвестная ошибка при получении
+                       изображения.
+    """
+
+    img_path = img_repos.get_path_by_uuid(uuid)
+    if not img_path.exists():
+        raise ValueError(f"Пути к файлу {img_path} не существует!")
+
+    try:
+        with open(img_path, 'rb') as f:
+            img = f.read()
+    except PermissionError:
+        raise PermissionError("Нет прав для получения изображения!")
+    except OSError:
+        raise OSError("Невозможно получить изображение!")
+    except Exception as e:
+        raise Exception(f"Неизвестная ошибка при получении изображения:"
+                        f" {e}!")
+
+    return img
+
+
+def _profile_max_length(
+        max_length: int | None,
+        profile: GenerationProfile
+) -> int:
+    """
+    Получение максимальной длины описания с учетом профиля генерации.
+
+    :param max_length: Максимальная длина описания изображения.
+    :type max_length: int | None
+
+    :param profile: Профиль генерации.
+    :type profile: GenerationProfile
+
+    :return: Максимальная длина описания, не больше длины профиля.
+    :rtype: int
+    """
+
+    max_length = max_length or DEFAULT_LENGTH_DESCRIPTION
+    if profile.max_length is not None:
+        max_length = min(max_length, profile.max_length)
+
+    return max_length
+
+
+def _get_translator(name_translator: str | None) -> AbstractTranslator | None:
+    """
+    Получение переводчика описания изображения.
+
+    Если включены запасные переводчики, то выбранный переводчик
+    оборачивается переводчиком с хеджированием и запасными
+    переводчиками.
+
+    :param name_translator: Название переводчика описания изображения.
+    :type name_translator: str | None
+
+    :return: Переводчик или None, если перевод не нужен.
+    :rtype: AbstractTranslator | None
+
+    :raises ValueError: Если нет переводчика.
+    """
+
+    if name_translator is None:
+        return None
+    if name_translator not in _translator_mapping:
+        raise ValueError(f'Нет такого переводчика: {name_translator}')
+    if TRANSLATION_RESILIENCE_ENABLED:
+        return _resilient_mapping[name_translator]
+
+    return _translator_mapping[name_translator]
+
+
+def _get_director(
+        name_cap_model: str,
+        name_translator: str | None
+) -> 'AbstractCapModelDirector':
+    """
+    Получение директора captioning-модели с назначенным переводчиком.
+
+    :param name_cap_model: Название captioning-модели.
+    :type name_cap_model: str
+
+    :param name_translator: Название переводчика описания изображения.
+    :type name_translator: str | None
+
+    :return: Директор captioning-модели.
+    :rtype: AbstractCapModelDirector
+
+    :raises ValueError: Если нет captioning-модели.
+    :raises ValueError: Если нет переводчика.
+    """
+
+    if name_cap_model not in _director_mapping:
+        raise ValueError(f'Нет такой captioning-модели: {name_cap_model}')
+    # Копия, так как директор общий для параллельных запросов.
+    director = _director_mapping[name_cap_model].clone()
+
+    director.set_translator(_get_translator(name_translator))
+
+    return director
+
+
+@dataclass
+class _Description:
+    result: str
+    cached: bool
+    key: str | None
+    profile: GenerationProfile
+
+
+@dataclass
+class _DescriptTask:
+    uuid: 'UUID'
+    name_cap_model: str
+    name_translator: str | None
+    max_length: int | None
+    name_profile: str | None
+    profile: GenerationProfile
+    translator: AbstractTranslator | None
+    img_repos: 'AbstractImageRepository'
+    desc_repos: 'AbstractDescriptionRepository'
+    caption_repos: 'AbstractCaptionCacheRepository | None'
+    repos_scope: '_RepositoriesScope | None'
+    img: bytes | None = None
+    desc: _Description | None = None
+    translated: bool = True
+
+
+@contextmanager
+def _task_repositories(task: _DescriptTask) -> Iterator['_Repositories']:
+    """
+    Получение репозиториев для этапа задачи.
+
+    Если задан repos_scope, то этап работает в собственной сессии
+    (этапы конвейера выполняются в своих потоках), иначе - с
+    репозиториями запроса.
+
+    :param task: Задача получения описания изображения.
+    :type task: _DescriptTask
+
+    :return: Репозитории изображений, описаний и кеша описаний.
+    :rtype: Iterator[_Repositories]
+    """
+
+    if task.repos_scope is None:
+        yield task.img_repos, task.desc_repos, task.caption_repos
+        return
+
+    with task.repos_scope() as repos:
+        yield repos
+
+
+def _read_task(task: _DescriptTask) -> _DescriptTask:
+    """
+    Этап чтения изображения из хранилища.
+
+    :param task: Задача получения описания изображения.
+    :type task: _DescriptTask
+
+    :return: Задача с изображением.
+    :rtype: _DescriptTask
+    """
+
+    with _task_repositories(task) as (img_repos, _, _):
+        task.img = _read_img(img_repos, task.uuid)
+
+    return task
+
+
+def _describe_task(task: _DescriptTask) -> _DescriptTask:
+    """
+    Этап получения непереведенного описания изображения или
+    переведенного описания из кеша описаний.
+
+    Декодирование, обработка, кодирование изображения и генерация
+    описания выполняются captioning-моделью (с ее микро-батчингом и
+    кешем эмбеддингов). Контроллер нагрузки учитывает только этот этап,
+    без чтения, перевода и записи в БД.
+
+    :param task: Задача получения описания изображения.
+    :type task: _DescriptTask
+
+    :return: Задача с описанием изображения.
+    :rtype: _DescriptTask
+    """
+
+    # Инциализация Captioning-модели (перевод выполняется отдельно).
+    director = _get_director(task.name_cap_model, None)
+    max_length = _profile_max_length(task.max_length, task.profile)
+
+    # Получение результата из кеша описаний.
+    key, result = None, None
+    if caption_cache is not None:
+        key = caption_cache.make_key(
+            task.img,
+            task.name_cap_model,
+            max_length,
+            task.name_translator,
+            (TRANS_MODEL_SETTINGS[task.name_translator]['lang']
+             if task.name_translator is not None else None),
+            task.profile.name
+        )
+        with _task_repositories(task) as (_, _, caption_repos):
+            result = caption_cache.get(key, caption_repos)
+    if result is not None:
+        task.desc = _Description(result, True, None, task.profile)
+        return task
+
+    # Получение результата описания изображения.
+    with generation_controller.track(task.profile,
+                                     pinned=task.name_profile is not None):
+        result = director.get_descript(task.img, max_length, task.profile)
+    task.desc = _Description(result, False, key, task.profile)
+
+    return task
+
+
+def _translate_task(task: _DescriptTask) -> _DescriptTask:
+    """
+    Этап перевода описания изображения.
+
+    :param task: Задача получения описания изображения.
+    :type task: _DescriptTask
+
+    :return: Задача с переведенным описанием изображения.
+    :rtype: _DescriptTask
+    """
+
+    if task.translator is not None and not task.desc.cached:
+        _apply_translation(
+            task, task.translator.translate_result(task.desc.result)
+        )
+
+    return task
+
+
+def _persist_task(task: _DescriptTask) -> _DescriptTask:
+    """
+    Этап сохранения описания изображения в кеш описаний и в хранилище.
+
+    :param task: Задача получения описания изображения.
+    :type task: _DescriptTask
+
+    :return: Задача получения описания изображения.
+    :rtype: _DescriptTask
+    """
+
+    desc = task.desc
+    with _task_repositories(task) as (_, desc_repos, caption_repos):
+        if caption_cache is not None and desc.key is not None:
+            caption_cache.put(
+                desc.key, task.name_cap_model, desc.result, caption_repos
+            )
+        desc_repos.set_description_by_uuid(task.uuid, desc=desc.result)
+
+    return task
+
+
+def _apply_translation(
+        task: _DescriptTask,
+        translation: TranslationResult
+) -> None:
+    """
+    Применение перевода к описанию изображения.
+
+    Непереведенное описание (все переводчики недоступны) не
+    сохраняется в кеш описаний, чтобы следующий запрос снова
+    попробовал его перевести.
+
+    :param task: Задача получения описания изображения.
+    :type task: _DescriptTask
+
+    :param translation: Результат перевода.
+    :type translation: TranslationResult
+    """
+
+    task.desc.result = translation.text
+    task.translated = translation.translated
+    if not translation.translated:
+        task.desc.key = None
+
+
+# Конвейер получения описания: у каждого этапа свой пул потоков и
+# очередь, поэтому чтение, генерация, перевод и запись разных запросов
+# выполняются одновременно. Поток генерации ждет результата
+# микро-батчинга, поэтому потоков генерации не меньше размера батча,
+# иначе батч не заполняется.
+_pipeline_workers = dict(PIPELINE_WORKERS)
+if CAP_MODEL_BATCHING_ENABLED:
+    _pipeline_workers['describe'] = max(
+        _pipeline_workers['describe'], CAP_MODEL_BATCH_MAX_SIZE
+    )
+descript_pipeline = (
+    Pipeline('descript', [
+        PipelineStage(
+            name, func,
+            workers=_pipeline_workers[name],
+            queue_size=PIPELINE_QUEUE_SIZE
+        )
+        for name, func in (('read', _read_task),
+                           ('describe', _describe_task),
+                           ('translate', _translate_task),
+                           ('persist', _persist_task))
+    ]) if PIPELINE_ENABLED else None
+)
 
 
 class GetDescript(AbstractUseCase):
@@ -113,12 +946,27 @@ class GetDescript(AbstractUseCase):
     :ivar __desc_repos: Атрибут репозитория описаний, для доступа к
                         хранилищу.
     :type __desc_repos: DescriptionRepository
+
+    :ivar __caption_repos: Атрибут репозитория кеша описаний, для
+                           доступа к хранилищу.
+    :type __caption_repos: CaptionCacheRepository | None
+
+    :ivar __run_blocking: Атрибут запуска блокирующих шагов вне цикла
+                          событий в асинхронном получении описания.
+    :type __run_blocking: Callable[..., Awaitable[Any]]
+
+    :ivar __repos_scope: Атрибут получения репозиториев с собственной
+                         сессией для этапов.
+    :type __repos_scope: Callable[[], AbstractContextManager] | None
     """
 
     def __init__(
             self,
             img_repos: 'AbstractImageRepository',
-            desc_repos: 'AbstractDescriptionRepository'
+            desc_repos: 'AbstractDescriptionRepository',
+            caption_repos: 'AbstractCaptionCacheRepository | None' = None,
+            run_blocking: Callable[..., Awaitable[Any]] | None = None,
+            repos_scope: '_RepositoriesScope | None' = None
     ) -> None:
         """
         Инициализация описания изображения.
@@ -130,24 +978,110 @@ class GetDescript(AbstractUseCase):
         ::param desc_repos: Репозиторий описаний, для доступа к
                             хранилищу.
         :type desc_repos: DescriptionRepository
+
+        :param caption_repos: Репозиторий кеша описаний, для доступа к
+                              хранилищу (None - кеш только в памяти).
+        :type caption_repos: CaptionCacheRepository | None
+
+        :param run_blocking: Запуск блокирующих шагов (чтение
+                             изображения, генерация описания, запись в
+                             БД) вне цикла событий в асинхронном
+                             получении описания без конвейера (None -
+                             asyncio.to_thread).
+        :type run_blocking: Callable[..., Awaitable[Any]] | None
+
+        :param repos_scope: Получение репозиториев изображений, описаний
+                            и кеша описаний с собственной сессией: этапы
+                            выполняются в других потоках, поэтому не
+                            используют сессию запроса (None -
+                            репозитории запроса).
+        :type repos_scope: Callable[[], AbstractContextManager] | None
         """
 
         self.__img_repos = img_repos
         self.__desc_repos = desc_repos
+        self.__caption_repos = caption_repos
+        self.__run_blocking = run_blocking or asyncio.to_thread
+        self.__repos_scope = repos_scope
 
     def execute(
             self,
             uuid: 'UUID',
             name_cap_model: str,
             name_translator: str | None,
-            max_length: int | None
-    ) -> str:
+            max_length: int | None,
+            name_profile: str | None = None
+    ) -> tuple[str, str, bool]:
         """
         Получение описания изображения.
 
         Получение изображения, по его пути, из репозитория, после чего,
         с помощью директора captioning-модели, идет описание
-        изображения.
+        изображения. Если такое же изображение с теми же параметрами
+        уже описывалось, то описание берется из кеша описаний.
+
+        Описание генерируется с закрепленным клиентом профилем генерации
+        или с активным профилем контроллера нагрузки. Профиль выбирается
+        при постановке запроса, а нагрузка и задержка учитываются
+        контроллером только на этапе генерации описания.
+
+        Если включен конвейер, то этапы выполняются его пулами потоков,
+        иначе - подряд в вызывающем потоке.
+
+        :param uuid: UUID загруженного изображения.
+        :type uuid: UUID
+
+        :param name_cap_model: Название captioning-модели.
+        :type name_cap_model: str
+
+        :param name_translator: Название переводчика описания изображения.
+        :type name_translator: str | None
+
+        :param max_length: Максимальная длина описания изображения.
+        :type max_length: int | None
+
+        :param name_profile: Название профиля генерации (None - активный
+                             профиль).
+        :type name_profile: str | None
+
+        :return: Описание изображения, название профиля генерации и
+                 признак того, что описание переведено.
+        :rtype: tuple[str, str, bool]
+
+        :raises ValueError: Если нет captioning-модели.
+        :raises ValueError: Если нет переводчика.
+        :raises ValueError: Если нет профиля генерации.
+        """
+
+        task = self.__make_task(
+            uuid, name_cap_model, name_translator, max_length, name_profile
+        )
+
+        if descript_pipeline is not None:
+            task = descript_pipeline.run(task)
+        else:
+            _read_task(task)
+            _describe_task(task)
+            _translate_task(task)
+            _persist_task(task)
+
+        return task.desc.result, task.desc.profile.name, task.translated
+
+    async def aexecute(
+            self,
+            uuid: 'UUID',
+            name_cap_model: str,
+            name_translator: str | None,
+            max_length: int | None,
+            name_profile: str | None = None
+    ) -> tuple[str, str, bool]:
+        """
+        Асинхронное получение описания изображения.
+
+        То же, что и execute. Если конвейер выключен, то блокирующие
+        шаги выполняются через run_blocking, а перевод ожидается в цикле
+        событий, не занимая поток инференса на время запроса к
+        переводчику.
 
         :param uuid: UUID загруженного изображения.
         :type uuid: UUID
@@ -161,45 +1095,67 @@ class GetDescript(AbstractUseCase):
         :param max_length: Максимальная длина описания изображения.
         :type max_length: int | None
 
-        :return: Описание изображения.
-        :rtype: str
+        :param name_profile: Название профиля генерации (None - активный
+                             профиль).
+        :type name_profile: str | None
+
+        :return: Описание изображения, название профиля генерации и
+                 признак того, что описание переведено.
+        :rtype: tuple[str, str, bool]
 
         :raises ValueError: Если нет captioning-модели.
         :raises ValueError: Если нет переводчика.
+        :raises ValueError: Если нет профиля генерации.
         """
 
-        # Получение изображения.
-        img_path = self.__img_repos.get_path_by_uuid(uuid)
-        if not img_path.exists():
-            raise ValueError(f"Пути к файлу {img_path} не существует!")
-
-        try:
-            with open(img_path, 'rb') as f:
-                img = f.read()
-        except PermissionError:
-            raise PermissionError("Нет прав для получения изображения!")
-        except OSError:
-            raise OSError("Невозможно получить изображение!")
-        except Exception as e:
-            raise Exception(f"Неизвестная ошибка при получении изображения:"
-                            f" {e}!")
-
-        # Инциализация Captioning-модели.
-        if name_cap_model not in _director_mapping:
-            raise ValueError(f'Нет такой captioning-модели: {name_cap_model}')
-        director = _director_mapping[name_cap_model]
-
-        if name_translator is not None:
-            if name_translator not in _translator_mapping:
-                raise ValueError(f'Нет такого переводчика: {name_translator}')
-            translator = _translator_mapping[name_translator]
+        task = self.__make_task(
+            uuid, name_cap_model, name_translator, max_length, name_profile
+        )
+
+        if descript_pipeline is not None:
+            task = await descript_pipeline.arun(task)
         else:
-            translator = None
+            await self.__run_blocking(_read_task, task)
+            await self.__run_blocking(_describe_task, task)
 
-        director.set_translator(translator)
+            # Перевод результата описания изображения.
+            if task.translator is not None and not task.desc.cached:
+                translation = await task.translator.atranslate_result(
+                    task.desc.result
+                )
+                _apply_translation(task, translation)
+            await self.__run_blocking(_persist_task, task)
 
-        # Получение результата и сохранение в хранилище.
-        result = director.get_descript(img, max_length)
-        self.__desc_repos.set_description_by_uuid(uuid, desc=result)
+        return task.desc.result, task.desc.profile.name, task.translated
 
-        return result
+    def __make_task(
+            self,
+            uuid: 'UUID',
+            name_cap_model: str,
+            name_translator: str | None,
+            max_length: int | None,
+            name_profile: str | None
+    ) -> _DescriptTask:
+        """
+        Создание задачи получения описания изображения.
+
+        :return: Задача получения описания изображения.
+        :rtype: _DescriptTask
+
+        :raises ValueError: Если нет переводчика.
+        :raises ValueError: Если нет профиля генерации.
+        """
+
+        return _DescriptTask(
+            uuid=uuid,
+            name_cap_model=name_cap_model,
+            name_translator=name_translator,
+            max_length=max_length,
+            name_profile=name_profile,
+            profile=generation_controller.select(name_profile),
+            translator=_get_translator(name_translator),
+            img_repos=self.__img_repos,
+            desc_repos=self.__desc_repos,
+            caption_repos=self.__caption_repos,
+            repos_scope=self.__repos_scope
+        )
@@ -0,0 +1,126 @@
+from typing import TYPE_CHECKING, Sequence
+
+from use_cases.base import AbstractUseCase
+from use_cases.get_descript import (
+    generation_controller,
+    _profile_max_length,
+    _read_img,
+    _get_director,
+    _get_translator
+)
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from infrastructure.db import (
+        AbstractImageRepository,
+        AbstractDescriptionRepository
+    )
+
+
+class GetDescriptBatch(AbstractUseCase):
+    """
+    Получение описаний батча изображений.
+
+    :ivar __img_repos: Атрибут репозитория изображений, для доступа к
+                       хранилищу.
+    :type __img_repos: ImageRepository
+
+    :ivar __desc_repos: Атрибут репозитория описаний, для доступа к
+                        хранилищу.
+    :type __desc_repos: DescriptionRepository
+    """
+
+    def __init__(
+            self,
+            img_repos: 'AbstractImageRepository',
+            desc_repos: 'AbstractDescriptionRepository'
+    ) -> None:
+        """
+        Инициализация описания батча изображений.
+
+        :param img_repos: Репозиторий изображений, для доступа к
+                          хранилищу.
+        :type img_repos: ImageRepository
+
+        :param desc_repos: Репозиторий описаний, для доступа к
+                           хранилищу.
+        :type desc_repos: DescriptionRepository
+        """
+
+        self.__img_repos = img_repos
+        self.__desc_repos = desc_repos
+
+    def execute(
+            self,
+            uuids: Sequence['UUID'],
+            name_cap_model: str,
+            name_translator: str | None,
+            max_lengths: int | Sequence[int | None] | None,
+            name_profile: str | None = None
+    ) -> tuple[list[str], str]:
+        """
+        Получение описаний батча изображений.
+
+        Все изображения описываются одним батчевым вызовом
+        captioning-модели (с закрепленным клиентом или активным
+        профилем генерации), после чего описания сохраняются в
+        хранилище.
+
+        :param uuids: UUID загруженных изображений.
+        :type uuids: Sequence[UUID]
+
+        :param name_cap_model: Название captioning-модели.
+        :type name_cap_model: str
+
+        :param name_translator: Название переводчика описания изображения.
+        :type name_translator: str | None
+
+        :param max_lengths: Максимальная длина описания для всех
+                            изображений или для каждого изображения.
+        :type max_lengths: int | Sequence[int | None] | None
+
+        :param name_profile: Название профиля генерации (None - активный
+                             профиль).
+        :type name_profile: str | None
+
+        :return: Описания изображений в порядке UUID и название профиля
+                 генерации.
+        :rtype: tuple[list[str], str]
+
+        :raises ValueError: Если нет профиля генерации.
+        """
+
+        # Получение изображений.
+        images = [_read_img(self.__img_repos, uuid) for uuid in uuids]
+
+        # Инциализация Captioning-модели (перевод выполняется отдельно).
+        director = _get_director(name_cap_model, None)
+        translator = _get_translator(name_translator)
+
+        # Выбор профиля генерации.
+        profile = generation_controller.select(name_profile)
+        if max_lengths is None or isinstance(max_lengths, int):
+            max_lengths = _profile_max_length(max_lengths, profile)
+        else:
+            max_lengths = [
+                _profile_max_length(length, profile) for length in max_lengths
+            ]
+
+        # Получение результатов и сохранение в хранилище.
+        with generation_controller.track(profile,
+                                         pinned=name_profile is not None):
+            results = director.get_descript_batch(
+                images, max_lengths, profile
+            )
+
+        # Перевод результатов описания изображений.
+        if translator is not None:
+            results = [
+                translation.text
+                for translation in translator.translate_batch_result(results)
+            ]
+        for uuid, result in zip(uuids, results):
+            self.__desc_repos.set_description_by_uuid(uuid, desc=result)
+
+        return results, profile.name
@@ -0,0 +1,183 @@
+from typing import TYPE_CHECKING, Iterator
+
+from use_cases.base import AbstractUseCase
+from use_cases.get_descript import (
+    caption_cache,
+    generation_controller,
+    _profile_max_length,
+    _read_img,
+    _get_director,
+    _get_translator
+)
+from infrastructure.config import TRANS_MODEL_SETTINGS
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from infrastructure.db import (
+        AbstractCaptionCacheRepository,
+        AbstractImageRepository,
+        AbstractDescriptionRepository
+    )
+
+
+class GetDescriptStream(AbstractUseCase):
+    """
+    Потоковое получение описания изображения.
+
+    :ivar __img_repos: Атрибут репозитория изображений, для доступа к
+                       хранилищу.
+    :type __img_repos: ImageRepository
+
+    :ivar __desc_repos: Атрибут репозитория описаний, для доступа к
+                        хранилищу.
+    :type __desc_repos: DescriptionRepository
+
+    :ivar __caption_repos: Атрибут репозитория кеша описаний, для
+                           доступа к хранилищу.
+    :type __caption_repos: CaptionCacheRepository | None
+    """
+
+    def __init__(
+            self,
+            img_repos: 'AbstractImageRepository',
+            desc_repos: 'AbstractDescriptionRepository',
+            caption_repos: 'AbstractCaptionCacheRepository | None' = None
+    ) -> None:
+        """
+        Инициализация потокового описания изображения.
+
+        :param img_repos: Репозиторий изображений, для доступа к
+                          хранилищу.
+        :type img_repos: ImageRepository
+
+        :param desc_repos: Репозиторий описаний, для доступа к
+                           хранилищу.
+        :type desc_repos: DescriptionRepository
+
+        :param caption_repos: Репозиторий кеша описаний, для доступа к
+                              хранилищу (None - кеш только в памяти).
+        :type caption_repos: CaptionCacheRepository | None
+        """
+
+        self.__img_repos = img_repos
+        self.__desc_repos = desc_repos
+        self.__caption_repos = caption_repos
+
+    def execute(
+            self,
+            uuid: 'UUID',
+            name_cap_model: str,
+            name_translator: str | None,
+            max_length: int | None,
+            name_profile: str | None = None
+    ) -> tuple[Iterator[str], str]:
+        """
+        Потоковое получение описания изображения.
+
+        Изображение и директор captioning-модели получаются сразу, чтобы
+        ошибки параметров возникали до начала генерации. Частичные
+        описания отдаются по мере генерации, а полное описание
+        сохраняется в хранилище и кеш описаний. Описание из кеша
+        отдается сразу целиком. Профиль генерации выбирается сразу, а
+        нагрузка учитывается контроллером на время генерации.
+        Непереведенное описание (все переводчики недоступны) отдается,
+        но не сохраняется в кеш описаний. Полное описание сохраняется в
+        хранилище и тогда, когда клиент перестал читать поток после его
+        получения, а если модель не выдала описания, то ничего не
+        сохраняется.
+
+        :param uuid: UUID загруженного изображения.
+        :type uuid: UUID
+
+        :param name_cap_model: Название captioning-модели.
+        :type name_cap_model: str
+
+        :param name_translator: Название переводчика описания изображения.
+        :type name_translator: str | None
+
+        :param max_length: Максимальная длина описания изображения.
+        :type max_length: int | None
+
+        :param name_profile: Название профиля генерации (None - активный
+                             профиль).
+        :type name_profile: str | None
+
+        :return: Итератор частичных описаний (последнее - полное
+                 описание) и название профиля генерации.
+        :rtype: tuple[Iterator[str], str]
+
+        :raises ValueError: Если нет captioning-модели.
+        :raises ValueError: Если нет переводчика.
+        :raises ValueError: Если нет профиля генерации.
+        """
+
+        # Получение изображения.
+        img = _read_img(self.__img_repos, uuid)
+
+        # Инциализация Captioning-модели (перевод выполняется отдельно,
+        # чтобы знать, переведено ли описание).
+        director = _get_director(name_cap_model, None)
+        translator = _get_translator(name_translator)
+
+        # Выбор профиля генерации.
+        profile = generation_controller.select(name_profile)
+        max_length = _profile_max_length(max_length, profile)
+
+        # Получение результата из кеша описаний.
+        key, cached = None, None
+        if caption_cache is not None:
+            key = caption_cache.make_key(
+                img,
+                name_cap_model,
+                max_length,
+                name_translator,
+                (TRANS_MODEL_SETTINGS[name_translator]['lang']
+                 if name_translator is not None else None),
+                profile.name
+            )
+            cached = caption_cache.get(key, self.__caption_repos)
+
+        def stream() -> Iterator[str]:
+            # Полное описание, которое сохраняется в хранилище, даже если
+            # клиент перестал читать поток после его получения.
+            result = None
+            try:
+                if cached is not None:
+                    result = cached
+                    yield result
+                    return
+
+                partial = None
+                with generation_controller.track(
+                        profile, pinned=name_profile is not None
+                ):
+                    for partial in director.get_descript_stream(
+                            img, max_length, profile
+                    ):
+                        yield partial
+                if partial is None:
+                    return
+
+                # Перевод полного описания.
+                full, translated = partial, True
+                if translator is not None:
+                    translation = translator.translate_result(partial)
+                    full, translated = (translation.text,
+                                        translation.translated)
+
+                if caption_cache is not None and translated:
+                    caption_cache.put(
+                        key, name_cap_model, full, self.__caption_repos
+                    )
+                result = full
+                if translator is not None:
+                    yield result
+            finally:
+                # Сохранение полного результата в хранилище.
+                if result is not None:
+                    self.__desc_repos.set_description_by_uuid(
+                        uuid, desc=result
+                    )
+
+        return stream(), profile.name
@@ -0,0 +1,114 @@
+from dataclasses import asdict
+from typing import Any, Callable
+
+from use_cases.base import AbstractUseCase
+from use_cases.get_descript import (
+    cap_model_embeds_caches,
+    cap_model_registry,
+    cap_model_token_cache,
+    cap_model_worker_pools,
+    caption_cache,
+    descript_pipeline,
+    generation_controller,
+    translation_batchers,
+    translation_breakers,
+    translation_cache,
+    translation_clients,
+    translation_models,
+    _director_mapping,
+    _resilient_mapping
+)
+from use_cases.warm_up import warm_up_state
+
+
+def _batcher_stats() -> dict[str, Any]:
+    """
+    Получение счетчиков движков микро-батчинга по captioning-моделям.
+
+    Учитываются только уже созданные директоры, чтобы сбор метрик не
+    загружал captioning-модели.
+
+    :return: Счетчики движков по названиям captioning-моделей.
+    :rtype: dict[str, Any]
+    """
+
+    result = {}
+    for name, director in _director_mapping.loaded().items():
+        stats = director.get_batcher_stats()
+        if stats is not None:
+            result[name] = asdict(stats)
+
+    return result
+
+
+_metrics_mapping: dict[str, Callable[[], dict[str, Any]]] = {
+    'cap_model_registry': lambda: asdict(cap_model_registry.stats()),
+    'cap_model_batcher': _batcher_stats,
+    'cap_model_worker_pool': lambda: {
+        name: asdict(pool.stats())
+        for name, pool in cap_model_worker_pools.items()
+    },
+    'cap_model_embeds_cache': lambda: (
+        asdict(cap_model_embeds_caches['embeds'].stats())
+        if 'embeds' in cap_model_embeds_caches.loaded() else {}
+    ),
+    'cap_model_token_cache': lambda: (
+        asdict(cap_model_token_cache.stats())
+        if cap_model_token_cache is not None else {}
+    ),
+    'caption_cache': lambda: (
+        asdict(caption_cache.stats()) if caption_cache is not None else {}
+    ),
+    'translation_cache': lambda: (
+        asdict(translation_cache.stats())
+        if translation_cache is not None else {}
+    ),
+    'translation_batcher': lambda: {
+        name: asdict(batcher.stats())
+        for name, batcher in translation_batchers.items()
+    },
+    'translation_client': lambda: {
+        name: asdict(client.stats())
+        for name, client in translation_clients.items()
+    },
+    'translation_model': lambda: {
+        name: asdict(model.stats())
+        for name, model in translation_models.items()
+    },
+    'translation_resilience': lambda: {
+        'breakers': {
+            name: asdict(breaker.stats())
+            for name, breaker in translation_breakers.items()
+        },
+        'translators': {
+            name: asdict(translator.stats())
+            for name, translator in _resilient_mapping.loaded().items()
+        }
+    },
+    'pipeline': lambda: (
+        {
+            name: asdict(stage)
+            for name, stage in descript_pipeline.stats().items()
+        }
+        if descript_pipeline is not None else {}
+    ),
+    'generation_profiles': lambda: asdict(generation_controller.stats()),
+    'warm_up': lambda: asdict(warm_up_state.stats())
+}
+
+
+class GetMetrics(AbstractUseCase):
+    """ Получение метрик сервиса."""
+
+    def execute(self) -> dict[str, Any]:
+        """
+        Получение метрик сервиса.
+
+        Сбор счетчиков со всех источников метрик (реестр
+        captioning-моделей и т.д.).
+
+        :return: Метрики сервиса по названиям источников.
+        :rtype: dict[str, Any]
+        """
+
+        return {name: source() for name, source in _metrics_mapping.items()}
@@ -0,0 +1,19 @@
+from use_cases.base import AbstractUseCase
+from use_cases.warm_up import WarmUpStats, warm_up_state
+
+
+class GetReadiness(AbstractUseCase):
+    """ Получение готовности сервиса к обработке запросов."""
+
+    def execute(self) -> WarmUpStats:
+        """
+        Получение готовности сервиса.
+
+        Сервис готов, когда прогрев captioning-моделей закончен и
+        прогрета хотя бы одна модель.
+
+        :return: Счетчики прогрева captioning-моделей.
+        :rtype: WarmUpStats
+        """
+
+        return warm_up_state.stats()
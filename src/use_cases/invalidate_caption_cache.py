@@ -0,0 +1,51 @@
+from typing import TYPE_CHECKING
+
+from use_cases.base import AbstractUseCase
+from use_cases.get_descript import caption_cache
+
+if TYPE_CHECKING:
+    from infrastructure.db import AbstractCaptionCacheRepository
+
+
+class InvalidateCaptionCache(AbstractUseCase):
+    """
+    Инвалидация кеша описаний изображений.
+
+    :ivar __caption_repos: Атрибут репозитория кеша описаний, для
+                           доступа к хранилищу.
+    :type __caption_repos: CaptionCacheRepository
+    """
+
+    def __init__(
+            self,
+            caption_repos: 'AbstractCaptionCacheRepository'
+    ) -> None:
+        """
+        Инициализация инвалидации кеша описаний.
+
+        :param caption_repos: Репозиторий кеша описаний, для доступа к
+                              хранилищу.
+        :type caption_repos: CaptionCacheRepository
+        """
+
+        self.__caption_repos = caption_repos
+
+    def execute(self, name_cap_model: str | None) -> int:
+        """
+        Удаление описаний captioning-модели из кеша описаний.
+
+        Нужно после замены весов модели, чтобы не отдавать описания
+        старых весов.
+
+        :param name_cap_model: Название captioning-модели (None - все
+                               модели).
+        :type name_cap_model: str | None
+
+        :return: Количество удаленных описаний.
+        :rtype: int
+        """
+
+        if caption_cache is None:
+            return self.__caption_repos.delete_captions(name_cap_model)
+
+        return caption_cache.invalidate(name_cap_model, self.__caption_repos)
@@ -0,0 +1,332 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from logging import getLogger
+from typing import Any, Callable, Sequence
+
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class PipelineStage:
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+    queue_size: int = 8
+
+
+@dataclass
+class PipelineStageStats:
+    workers: int = 0
+    queue_size: int = 0
+    queue_depth: int = 0
+    waiting: int = 0
+    busy: int = 0
+    processed: int = 0
+    failed: int = 0
+    throughput: float = 0.0
+    mean_latency: float = 0.0
+    mean_wait_time: float = 0.0
+    blocked_time: float = 0.0
+
+
+@dataclass
+class _PipelineJob:
+    item: Any
+    future: Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class _Stage:
+    """
+    Этап конвейера: очередь ограниченного размера и пул потоков,
+    выполняющих функцию этапа.
+    """
+
+    def __init__(self, spec: PipelineStage) -> None:
+        if spec.workers < 1:
+            raise ValueError(f"Количество потоков этапа {spec.name} должно "
+                             "быть больше 0!")
+        if spec.queue_size < 1:
+            raise ValueError(f"Размер очереди этапа {spec.name} должен быть "
+                             "больше 0!")
+
+        self.spec = spec
+        self.queue: queue.Queue[_PipelineJob | None] = queue.Queue(
+            maxsize=spec.queue_size
+        )
+        self.workers: list[threading.Thread] = []
+        self.lock = threading.Lock()
+
+        self.waiting = 0
+        self.busy = 0
+        self.processed = 0
+        self.failed = 0
+        self.started_at: float | None = None
+        self.latency_total = 0.0
+        self.wait_time_total = 0.0
+        self.blocked_time_total = 0.0
+
+    def put(self, job: _PipelineJob) -> None:
+        """
+        Постановка задачи в очередь этапа.
+
+        Если очередь заполнена, то вызывающий поток ждет освобождения
+        места, поэтому медленный этап сдерживает предыдущие. Ждущие
+        потоки учитываются в нагрузке этапа.
+        """
+
+        with self.lock:
+            self.waiting += 1
+        job.enqueued_at = time.perf_counter()
+        try:
+            self.queue.put(job)
+        finally:
+            with self.lock:
+                self.waiting -= 1
+                self.blocked_time_total += (time.perf_counter()
+                                            - job.enqueued_at)
+
+    def stats(self) -> PipelineStageStats:
+        with self.lock:
+            done = self.processed + self.failed
+            elapsed = (time.perf_counter() - self.started_at
+                       if self.started_at is not None else 0.0)
+            return PipelineStageStats(
+                workers=self.spec.workers,
+                queue_size=self.spec.queue_size,
+                queue_depth=self.queue.qsize(),
+                waiting=self.waiting,
+                busy=self.busy,
+                processed=self.processed,
+                failed=self.failed,
+                throughput=self.processed / elapsed if elapsed else 0.0,
+                mean_latency=self.latency_total / done if done else 0.0,
+                mean_wait_time=self.wait_time_total / done if done else 0.0,
+                blocked_time=self.blocked_time_total
+            )
+
+
+class Pipeline:
+    """
+    Конвейер обработки запросов по этапам.
+
+    У каждого этапа свой пул потоков и очередь ограниченного размера
+    перед ним. Результат этапа передается в очередь следующего этапа, а
+    результат последнего этапа - в future запроса. Поэтому этапы разных
+    запросов выполняются одновременно: пока один запрос ждет
+    переводчика, следующий уже генерируется моделью. Если очередь
+    этапа заполнена, то поток предыдущего этапа (или отправитель
+    запроса) ждет, то есть медленный этап сдерживает весь конвейер, а
+    не копит запросы в памяти.
+
+    Ошибка этапа завершает future запроса этой ошибкой, и следующие
+    этапы для него не выполняются. Отмененные запросы пропускаются.
+
+    :ivar __name: Атрибут названия конвейера (префикс имен потоков).
+    :type __name: str
+
+    :ivar __stages: Атрибут этапов конвейера по порядку.
+    :type __stages: list[_Stage]
+
+    :ivar __started: Атрибут запущенных потоков этапов.
+    :type __started: bool
+    """
+
+    def __init__(self, name: str, stages: Sequence[PipelineStage]) -> None:
+        """
+        Инициализация конвейера.
+
+        Потоки этапов запускаются при первом запросе.
+
+        :param name: Название конвейера (префикс имен потоков).
+        :type name: str
+
+        :param stages: Этапы конвейера по порядку.
+        :type stages: Sequence[PipelineStage]
+
+        :raises ValueError: Если нет этапов.
+        :raises ValueError: Если названия этапов повторяются.
+        :raises ValueError: Если количество потоков или размер очереди
+                            этапа меньше 1.
+        """
+
+        if not stages:
+            raise ValueError("У конвейера должен быть хотя бы один этап!")
+        names = [stage.name for stage in stages]
+        if len(set(names)) != len(names):
+            raise ValueError("Названия этапов конвейера не должны "
+                             "повторяться!")
+
+        self.__name = name
+        self.__stages = [_Stage(stage) for stage in stages]
+        self.__started = False
+        self.__lock = threading.Lock()
+
+    def submit(self, item: Any) -> Future:
+        """
+        Постановка запроса в конвейер.
+
+        Ждет, если очередь первого этапа заполнена.
+
+        :param item: Запрос, передаваемый функции первого этапа.
+        :type item: Any
+
+        :return: Future с результатом последнего этапа.
+        :rtype: Future
+        """
+
+        self.__start()
+        future = Future()
+        self.__stages[0].put(_PipelineJob(item, future))
+
+        return future
+
+    def run(self, item: Any) -> Any:
+        """
+        Обработка запроса конвейером с ожиданием результата.
+
+        :param item: Запрос, передаваемый функции первого этапа.
+        :type item: Any
+
+        :return: Результат последнего этапа.
+        :rtype: Any
+
+        :raises Exception: Если ошибка на одном из этапов.
+        """
+
+        return self.submit(item).result()
+
+    async def arun(self, item: Any) -> Any:
+        """
+        Асинхронная обработка запроса конвейером.
+
+        Постановка в очередь (которая может ждать из-за сдерживания)
+        выполняется вне цикла событий.
+
+        :param item: Запрос, передаваемый функции первого этапа.
+        :type item: Any
+
+        :return: Результат последнего этапа.
+        :rtype: Any
+
+        :raises Exception: Если ошибка на одном из этапов.
+        """
+
+        future = await asyncio.to_thread(self.submit, item)
+
+        return await asyncio.wrap_future(future)
+
+    def pending(self, name: str) -> int:
+        """
+        Получение количества запросов в очереди и в работе этапа, а
+        также ждущих места в его заполненной очереди (отправителей
+        запросов или потоков предыдущего этапа).
+
+        :param name: Название этапа.
+        :type name: str
+
+        :return: Количество запросов этапа.
+        :rtype: int
+
+        :raises ValueError: Если нет такого этапа.
+        """
+
+        stage = self.__get_stage(name)
+        with stage.lock:
+            return stage.queue.qsize() + stage.waiting + stage.busy
+
+    def stats(self) -> dict[str, PipelineStageStats]:
+        """
+        Получение счетчиков этапов конвейера.
+
+        :return: Копии счетчиков по названиям этапов.
+        :rtype: dict[str, PipelineStageStats]
+        """
+
+        return {stage.spec.name: stage.stats() for stage in self.__stages}
+
+    def close(self) -> None:
+        """
+        Остановка потоков этапов.
+
+        Запросы, уже стоящие в очередях, обрабатываются до остановки.
+        """
+
+        with self.__lock:
+            started, self.__started = self.__started, False
+        if not started:
+            return
+
+        for stage in self.__stages:
+            for _ in stage.workers:
+                stage.queue.put(None)
+            for worker in stage.workers:
+                worker.join()
+            stage.workers = []
+
+    def __get_stage(self, name: str) -> _Stage:
+        for stage in self.__stages:
+            if stage.spec.name == name:
+                return stage
+        raise ValueError(f"Нет такого этапа конвейера: {name}!")
+
+    def __start(self) -> None:
+        with self.__lock:
+            if self.__started:
+                return
+            for i, stage in enumerate(self.__stages):
+                stage.started_at = time.perf_counter()
+                for j in range(stage.spec.workers):
+                    worker = threading.Thread(
+                        target=self.__run,
+                        args=(i,),
+                        name=f'{self.__name}-{stage.spec.name}-{j}',
+                        daemon=True
+                    )
+                    worker.start()
+                    stage.workers.append(worker)
+            self.__started = True
+
+    def __run(self, index: int) -> None:
+        stage = self.__stages[index]
+        next_stage = (self.__stages[index + 1]
+                      if index + 1 < len(self.__stages) else None)
+
+        while (job := stage.queue.get()) is not None:
+            # Отмененный до начала обработки запрос пропускается, а
+            # начатый уже нельзя отменить.
+            if index == 0 and not job.future.set_running_or_notify_cancel():
+                continue
+
+            started_at = time.perf_counter()
+            with stage.lock:
+                stage.busy += 1
+                stage.wait_time_total += started_at - job.enqueued_at
+
+            try:
+                result = stage.spec.func(job.item)
+            except Exception as e:
+                result, error = None, e
+            else:
+                error = None
+
+            with stage.lock:
+                stage.busy -= 1
+                stage.latency_total += time.perf_counter() - started_at
+                if error is None:
+                    stage.processed += 1
+                else:
+                    stage.failed += 1
+
+            if error is not None:
+                logger.debug(f"Ошибка на этапе {stage.spec.name}: {error}")
+                job.future.set_exception(error)
+            elif next_stage is None:
+                job.future.set_result(result)
+            else:
+                next_stage.put(_PipelineJob(result, job.future))
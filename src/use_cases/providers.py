@@ -0,0 +1,94 @@
+import threading
+from collections.abc import Mapping
+from typing import Callable, Generic, Iterator, TypeVar
+
+
+T = TypeVar('T')
+
+
+class LazyProviderRegistry(Mapping[str, T], Generic[T]):
+    """
+    Реестр провайдеров, создаваемых при первом обращении.
+
+    Названия провайдеров известны сразу, а сами провайдеры (директоры
+    captioning-моделей, переводчики) и их тяжелые зависимости
+    (transformers, googletrans и т.д.) создаются и импортируются только
+    при первом обращении по названию.
+
+    :ivar __factories: Атрибут фабрик провайдеров по названиям.
+    :type __factories: dict[str, Callable[[], T]]
+
+    :ivar __providers: Атрибут созданных провайдеров по названиям.
+    :type __providers: dict[str, T]
+
+    :ivar __lock: Атрибут блокировки создания провайдеров.
+    :type __lock: threading.Lock
+    """
+
+    def __init__(self, factories: dict[str, Callable[[], T]]) -> None:
+        """
+        Инициализация реестра провайдеров.
+
+        :param factories: Фабрики провайдеров по названиям.
+        :type factories: dict[str, Callable[[], T]]
+        """
+
+        self.__factories = dict(factories)
+        self.__providers: dict[str, T] = {}
+        self.__lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> T:
+        """
+        Получение провайдера по названию.
+
+        Провайдер создается один раз, даже при параллельных обращениях.
+
+        :param name: Название провайдера.
+        :type name: str
+
+        :return: Провайдер.
+        :rtype: T
+
+        :raises KeyError: Если нет провайдера.
+        """
+
+        provider = self.__providers.get(name)
+        if provider is not None:
+            return provider
+
+        factory = self.__factories[name]
+        with self.__lock:
+            if name not in self.__providers:
+                self.__providers[name] = factory()
+
+            return self.__providers[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.__factories
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__factories)
+
+    def __len__(self) -> int:
+        return len(self.__factories)
+
+    def warm(self) -> None:
+        """
+        Создание всех провайдеров заранее, а не при первом обращении.
+        """
+
+        with self.__lock:
+            for name, factory in self.__factories.items():
+                if name not in self.__providers:
+                    self.__providers[name] = factory()
+
+    def loaded(self) -> dict[str, T]:
+        """
+        Получение уже созданных провайдеров.
+
+        :return: Созданные провайдеры по названиям.
+        :rtype: dict[str, T]
+        """
+
+        with self.__lock:
+            return dict(self.__providers)
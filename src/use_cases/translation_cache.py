@@ -0,0 +1,232 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from entities.translators import AbstractTranslationCache
+
+if TYPE_CHECKING:
+    from infrastructure.db import AbstractTranslationCacheRepository
+
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class TranslationCacheStats:
+    hits: int = 0
+    db_hits: int = 0
+    misses: int = 0
+    hit_rate: float = 0.0
+    evictions: int = 0
+    db_errors: int = 0
+    entries: int = 0
+    max_entries: int = 0
+    persistent: bool = False
+
+
+class TranslationCache(AbstractTranslationCache):
+    """
+    Двухуровневый кеш переводов описаний изображений.
+
+    Первый уровень - LRU в памяти процесса, второй - таблица в БД
+    (через репозиторий кеша переводов, назначаемый при запуске
+    приложения). Ключ перевода - название переводчика и хеш языка
+    перевода и исходного текста. Переводы не устаревают: перевод одной
+    и той же фразы не меняется.
+
+    :ivar __max_entries: Атрибут максимального количества переводов в
+                         памяти.
+    :type __max_entries: int
+
+    :ivar __entries: Атрибут переводов в памяти, упорядоченных по
+                     времени последнего обращения.
+    :type __entries: OrderedDict[str, str]
+
+    :ivar __repos: Атрибут репозитория кеша переводов (None - только
+                   память).
+    :type __repos: AbstractTranslationCacheRepository | None
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Инициализация кеша переводов.
+
+        :param max_entries: Максимальное количество переводов в памяти.
+        :type max_entries: int
+
+        :raises ValueError: Если максимальное количество переводов
+                            меньше 1.
+        """
+
+        if max_entries < 1:
+            raise ValueError("Максимальное количество переводов в кеше "
+                             "должно быть больше 0!")
+
+        self.__max_entries = max_entries
+        self.__entries: OrderedDict[str, str] = OrderedDict()
+        self.__repos: 'AbstractTranslationCacheRepository | None' = None
+        self.__lock = threading.Lock()
+        self.__stats = TranslationCacheStats(max_entries=max_entries)
+
+    def set_repository(
+            self,
+            repos: 'AbstractTranslationCacheRepository | None'
+    ) -> None:
+        """
+        Назначение репозитория кеша переводов.
+
+        :param repos: Репозиторий кеша переводов (None - только память).
+        :type repos: AbstractTranslationCacheRepository | None
+        """
+
+        self.__repos = repos
+
+    @staticmethod
+    def make_key(provider: str, lang: str, text: str) -> str:
+        """
+        Получение ключа перевода.
+
+        :param provider: Название переводчика.
+        :type provider: str
+
+        :param lang: Язык перевода.
+        :type lang: str
+
+        :param text: Исходный текст.
+        :type text: str
+
+        :return: Ключ перевода.
+        :rtype: str
+        """
+
+        digest = hashlib.sha256(f"{lang}|{text}".encode())
+
+        return f"{provider}:{digest.hexdigest()}"
+
+    def get(self, provider: str, lang: str, text: str) -> str | None:
+        """
+        Получение перевода из кеша.
+
+        Сначала перевод ищется в памяти, затем в БД. Найденный в БД
+        перевод переносится в память.
+
+        :param provider: Название переводчика.
+        :type provider: str
+
+        :param lang: Язык перевода.
+        :type lang: str
+
+        :param text: Исходный текст.
+        :type text: str
+
+        :return: Перевод или None, если его нет в кеше.
+        :rtype: str | None
+        """
+
+        key = self.make_key(provider, lang, text)
+        with self.__lock:
+            translation = self.__entries.get(key)
+            if translation is not None:
+                self.__entries.move_to_end(key)
+                self.__stats.hits += 1
+                return translation
+
+        repos = self.__repos
+        if repos is not None:
+            try:
+                translation = repos.get_translation(key)
+            except Exception as e:
+                logger.warning(f"Кеш переводов в БД недоступен: {e}")
+                translation = None
+                with self.__lock:
+                    self.__stats.db_errors += 1
+
+            if translation is not None:
+                with self.__lock:
+                    self.__stats.db_hits += 1
+                    self.__insert(key, translation)
+                return translation
+
+        with self.__lock:
+            self.__stats.misses += 1
+
+        return None
+
+    def put(
+            self,
+            provider: str,
+            lang: str,
+            text: str,
+            translation: str
+    ) -> None:
+        """
+        Сохранение перевода в кеш.
+
+        :param provider: Название переводчика.
+        :type provider: str
+
+        :param lang: Язык перевода.
+        :type lang: str
+
+        :param text: Исходный текст.
+        :type text: str
+
+        :param translation: Перевод.
+        :type translation: str
+        """
+
+        key = self.make_key(provider, lang, text)
+        with self.__lock:
+            self.__insert(key, translation)
+
+        repos = self.__repos
+        if repos is not None:
+            try:
+                repos.set_translation(
+                    key,
+                    provider=provider,
+                    lang=lang,
+                    text=text,
+                    translation=translation,
+                    created_at=time.time()
+                )
+            except Exception as e:
+                logger.warning(f"Невозможно записать перевод в кеш в БД: "
+                               f"{e}")
+                with self.__lock:
+                    self.__stats.db_errors += 1
+
+    def stats(self) -> TranslationCacheStats:
+        """
+        Получение счетчиков кеша.
+
+        :return: Копия счетчиков кеша.
+        :rtype: TranslationCacheStats
+        """
+
+        with self.__lock:
+            stats = self.__stats
+            lookups = stats.hits + stats.db_hits + stats.misses
+            return TranslationCacheStats(
+                hits=stats.hits,
+                db_hits=stats.db_hits,
+                misses=stats.misses,
+                hit_rate=((stats.hits + stats.db_hits) / lookups
+                          if lookups else 0.0),
+                evictions=stats.evictions,
+                db_errors=stats.db_errors,
+                entries=len(self.__entries),
+                max_entries=stats.max_entries,
+                persistent=self.__repos is not None
+            )
+
+    def __insert(self, key: str, translation: str) -> None:
+        self.__entries[key] = translation
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.__max_entries:
+            self.__entries.popitem(last=False)
+            self.__stats.evictions += 1
@@ -0,0 +1,280 @@
+import io
+import os
+import time
+import threading
+from dataclasses import dataclass, field
+from logging import getLogger
+
+from PIL import Image
+
+from use_cases.base import AbstractUseCase
+from use_cases.get_descript import (
+    generation_controller,
+    translation_models,
+    _director_mapping,
+    _get_director,
+    _translator_mapping
+)
+from infrastructure.config import (
+    WARM_UP_ENABLED,
+    WARM_UP_ITERATIONS,
+    WARM_UP_BATCH_SIZES,
+    WARM_UP_IMAGE_SIZE,
+    WARM_UP_TRANSLATORS,
+    DEFAULT_LENGTH_DESCRIPTION
+)
+
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class WarmUpStats:
+    status: str = 'pending'
+    started_at: float = 0.0
+    finished_at: float = 0.0
+    duration: float = 0.0
+    timings: dict[str, dict[int, list[float]]] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ready(self) -> bool:
+        """ Готов ли сервис принимать запросы."""
+
+        return self.status in ('ready', 'degraded')
+
+
+class WarmUpState:
+    """
+    Состояние прогрева captioning-моделей процесса.
+
+    Статусы: pending - прогрев не начат, running - идет прогрев, ready -
+    все модели прогреты, degraded - часть моделей не прогрета, failed -
+    ни одна модель не прогрета.
+
+    :ivar __stats: Атрибут счетчиков прогрева.
+    :type __stats: WarmUpStats
+
+    :ivar __lock: Атрибут блокировки состояния прогрева.
+    :type __lock: threading.Lock
+    """
+
+    def __init__(self) -> None:
+        """ Инициализация состояния прогрева."""
+
+        self.__stats = WarmUpStats()
+        self.__lock = threading.Lock()
+
+    def start(self) -> None:
+        """ Отметка начала прогрева."""
+
+        with self.__lock:
+            self.__stats = WarmUpStats(status='running',
+                                       started_at=time.time())
+
+    def record(self, name: str, batch_size: int, duration: float) -> None:
+        """
+        Запись длительности прогона прогрева.
+
+        :param name: Название captioning-модели.
+        :type name: str
+
+        :param batch_size: Размер батча прогона.
+        :type batch_size: int
+
+        :param duration: Длительность прогона в секундах.
+        :type duration: float
+        """
+
+        with self.__lock:
+            timings = self.__stats.timings.setdefault(name, {})
+            timings.setdefault(batch_size, []).append(duration)
+
+    def fail(self, name: str, error: str) -> None:
+        """
+        Запись ошибки прогрева captioning-модели.
+
+        :param name: Название captioning-модели.
+        :type name: str
+
+        :param error: Текст ошибки.
+        :type error: str
+        """
+
+        with self.__lock:
+            self.__stats.errors[name] = error
+
+    def finish(self, total: int) -> None:
+        """
+        Отметка окончания прогрева.
+
+        :param total: Количество прогреваемых captioning-моделей.
+        :type total: int
+        """
+
+        with self.__lock:
+            failed = len(self.__stats.errors)
+            if failed == 0:
+                self.__stats.status = 'ready'
+            elif failed < total:
+                self.__stats.status = 'degraded'
+            else:
+                self.__stats.status = 'failed'
+            self.__stats.finished_at = time.time()
+            if self.__stats.started_at:
+                self.__stats.duration = (self.__stats.finished_at
+                                         - self.__stats.started_at)
+
+    def stats(self) -> WarmUpStats:
+        """
+        Получение счетчиков прогрева.
+
+        :return: Копия счетчиков прогрева.
+        :rtype: WarmUpStats
+        """
+
+        with self.__lock:
+            return WarmUpStats(
+                status=self.__stats.status,
+                started_at=self.__stats.started_at,
+                finished_at=self.__stats.finished_at,
+                duration=self.__stats.duration,
+                timings={
+                    name: {size: list(runs) for size, runs in sizes.items()}
+                    for name, sizes in self.__stats.timings.items()
+                },
+                errors=dict(self.__stats.errors)
+            )
+
+
+warm_up_state = WarmUpState()
+
+
+def _make_images(count: int) -> list[bytes]:
+    """
+    Создание JPEG-изображений из шума для прогрева.
+
+    Изображения каждый раз разные, чтобы прогон не попадал в кеши
+    эмбеддингов и токенов и проходил всю модель.
+
+    :param count: Количество изображений.
+    :type count: int
+
+    :return: Изображения.
+    :rtype: list[bytes]
+    """
+
+    width, height = WARM_UP_IMAGE_SIZE
+    images = []
+    for _ in range(count):
+        image = Image.frombytes('RGB', (width, height),
+                                os.urandom(width * height * 3))
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=90)
+        images.append(buffer.getvalue())
+
+    return images
+
+
+def _make_texts(count: int) -> list[str]:
+    """
+    Создание описаний изображений для прогрева переводчиков.
+
+    :param count: Количество описаний.
+    :type count: int
+
+    :return: Описания.
+    :rtype: list[str]
+    """
+
+    return [f"a photo of {i + 2} dogs playing on the grass"
+            for i in range(count)]
+
+
+def _warm_up_translator(name: str) -> None:
+    """
+    Загрузка и прогрев локального переводчика.
+
+    :param name: Название переводчика.
+    :type name: str
+
+    :raises ValueError: Если переводчик не является локальной моделью.
+    """
+
+    _translator_mapping[name]
+    translator = translation_models.get(name)
+    if translator is None:
+        raise ValueError(f"Переводчик {name} не является локальной "
+                         "моделью перевода!")
+
+    for batch_size in WARM_UP_BATCH_SIZES:
+        for _ in range(WARM_UP_ITERATIONS):
+            texts = _make_texts(batch_size)
+            start = time.perf_counter()
+            translator.translate_batch(texts)
+            warm_up_state.record(
+                name, batch_size, time.perf_counter() - start
+            )
+
+
+class WarmUp(AbstractUseCase):
+    """ Прогрев моделей при старте сервиса."""
+
+    def execute(self) -> WarmUpStats:
+        """
+        Прогрев captioning-моделей и локальных переводчиков.
+
+        Каждая captioning-модель загружается и описывает батчи
+        изображений типичных размеров несколько раз, чтобы первые
+        запросы клиентов не ждали загрузки весов, выделения памяти и
+        выбора ядер. Так же прогреваются локальные переводчики из
+        warm_up.translators. Ошибка прогрева одной модели не
+        останавливает прогрев остальных.
+
+        :return: Счетчики прогрева.
+        :rtype: WarmUpStats
+        """
+
+        total = len(_director_mapping) + len(WARM_UP_TRANSLATORS)
+        warm_up_state.start()
+        if not WARM_UP_ENABLED:
+            warm_up_state.finish(total)
+            return warm_up_state.stats()
+
+        # Прогрев идет с профилем по умолчанию без учета в нагрузке.
+        profile = generation_controller.select()
+        for name in _director_mapping:
+            director = _get_director(name, None)
+            try:
+                for batch_size in WARM_UP_BATCH_SIZES:
+                    for _ in range(WARM_UP_ITERATIONS):
+                        images = _make_images(batch_size)
+                        start = time.perf_counter()
+                        director.get_descript_batch(
+                            images, DEFAULT_LENGTH_DESCRIPTION, profile
+                        )
+                        warm_up_state.record(
+                            name, batch_size, time.perf_counter() - start
+                        )
+            except Exception as e:
+                logger.exception(f"Ошибка прогрева модели {name}!")
+                warm_up_state.fail(name, str(e))
+                continue
+
+            logger.info(f"Модель {name} прогрета")
+
+        # Локальные модели перевода загружаются и прогреваются напрямую,
+        # минуя кеш переводов.
+        for name in WARM_UP_TRANSLATORS:
+            try:
+                _warm_up_translator(name)
+            except Exception as e:
+                logger.exception(f"Ошибка прогрева переводчика {name}!")
+                warm_up_state.fail(name, str(e))
+                continue
+
+            logger.info(f"Переводчик {name} прогрет")
+
+        warm_up_state.finish(total)
+
+        return warm_up_state.stats()